@@ -1,3 +1,6 @@
+import importlib
+import importlib.util
+
 from .core import (
     CommonServiceException,
     HttpRequest,
@@ -19,3 +22,11 @@ __all__ = [
     "HttpRequest",
     "HttpResponse",
 ]
+
+
+def __getattr__(name: str):
+    # the generated API modules are large, so they are only imported when they are accessed (PEP 562), i.e., accessing
+    # ``localstack.aws.api.sqs`` imports the module without the need of importing all API modules with the package
+    if name.startswith("_") or importlib.util.find_spec(f"{__name__}.{name}") is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f"{__name__}.{name}")
@@ -1,10 +1,14 @@
 import functools
 import sys
-from typing import Any, NamedTuple, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Type, Union
 
-from localstack.aws.connect import InternalRequestParameters
+from localstack.aws.auth import Authorization, parse_authorization_header
 from localstack.utils.strings import long_uid
 
+if TYPE_CHECKING:
+    # importing the client factories (and boto3) is expensive, and only necessary for type checking
+    from localstack.aws.connect import InternalRequestParameters
+
 if sys.version_info >= (3, 8):
     from typing import Protocol, TypedDict
 else:
@@ -100,8 +104,13 @@ class RequestContext:
     """The response from the AWS emulator backend."""
     service_exception: Optional[ServiceException]
     """The exception the AWS emulator backend may have raised."""
-    internal_request_params: Optional[InternalRequestParameters]
+    internal_request_params: Optional["InternalRequestParameters"]
     """Data sent by client-side LocalStack during internal calls."""
+    direct_dispatch: bool
+    """Whether the request was dispatched directly by an internal client. The service response is then handed back
+    through the context, instead of being serialized into the HTTP response."""
+    _authorization: Optional[Authorization]
+    _authorization_parsed: bool
 
     def __init__(self) -> None:
         self.service = None
@@ -114,6 +123,27 @@ class RequestContext:
         self.service_response = None
         self.service_exception = None
         self.internal_request_params = None
+        self.direct_dispatch = False
+        self._authorization = None
+        self._authorization_parsed = False
+
+    @property
+    def authorization(self) -> Optional[Authorization]:
+        """
+        The parsed Authorization header of the request (or None if the request does not contain a valid one). The
+        header is only parsed once (on first access), handlers which modify the header need to set the new value.
+        """
+        if not self._authorization_parsed and self.request is not None:
+            self._authorization = parse_authorization_header(
+                self.request.headers.get("Authorization")
+            )
+            self._authorization_parsed = True
+        return self._authorization
+
+    @authorization.setter
+    def authorization(self, authorization: Optional[Authorization]):
+        self._authorization = authorization
+        self._authorization_parsed = True
 
     @property
     def is_internal_call(self) -> bool:
@@ -3,6 +3,7 @@ from localstack.aws import handlers
 from localstack.aws.chain import HandlerChain
 from localstack.aws.handlers.metric_handler import MetricHandler
 from localstack.aws.handlers.service_plugin import ServiceLoader
+from localstack.aws.metrics import HANDLER_CHAIN_METRICS
 from localstack.aws.trace import TracingHandlerChain
 from localstack.services.plugins import SERVICE_PLUGINS, ServiceManager, ServicePluginManager
 from localstack.utils.ssl import create_ssl_cert, install_predefined_cert_if_available
@@ -71,6 +72,7 @@ class LocalstackAwsGateway(Gateway):
                 handlers.count_service_request,
                 handlers.pop_request_context,
                 metric_collector.update_metric_collection,
+                handlers.compress_response,  # after all other handlers have seen the uncompressed body
             ]
         )
 
@@ -79,7 +81,10 @@ class LocalstackAwsGateway(Gateway):
             return TracingHandlerChain(
                 self.request_handlers, self.response_handlers, self.exception_handlers
             )
-        return super().new_chain()
+        chain = super().new_chain()
+        if config.ENABLE_HANDLER_CHAIN_METRICS:
+            chain.metrics = HANDLER_CHAIN_METRICS
+        return chain
 
 
 def main():
@@ -1,18 +1,27 @@
 """
 The core concepts of the HandlerChain.
 """
+import asyncio
+import contextvars
+import inspect
 import logging
-from typing import Any, Callable, List, Optional
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Generator, List, Optional, Tuple
 
 from localstack.http import Response
+from localstack.utils.asyncio import run_awaitable
 
 from .api import RequestContext
+from .metrics import HandlerChainMetrics
 
 LOG = logging.getLogger(__name__)
 
-Handler = Callable[["HandlerChain", RequestContext, Response], None]
+Handler = Callable[["HandlerChain", RequestContext, Response], Optional[Awaitable]]
 """The signature of request or response handler in the handler chain. Receives the HandlerChain, the RequestContext,
-and the Response object to be populated."""
+and the Response object to be populated. A request handler can return an awaitable to defer the remainder of its work
+(e.g., waiting for a resource to become ready), which the chain awaits before it continues with the next handler."""
 
 ExceptionHandler = Callable[["HandlerChain", Exception, RequestContext, Response], None]
 """The signature of an exception handler in the handler chain. Receives the HandlerChain, the exception that was
@@ -36,6 +45,10 @@ class HandlerChain:
     then runs each exception handler, and finally runs the response handlers. Exceptions that happen during the
     execution of response or exception handlers are logged but do not modify the control flow of the chain.
 
+    Request handlers may return an awaitable, in which case the chain suspends until the awaitable is done. An
+    exception raised by the awaitable is treated like an exception raised by the handler itself. ``handle`` blocks
+    the calling thread while waiting, whereas ``handle_async`` awaits it on the running event loop, and only uses
+    threads of an executor to run the (synchronous) handlers.
     """
 
     # handlers
@@ -49,6 +62,8 @@ class HandlerChain:
     raise_on_error: bool = False
     """If set to true, an exception in the request handler will be re-raised by ``handle`` after the exception
     handlers have been called. """
+    metrics: Optional[HandlerChainMetrics] = None
+    """If set, the latency of each handler and of the processed service operation is recorded into the metrics."""
 
     # internal state
     stopped: bool
@@ -82,12 +97,87 @@ class HandlerChain:
         :param context: the incoming request
         :param response: the response to be populated
         """
+        steps = self._handle(context, response)
+
+        awaitable = _advance(steps.send, None)
+        while awaitable is not None:
+            try:
+                run_awaitable(awaitable)
+            except Exception as e:
+                awaitable = _advance(steps.throw, e)
+            else:
+                awaitable = _advance(steps.send, None)
+
+    async def handle_async(
+        self, context: RequestContext, response: Response, executor: Optional[Executor] = None
+    ):
+        """
+        Async variant of ``handle``. The handlers are run in the given executor, but awaitables returned by request
+        handlers are awaited on the running event loop, so the chain does not occupy a thread while it is waiting.
+
+        :param context: the incoming request
+        :param response: the response to be populated
+        :param executor: the executor to run the handlers in (defaults to the default executor of the event loop)
+        """
+        loop = asyncio.get_running_loop()
+        # all steps run in the same context, so context variables set by handlers are retained even though the
+        # steps may be executed by different threads. the thread-local request state is carried over explicitly.
+        ctx = contextvars.copy_context()
+        thread_locals = _RequestThreadLocals()
+        steps = self._handle(context, response)
+
+        awaitable = await loop.run_in_executor(
+            executor, ctx.run, thread_locals.run, _advance, steps.send, None
+        )
+        while awaitable is not None:
+            try:
+                await ctx.run(asyncio.ensure_future, awaitable)
+            except Exception as e:
+                awaitable = await loop.run_in_executor(
+                    executor, ctx.run, thread_locals.run, _advance, steps.throw, e
+                )
+            else:
+                awaitable = await loop.run_in_executor(
+                    executor, ctx.run, thread_locals.run, _advance, steps.send, None
+                )
+
+    def _handle(
+        self, context: RequestContext, response: Response
+    ) -> Generator[Awaitable, None, None]:
+        """
+        Implements the control flow of the chain as a generator, which yields the awaitables returned by request
+        handlers. The caller needs to await them, and then either resume the generator, or throw the exception
+        raised by the awaitable into it.
+        """
         self.context = context
         self.response = response
 
+        if self.metrics is None:
+            yield from self._handle_request(response)
+            return
+
+        then = time.perf_counter()
+        try:
+            yield from self._handle_request(response)
+        finally:
+            if context.service_operation:
+                self.metrics.record_operation(
+                    context.service_operation.service,
+                    context.service_operation.operation,
+                    time.perf_counter() - then,
+                )
+
+    def _handle_request(self, response: Response) -> Generator[Awaitable, None, None]:
+        metrics = self.metrics
+
         for handler in self.request_handlers:
             try:
-                handler(self, self.context, response)
+                if metrics is None:
+                    result = handler(self, self.context, response)
+                else:
+                    result = self._call_measured("request", handler, self.context, response)
+                if result is not None and inspect.isawaitable(result):
+                    yield result
             except Exception as e:
                 # prepare the continuation behavior, but exception handlers could overwrite it
                 if self.raise_on_error:
@@ -146,13 +236,25 @@ class HandlerChain:
         """
         self.error = error
 
+    def _call_measured(self, phase: str, handler: Callable, *args) -> Any:
+        then = time.perf_counter()
+        try:
+            return handler(self, *args)
+        finally:
+            self.metrics.record_handler(phase, handler, time.perf_counter() - then)
+
     def _call_response_handlers(self, response):
+        metrics = self.metrics
+
         for handler in self.response_handlers:
             if self.terminated:
                 return
 
             try:
-                handler(self, self.context, response)
+                if metrics is None:
+                    handler(self, self.context, response)
+                else:
+                    self._call_measured("response", handler, self.context, response)
             except Exception as e:
                 msg = "exception while running response handler"
                 if LOG.isEnabledFor(logging.DEBUG):
@@ -161,9 +263,14 @@ class HandlerChain:
                     LOG.warning(msg + ": %s", e)
 
     def _call_exception_handlers(self, e, response):
+        metrics = self.metrics
+
         for exception_handler in self.exception_handlers:
             try:
-                exception_handler(self, e, self.context, response)
+                if metrics is None:
+                    exception_handler(self, e, self.context, response)
+                else:
+                    self._call_measured("exception", exception_handler, e, self.context, response)
             except Exception as nested:
                 # make sure we run all exception handlers
                 msg = "exception while running exception handler"
@@ -173,6 +280,60 @@ class HandlerChain:
                     LOG.warning(msg + ": %s", nested)
 
 
+def _advance(step: Callable, value: Any) -> Optional[Awaitable]:
+    """Advances the generator of ``HandlerChain._handle`` and returns the next awaitable, or None once it is done."""
+    try:
+        return step(value)
+    except StopIteration:
+        return None
+
+
+_MISSING = object()
+
+
+class _RequestThreadLocals:
+    """
+    Carries the thread-local state of a request (the account and access key of ``localstack.aws.accounts``, and the
+    legacy request context) between the steps of a chain in ``HandlerChain.handle_async``, which may be run by
+    different threads. Each step is run with the state left by the previous step, and the state of the thread is
+    restored afterwards, so the thread does not keep the state of a suspended request.
+    """
+
+    values: Optional[List[Any]]
+
+    def __init__(self):
+        from localstack.aws import accounts
+        from localstack.utils.aws import request_context
+
+        self.attributes: List[Tuple[threading.local, str]] = [
+            (accounts.REQUEST_CTX_TLS, "account_id"),
+            (accounts.REQUEST_CTX_TLS, "access_key_id"),
+            (request_context.THREAD_LOCAL, "request_context"),
+        ]
+        # the first step starts with the state of its thread, like a chain run with ``HandlerChain.handle``
+        self.values = None
+
+    def run(self, fn: Callable, *args):
+        previous = self._capture()
+        if self.values is not None:
+            self._apply(self.values)
+        try:
+            return fn(*args)
+        finally:
+            self.values = self._capture()
+            self._apply(previous)
+
+    def _capture(self) -> List[Any]:
+        return [getattr(local, name, _MISSING) for local, name in self.attributes]
+
+    def _apply(self, values: List[Any]):
+        for (local, name), value in zip(self.attributes, values):
+            if value is not _MISSING:
+                setattr(local, name, value)
+            elif hasattr(local, name):
+                delattr(local, name)
+
+
 class CompositeHandler(Handler):
     """
     A handler that sequentially invokes a list of Handlers, forming a stripped-down version of a handler chain.
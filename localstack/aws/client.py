@@ -2,15 +2,33 @@
 import io
 import logging
 from datetime import datetime
-from typing import Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
 
-from botocore.model import OperationModel
+from botocore.awsrequest import AWSPreparedRequest, AWSResponse
+from botocore.client import BaseClient
+from botocore.model import NoShapeFoundError, OperationModel, ServiceModel, Shape
 from botocore.parsers import ResponseParser, ResponseParserFactory
+from botocore.utils import parse_to_aware_datetime
 from werkzeug import Response
-
-from localstack.aws.api import CommonServiceException, ServiceException, ServiceResponse
+from werkzeug.datastructures import Headers
+
+from localstack import config
+from localstack.aws.api import (
+    CommonServiceException,
+    RequestContext,
+    ServiceException,
+    ServiceResponse,
+)
+from localstack.aws.protocol.codec import json_codec
+from localstack.http import Request
+from localstack.http import Response as HttpResponse
 from localstack.runtime import hooks
 from localstack.utils.patch import patch
+from localstack.utils.strings import to_bytes, to_str
+
+if TYPE_CHECKING:
+    from localstack.aws.gateway import Gateway
 
 LOG = logging.getLogger(__name__)
 
@@ -76,6 +94,20 @@ class _RawStream:
         pass
 
 
+class _GatewayResponseStream(_ResponseStream):
+    """
+    Adapter that exposes a server-side Response as the ``raw`` attribute of a botocore ``AWSResponse``. botocore reads
+    the body either through ``stream()`` (to load the content), or through ``read()`` (for streaming bodies).
+    """
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        # urllib3 (which botocore normally uses) accepts None, while RawIOBase only accepts -1 to read everything
+        return super().read(-1 if amt is None else amt)
+
+    def stream(self, **kwargs) -> Iterable[bytes]:
+        return self.iterator
+
+
 def _add_modeled_error_fields(
     response_dict: Dict,
     parsed_response: Dict,
@@ -116,7 +148,14 @@ def _patch_botocore_json_parser():
         botocore does not support CBOR encoded response parsing. Since we use the botocore parsers
         to parse responses from external backends (like kinesis-mock), we need to patch botocore to
         try CBOR decoding in case the JSON decoding fails.
+        Valid JSON documents are directly decoded with the (faster) JSON codec of the ASF protocol
+        parsers, everything else is handled by the original botocore function.
         """
+        if body_contents:
+            try:
+                return json_codec.loads(body_contents)
+            except ValueError:
+                pass
         try:
             return fn(self, body_contents)
         except UnicodeDecodeError as json_exception:
@@ -130,6 +169,301 @@ def _patch_botocore_json_parser():
                 raise cbor_exception from json_exception
 
 
+def create_http_request(aws_request: AWSPreparedRequest) -> Request:
+    # create HttpRequest from AWSRequest
+    split_url = urlsplit(aws_request.url)
+    host = split_url.netloc.split(":")
+    if len(host) == 1:
+        server = (to_str(host[0]), None)
+    elif len(host) == 2:
+        server = (to_str(host[0]), int(host[1]))
+    else:
+        raise ValueError
+
+    # prepare the RequestContext
+    headers = Headers()
+    for k, v in aws_request.headers.items():
+        headers[k] = v
+
+    return Request(
+        method=aws_request.method,
+        path=split_url.path,
+        query_string=split_url.query,
+        headers=headers,
+        body=aws_request.body,
+        server=server,
+    )
+
+
+class GatewayShortCircuit:
+    """
+    A botocore ``before-send`` event handler that dispatches the prepared request of a client directly into a
+    ``Gateway``, instead of sending it over the network to the edge port. Returning a response from the
+    ``before-send`` event makes botocore skip the HTTP transport entirely (this is the same mechanism botocore's
+    ``Stubber`` uses), but the request is still serialized by botocore and parsed by the gateway, so the handler
+    chain behaves exactly like it would for a request coming in over the network.
+
+    Requests that are not addressed to the edge port (e.g., clients that were created with an ``endpoint_url``
+    pointing to a backend like DynamoDBLocal) are not intercepted.
+    """
+
+    gateway: Optional["Gateway"]
+
+    def __init__(self, gateway: "Gateway" = None):
+        """
+        :param gateway: the gateway to dispatch requests to. If not set, the gateway currently served by the
+            LocalStack runtime is used, and requests fall through to the HTTP transport as long as it is not running.
+        """
+        self.gateway = gateway
+
+    def __call__(self, request: AWSPreparedRequest, **kwargs) -> Optional[AWSResponse]:
+        gateway = self.gateway or _get_current_gateway()
+        if not gateway:
+            return None
+
+        if not self._is_edge_request(request):
+            return None
+
+        http_request = create_http_request(request)
+        http_response = HttpResponse()
+        gateway.process(http_request, http_response)
+
+        return AWSResponse(
+            request.url,
+            http_response.status_code,
+            dict(http_response.headers.items()),
+            _GatewayResponseStream(http_response),
+        )
+
+    @staticmethod
+    def _is_edge_request(request: AWSPreparedRequest) -> bool:
+        port = urlsplit(request.url).port
+        return port is not None and port == config.get_edge_port_http()
+
+    @classmethod
+    def modify_client(cls, client: BaseClient, gateway: "Gateway" = None):
+        """
+        Registers a new GatewayShortCircuit as first ``before-send`` handler of the given client.
+
+        :param client: the client to modify
+        :param gateway: the gateway to dispatch requests to (defaults to the currently served gateway)
+        """
+        client.meta.events.register_first("before-send.*.*", cls(gateway))
+
+
+class DirectDispatchShortCircuit:
+    """
+    A botocore ``before-call`` event handler that short-circuits internal service-to-service calls. Instead of
+    encoding the request to the wire format and having the gateway parse it again, the parameters of the client call
+    are passed as already parsed ``ServiceRequest`` into the handler chain of the gateway. The skeleton then hands the
+    ``ServiceResponse`` of the provider back without serializing it (see ``RequestContext.direct_dispatch``), and it is
+    returned to the client as if botocore had parsed it from an HTTP response.
+
+    Only requests of internal clients (i.e., requests that carry the internal request parameters header) are
+    dispatched directly. Operations with streaming payloads or event streams, as well as requests that are not
+    addressed to the edge port, fall through to the regular transport.
+    """
+
+    client: BaseClient
+    gateway: Optional["Gateway"]
+
+    def __init__(self, client: BaseClient, gateway: "Gateway" = None):
+        """
+        :param client: the client whose calls should be dispatched directly
+        :param gateway: the gateway to dispatch requests to (defaults to the currently served gateway)
+        """
+        self.client = client
+        self.gateway = gateway
+        self._service: Optional[ServiceModel] = None
+
+    @property
+    def service(self) -> ServiceModel:
+        # the localstack (patched) spec of the service, which may differ from the one used by the client
+        if self._service is None:
+            from localstack.aws.spec import load_service
+
+            self._service = load_service(self.client.meta.service_model.service_name)
+        return self._service
+
+    def __call__(
+        self, model: OperationModel, params: dict, context: dict, **kwargs
+    ) -> Optional[tuple[AWSResponse, dict]]:
+        from localstack.aws.connect import INTERNAL_REQUEST_PARAMS_HEADER
+
+        if INTERNAL_REQUEST_PARAMS_HEADER not in params["headers"]:
+            return None
+
+        if (
+            model.has_streaming_input
+            or model.has_streaming_output
+            or model.has_event_stream_input
+            or model.has_event_stream_output
+        ):
+            return None
+
+        service_request = context.get("_service_request")
+        if service_request is None:
+            return None
+
+        gateway = self.gateway or _get_current_gateway()
+        if not gateway:
+            return None
+
+        # creating the request also signs it, which is needed so the handler chain can determine the account
+        aws_request = self.client._endpoint.create_request(params, model)
+        if not GatewayShortCircuit._is_edge_request(aws_request):
+            return None
+
+        operation = self.service.operation_model(model.name)
+
+        request_context = RequestContext()
+        request_context.request = create_http_request(aws_request)
+        request_context.operation = operation
+        request_context.service_request = _to_service_request(
+            operation.input_shape, service_request
+        )
+        request_context.direct_dispatch = True
+
+        http_response = HttpResponse()
+        gateway.handle(request_context, http_response)
+
+        if exception := request_context.service_exception:
+            status_code = getattr(exception, "status_code", None) or 400
+            parsed = _to_error_response(operation, exception)
+        elif request_context.service_response is not None:
+            status_code = http_response.status_code
+            parsed = _to_client_response(operation.output_shape, request_context.service_response)
+        else:
+            # the request was not handled by a skeleton (e.g., by a legacy listener), parse the raw HTTP response
+            status_code = http_response.status_code
+            parsed = parse_response(operation, http_response)
+
+        headers = dict(http_response.headers.items())
+        parsed["ResponseMetadata"] = {
+            "RequestId": request_context.request_id,
+            "HTTPStatusCode": status_code,
+            "HTTPHeaders": {k.lower(): v for k, v in headers.items()},
+            "RetryAttempts": 0,
+        }
+        response = AWSResponse(
+            aws_request.url, status_code, headers, _GatewayResponseStream(http_response)
+        )
+        return response, parsed
+
+    @classmethod
+    def modify_client(cls, client: BaseClient, gateway: "Gateway" = None):
+        """
+        Registers a new DirectDispatchShortCircuit for the given client.
+
+        :param client: the client to modify
+        :param gateway: the gateway to dispatch requests to (defaults to the currently served gateway)
+        """
+        client.meta.events.register("provide-client-params.*.*", _handler_keep_service_request)
+        client.meta.events.register("before-call.*.*", cls(client, gateway))
+
+
+def _handler_keep_service_request(params: dict, context: dict, **kwargs):
+    """
+    Keeps a reference to the (unserialized) parameters of the client call in the botocore request context. Handlers
+    of ``before-parameter-build`` modify the parameters in place, so the reference also reflects their changes.
+    """
+    context["_service_request"] = params
+
+
+def _to_service_request(shape: Optional[Shape], value: Any) -> Any:
+    """
+    Converts client call parameters into the types the request parser would produce. botocore accepts, for example,
+    strings for blob members, or strings and numbers for timestamp members.
+    """
+    if shape is None or value is None:
+        return value
+
+    type_name = shape.type_name
+    if type_name == "structure":
+        members = shape.members
+        return {key: _to_service_request(members.get(key), member) for key, member in value.items()}
+    if type_name == "list":
+        return [_to_service_request(shape.member, item) for item in value]
+    if type_name == "map":
+        return {key: _to_service_request(shape.value, item) for key, item in value.items()}
+    if type_name == "blob":
+        return to_bytes(value) if isinstance(value, str) else value
+    if type_name == "timestamp":
+        return parse_to_aware_datetime(value)
+
+    return value
+
+
+def _to_client_response(shape: Optional[Shape], value: Any) -> Any:
+    """
+    Converts a service response of a provider into what botocore would have parsed from the serialized response.
+    Members that are not part of the output shape are dropped, since they would not have been serialized either.
+    """
+    if shape is None:
+        return {}
+    if value is None:
+        return None
+
+    type_name = shape.type_name
+    if type_name == "structure":
+        result = {}
+        members = shape.members
+        for key, member in value.items():
+            if key in members and member is not None:
+                result[key] = _to_client_response(members[key], member)
+        return result
+    if type_name == "list":
+        return [_to_client_response(shape.member, item) for item in value]
+    if type_name == "map":
+        return {key: _to_client_response(shape.value, item) for key, item in value.items()}
+    if type_name == "blob":
+        return to_bytes(value) if isinstance(value, str) else value
+    if type_name == "timestamp":
+        return parse_to_aware_datetime(value)
+    if type_name in ("integer", "long"):
+        return int(value)
+    if type_name in ("float", "double"):
+        return float(value)
+    if type_name == "boolean":
+        return value.lower() == "true" if isinstance(value, str) else bool(value)
+    if type_name == "string" and not isinstance(value, str):
+        return str(value)
+
+    return value
+
+
+def _to_error_response(operation: OperationModel, exception: ServiceException) -> dict:
+    """
+    Creates the error response dict botocore would have parsed from a serialized ServiceException, including the
+    additional members of modeled errors.
+    """
+    code = getattr(exception, "code", None) or exception.__class__.__name__
+    parsed = {
+        "Error": {
+            "Code": code,
+            "Message": exception.message,
+            "Type": "Sender" if getattr(exception, "sender_fault", False) else "Receiver",
+        }
+    }
+    try:
+        error_shape = operation.service_model.shape_for(exception.__class__.__name__)
+    except NoShapeFoundError:
+        return parsed
+
+    for member_name, member_shape in error_shape.members.items():
+        if member_name.lower() in ("code", "message"):
+            continue
+        if (member := getattr(exception, member_name, None)) is not None:
+            parsed[member_name] = _to_client_response(member_shape, member)
+    return parsed
+
+
+def _get_current_gateway() -> Optional["Gateway"]:
+    from localstack.aws.serving.edge import get_current_gateway
+
+    return get_current_gateway()
+
+
 def parse_response(
     operation: OperationModel, response: Response, include_response_metadata: bool = True
 ) -> ServiceResponse:
@@ -367,6 +367,18 @@ class InternalClientFactory(ClientFactory):
         )
         client.meta.events.register("before-call.*.*", handler=_handler_inject_dto_header)
 
+        if localstack_config.IN_MEMORY_CLIENT:
+            # this makes the client call the gateway directly, skipping the network round-trip to the edge port
+            from localstack.aws.client import GatewayShortCircuit
+
+            GatewayShortCircuit.modify_client(client)
+
+        if localstack_config.IN_MEMORY_CLIENT_DIRECT_DISPATCH:
+            # this additionally skips the request and response serialization for internal calls
+            from localstack.aws.client import DirectDispatchShortCircuit
+
+            DirectDispatchShortCircuit.modify_client(client)
+
         return client
 
     def get_client(
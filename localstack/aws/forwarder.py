@@ -3,7 +3,6 @@ This module contains utilities to call a backend (e.g., an external service proc
 DynamoDBLocal) from a service provider.
 """
 from typing import Any, Callable, Mapping, Optional
-from urllib.parse import urlsplit
 
 from botocore.awsrequest import AWSPreparedRequest, prepare_request_dict
 from botocore.config import Config as BotoConfig
@@ -11,19 +10,17 @@ from werkzeug.datastructures import Headers
 
 from localstack import config
 from localstack.aws.api.core import (
-    Request,
     RequestContext,
     ServiceRequest,
     ServiceRequestHandler,
     ServiceResponse,
 )
-from localstack.aws.client import parse_response, raise_service_exception
+from localstack.aws.client import create_http_request, parse_response, raise_service_exception
 from localstack.aws.skeleton import DispatchTable, create_dispatch_table
 from localstack.aws.spec import load_service
 from localstack.http import Response
 from localstack.http.proxy import forward
 from localstack.utils.aws import aws_stack
-from localstack.utils.strings import to_str
 
 
 def ForwardingFallbackDispatcher(
@@ -202,29 +199,3 @@ def create_aws_request_context(
     context.service_request = parameters
 
     return context
-
-
-def create_http_request(aws_request: AWSPreparedRequest) -> Request:
-    # create HttpRequest from AWSRequest
-    split_url = urlsplit(aws_request.url)
-    host = split_url.netloc.split(":")
-    if len(host) == 1:
-        server = (to_str(host[0]), None)
-    elif len(host) == 2:
-        server = (to_str(host[0]), int(host[1]))
-    else:
-        raise ValueError
-
-    # prepare the RequestContext
-    headers = Headers()
-    for k, v in aws_request.headers.items():
-        headers[k] = v
-
-    return Request(
-        method=aws_request.method,
-        path=split_url.path,
-        query_string=split_url.query,
-        headers=headers,
-        body=aws_request.body,
-        server=server,
-    )
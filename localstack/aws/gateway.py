@@ -1,5 +1,6 @@
 import logging
-from typing import List
+from concurrent.futures import Executor
+from typing import List, Optional
 
 from localstack.http import Request, Response
 
@@ -28,9 +29,39 @@ class Gateway:
         return HandlerChain(self.request_handlers, self.response_handlers, self.exception_handlers)
 
     def process(self, request: Request, response: Response):
+        context = RequestContext()
+        context.request = request
+
+        self.handle(context, response)
+
+    def handle(self, context: RequestContext, response: Response):
+        """
+        Processes the given (possibly pre-populated) RequestContext through a new HandlerChain.
+
+        :param context: the request context, which needs to hold at least the request
+        :param response: the response to be populated
+        """
         chain = self.new_chain()
+        chain.handle(context, response)
 
+    async def process_async(
+        self, request: Request, response: Response, executor: Optional[Executor] = None
+    ):
         context = RequestContext()
         context.request = request
 
-        chain.handle(context, response)
+        await self.handle_async(context, response, executor)
+
+    async def handle_async(
+        self, context: RequestContext, response: Response, executor: Optional[Executor] = None
+    ):
+        """
+        Async variant of ``handle``, which processes the given RequestContext through
+        ``HandlerChain.handle_async``.
+
+        :param context: the request context, which needs to hold at least the request
+        :param response: the response to be populated
+        :param executor: the executor to run the handlers in
+        """
+        chain = self.new_chain()
+        await chain.handle_async(context, response, executor)
@@ -19,6 +19,7 @@ enforce_cors = cors.CorsEnforcer()
 preprocess_request = chain.CompositeHandler()
 add_cors_response_headers = cors.CorsResponseEnricher()
 content_decoder = codec.ContentDecoder()
+compress_response = codec.ResponseCompressor()
 parse_service_name = service.ServiceNameParser()
 parse_service_request = service.ServiceRequestParser()
 add_account_id = auth.AccountIdEnricher()
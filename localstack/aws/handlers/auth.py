@@ -7,9 +7,9 @@ from localstack.aws.accounts import (
 )
 from localstack.constants import TEST_AWS_ACCESS_KEY_ID
 from localstack.http import Response
-from localstack.utils.aws.aws_stack import extract_access_key_id_from_auth_header
 
 from ..api import RequestContext
+from ..auth import parse_authorization_header
 from ..chain import Handler, HandlerChain
 
 LOG = logging.getLogger(__name__)
@@ -31,6 +31,7 @@ class MissingAuthHeaderInjector(Handler):
             headers["Authorization"] = aws_stack.mock_aws_request_headers(
                 api, access_key="injectedaccesskey"
             )["Authorization"]
+            context.authorization = parse_authorization_header(headers["Authorization"])
 
 
 class AccountIdEnricher(Handler):
@@ -40,10 +41,8 @@ class AccountIdEnricher(Handler):
 
     def __call__(self, chain: HandlerChain, context: RequestContext, response: Response):
         # Obtain the access key ID and save it in the thread context
-        access_key_id = (
-            extract_access_key_id_from_auth_header(context.request.headers)
-            or TEST_AWS_ACCESS_KEY_ID
-        )
+        authorization = context.authorization
+        access_key_id = (authorization and authorization.access_key_id) or TEST_AWS_ACCESS_KEY_ID
         set_aws_access_key_id(access_key_id)
 
         # Obtain the account ID and save it in the request context
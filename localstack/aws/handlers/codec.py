@@ -1,28 +1,306 @@
-import gzip
+import functools
+import io
+import re
+import zlib
+from typing import IO, Callable, Dict, Iterable, Iterator
 
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
+
+from localstack import config
 from localstack.aws.api import RequestContext
 from localstack.aws.chain import Handler, HandlerChain
 from localstack.http import Response
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class DecodingStream(io.RawIOBase):
+    """
+    A readable stream which incrementally decodes the data of another stream. The size of the decoded data is limited
+    to protect the memory from highly compressed payloads ("decompression bombs").
+    """
+
+    chunk_size = 64 * 1024
+    """The size of the chunks read from the underlying stream."""
+
+    def __init__(self, stream: IO[bytes], max_size: int):
+        self.stream = stream
+        self.max_size = max_size
+        self.decoded_size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return self.readall()
+        if size == 0:
+            return b""
+
+        data = self._decode(size)
+        self.decoded_size += len(data)
+        if self.decoded_size > self.max_size:
+            raise RequestEntityTooLarge(
+                f"The decoded request body exceeds the maximum size of {self.max_size} bytes"
+            )
+        return data
+
+    def readall(self) -> bytes:
+        chunks = []
+        while data := self.read(self.chunk_size * 4):
+            chunks.append(data)
+        return b"".join(chunks)
+
+    def _decode(self, size: int) -> bytes:
+        """Returns at most size bytes of decoded data, or an empty bytes object if the stream has ended."""
+        raise NotImplementedError
+
+
+class ZlibDecodingStream(DecodingStream):
+    """
+    Decodes the "gzip" and "deflate" content codings. Since some clients send raw DEFLATE data instead of the zlib
+    format (which is required by RFC 9110), the format of "deflate" is detected from the first bytes.
+    """
+
+    def __init__(self, stream: IO[bytes], max_size: int, encoding: str = "gzip"):
+        super().__init__(stream, max_size)
+        self.encoding = encoding
+        self._decompressor = None
+
+    def _create_decompressor(self, data: bytes):
+        if self.encoding != "deflate":
+            # wbits 16 + MAX_WBITS only accepts the gzip format
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if len(data) >= 2 and data[0] & 0x0F == 8 and int.from_bytes(data[:2], "big") % 31 == 0:
+            return zlib.decompressobj(zlib.MAX_WBITS)
+        # negative wbits accept raw DEFLATE data without a header
+        return zlib.decompressobj(-zlib.MAX_WBITS)
+
+    def _decode(self, size: int) -> bytes:
+        try:
+            while True:
+                decompressor = self._decompressor
+                if decompressor is None or decompressor.eof:
+                    # the body may consist of multiple members (f.e. concatenated gzip files)
+                    data = decompressor.unused_data if decompressor else b""
+                    data = data or self.stream.read(self.chunk_size)
+                    if not data:
+                        return b""
+                    decompressor = self._decompressor = self._create_decompressor(data)
+                else:
+                    data = decompressor.unconsumed_tail or self.stream.read(self.chunk_size)
+                    if not data:
+                        raise BadRequest(f"The {self.encoding} request body is truncated")
+
+                if result := decompressor.decompress(data, size):
+                    return result
+        except zlib.error as e:
+            raise BadRequest(f"The {self.encoding} request body cannot be decoded: {e}")
+
+
+class ZstdDecodingStream(DecodingStream):
+    """
+    Decodes the "zstd" content coding, which requires the (optional) ``zstandard`` package.
+    """
+
+    def __init__(self, stream: IO[bytes], max_size: int):
+        super().__init__(stream, max_size)
+        self._reader = zstandard.ZstdDecompressor().stream_reader(
+            stream, read_size=self.chunk_size, read_across_frames=True
+        )
+
+    def _decode(self, size: int) -> bytes:
+        try:
+            return self._reader.read(size)
+        except zstandard.ZstdError as e:
+            raise BadRequest(f"The zstd request body cannot be decoded: {e}")
+
 
 class ContentDecoder(Handler):
     """
     A handler which takes care of decoding the content of a request (if the header "Content-Encoding" is set).
 
     The Content-Encoding representation header lists any encodings that have been applied to the representation
-    (message payload), and in what order.
+    (message payload), and in what order. The decoders are therefore applied in the reverse order. The request stream
+    is decoded lazily while it is read, and the decoded size is limited to ``max_size`` bytes. Requests with content
+    codings which are not supported are passed on unchanged.
     """
 
     # Some services _break_ the specification of Content-Encoding (f.e. in combination with Content-MD5).
     SKIP_GZIP_SERVICES = ["s3"]
 
+    decoders: Dict[str, Callable[[IO[bytes], int], DecodingStream]]
+
+    def __init__(self, max_size: int = None):
+        self.max_size = config.REQUEST_DECOMPRESSION_MAX_SIZE if max_size is None else max_size
+        self.decoders = {
+            "gzip": ZlibDecodingStream,
+            "x-gzip": ZlibDecodingStream,
+            "deflate": functools.partial(ZlibDecodingStream, encoding="deflate"),
+        }
+        if zstandard:
+            self.decoders["zstd"] = ZstdDecodingStream
+
     def __call__(self, chain: HandlerChain, context: RequestContext, response: Response):
         if context.service and context.service.service_name in self.SKIP_GZIP_SERVICES:
             # Skip the decoding for services which need to do this on their own
             return
 
-        # Currently, only GZIP is supported. When supporting multiple types, the order needs to be respected
-        if context.request.content_encoding and context.request.content_encoding.lower() == "gzip":
-            # wrap the request's stream with GZip decompression (inspired by flask-inflate)
-            context.request.stream = gzip.GzipFile(fileobj=context.request.stream)
-            context.request.headers["Content-Encoding"] = "identity"
+        content_encoding = context.request.content_encoding
+        if not content_encoding:
+            return
+
+        encodings = [
+            encoding
+            for encoding in content_encoding.lower().replace(" ", "").split(",")
+            if encoding and encoding != "identity"
+        ]
+        if not encodings or any(encoding not in self.decoders for encoding in encodings):
+            return
+
+        stream = context.request.stream
+        for encoding in reversed(encodings):
+            stream = self.decoders[encoding](stream, self.max_size)
+        context.request.stream = stream
+        context.request.headers["Content-Encoding"] = "identity"
+
+
+class Encoder:
+    """
+    Incrementally compresses a response body with a specific content coding.
+    """
+
+    def compress(self, data: bytes) -> bytes:
+        """Compresses the given data, the returned data may be buffered until the next call to flush or finish."""
+        raise NotImplementedError
+
+    def flush(self) -> bytes:
+        """Returns all data compressed so far, such that the client can decode it without waiting for more data."""
+        raise NotImplementedError
+
+    def finish(self) -> bytes:
+        """Returns the remaining compressed data. The encoder cannot be used afterwards."""
+        raise NotImplementedError
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int = 6):
+        # wbits 16 + MAX_WBITS writes the gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class ResponseCompressor:
+    """
+    A response handler which compresses the response body with the best content coding the client accepts (as
+    advertised in the "Accept-Encoding" header of the request). Only bodies of compressible content types (like JSON or
+    XML) which are larger than ``min_size`` are compressed. Streamed bodies are compressed incrementally, where every
+    chunk of the original body is flushed to the client as soon as it has been compressed.
+
+    The object bodies of S3 are never compressed, since the Content-Encoding of S3 objects has object semantics (it
+    is set by the client on upload and returned unchanged).
+    """
+
+    COMPRESSIBLE_MIMETYPES = re.compile(
+        r"^(text/.+"
+        r"|application/([\w.+-]*[+-])?(json|xml)[\w.-]*"
+        r"|application/javascript"
+        r"|application/x-www-form-urlencoded)$"
+    )
+
+    def __init__(self, min_size: int = None):
+        self.min_size = config.RESPONSE_COMPRESSION_MIN_SIZE if min_size is None else min_size
+        # the content codings in the order of preference of the server
+        self.encodings = {}
+        if zstandard:
+            self.encodings["zstd"] = ZstdEncoder
+        self.encodings["gzip"] = GzipEncoder
+
+    def __call__(self, chain: HandlerChain, context: RequestContext, response: Response):
+        if config.DISABLE_RESPONSE_COMPRESSION:
+            return
+        if not context.request or "Accept-Encoding" not in context.request.headers:
+            return
+        if not self.is_compressible(context, response):
+            return
+
+        encoding = context.request.accept_encodings.best_match(list(self.encodings))
+        if not encoding:
+            return
+
+        if response.is_streamed:
+            content_length = response.headers.get("Content-Length", type=int)
+            if content_length is not None and content_length < self.min_size:
+                return
+            response.response = _compress_stream(self.encodings[encoding](), response.response)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return
+            encoder = self.encodings[encoding]()
+            response.set_data(encoder.compress(data) + encoder.finish())
+            if "x-amz-crc32" in response.headers:
+                # like AWS, the checksum is calculated over the compressed body (f.e. for DynamoDB)
+                response.headers["x-amz-crc32"] = zlib.crc32(response.data) & 0xFFFFFFFF
+
+        response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+
+    def is_compressible(self, context: RequestContext, response: Response) -> bool:
+        if context.request.method == "HEAD":
+            return False
+        if response.status_code < 200 or response.status_code in (204, 304):
+            return False
+        if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+            # the body is already encoded
+            return False
+        if context.service and context.service.service_name == "s3":
+            if not context.operation or context.operation.has_streaming_output:
+                return False
+        mimetype = response.mimetype
+        return bool(mimetype and self.COMPRESSIBLE_MIMETYPES.match(mimetype))
+
+
+def _compress_stream(encoder: Encoder, iterable: Iterable) -> Iterator[bytes]:
+    try:
+        for chunk in iterable:
+            if not chunk:
+                continue
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            yield encoder.compress(chunk) + encoder.flush()
+        yield encoder.finish()
+    finally:
+        if hasattr(iterable, "close"):
+            iterable.close()
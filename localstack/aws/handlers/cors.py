@@ -6,13 +6,6 @@ import re
 from typing import List, Set
 from urllib.parse import urlparse
 
-from flask_cors.core import (
-    ACL_ALLOW_HEADERS,
-    ACL_EXPOSE_HEADERS,
-    ACL_METHODS,
-    ACL_ORIGIN,
-    ACL_REQUEST_HEADERS,
-)
 from werkzeug.datastructures import Headers
 
 from localstack import config
@@ -24,7 +17,12 @@ from localstack.http import Response
 
 LOG = logging.getLogger(__name__)
 
-# header name constants
+# header name constants (the same as in flask_cors.core, which is not imported since it pulls in flask)
+ACL_ORIGIN = "Access-Control-Allow-Origin"
+ACL_METHODS = "Access-Control-Allow-Methods"
+ACL_ALLOW_HEADERS = "Access-Control-Allow-Headers"
+ACL_EXPOSE_HEADERS = "Access-Control-Expose-Headers"
+ACL_REQUEST_HEADERS = "Access-Control-Request-Headers"
 ACL_REQUEST_PRIVATE_NETWORK = "Access-Control-Request-Private-Network"
 ACL_ALLOW_PRIVATE_NETWORK = "Access-Control-Allow-Private-Network"
 
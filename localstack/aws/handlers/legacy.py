@@ -9,6 +9,7 @@ from requests import Response as RequestsResponse
 from localstack.constants import HEADER_LOCALSTACK_EDGE_URL, HEADER_LOCALSTACK_REQUEST_URL
 from localstack.http import Response
 from localstack.http.request import restore_payload
+from localstack.http.router import RoutePrefilter
 from localstack.services.generic_proxy import ProxyListener, modify_and_forward
 
 from ..api import RequestContext
@@ -62,6 +63,17 @@ class EdgeRouterHandler(RouterHandler):
         from localstack.services.edge import ROUTER
 
         super().__init__(ROUTER, respond_not_found)
+        self.prefilter = RoutePrefilter(ROUTER)
+
+    def __call__(self, chain: HandlerChain, context: RequestContext, response: Response):
+        # the edge routes only serve few requests (f.e., lambda function URLs or internal service endpoints), so all
+        # the other requests (mostly AWS API requests) skip matching the routes
+        if not self.prefilter.may_match(context.request):
+            if self.respond_not_found:
+                chain.respond(404)
+            return
+
+        super().__call__(chain, context, response)
 
 
 class GenericProxyHandler(Handler):
@@ -1,14 +1,17 @@
 """Handlers for logging."""
 import logging
 from functools import cached_property
-from typing import Type
+from typing import Optional, Type
 
+from localstack import config
 from localstack.aws.api import RequestContext, ServiceException
 from localstack.aws.chain import ExceptionHandler, HandlerChain
 from localstack.http import Response
 from localstack.http.request import restore_payload
 from localstack.logging.format import AwsTraceLoggingFormatter, TraceLoggingFormatter
 from localstack.logging.setup import create_default_handler
+from localstack.logging.writer import QueueLogWriter
+from localstack.runtime.shutdown import SHUTDOWN_HANDLERS
 from localstack.utils.aws.aws_stack import is_internal_call_context
 
 LOG = logging.getLogger(__name__)
@@ -40,6 +43,22 @@ class ExceptionLogger(ExceptionHandler):
 
 
 class ResponseLogger:
+    """
+    Logs requests and responses, including their payloads if trace logging is enabled. If a ``QueueLogWriter`` is
+    set (by default if ``ASYNC_REQUEST_LOGGING`` is enabled), the log records are formatted and written by the
+    background thread of the writer, instead of the request thread.
+    """
+
+    writer: Optional[QueueLogWriter]
+
+    def __init__(self, writer: QueueLogWriter = None):
+        if writer is None and config.ASYNC_REQUEST_LOGGING:
+            writer = QueueLogWriter(
+                max_size=config.ASYNC_REQUEST_LOGGING_QUEUE_SIZE, name="request-log-writer"
+            )
+            SHUTDOWN_HANDLERS.register(writer.close)
+        self.writer = writer
+
     def __call__(self, _: HandlerChain, context: RequestContext, response: Response):
         if context.request.path == "/health" or context.request.path == "/_localstack/health":
             # special case so the health check doesn't spam the logs
@@ -87,9 +106,12 @@ class ResponseLogger:
             aws_logger = self.internal_aws_logger
             http_logger = self.internal_http_logger
         if context.operation:
+            if not aws_logger.isEnabledFor(logging.INFO):
+                return
             # log an AWS response
             if context.service_exception:
-                aws_logger.info(
+                self._emit(
+                    aws_logger,
                     "AWS %s.%s => %d (%s)",
                     context.service.service_name,
                     context.operation.name,
@@ -109,7 +131,8 @@ class ResponseLogger:
                     },
                 )
             else:
-                aws_logger.info(
+                self._emit(
+                    aws_logger,
                     "AWS %s.%s => %s",
                     context.service.service_name,
                     context.operation.name,
@@ -130,8 +153,11 @@ class ResponseLogger:
                     },
                 )
         else:
+            if not http_logger.isEnabledFor(logging.INFO):
+                return
             # log any other HTTP response
-            http_logger.info(
+            self._emit(
+                http_logger,
                 "%s %s => %d",
                 context.request.method,
                 context.request.path,
@@ -147,3 +173,9 @@ class ResponseLogger:
                     "response_headers": dict(response.headers),
                 },
             )
+
+    def _emit(self, logger: logging.Logger, msg: str, *args, extra: dict):
+        if self.writer:
+            self.writer.log(logger, logging.INFO, msg, *args, extra=extra)
+        else:
+            logger.info(msg, *args, extra=extra)
@@ -1,5 +1,9 @@
+import csv
+import json
 import logging
-from typing import List, Optional
+import threading
+import weakref
+from typing import IO, Dict, Iterator, List, Optional, Tuple
 
 from localstack import config
 from localstack.aws.api import RequestContext
@@ -22,7 +26,8 @@ class MetricHandlerItem:
     def __init__(self, request_contex: RequestContext) -> None:
         super().__init__()
         self.request_id = str(hash(request_contex))
-        self.request_context = request_contex
+        # the MetricHandler holds the items in a weak dictionary keyed by the context, so the item must not keep it alive
+        self.request_context = weakref.proxy(request_contex)
         self.parameters_after_parse = None
 
 
@@ -110,6 +115,8 @@ class Metric:
         )
 
     def __eq__(self, other):
+        if not isinstance(other, Metric):
+            return False
         # ignore header in comparison, because timestamp will be different
         if self.service != other.service:
             return False
@@ -133,12 +140,132 @@ class Metric:
             return False
         return True
 
+    def __hash__(self):
+        # only hash the attributes that are set when the metric is recorded, the test-related attributes are set later
+        return hash(
+            (
+                self.service,
+                self.operation,
+                self.parameters,
+                self.response_code,
+                self.response_data,
+                self.exception,
+                self.origin,
+            )
+        )
+
+    def to_dict(self) -> Dict[str, object]:
+        return dict(zip(self.RAW_DATA_HEADER, (str(value) for value in self)))
+
+
+class MetricCollection:
+    """
+    A bounded collection of distinct metrics. Metrics that are recorded multiple times are only stored once, together
+    with the number of times they have been recorded. Once the collection holds ``max_size`` distinct metrics, new
+    metrics are dropped until the collection is cleared.
+    """
+
+    max_size: int
+    dropped: int
+    """The number of recorded metrics that were dropped because the collection was full."""
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        self.dropped = 0
+        self._counts: Dict[Metric, int] = {}
+        self._mutex = threading.Lock()
+
+    def add(self, metric: Metric) -> bool:
+        """
+        Records the given metric.
+
+        :param metric: the metric to record
+        :return: False if the metric was dropped because the collection is full, True otherwise
+        """
+        with self._mutex:
+            count = self._counts.get(metric)
+            if count is not None:
+                self._counts[metric] = count + 1
+                return True
+
+            if len(self._counts) >= self.max_size:
+                if not self.dropped:
+                    LOG.warning(
+                        "metric collection is full (%d distinct metrics), dropping new metrics",
+                        self.max_size,
+                    )
+                self.dropped += 1
+                return False
+
+            self._counts[metric] = 1
+            return True
+
+    def count(self, metric: Metric) -> int:
+        """Returns the number of times the given metric has been recorded."""
+        return self._counts.get(metric, 0)
+
+    def items(self) -> List[Tuple[Metric, int]]:
+        """Returns a snapshot of the distinct metrics and their counts, in the order they were first recorded."""
+        with self._mutex:
+            return list(self._counts.items())
+
+    def clear(self):
+        with self._mutex:
+            self._counts = {}
+            self.dropped = 0
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __iter__(self) -> Iterator[Metric]:
+        return iter([metric for metric, _ in self.items()])
+
+    def __contains__(self, metric: Metric) -> bool:
+        return metric in self._counts
+
+    def export_csv(self, fd: IO[str], clear: bool = False):
+        """
+        Writes the distinct metrics as CSV rows (without header) in the format of ``Metric.RAW_DATA_HEADER`` into the
+        given file.
+
+        :param fd: the file to write to
+        :param clear: whether to clear the collection
+        """
+        writer = csv.writer(fd)
+        for metric, _ in self._snapshot(clear):
+            writer.writerow(metric)
+
+    def export_jsonl(self, fd: IO[str], clear: bool = False):
+        """
+        Writes the distinct metrics as JSON lines into the given file. Each line contains the attributes of
+        ``Metric.RAW_DATA_HEADER``, and the number of times the metric has been recorded as ``count``.
+
+        :param fd: the file to write to
+        :param clear: whether to clear the collection
+        """
+        for metric, count in self._snapshot(clear):
+            fd.write(json.dumps({**metric.to_dict(), "count": count}))
+            fd.write("\n")
+
+    def _snapshot(self, clear: bool) -> Iterator[Tuple[Metric, int]]:
+        if not clear:
+            return iter(self.items())
+
+        with self._mutex:
+            counts = self._counts
+            self._counts = {}
+            self.dropped = 0
+        return iter(counts.items())
+
 
 class MetricHandler:
-    metric_data: List[Metric] = []
+    metric_data: MetricCollection = MetricCollection(config.get_collect_metrics_max_size())
 
     def __init__(self) -> None:
-        self.metrics_handler_items = {}
+        # items are evicted as soon as their request context is garbage collected
+        self.metrics_handler_items: "weakref.WeakKeyDictionary[RequestContext, MetricHandlerItem]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     def create_metric_handler_item(
         self, chain: HandlerChain, context: RequestContext, response: Response
@@ -172,11 +299,14 @@ class MetricHandler:
     def update_metric_collection(
         self, chain: HandlerChain, context: RequestContext, response: Response
     ):
-        if not config.is_collect_metrics_mode() or not context.service_operation:
+        if not config.is_collect_metrics_mode():
+            return
+
+        item = self.metrics_handler_items.pop(context, None)
+        if not item or not context.service_operation:
             return
 
         is_internal = is_internal_call_context(context.request.headers)
-        item = self._get_metric_handler_item_for_context(context)
 
         # parameters might get changed when dispatched to the service - we use the params stored in
         # parameters_after_parse
@@ -195,9 +325,4 @@ class MetricHandler:
             else "",
             origin="internal" if is_internal else "external",
         )
-        # refrain from adding duplicates
-        if metric not in MetricHandler.metric_data:
-            MetricHandler.metric_data.append(metric)
-
-        # cleanup
-        del self.metrics_handler_items[context]
+        MetricHandler.metric_data.add(metric)
@@ -71,8 +71,8 @@ class ArnPartitionRewriteHandler(Handler):
             request.headers
         ):
             return
-        # since we are very early in the handler chain, we cannot use the request context here
-        request_region = extract_region_from_headers(request.headers)
+        # since we are very early in the handler chain, the region is not yet set in the request context here
+        request_region = extract_region_from_headers(request.headers, context.authorization)
         forward_request = self.modify_request(request)
 
         # forward to the handler chain again
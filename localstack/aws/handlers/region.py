@@ -1,8 +1,10 @@
 import logging
+from typing import Optional
 
 from localstack.http import Request, Response
 
 from ..api import RequestContext
+from ..auth import Authorization
 from ..chain import Handler, HandlerChain
 
 LOG = logging.getLogger(__name__)
@@ -14,10 +16,10 @@ class RegionContextEnricher(Handler):
     """
 
     def __call__(self, chain: HandlerChain, context: RequestContext, response: Response):
-        context.region = self.get_region(context.request)
+        context.region = self.get_region(context.request, context.authorization)
 
     @staticmethod
-    def get_region(request: Request) -> str:
+    def get_region(request: Request, authorization: Optional[Authorization] = None) -> str:
         from localstack.utils.aws.request_context import extract_region_from_headers
 
-        return extract_region_from_headers(request.headers)
+        return extract_region_from_headers(request.headers, authorization)
@@ -1,11 +1,13 @@
 """A set of common handlers to parse and route AWS service requests."""
+import inspect
 import logging
 import traceback
 from collections import defaultdict
 from functools import lru_cache
-from typing import Any, Dict, Optional, Union
+from typing import Any, Awaitable, Dict, Optional, Union
 
 from botocore.model import OperationModel, ServiceModel
+from werkzeug.exceptions import HTTPException
 
 from localstack import config
 from localstack.http import Response
@@ -30,7 +32,7 @@ class ServiceNameParser(Handler):
     """
 
     def __call__(self, chain: HandlerChain, context: RequestContext, response: Response):
-        service = determine_aws_service_name(context.request)
+        service = determine_aws_service_name(context.request, authorization=context.authorization)
 
         if not service:
             return
@@ -61,6 +63,10 @@ class ServiceRequestParser(Handler):
             LOG.debug("no service set in context, skipping request parsing")
             return
 
+        if context.operation and context.service_request is not None:
+            # the request has already been parsed (e.g., it was dispatched directly by an internal client)
+            return
+
         return self.parse_and_enrich(context)
 
     def get_parser(self, service: ServiceModel):
@@ -90,9 +96,15 @@ class SkeletonHandler(Handler):
         self.skeleton = skeleton
 
     def __call__(self, chain: HandlerChain, context: RequestContext, response: Response):
-        skeleton_response = self.skeleton.invoke(context)
+        skeleton_response = self.skeleton.invoke_deferred(context)
+        if inspect.isawaitable(skeleton_response):
+            return self._update_response_async(skeleton_response, response)
         response.update_from(skeleton_response)
 
+    @staticmethod
+    async def _update_response_async(skeleton_response: Awaitable[Response], response: Response):
+        response.update_from(await skeleton_response)
+
 
 class ServiceRequestRouter(Handler):
     """
@@ -120,7 +132,7 @@ class ServiceRequestRouter(Handler):
             chain.stop()
             return
 
-        handler(chain, context, response)
+        return handler(chain, context, response)
 
     def add_handler(self, key: ServiceOperation, handler: Handler):
         if key in self.handlers:
@@ -174,6 +186,11 @@ class ServiceExceptionSerializer(ExceptionHandler):
         if not context.service:
             return
 
+        if isinstance(exception, HTTPException) and context.service_request is None:
+            # the request could not be read (f.e., its decoded body is too large), the InternalFailureHandler responds
+            # with the status code of the exception
+            return
+
         error = self.create_exception_response(exception, context)
         if error:
             response.update_from(error)
@@ -0,0 +1,224 @@
+"""
+Low-overhead latency metrics of the handler chain, which are recorded into fixed-bucket histograms and can be
+exported in the Prometheus text exposition format.
+"""
+import bisect
+import inspect
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds (in seconds) of the histogram buckets. Values larger than the last bound go into the +Inf bucket."""
+
+
+class Histogram:
+    """
+    A thread-safe histogram with fixed buckets.
+    """
+
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    """The (non-cumulative) number of observations per bucket, the last one being the +Inf bucket."""
+    sum: float
+    count: int
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._mutex = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._mutex:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        """Returns the cumulative number of observations per bucket, as they are exported to Prometheus."""
+        with self._mutex:
+            counts = list(self.counts)
+
+        total = 0
+        for i, count in enumerate(counts):
+            total += count
+            counts[i] = total
+        return counts
+
+
+class HistogramFamily:
+    """
+    A set of histograms of the same metric, each identified by its values for the label names of the family.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Tuple[str, ...],
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        self.histograms: Dict[Tuple[str, ...], Histogram] = {}
+        self._mutex = threading.Lock()
+
+    def labels(self, *label_values: str) -> Histogram:
+        """
+        Returns the histogram for the given label values, creating it if it does not exist yet.
+
+        :param label_values: the values of the labels, in the order of the label names of the family
+        :return: the histogram
+        """
+        try:
+            return self.histograms[label_values]
+        except KeyError:
+            pass
+
+        with self._mutex:
+            if label_values not in self.histograms:
+                self.histograms[label_values] = Histogram(self.buckets)
+            return self.histograms[label_values]
+
+    def clear(self):
+        with self._mutex:
+            self.histograms.clear()
+
+    def to_prometheus(self) -> Iterable[str]:
+        """
+        Generates the lines of the family in the Prometheus text exposition format.
+        """
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+
+        bounds = [_format_float(bound) for bound in self.buckets] + ["+Inf"]
+
+        with self._mutex:
+            histograms = sorted(self.histograms.items())
+
+        for label_values, histogram in histograms:
+            labels = ",".join(
+                f'{name}="{_escape_label_value(value)}"'
+                for name, value in zip(self.label_names, label_values)
+            )
+            for bound, count in zip(bounds, histogram.cumulative_counts()):
+                yield f'{self.name}_bucket{{{labels},le="{bound}"}} {count}'
+            yield f"{self.name}_sum{{{labels}}} {_format_float(histogram.sum)}"
+            yield f"{self.name}_count{{{labels}}} {histogram.count}"
+
+
+class HandlerChainMetrics:
+    """
+    Records the latency of each handler in the handler chain, and the latency of each service operation (i.e., the
+    time it takes a handler chain to process a request to that operation).
+    """
+
+    handler_duration: HistogramFamily
+    operation_duration: HistogramFamily
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.handler_duration = HistogramFamily(
+            "localstack_handler_duration_seconds",
+            "Time spent in a handler of the handler chain.",
+            ("phase", "handler"),
+            buckets,
+        )
+        self.operation_duration = HistogramFamily(
+            "localstack_service_operation_duration_seconds",
+            "Time it takes the handler chain to process a request to a service operation.",
+            ("service", "operation"),
+            buckets,
+        )
+        # caches the histograms by handler object to avoid computing the handler name for each observation
+        self._handler_histograms: Dict[Tuple[str, object], Histogram] = {}
+
+    def record_handler(self, phase: str, handler, duration: float):
+        """
+        Records the time spent in a handler.
+
+        :param phase: the phase of the chain in which the handler was called (request, response, or exception)
+        :param handler: the handler
+        :param duration: the duration in seconds
+        """
+        key = (phase, handler)
+        try:
+            histogram = self._handler_histograms[key]
+        except KeyError:
+            histogram = self._handler_histograms[key] = self.handler_duration.labels(
+                phase, get_handler_name(handler)
+            )
+        except TypeError:
+            # the handler is not hashable
+            histogram = self.handler_duration.labels(phase, get_handler_name(handler))
+
+        histogram.observe(duration)
+
+    def record_operation(self, service: str, operation: str, duration: float):
+        """
+        Records the time it took to process a request to the given service operation.
+
+        :param service: the service name
+        :param operation: the operation name
+        :param duration: the duration in seconds
+        """
+        self.operation_duration.labels(service, operation).observe(duration)
+
+    def clear(self):
+        self._handler_histograms.clear()
+        self.handler_duration.clear()
+        self.operation_duration.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        Returns all metrics in the Prometheus text exposition format.
+        """
+        lines = [
+            *self.handler_duration.to_prometheus(),
+            *self.operation_duration.to_prometheus(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def get_handler_name(handler) -> str:
+    """
+    Returns a human-readable name of the given handler, which is the qualified name of functions and methods, and the
+    class name of any other callable.
+    """
+    if inspect.isfunction(handler) or inspect.ismethod(handler):
+        return handler.__qualname__
+    return handler.__class__.__name__
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape_label_value(value: Optional[str]) -> str:
+    if value is None:
+        return ""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+HANDLER_CHAIN_METRICS = HandlerChainMetrics()
+"""The metrics recorded by the handler chains of the gateway if ``ENABLE_HANDLER_CHAIN_METRICS`` is set."""
@@ -0,0 +1,106 @@
+"""
+JSON codecs used to decode and encode the bodies of requests and responses of the ``json`` and ``rest-json``
+protocols (f.e. DynamoDB, Kinesis, Lambda, SSM, or Step Functions).
+
+The ``JsonCodec`` is a minimal abstraction over the JSON library which is used. If `orjson
+<https://github.com/ijl/orjson>`_ is installed, the ``OrjsonCodec`` is used, which is considerably faster than the
+``json`` module of the standard library. Otherwise, the ``StdlibJsonCodec`` is used.
+
+The codecs only handle the native JSON types. Members which need a special encoding (like timestamps or blobs) are
+converted by the serializers and parsers using the service specification before / after the codec is invoked.
+"""
+import abc
+import json
+import logging
+from typing import Any, Union
+
+LOG = logging.getLogger(__name__)
+
+
+class JsonCodec(abc.ABC):
+    """
+    A JsonCodec decodes JSON documents to Python objects and encodes Python objects to JSON documents.
+    """
+
+    name: str
+
+    @abc.abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decodes the given JSON document.
+
+        :param data: UTF-8 encoded bytes or string containing the JSON document
+        :return: the decoded Python object
+        :raises ValueError: if the data is not a valid JSON document
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes the given Python object as JSON document.
+
+        :param obj: the object to encode, consisting only of native JSON types (dict, list, str, int, float, bool, None)
+        :return: the UTF-8 encoded JSON document
+        :raises TypeError: if the object contains values which cannot be encoded
+        """
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JsonCodec using the ``json`` module of the Python standard library."""
+
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JsonCodec using ``orjson``. Documents which cannot be handled by orjson, but are accepted by the standard library
+    (f.e. lone surrogates in strings, or integers exceeding 64 bits when encoding), are handled by falling back to the
+    ``StdlibJsonCodec``. Be aware that orjson decodes integers exceeding 64 bits as float.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        # datetime objects are passed through to the fallback (which raises a TypeError), just like for the stdlib
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        self._fallback = StdlibJsonCodec()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except ValueError:
+            return self._fallback.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            return self._fallback.dumps(obj)
+
+
+def create_json_codec() -> JsonCodec:
+    """
+    Creates the fastest available JsonCodec.
+
+    :return: an OrjsonCodec if orjson is installed, a StdlibJsonCodec otherwise
+    """
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        LOG.debug("orjson is not installed, using the json module of the standard library")
+        return StdlibJsonCodec()
+
+
+json_codec: JsonCodec = create_json_codec()
+"""The JsonCodec used by the parsers and serializers."""
@@ -59,7 +59,7 @@ class _HttpOperation(NamedTuple):
             # parse the query args of the request URI (they are mandatory)
             query_args: Dict[str, List[str]] = parse_qs(path_query[1], keep_blank_values=True)
             # for mandatory keys without values, keep an empty list (instead of [''] - the result of parse_qs)
-            query_args = {k: filter(None, v) for k, v in query_args.items()}
+            query_args = {k: list(filter(None, v)) for k, v in query_args.items()}
 
         # find the required header and query parameters of the input shape
         input_shape = op.input_shape
@@ -277,10 +277,12 @@ def _create_service_map(service: ServiceModel) -> Map:
     )
 
 
-class RestServiceOperationRouter:
+class WerkzeugRestServiceOperationRouter:
     """
     A router implementation which abstracts the (quite complex) routing of incoming HTTP requests to a specific
-    operation within a "REST" service (rest-xml, rest-json).
+    operation within a "REST" service (rest-xml, rest-json) using a Werkzeug ``Map``.
+    This router is the reference implementation for the ``RestServiceOperationRouter`` (which is used to verify the
+    trie-based matching of the ``RestServiceOperationRouter`` in the tests).
     """
 
     _map: Map
@@ -334,3 +336,307 @@ class RestServiceOperationRouter:
         operation: OperationModel = rule.endpoint
 
         return operation, args
+
+
+class _PathPart(NamedTuple):
+    """
+    A part of a requestUri path which is matched by a single transition of the ``_TrieNode``.
+    Parts are determined (and weighted) exactly like Werkzeug's ``RulePart``.
+    """
+
+    # literal segment of static parts, regex of dynamic parts
+    content: str
+    static: bool
+    # final parts contain a greedy path param and consume all remaining segments of a request path
+    final: bool
+    # final parts with a trailing slash (which might be matched by an optional trailing slash)
+    suffixed: bool
+    # sort key of the dynamic parts (the same as the ``Weighting`` of Werkzeug)
+    weight: Tuple
+    param_names: Tuple[str, ...]
+
+
+# Regex to tokenize requestUri paths into slashes, path params (f.e. {param1} or {param2+}), and static strings
+_path_token_regex = re.compile(r"(?P<slash>/)|(?P<param>{[^}]+})|(?P<static>[^{/]+)")
+# Regex of the (non-greedy) path params, matching a whole segment of a path
+_path_param_content = "([^/]+)"
+# Regex of the greedy path params (f.e. {Key+}), also matching empty strings and slashes (see GreedyPathConverter)
+_greedy_path_param_content = "(.*?)"
+
+
+def _split_path(path: str) -> List[_PathPart]:
+    """
+    Splits a requestUri path (without query params) into the parts which are used as transitions in the trie.
+
+    :param path: requestUri path, f.e. ``/restapis/{restapi_id}/deployments``
+    :return: list of parts for the transitions of the path (starting at the root of the trie)
+    """
+    result = []
+    content = []
+    static = True
+    final = False
+    static_weights = []
+    param_weights = []
+    param_names = []
+
+    def _create_part(suffixed: bool = False) -> _PathPart:
+        weight = (-len(static_weights), static_weights, -len(param_weights), param_weights)
+        if static:
+            return _PathPart("".join(content), True, False, False, weight, ())
+        regex = "".join(content)
+        if suffixed:
+            # the trailing slash is optional (and matched by the last group)
+            regex = regex[:-1] + "(?<!/)(/?)"
+        return _PathPart(regex + r"\Z", False, final, suffixed, weight, tuple(param_names))
+
+    for token in _path_token_regex.finditer(path):
+        slash, param, static_content = token.group("slash", "param", "static")
+        if static_content is not None:
+            static_weights.append((len(static_weights), -len(static_content)))
+            content.append(static_content if static else re.escape(static_content))
+        elif param is not None:
+            if static:
+                # switch the content to a regex
+                content = [re.escape(c) for c in content]
+                static = False
+            name = param[1:-1]
+            if name.endswith("+"):
+                final = True
+                param_names.append(name[:-1])
+                param_weights.append(200)
+                content.append(_greedy_path_param_content)
+            else:
+                param_names.append(name)
+                param_weights.append(100)
+                content.append(_path_param_content)
+        elif final:
+            # final parts (with a greedy param) span all remaining segments
+            content.append(slash)
+        else:
+            result.append(_create_part())
+            content = []
+            static = True
+            static_weights = []
+            param_weights = []
+            param_names = []
+
+    suffixed = final and content[-1] == "/"
+    result.append(_create_part(suffixed))
+    if suffixed:
+        result.append(_PathPart("", True, False, False, result[-1].weight, ()))
+    return result
+
+
+class _TrieLeaf:
+    """
+    Leaf of the trie, containing the operations for a specific path and method. If there are multiple operations for
+    the same path and method, the required query and header args of the operations are used to discriminate them.
+    """
+
+    param_names: Tuple[str, ...]
+    operation: Optional[OperationModel]
+    rules: List[_RequiredArgsRule]
+
+    def __init__(self, param_names: Tuple[str, ...], operations: List[_HttpOperation]):
+        self.param_names = param_names
+        if len(operations) == 1:
+            self.operation = operations[0].operation
+            self.rules = []
+        else:
+            self.operation = None
+            # sort the rules descending based on their rule score (the first matching rule has the highest score)
+            rules = [_RequiredArgsRule(op) for op in operations]
+            self.rules = sorted(rules, key=lambda rule: rule.match_score, reverse=True)
+
+    def match_request(self, request: Request) -> OperationModel:
+        """
+        :param request: to perform the fine-grained matching on
+        :return: matching operation
+        :raises: NotFound if none of the operations matches the required args
+        """
+        if self.operation:
+            return self.operation
+        query_args = request.args
+        headers = request.headers
+        for rule in self.rules:
+            if rule.matches(query_args, headers):
+                return rule.endpoint
+        raise NotFound()
+
+
+class _TrieNode:
+    """
+    Node of the segment trie of a single HTTP method.
+    The transitions are tried in the same order as Werkzeug's state machine matcher does (which makes the results of
+    the ``RestServiceOperationRouter`` equal to the results of the ``WerkzeugRestServiceOperationRouter``):
+    - static transitions (literal path segments) are tried first,
+    - dynamic transitions (segments with path params, or the rest of the path for greedy params) are tried afterwards
+      (ordered by their weight).
+    """
+
+    static: Dict[str, "_TrieNode"]
+    # tuples of the compiled regex (None for a segment consisting only of a path param), the part, and the next node
+    dynamic: List[Tuple[Optional[re.Pattern], _PathPart, "_TrieNode"]]
+    leaf: Optional[_TrieLeaf]
+
+    def __init__(self):
+        self.static = {}
+        self.dynamic = []
+        self.leaf = None
+
+    def add(self, parts: List[_PathPart], operations: List[_HttpOperation]) -> None:
+        node = self
+        param_names = []
+        for part in parts:
+            param_names.extend(part.param_names)
+            if part.static:
+                node = node.static.setdefault(part.content, _TrieNode())
+                continue
+            for _, existing_part, next_node in node.dynamic:
+                # path params with different names (f.e. /{Bucket} and /{Name}) share the same transition
+                if existing_part[:-1] == part[:-1]:
+                    node = next_node
+                    break
+            else:
+                next_node = _TrieNode()
+                regex = (
+                    None
+                    if part.content == _path_param_content + r"\Z"
+                    else re.compile(part.content)
+                )
+                node.dynamic.append((regex, part, next_node))
+                # sort the transitions by their weight (stable, i.e. equally weighted parts keep their order)
+                node.dynamic.sort(key=lambda transition: transition[1].weight)
+                node = next_node
+        if node.leaf is None:
+            node.leaf = _TrieLeaf(tuple(param_names), operations)
+
+    def match(self, parts: List[str], index: int) -> Optional[Tuple[_TrieLeaf, List[str]]]:
+        """
+        Matches the remaining parts of a request path against the subtree of this node.
+
+        :param parts: segments of the request path
+        :param index: index of the first segment which still needs to be matched
+        :return: tuple of the matching leaf and the values of its path params, or None if nothing matches
+        """
+        if index == len(parts):
+            if self.leaf:
+                return self.leaf, []
+            # rules with a trailing slash also match paths without the trailing slash
+            slash_node = self.static.get("")
+            if slash_node and slash_node.leaf:
+                return slash_node.leaf, []
+            return None
+
+        part = parts[index]
+        next_node = self.static.get(part)
+        if next_node:
+            result = next_node.match(parts, index + 1)
+            if result:
+                return result
+
+        for regex, path_part, next_node in self.dynamic:
+            if regex is None:
+                # fast path for segments which only consist of a path param
+                if not part:
+                    continue
+                result = next_node.match(parts, index + 1)
+                if result:
+                    leaf, values = result
+                    return leaf, [part, *values]
+                continue
+
+            remaining_parts, remaining_index = parts, index + 1
+            if path_part.final:
+                match = regex.match("/".join(parts[index:]))
+                remaining_index = len(parts)
+            else:
+                match = regex.match(part)
+            if match is None:
+                continue
+            groups = match.groups()
+            if path_part.suffixed:
+                if groups[-1] == "/":
+                    remaining_parts, remaining_index = [""], 0
+                groups = groups[:-1]
+            result = next_node.match(remaining_parts, remaining_index)
+            if result:
+                leaf, values = result
+                return leaf, [*groups, *values]
+
+        # a trailing slash also matches rules without a trailing slash
+        if index == len(parts) - 1 and not part and self.leaf:
+            return self.leaf, []
+        return None
+
+
+def _create_method_tries(service: ServiceModel) -> Dict[str, _TrieNode]:
+    """
+    Creates a segment trie for each HTTP method with all operations of the given service.
+    :param service: botocore service model to create the tries for
+    :return: dict of the HTTP methods to the root nodes of their tries
+    """
+    # group all operations by their path and method
+    path_index: Dict[(str, str), List[_HttpOperation]] = defaultdict(list)
+    for op_name in service.operation_names:
+        http_op = _HttpOperation.from_operation(service.operation_model(op_name))
+        path_index[(http_op.path, http_op.method)].append(http_op)
+
+    tries: Dict[str, _TrieNode] = defaultdict(_TrieNode)
+    for (path, method), ops in path_index.items():
+        tries[method.upper()].add(_split_path(path), ops)
+    return dict(tries)
+
+
+class RestServiceOperationRouter:
+    """
+    A router implementation which abstracts the (quite complex) routing of incoming HTTP requests to a specific
+    operation within a "REST" service (rest-xml, rest-json).
+
+    The operations are stored in a segment trie per HTTP method. The trie is keyed by the literal segments of the
+    requestUris, path params are matched by dynamic transitions (with a fast path for segments which only consist of
+    a path param), and ambiguous operations (with the same path and method) are discriminated at the leaves using
+    their required query and header args. The matching yields the same results as the
+    ``WerkzeugRestServiceOperationRouter``.
+    """
+
+    _tries: Dict[str, _TrieNode]
+
+    def __init__(self, service: ServiceModel):
+        self._tries = _create_method_tries(service)
+
+    def match(self, request: Request) -> Tuple[OperationModel, Mapping[str, Any]]:
+        """
+        Matches the given request to the operation it targets (or raises an exception if no operation matches).
+
+        :param request: The request of which the targeting operation needs to be found
+        :return: A tuple with the matched operation and the (already parsed) path params
+        :raises: Werkzeug's NotFound exception in case the given request does not match any operation
+        """
+        # some services (at least S3) allow OPTIONS request (f.e. for CORS preflight requests) without them being
+        # specified. the specs do _not_ contain any operations on OPTIONS methods at all.
+        # avoid matching issues for preflight requests by matching against a similar GET request instead.
+        method = request.method.upper()
+        if method == "OPTIONS":
+            method = "GET"
+        trie = self._tries.get(method)
+        if trie is None:
+            raise NotFound()
+
+        # trailing slashes are ignored in smithy matching,
+        # see https://smithy.io/1.0/spec/core/http-traits.html#literal-character-sequences and this
+        # makes sure that, e.g., in s3, `GET /mybucket/` is not matched to `GetBucket` and not to
+        # `GetObject` and the associated rule.
+        path = get_raw_path(request).rstrip("/")
+        # leading slashes are merged (like Werkzeug does)
+        parts = f"/{path.lstrip('/')}".split("/") if path else [""]
+
+        result = trie.match(parts, 0)
+        if result is None:
+            raise NotFound()
+        leaf, values = result
+        operation = leaf.match_request(request)
+
+        # the path param values might still be url-encoded
+        args = {name: unquote(value) for name, value in zip(leaf.param_names, values)}
+        return operation, args
@@ -60,6 +60,13 @@ to certain so-called "traits" in Smithy.
 The result of the parser methods are the operation model of the
 service's action which the request was aiming for, as well as the
 parsed parameters for the service's function invocation.
+
+Instead of walking the shape tree of an operation on every request,
+the parsers compile a specialized parse function for each shape the
+first time it is encountered (see ``RequestParser._get_shape_parser``).
+The compiled functions have the shape's metadata (member names,
+locations, type handlers) already resolved, and are cached on the parser
+instance (i.e. once per service).
 """
 import abc
 import base64
@@ -68,7 +75,7 @@ import functools
 import re
 from abc import ABC
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
 from typing.io import IO
 from xml.etree import ElementTree as ETree
 
@@ -83,12 +90,16 @@ from botocore.model import (
     Shape,
     StructureShape,
 )
-from werkzeug.exceptions import BadRequest, NotFound
+from werkzeug.exceptions import HTTPException, NotFound
 
 from localstack.aws.api import HttpRequest
+from localstack.aws.protocol.codec import JsonCodec, json_codec
 from localstack.aws.protocol.op_router import RestServiceOperationRouter
 from localstack.config import LEGACY_S3_PROVIDER
 
+ShapeParser = Callable[[HttpRequest, Any, Optional[Mapping[str, Any]]], Any]
+"""A parse function compiled for a specific shape, called with the request, the node, and the URI params."""
+
 
 def _text_content(func):
     """
@@ -161,7 +172,9 @@ class OperationNotFoundParserError(ProtocolParserError):
 def _handle_exceptions(func):
     """
     Decorator which handles the exceptions raised by the parser. It ensures that all exceptions raised by the public
-    methods of the parser are instances of RequestParserError.
+    methods of the parser are instances of RequestParserError, except for werkzeug's HTTPExceptions raised while
+    reading the request (f.e., if the decoded request body is too large), which already define the status code of the
+    response.
     :param func: to wrap in order to add the exception handling
     :return: wrapped function
     """
@@ -170,7 +183,7 @@ def _handle_exceptions(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except RequestParserError:
+        except (RequestParserError, HTTPException):
             raise
         except Exception as e:
             raise UnknownParserError(
@@ -200,6 +213,8 @@ class RequestParser(abc.ABC):
     def __init__(self, service: ServiceModel) -> None:
         super().__init__()
         self.service = service
+        # compiled parse functions, keyed by the (identity of the) shape they have been compiled for
+        self._shape_parsers: Dict[Shape, ShapeParser] = {}
 
     @_handle_exceptions
     def parse(self, request: HttpRequest) -> Tuple[OperationModel, Any]:
@@ -218,7 +233,7 @@ class RequestParser(abc.ABC):
         self, request: HttpRequest, shape: Shape, node: Any, uri_params: Mapping[str, Any] = None
     ) -> Any:
         """
-        Main parsing method which dynamically calls the parsing function for the specific shape.
+        Main parsing method which calls the compiled parsing function for the specific shape.
 
         :param request: the complete HttpRequest
         :param shape: of the node
@@ -228,59 +243,129 @@ class RequestParser(abc.ABC):
         """
         if shape is None:
             return None
+        return self._get_shape_parser(shape)(request, node, uri_params)
+
+    def _get_shape_parser(self, shape: Shape) -> ShapeParser:
+        """
+        Returns the parse function for the given shape. The function is compiled the first time the shape is
+        encountered, and afterwards cached for the lifetime of the parser.
+
+        :param shape: to get the parse function for
+        :return: the compiled parse function
+        """
+        try:
+            return self._shape_parsers[shape]
+        except KeyError:
+            shape_parser = self._shape_parsers[shape] = self._compile_shape(shape)
+            return shape_parser
+
+    def _compile_shape(self, shape: Shape) -> ShapeParser:
+        """
+        Compiles the parse function for the given shape. The function extracts the value from the shape's location
+        (or takes the given node if the shape does not have a location trait), and converts it with the type-specific
+        value parser (see ``_compile_value``).
+
+        :param shape: to compile the parse function for
+        :return: the compiled parse function
+        """
+        if shape.serialization.get("location") == "headers":
+            # shapes with the location trait "headers" only contain strings and are not further processed
+            def _parse_header_map(request: HttpRequest, _, __=None) -> dict:
+                return self._parse_header_map(shape, request.headers)
+
+            return _parse_header_map
+
+        get_payload = self._compile_location(shape)
+        parse_value = self._compile_value(shape)
+        shape_name = shape.name
+        type_name = shape.type_name
+
+        def _parse(request: HttpRequest, node: Any, uri_params: Mapping[str, Any] = None) -> Any:
+            payload = node if get_payload is None else get_payload(request, uri_params)
+            if payload is None:
+                return None
+            try:
+                return parse_value(request, payload, uri_params)
+            except (TypeError, ValueError, AttributeError) as e:
+                raise ProtocolParserError(
+                    f"Invalid type when parsing {shape_name}: '{payload}' cannot be parsed to {type_name}."
+                ) from e
+
+        return _parse
+
+    def _compile_location(
+        self, shape: Shape
+    ) -> Optional[Callable[[HttpRequest, Mapping[str, Any]], Any]]:
+        """
+        Compiles the function which extracts the value of a shape with a location trait from the request.
+
+        :param shape: to compile the location function for
+        :return: function which is called with the request and the URI params and returns the (raw) value,
+                 or None if the shape does not have a location trait (i.e. the value is the node itself)
+        """
         location = shape.serialization.get("location")
-        if location is not None:
-            if location == "header":
-                header_name = shape.serialization.get("name")
-                payload = request.headers.get(header_name)
-                if shape.type_name == "list":
+        if location is None:
+            return None
+        name = shape.serialization.get("name")
+        is_list = shape.type_name == "list"
+
+        if location == "header":
+
+            def _get_header(request: HttpRequest, _) -> Any:
+                payload = request.headers.get(name)
+                if is_list and payload is not None:
                     # headers may contain a comma separated list of values (e.g., the ObjectAttributes member in
-                    # s3.GetObjectAttributes), so we prepare it here for the handler, which will be `_parse_list`.
+                    # s3.GetObjectAttributes), so we prepare it here for the list parser.
                     payload = payload.split(",")
-            elif location == "headers":
-                payload = self._parse_header_map(shape, request.headers)
-                # shapes with the location trait "headers" only contain strings and are not further processed
                 return payload
-            elif location == "querystring":
-                query_name = shape.serialization.get("name")
-                parsed_query = request.args
-                if shape.type_name == "list":
-                    payload = parsed_query.getlist(query_name)
-                else:
-                    payload = parsed_query.get(query_name)
-            elif location == "uri":
-                uri_param_name = shape.serialization.get("name")
-                if uri_param_name in uri_params:
-                    payload = uri_params[uri_param_name]
-            else:
-                raise UnknownParserError("Unknown shape location '%s'." % location)
+
+            return _get_header
+        elif location == "querystring":
+
+            def _get_query_param(request: HttpRequest, _) -> Any:
+                if is_list:
+                    return request.args.getlist(name)
+                return request.args.get(name)
+
+            return _get_query_param
+        elif location == "uri":
+
+            def _get_uri_param(_, uri_params: Mapping[str, Any]) -> Any:
+                return uri_params.get(name) if uri_params else None
+
+            return _get_uri_param
         else:
-            # If we don't have to use a specific location, we use the node
-            payload = node
+            raise UnknownParserError("Unknown shape location '%s'." % location)
 
-        fn_name = "_parse_%s" % shape.type_name
-        handler = getattr(self, fn_name, self._noop_parser)
-        try:
-            return handler(request, shape, payload, uri_params) if payload is not None else None
-        except (TypeError, ValueError, AttributeError) as e:
-            raise ProtocolParserError(
-                f"Invalid type when parsing {shape.name}: '{payload}' cannot be parsed to {shape.type_name}."
-            ) from e
+    def _compile_value(self, shape: Shape) -> ShapeParser:
+        """
+        Compiles the function which converts a (non-None) value of the given shape. Complex types are compiled by the
+        protocol-specific ``_compile_<type>`` methods, scalar types are converted with the ``_parse_<type>`` methods.
 
-    # The parsing functions for primitive types, lists, and timestamps are shared among subclasses.
+        :param shape: to compile the value parser for
+        :return: the compiled value parser
+        """
+        compile_fn = getattr(self, "_compile_%s" % shape.type_name, None)
+        if compile_fn is not None:
+            return compile_fn(shape)
 
-    def _parse_list(
-        self,
-        request: HttpRequest,
-        shape: ListShape,
-        node: list,
-        uri_params: Mapping[str, Any] = None,
-    ):
-        parsed = []
-        member_shape = shape.member
-        for item in node:
-            parsed.append(self._parse_shape(request, member_shape, item, uri_params))
-        return parsed
+        handler = getattr(self, "_parse_%s" % shape.type_name, self._noop_parser)
+
+        def _parse_scalar(request: HttpRequest, node: Any, uri_params: Mapping[str, Any] = None):
+            return handler(request, shape, node, uri_params)
+
+        return _parse_scalar
+
+    # The compile functions for lists, as well as the parsing functions for primitive types and timestamps are shared
+    # among subclasses.
+
+    def _compile_list(self, shape: ListShape) -> ShapeParser:
+        parse_member = self._get_shape_parser(shape.member)
+
+        def _parse_list(request: HttpRequest, node: list, uri_params: Mapping[str, Any] = None):
+            return [parse_member(request, item, uri_params) for item in node]
+
+        return _parse_list
 
     @_text_content
     def _parse_integer(self, _, __, node: str, ___) -> int:
@@ -383,54 +468,84 @@ class QueryRequestParser(RequestParser):
             return operation, {}
         return operation, parsed
 
-    def _process_member(
-        self,
-        request: HttpRequest,
-        member_name: str,
-        member_shape: Shape,
-        node: dict,
-        uri_params: Mapping[str, Any] = None,
-    ):
+    def _compile_member(
+        self, member_shape: Shape
+    ) -> Callable[[HttpRequest, str, dict, Optional[Mapping[str, Any]]], Any]:
+        """
+        Compiles the function which extracts the member with a given (serialized) name from the node and parses it.
+
+        :param member_shape: shape of the member
+        :return: function which is called with the request, the name of the member, the node, and the URI params
+        """
+        parse_member = self._get_shape_parser(member_shape)
+
         if isinstance(member_shape, (MapShape, ListShape, StructureShape)):
             # If we have a complex type, we filter the node and change it's keys to craft a new "context" for the
             # new hierarchy level
-            sub_node = self._filter_node(member_name, node)
-        else:
-            # If it is a primitive type we just get the value from the dict
+            def _process_complex_member(
+                request: HttpRequest,
+                member_name: str,
+                node: dict,
+                uri_params: Mapping[str, Any] = None,
+            ):
+                sub_node = self._filter_node(member_name, node)
+                return parse_member(request, sub_node, uri_params) if sub_node is not None else None
+
+            return _process_complex_member
+
+        # If it is a primitive type we just get the value from the dict
+        def _process_member(
+            request: HttpRequest,
+            member_name: str,
+            node: dict,
+            uri_params: Mapping[str, Any] = None,
+        ):
             sub_node = node.get(member_name)
-        # The filtered node is processed and returned (or None if the sub_node is None)
-        return (
-            self._parse_shape(request, member_shape, sub_node, uri_params)
-            if sub_node is not None
-            else None
-        )
-
-    def _parse_structure(
-        self,
-        request: HttpRequest,
-        shape: StructureShape,
-        node: dict,
-        uri_params: Mapping[str, Any] = None,
-    ) -> dict:
-        result = {}
-
-        for member, member_shape in shape.members.items():
-            # The key in the node is either the serialization config "name" of the shape, or the name of the member
-            member_name = self._get_serialized_name(member_shape, member, node)
-            # BUT, if it's flattened and a list, the name is defined by the list's member's name
-            if member_shape.serialization.get("flattened"):
-                if isinstance(member_shape, ListShape):
-                    member_name = self._get_serialized_name(member_shape.member, member, node)
-            value = self._process_member(request, member_name, member_shape, node, uri_params)
-            if value is not None or member in shape.required_members:
-                # If the member is required, but not existing, we explicitly set None
-                result[member] = value
-
-        return result if len(result) > 0 else None
-
-    def _parse_map(
-        self, request: HttpRequest, shape: MapShape, node: dict, uri_params: Mapping[str, Any]
-    ) -> dict:
+            return parse_member(request, sub_node, uri_params) if sub_node is not None else None
+
+        return _process_member
+
+    def _compile_structure(self, shape: StructureShape) -> ShapeParser:
+        # the members are compiled on the first invocation, since the shapes can be recursive
+        members = None
+
+        def _compile_members() -> list:
+            compiled = []
+            for member, member_shape in shape.members.items():
+                # The key in the node is either the serialization config "name" of the shape, or the name of the
+                # member. BUT, if it's flattened and a list, the name is defined by the list's member's name
+                if member_shape.serialization.get("flattened") and isinstance(
+                    member_shape, ListShape
+                ):
+                    member_name = self._compile_serialized_name(member_shape.member, member)
+                else:
+                    member_name = self._compile_serialized_name(member_shape, member)
+                process_member = self._compile_member(member_shape)
+                required = member in shape.required_members
+                compiled.append((member, member_name, process_member, required))
+            return compiled
+
+        def _parse_structure(
+            request: HttpRequest, node: dict, uri_params: Mapping[str, Any] = None
+        ) -> dict:
+            nonlocal members
+            if members is None:
+                members = _compile_members()
+
+            result = {}
+            for member, member_name, process_member, required in members:
+                if not isinstance(member_name, str):
+                    member_name = member_name(node)
+                value = process_member(request, member_name, node, uri_params)
+                if value is not None or required:
+                    # If the member is required, but not existing, we explicitly set None
+                    result[member] = value
+
+            return result if len(result) > 0 else None
+
+        return _parse_structure
+
+    def _compile_map(self, shape: MapShape) -> ShapeParser:
         """
         This is what the node looks like for a flattened map::
         ::
@@ -441,7 +556,7 @@ class QueryRequestParser(RequestParser):
               ...
           }
         ::
-        This function expects an already filtered / pre-processed node. The node dict would therefore look like:
+        The compiled function expects an already filtered / pre-processed node. The node dict would therefore look like:
         ::
           {
               "1.Name": "MyKey",
@@ -455,33 +570,34 @@ class QueryRequestParser(RequestParser):
         # https://awslabs.github.io/smithy/1.0/spec/core/xml-traits.html#xmlflattened-trait
         if not shape.serialization.get("flattened"):
             key_prefix += "entry."
-        result = {}
-
-        i = 0
-        while True:
-            i += 1
-            # The key and value can be renamed (with their serialization config's "name").
-            # By default they are called "key" and "value".
-            key_name = f"{key_prefix}{i}.{self._get_serialized_name(shape.key, 'key', node)}"
-            value_name = f"{key_prefix}{i}.{self._get_serialized_name(shape.value, 'value', node)}"
-
-            # We process the key and value individually
-            k = self._process_member(request, key_name, shape.key, node)
-            v = self._process_member(request, value_name, shape.value, node)
-            if k is None or v is None:
-                # technically, if one exists but not the other, then that would be an invalid request
-                break
-            result[k] = v
-
-        return result if len(result) > 0 else None
-
-    def _parse_list(
-        self,
-        request: HttpRequest,
-        shape: ListShape,
-        node: dict,
-        uri_params: Mapping[str, Any] = None,
-    ) -> list:
+        # The key and value can be renamed (with their serialization config's "name").
+        # By default they are called "key" and "value".
+        key_name = self._compile_serialized_name(shape.key, "key")
+        value_name = self._compile_serialized_name(shape.value, "value")
+        process_key = self._compile_member(shape.key)
+        process_value = self._compile_member(shape.value)
+
+        def _parse_map(request: HttpRequest, node: dict, uri_params: Mapping[str, Any] = None):
+            key_suffix = key_name if isinstance(key_name, str) else key_name(node)
+            value_suffix = value_name if isinstance(value_name, str) else value_name(node)
+            result = {}
+
+            i = 0
+            while True:
+                i += 1
+                # We process the key and value individually
+                k = process_key(request, f"{key_prefix}{i}.{key_suffix}", node)
+                v = process_value(request, f"{key_prefix}{i}.{value_suffix}", node)
+                if k is None or v is None:
+                    # technically, if one exists but not the other, then that would be an invalid request
+                    break
+                result[k] = v
+
+            return result if len(result) > 0 else None
+
+        return _parse_map
+
+    def _compile_list(self, shape: ListShape) -> ShapeParser:
         """
         Some actions take lists of parameters. These lists are specified using the param.[member.]n notation.
         The "member" is used if the list is not flattened.
@@ -489,7 +605,7 @@ class QueryRequestParser(RequestParser):
         For example, a list with two elements looks like this:
         - Flattened: &AttributeName.1=first&AttributeName.2=second
         - Non-flattened: &AttributeName.member.1=first&AttributeName.member.2=second
-        This function expects an already filtered / processed node. The node dict would therefore look like:
+        The compiled function expects an already filtered / processed node. The node dict would therefore look like:
         ::
           {
               "1": "first",
@@ -499,22 +615,26 @@ class QueryRequestParser(RequestParser):
         ::
         """
         # The keys might be prefixed (f.e. for flattened lists)
-        key_prefix = self._get_list_key_prefix(shape, node)
+        key_prefix = self._compile_list_key_prefix(shape)
+        process_member = self._compile_member(shape.member)
+
+        def _parse_list(request: HttpRequest, node: dict, uri_params: Mapping[str, Any] = None):
+            prefix = key_prefix if isinstance(key_prefix, str) else key_prefix(node)
+            # The list positions are processed in ascending order, therefore the result is already sorted, even if
+            # the attribute values in the request are unordered
+            result = []
 
-        # We collect the list value as well as the integer indicating the list position so we can
-        # later sort the list by the position, in case they attribute values are unordered
-        result: List[Tuple[int, Any]] = []
+            i = 0
+            while True:
+                i += 1
+                value = process_member(request, f"{prefix}{i}", node)
+                if value is None:
+                    break
+                result.append(value)
 
-        i = 0
-        while True:
-            i += 1
-            key_name = f"{key_prefix}{i}"
-            value = self._process_member(request, key_name, shape.member, node)
-            if value is None:
-                break
-            result.append((i, value))
+            return result if len(result) > 0 else None
 
-        return [r[1] for r in sorted(result)] if len(result) > 0 else None
+        return _parse_list
 
     @staticmethod
     def _filter_node(name: str, node: dict) -> dict:
@@ -529,14 +649,26 @@ class QueryRequestParser(RequestParser):
         """
         return shape.serialization.get("name", default_name)
 
-    def _get_list_key_prefix(self, shape: ListShape, node: dict):
-        key_prefix = ""
+    def _compile_serialized_name(
+        self, shape: Shape, default_name: str
+    ) -> Union[str, Callable[[dict], str]]:
+        """
+        Returns the serialized name for the shape (see ``_get_serialized_name``) when compiling the parse function.
+        Parsers for which the name depends on the contents of the node return a function which determines the name for
+        a given node instead.
+        """
+        return self._get_serialized_name(shape, default_name, {})
+
+    def _compile_list_key_prefix(self, shape: ListShape) -> Union[str, Callable[[dict], str]]:
         # Non-flattened lists have an additional hierarchy level:
         # https://awslabs.github.io/smithy/1.0/spec/core/xml-traits.html#xmlflattened-trait
         # The hierarchy level's name is the serialization name of its member or (by default) "member".
-        if not shape.serialization.get("flattened"):
-            key_prefix += f"{self._get_serialized_name(shape.member, 'member', node)}."
-        return key_prefix
+        if shape.serialization.get("flattened"):
+            return ""
+        member_name = self._compile_serialized_name(shape.member, "member")
+        if isinstance(member_name, str):
+            return f"{member_name}."
+        return lambda node: f"{member_name(node)}."
 
 
 class BaseRestRequestParser(RequestParser):
@@ -665,84 +797,107 @@ class RestXMLRequestParser(BaseRestRequestParser):
             return ETree.Element("")
         return self._parse_xml_string_to_dom(body)
 
-    def _parse_structure(
-        self,
-        request: HttpRequest,
-        shape: StructureShape,
-        node: ETree.Element,
-        uri_params: Mapping[str, Any] = None,
-    ) -> dict:
-        parsed = {}
-        xml_dict = self._build_name_to_xml_node(node)
-        for member_name, member_shape in shape.members.items():
-            xml_name = self._member_key_name(member_shape, member_name)
-            member_node = xml_dict.get(xml_name)
-            # If a shape defines a location trait, the node might be None (since these are extracted from the request's
-            # metadata like headers or the URI)
-            if (
-                member_node is not None
-                or "location" in member_shape.serialization
-                or member_shape.serialization.get("eventheader")
-            ):
-                parsed[member_name] = self._parse_shape(
-                    request, member_shape, member_node, uri_params
-                )
-            elif member_shape.serialization.get("xmlAttribute"):
-                attributes = {}
-                location_name = member_shape.serialization["name"]
-                for key, value in node.attrib.items():
-                    new_key = self._namespace_re.sub(location_name.split(":")[0] + ":", key)
-                    attributes[new_key] = value
-                if location_name in attributes:
-                    parsed[member_name] = attributes[location_name]
-            elif member_name in shape.required_members:
-                # If the member is required, but not existing, we explicitly set None
-                parsed[member_name] = None
-        return parsed
-
-    def _parse_map(
-        self,
-        request: HttpRequest,
-        shape: MapShape,
-        node: dict,
-        uri_params: Mapping[str, Any] = None,
-    ) -> dict:
-        parsed = {}
-        key_shape = shape.key
-        value_shape = shape.value
-        key_location_name = key_shape.serialization.get("name", "key")
-        value_location_name = value_shape.serialization.get("name", "value")
-        if shape.serialization.get("flattened") and not isinstance(node, list):
-            node = [node]
-        for keyval_node in node:
-            key_name = val_name = None
-            for single_pair in keyval_node:
-                # Within each <entry> there's a <key> and a <value>
-                tag_name = self._node_tag(single_pair)
-                if tag_name == key_location_name:
-                    key_name = self._parse_shape(request, key_shape, single_pair, uri_params)
-                elif tag_name == value_location_name:
-                    val_name = self._parse_shape(request, value_shape, single_pair, uri_params)
-                else:
-                    raise ProtocolParserError("Unknown tag: %s" % tag_name)
-            parsed[key_name] = val_name
-        return parsed
+    def _compile_structure(self, shape: StructureShape) -> ShapeParser:
+        # the members are compiled on the first invocation, since the shapes can be recursive
+        members = None
 
-    def _parse_list(
-        self,
-        request: HttpRequest,
-        shape: ListShape,
-        node: dict,
-        uri_params: Mapping[str, Any] = None,
-    ) -> list:
-        # When we use _build_name_to_xml_node, repeated elements are aggregated
-        # into a list. However, we can't tell the difference between a scalar
-        # value and a single element flattened list. So before calling the
-        # real _handle_list, we know that "node" should actually be a list if
-        # it's flattened, and if it's not, then we make it a one element list.
-        if shape.serialization.get("flattened") and not isinstance(node, list):
-            node = [node]
-        return super(RestXMLRequestParser, self)._parse_list(request, shape, node, uri_params)
+        def _compile_members() -> list:
+            compiled = []
+            for member_name, member_shape in shape.members.items():
+                serialization = member_shape.serialization
+                xml_name = self._member_key_name(member_shape, member_name)
+                parse_member = self._get_shape_parser(member_shape)
+                # If a shape defines a location trait, the node might be None (since these are extracted from the
+                # request's metadata like headers or the URI)
+                always_parse = "location" in serialization or bool(serialization.get("eventheader"))
+                attribute_name = (
+                    serialization["name"] if serialization.get("xmlAttribute") else None
+                )
+                required = member_name in shape.required_members
+                compiled.append(
+                    (member_name, xml_name, parse_member, always_parse, attribute_name, required)
+                )
+            return compiled
+
+        def _parse_structure(
+            request: HttpRequest, node: ETree.Element, uri_params: Mapping[str, Any] = None
+        ) -> dict:
+            nonlocal members
+            if members is None:
+                members = _compile_members()
+
+            parsed = {}
+            xml_dict = self._build_name_to_xml_node(node)
+            for (
+                member_name,
+                xml_name,
+                parse_member,
+                always_parse,
+                attribute_name,
+                required,
+            ) in members:
+                member_node = xml_dict.get(xml_name)
+                if member_node is not None or always_parse:
+                    parsed[member_name] = parse_member(request, member_node, uri_params)
+                elif attribute_name is not None:
+                    attributes = {}
+                    for key, value in node.attrib.items():
+                        new_key = self._namespace_re.sub(attribute_name.split(":")[0] + ":", key)
+                        attributes[new_key] = value
+                    if attribute_name in attributes:
+                        parsed[member_name] = attributes[attribute_name]
+                elif required:
+                    # If the member is required, but not existing, we explicitly set None
+                    parsed[member_name] = None
+            return parsed
+
+        return _parse_structure
+
+    def _compile_map(self, shape: MapShape) -> ShapeParser:
+        key_location_name = shape.key.serialization.get("name", "key")
+        value_location_name = shape.value.serialization.get("name", "value")
+        parse_key = self._get_shape_parser(shape.key)
+        parse_value = self._get_shape_parser(shape.value)
+        flattened = shape.serialization.get("flattened")
+
+        def _parse_map(request: HttpRequest, node: dict, uri_params: Mapping[str, Any] = None):
+            parsed = {}
+            if flattened and not isinstance(node, list):
+                node = [node]
+            for keyval_node in node:
+                key_name = val_name = None
+                for single_pair in keyval_node:
+                    # Within each <entry> there's a <key> and a <value>
+                    tag_name = self._node_tag(single_pair)
+                    if tag_name == key_location_name:
+                        key_name = parse_key(request, single_pair, uri_params)
+                    elif tag_name == value_location_name:
+                        val_name = parse_value(request, single_pair, uri_params)
+                    else:
+                        raise ProtocolParserError("Unknown tag: %s" % tag_name)
+                parsed[key_name] = val_name
+            return parsed
+
+        return _parse_map
+
+    def _compile_list(self, shape: ListShape) -> ShapeParser:
+        parse_list = super(RestXMLRequestParser, self)._compile_list(shape)
+        if not shape.serialization.get("flattened"):
+            return parse_list
+
+        def _parse_flattened_list(
+            request: HttpRequest, node: dict, uri_params: Mapping[str, Any] = None
+        ) -> list:
+            # When we use _build_name_to_xml_node, repeated elements are aggregated
+            # into a list. However, we can't tell the difference between a scalar
+            # value and a single element flattened list. So before calling the
+            # real list parser, we know that "node" should actually be a list if
+            # it's flattened, and if it's not, then we make it a one element list.
+            if not isinstance(node, list):
+                node = [node]
+            return parse_list(request, node, uri_params)
+
+        return _parse_flattened_list
 
     def _node_tag(self, node: ETree.Element) -> str:
         return self._namespace_re.sub("", node.tag)
@@ -809,49 +964,65 @@ class BaseJSONRequestParser(RequestParser, ABC):
     """
 
     TIMESTAMP_FORMAT = "unixtimestamp"
+    # codec used to decode the JSON payloads (uses orjson if it is installed)
+    JSON_CODEC: JsonCodec = json_codec
 
-    def _parse_structure(
-        self,
-        request: HttpRequest,
-        shape: StructureShape,
-        value: Optional[dict],
-        uri_params: Mapping[str, Any] = None,
-    ) -> Optional[dict]:
+    def _compile_structure(self, shape: StructureShape) -> ShapeParser:
         if shape.is_document_type:
-            final_parsed = value
-        else:
-            if value is None:
-                # If the comes across the wire as "null" (None in python),
-                # we should be returning this unchanged, instead of as an
-                # empty dict.
-                return None
-            final_parsed = {}
+
+            def _parse_document(
+                request: HttpRequest, value: dict, uri_params: Mapping[str, Any] = None
+            ) -> dict:
+                return value
+
+            return _parse_document
+
+        # the members are compiled on the first invocation, since the shapes can be recursive
+        members = None
+
+        def _compile_members() -> list:
+            compiled = []
             for member_name, member_shape in shape.members.items():
                 json_name = member_shape.serialization.get("name", member_name)
+                parse_member = self._get_shape_parser(member_shape)
+                # members with a location trait are not taken from the body, they need to be parsed in any case
+                has_location = "location" in member_shape.serialization
+                required = member_name in shape.required_members
+                compiled.append((member_name, json_name, parse_member, has_location, required))
+            return compiled
+
+        def _parse_structure(
+            request: HttpRequest, value: dict, uri_params: Mapping[str, Any] = None
+        ) -> dict:
+            nonlocal members
+            if members is None:
+                members = _compile_members()
+
+            final_parsed = {}
+            for member_name, json_name, parse_member, has_location, required in members:
                 raw_value = value.get(json_name)
-                parsed = self._parse_shape(request, member_shape, raw_value, uri_params)
-                if parsed is not None or member_name in shape.required_members:
+                if raw_value is not None or has_location:
+                    parsed = parse_member(request, raw_value, uri_params)
+                else:
+                    parsed = None
+                if parsed is not None or required:
                     # If the member is required, but not existing, we set it to None anyways
                     final_parsed[member_name] = parsed
-        return final_parsed
+            return final_parsed
 
-    def _parse_map(
-        self,
-        request: HttpRequest,
-        shape: MapShape,
-        value: Optional[dict],
-        uri_params: Mapping[str, Any] = None,
-    ) -> Optional[dict]:
-        if value is None:
-            return None
-        parsed = {}
-        key_shape = shape.key
-        value_shape = shape.value
-        for key, value in value.items():
-            actual_key = self._parse_shape(request, key_shape, key, uri_params)
-            actual_value = self._parse_shape(request, value_shape, value, uri_params)
-            parsed[actual_key] = actual_value
-        return parsed
+        return _parse_structure
+
+    def _compile_map(self, shape: MapShape) -> ShapeParser:
+        parse_key = self._get_shape_parser(shape.key)
+        parse_value = self._get_shape_parser(shape.value)
+
+        def _parse_map(request: HttpRequest, value: dict, uri_params: Mapping[str, Any] = None):
+            return {
+                parse_key(request, key, uri_params): parse_value(request, val, uri_params)
+                for key, val in value.items()
+            }
+
+        return _parse_map
 
     def _parse_body_as_json(self, request: HttpRequest) -> dict:
         body_contents = request.data
@@ -864,8 +1035,8 @@ class BaseJSONRequestParser(RequestParser, ABC):
                 raise ProtocolParserError("HTTP body could not be parsed as CBOR.") from e
         else:
             try:
-                return request.get_json(force=True)
-            except BadRequest as e:
+                return self.JSON_CODEC.loads(body_contents)
+            except ValueError as e:
                 raise ProtocolParserError("HTTP body could not be parsed as JSON.") from e
 
     def _parse_boolean(
@@ -961,7 +1132,7 @@ class EC2RequestParser(QueryRequestParser):
         else:
             return default_name
 
-    def _get_list_key_prefix(self, shape: ListShape, node: dict):
+    def _compile_list_key_prefix(self, shape: ListShape) -> str:
         # The EC2 protocol does not use a prefix notation for flattened lists
         return ""
 
@@ -1060,25 +1231,29 @@ class S3RequestParser(RestXMLRequestParser):
         else:
             return super().parse(request)
 
-    def _parse_shape(
-        self, request: HttpRequest, shape: Shape, node: Any, uri_params: Mapping[str, Any] = None
-    ) -> Any:
+    def _compile_location(
+        self, shape: Shape
+    ) -> Optional[Callable[[HttpRequest, Mapping[str, Any]], Any]]:
         """
         Special handling of parsing the shape for s3 object-names (=key):
         trailing '/' are valid and need to be preserved, however, the url-matcher removes it from the key
         we check the request.url to verify the name.
         We might want to encode the key to take into account the ones with special characters.
         """
-        if (
-            shape is not None
-            and uri_params is not None
-            and shape.serialization.get("location") == "uri"
+        get_payload = super()._compile_location(shape)
+        if not (
+            shape.serialization.get("location") == "uri"
             and shape.serialization.get("name") == "Key"
-            and request.base_url.endswith(f"{uri_params['Key']}/")
         ):
-            uri_params = dict(uri_params)
-            uri_params["Key"] = uri_params["Key"] + "/"
-        return super()._parse_shape(request, shape, node, uri_params)
+            return get_payload
+
+        def _get_key(request: HttpRequest, uri_params: Mapping[str, Any]) -> Optional[str]:
+            key = get_payload(request, uri_params)
+            if key is not None and request.base_url.endswith(f"{key}/"):
+                key = key + "/"
+            return key
+
+        return _get_key
 
 
 class SQSRequestParser(QueryRequestParser):
@@ -1114,6 +1289,15 @@ class SQSRequestParser(QueryRequestParser):
         # otherwise we use the primary name
         return primary_name
 
+    def _compile_serialized_name(
+        self, shape: Shape, default_name: str
+    ) -> Union[str, Callable[[dict], str]]:
+        # the name only needs to be determined for each node if the serialized name differs from the default name
+        primary_name = super()._get_serialized_name(shape, default_name, {})
+        if primary_name == default_name:
+            return primary_name
+        return functools.partial(self._get_serialized_name, shape, default_name)
+
 
 def create_parser(service: ServiceModel) -> RequestParser:
     """
@@ -69,6 +69,15 @@ to certain so-called "traits" in Smithy.
 
 The result of the serialization methods is the HTTP response which can
 be sent back to the calling client.
+
+Instead of inspecting the shapes of an operation's output for every
+response, the serializers compile a specialized serialization function for
+each shape the first time it is encountered, and cache it on the serializer
+instance (see ``ResponseSerializer._get_shape_serializer``). The XML
+serializers use the compiled functions to write the XML text directly,
+without building an intermediate DOM. If ``STREAM_XML_RESPONSES`` is
+enabled, the XML serializers return a generator as response body, which
+serializes the response in chunks while it is sent to the client.
 """
 import abc
 import base64
@@ -81,8 +90,20 @@ from binascii import crc32
 from datetime import datetime
 from email.utils import formatdate
 from struct import pack
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from xml.etree import ElementTree as ETree
+from xml.sax.saxutils import escape as xml_escape
 
 import cbor2
 import xmltodict
@@ -95,7 +116,9 @@ from werkzeug import Response as WerkzeugResponse
 from werkzeug.datastructures import Headers, MIMEAccept
 from werkzeug.http import parse_accept_header
 
+from localstack import config
 from localstack.aws.api import CommonServiceException, HttpResponse, ServiceException
+from localstack.aws.protocol.codec import JsonCodec, json_codec
 from localstack.aws.spec import load_service
 from localstack.constants import (
     APPLICATION_AMZ_CBOR_1_1,
@@ -114,6 +137,17 @@ LOG = logging.getLogger(__name__)
 
 REQUEST_ID_CHARACTERS = string.digits + string.ascii_uppercase
 
+XmlWriter = Callable[[List[str], Any, str], None]
+"""A serialization function compiled for a shape, which writes the XML for a value (with the given element name)."""
+XmlStreamWriter = Callable[[List[str], Any, str], Iterator[None]]
+"""
+A streaming serialization function compiled for a shape, which writes the XML for a value in parts, and yields whenever
+a part has been written (i.e., whenever the output can be flushed).
+"""
+
+# additional entities which are escaped in XML attribute values (in addition to &, <, and >), equal to ElementTree
+_XML_ATTRIBUTE_ENTITIES = {'"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"}
+
 
 class ResponseSerializerError(Exception):
     """
@@ -180,6 +214,10 @@ class ResponseSerializer(abc.ABC):
     # Needs to be specified by subclasses.
     SUPPORTED_MIME_TYPES: List[str] = []
 
+    def __init__(self):
+        # compiled serialization functions, keyed by the (identity of the) shape they have been compiled for
+        self._shape_serializers: Dict[Shape, Callable] = {}
+
     @_handle_exceptions
     def serialize_to_response(
         self,
@@ -310,6 +348,31 @@ class ResponseSerializer(abc.ABC):
     ) -> None:
         raise NotImplementedError
 
+    def _get_shape_serializer(self, shape: Shape) -> Callable:
+        """
+        Returns the serialization function for the given shape. The function is compiled the first time the shape is
+        encountered, and afterwards cached for the lifetime of the serializer.
+
+        :param shape: to get the serialization function for
+        :return: the compiled serialization function (the signature depends on the protocol)
+        """
+        try:
+            return self._shape_serializers[shape]
+        except KeyError:
+            shape_serializer = self._shape_serializers[shape] = self._compile_shape_serializer(
+                shape
+            )
+            return shape_serializer
+
+    def _compile_shape_serializer(self, shape: Shape) -> Callable:
+        """
+        Compiles the serialization function for the given shape.
+
+        :param shape: to compile the serialization function for
+        :return: the compiled serialization function
+        """
+        raise NotImplementedError
+
     def _serialize_event_stream(
         self,
         response: dict,
@@ -596,6 +659,13 @@ class BaseXMLResponseSerializer(ResponseSerializer):
     """
 
     SUPPORTED_MIME_TYPES = [TEXT_XML, APPLICATION_XML, APPLICATION_JSON]
+    # number of buffered output parts (roughly two per element) after which a chunk of a streamed response is yielded
+    STREAMING_CHUNK_PARTS = 1024
+
+    def __init__(self):
+        super().__init__()
+        # streaming serialization functions, keyed by the (identity of the) shape they have been compiled for
+        self._shape_stream_writers: Dict[Shape, Optional[XmlStreamWriter]] = {}
 
     def _serialize_error(
         self,
@@ -665,10 +735,38 @@ class BaseXMLResponseSerializer(ResponseSerializer):
         operation_model: OperationModel,
         mime_type: str,
         request_id: str,
+    ) -> Union[str, Iterator[bytes], None]:
+        if mime_type == APPLICATION_JSON:
+            # JSON responses of XML-based services are converted from the XML DOM
+            root = self._serialize_body_params_to_xml(params, shape, operation_model, mime_type)
+            self._prepare_additional_traits_in_xml(root, request_id)
+            return self._node_to_string(root, mime_type)
+        if config.STREAM_XML_RESPONSES:
+            return self._serialize_body_params_to_xml_stream(
+                params, shape, operation_model, request_id
+            )
+        return self._serialize_body_params_to_xml_string(params, shape, operation_model, request_id)
+
+    def _serialize_body_params_to_xml_string(
+        self, params: dict, shape: Shape, operation_model: OperationModel, request_id: str
     ) -> Optional[str]:
-        root = self._serialize_body_params_to_xml(params, shape, operation_model, mime_type)
-        self._prepare_additional_traits_in_xml(root, request_id)
-        return self._node_to_string(root, mime_type)
+        """
+        Serializes the given params directly to an XML string using the compiled serialization functions (i.e.
+        without building an intermediate DOM). This is the counterpart of the combination of
+        ``_serialize_body_params_to_xml``, ``_prepare_additional_traits_in_xml``, and ``_node_to_string``, which are
+        still used for JSON responses.
+
+        :param params: to serialize
+        :param shape: to know how to serialize the params
+        :param operation_model: for additional metadata
+        :param request_id: autogenerated AWS request ID identifying the original request
+        :return: string containing the serialized XML document, or None if there is no shape to serialize
+        """
+        if shape is None:
+            return None
+        out = [self._xml_declaration()]
+        self._write_root_shape(out, params, shape)
+        return "".join(out)
 
     def _serialize_body_params_to_xml(
         self, params: dict, shape: Shape, operation_model: OperationModel, mime_type: str
@@ -842,6 +940,400 @@ class BaseXMLResponseSerializer(ResponseSerializer):
         node = ETree.SubElement(xmlnode, name)
         node.text = str(params)
 
+    def _write_root_shape(self, out: List[str], params: Any, shape: Shape) -> None:
+        """Writes the XML element of the root shape of the response body to the given output."""
+        # The botocore serializer expects `shape.serialization["name"]`, but this isn't always present for responses
+        root_name = shape.serialization.get("name", shape.name)
+        self._get_shape_serializer(shape)(out, params, root_name)
+
+    def _compile_shape_serializer(self, shape: Shape) -> XmlWriter:
+        # Some output shapes define a `resultWrapper` in their serialization spec.
+        # While the name would imply that the result is _wrapped_, it is actually renamed.
+        result_wrapper = shape.serialization.get("resultWrapper")
+        compile_fn = getattr(self, "_compile_xml_%s" % shape.type_name, None)
+        write = compile_fn(shape) if compile_fn is not None else self._compile_xml_scalar(shape)
+        shape_name = shape.name
+        type_name = shape.type_name
+
+        def _write(out: List[str], params: Any, name: str) -> None:
+            try:
+                write(out, params, result_wrapper or name)
+            except (TypeError, ValueError, AttributeError) as e:
+                raise ProtocolSerializerError(
+                    f"Invalid type when serializing {shape_name}: '{params}' cannot be parsed to {type_name}."
+                ) from e
+
+        return _write
+
+    def _compile_xml_structure(self, shape: StructureShape) -> XmlWriter:
+        namespace_attributes = self._get_namespace_attributes(shape)
+        namespace_attributes_string = self._xml_attributes(namespace_attributes)
+        # the members are compiled on the first invocation, since the shapes can be recursive
+        members = None
+
+        def _compile_members() -> dict:
+            compiled = {}
+            for key, member_shape in shape.members.items():
+                if member_shape.serialization.get("xmlAttribute"):
+                    # xmlAttributes must have a serialization name, they are marked by not having a writer
+                    compiled[key] = (member_shape.serialization.get("name", key), None)
+                else:
+                    member_name = member_shape.serialization.get("name", key)
+                    compiled[key] = (member_name, self._get_shape_serializer(member_shape))
+            return compiled
+
+        def _write_structure(out: List[str], params: dict, name: str) -> None:
+            nonlocal members
+            if members is None:
+                members = _compile_members()
+
+            attributes = None
+            # the start tag is only written after the members, since they might add attributes to it
+            start = len(out)
+            out.append("")
+            for key, value in params.items():
+                if value is None:
+                    # Don't serialize any param whose value is None.
+                    continue
+                try:
+                    member_name, write_member = members[key]
+                except KeyError:
+                    LOG.warning(
+                        "Response object %s contains a member which is not specified: %s",
+                        shape.name,
+                        key,
+                    )
+                    continue
+                if write_member is None:
+                    # We need to special case member shapes that are marked as an xmlAttribute.
+                    # Rather than serializing into an XML child node, we instead serialize the shape to
+                    # an XML attribute of the *current* node.
+                    if attributes is None:
+                        attributes = dict(namespace_attributes)
+                    attributes[member_name] = value
+                    continue
+                write_member(out, value, member_name)
+
+            attributes_string = (
+                namespace_attributes_string
+                if attributes is None
+                else self._xml_attributes(attributes)
+            )
+            if len(out) > start + 1:
+                out[start] = f"<{name}{attributes_string}>"
+                out.append(f"</{name}>")
+            else:
+                out[start] = f"<{name}{attributes_string} />"
+
+        return _write_structure
+
+    def _compile_xml_list(self, shape: ListShape) -> XmlWriter:
+        member_shape = shape.member
+        write_member = self._get_shape_serializer(member_shape)
+
+        if shape.serialization.get("flattened"):
+            member_name = member_shape.serialization.get("name")
+
+            def _write_flattened_list(out: List[str], params: list, name: str) -> None:
+                # If the list is flattened, either take the member's "name" or the name of the usual name for the
+                # parent element for the children.
+                element_name = name if member_name is None else member_name
+                for item in params:
+                    # Don't serialize any item which is None
+                    if item is not None:
+                        write_member(out, item, element_name)
+
+            return _write_flattened_list
+
+        element_name = member_shape.serialization.get("name", "member")
+
+        def _write_list(out: List[str], params: list, name: str) -> None:
+            start = len(out)
+            out.append(f"<{name}>")
+            for item in params:
+                # Don't serialize any item which is None
+                if item is not None:
+                    write_member(out, item, element_name)
+            self._close_xml_element(out, start, name)
+
+        return _write_list
+
+    def _compile_xml_map(self, shape: MapShape) -> XmlWriter:
+        """
+        See ``_serialize_type_map`` for the structure of serialized maps.
+        """
+        key_name = self._get_serialized_name(shape.key, default_name="key")
+        value_name = self._get_serialized_name(shape.value, default_name="value")
+        write_key = self._get_shape_serializer(shape.key)
+        write_value = self._get_shape_serializer(shape.value)
+        flattened = shape.serialization.get("flattened")
+
+        def _write_map(out: List[str], params: dict, name: str) -> None:
+            start = len(out)
+            if flattened:
+                entry_name = name
+            else:
+                out.append(f"<{name}>")
+                entry_name = "entry"
+            for key, value in params.items():
+                if value is None:
+                    # Don't serialize any param whose value is None.
+                    continue
+                out.append(f"<{entry_name}>")
+                write_key(out, key, key_name)
+                write_value(out, value, value_name)
+                out.append(f"</{entry_name}>")
+            if not flattened:
+                self._close_xml_element(out, start, name)
+
+        return _write_map
+
+    def _compile_xml_scalar(self, shape: Shape) -> XmlWriter:
+        type_name = shape.type_name
+        if type_name == "boolean":
+
+            def to_text(value: bool) -> str:
+                return "true" if value else "false"
+
+        elif type_name == "blob":
+            to_text = self._get_base64
+        elif type_name == "timestamp":
+            timestamp_format = shape.serialization.get("timestampFormat")
+
+            def to_text(value: Any) -> str:
+                return str(self._convert_timestamp_to_str(value, timestamp_format))
+
+        else:
+            to_text = str
+        escape = self._escape_xml_text
+
+        def _write_scalar(out: List[str], params: Any, name: str) -> None:
+            text = escape(to_text(params))
+            if text:
+                out.append(f"<{name}>{text}</{name}>")
+            else:
+                out.append(f"<{name} />")
+
+        return _write_scalar
+
+    @staticmethod
+    def _close_xml_element(out: List[str], start: int, name: str) -> None:
+        """
+        Closes the element with the given name, whose start tag has been written at the given index of the output.
+        Equal to ElementTree, elements without any content are written as an empty-element tag.
+        """
+        if len(out) > start + 1:
+            out.append(f"</{name}>")
+        else:
+            out[start] = f"<{name} />"
+
+    def _escape_xml_text(self, text: str) -> str:
+        """Escapes the text content of an XML element."""
+        return xml_escape(text)
+
+    @staticmethod
+    def _xml_attributes(attributes: Dict[str, str]) -> str:
+        """Returns the string representation of the given XML attributes (including a leading whitespace)."""
+        return "".join(
+            f' {key}="{xml_escape(value, _XML_ATTRIBUTE_ENTITIES)}"'
+            for key, value in attributes.items()
+        )
+
+    def _xml_declaration(self) -> str:
+        return f"<?xml version='1.0' encoding='{self.DEFAULT_ENCODING}'?>\n"
+
+    @staticmethod
+    def _get_namespace_attributes(shape: Shape) -> Dict[str, str]:
+        """Returns the XML namespace attributes of elements of the given shape."""
+        namespace_attributes = {}
+        if "xmlNamespace" in shape.serialization:
+            namespace_metadata = shape.serialization["xmlNamespace"]
+            attribute_name = "xmlns"
+            if namespace_metadata.get("prefix"):
+                attribute_name += ":%s" % namespace_metadata["prefix"]
+            namespace_attributes[attribute_name] = namespace_metadata["uri"]
+        return namespace_attributes
+
+    def _serialize_body_params_to_xml_stream(
+        self, params: dict, shape: Shape, operation_model: OperationModel, request_id: str
+    ) -> Optional[Iterator[bytes]]:
+        """
+        Streaming counterpart of ``_serialize_body_params_to_xml_string``. Instead of returning the whole document, it
+        returns a generator which serializes the given params while it is consumed, and yields the XML document in
+        chunks. Structures and lists are written member by member, all other shapes are written with their compiled
+        serialization function.
+        Serialization errors are raised when the generator is consumed.
+
+        :param params: to serialize
+        :param shape: to know how to serialize the params
+        :param operation_model: for additional metadata
+        :param request_id: autogenerated AWS request ID identifying the original request
+        :return: generator yielding the encoded chunks of the XML document, or None if there is no shape to serialize
+        """
+        if shape is None:
+            return None
+
+        def _stream_document(out: List[str]) -> Iterator[None]:
+            out.append(self._xml_declaration())
+            yield from self._stream_root_shape(out, params, shape)
+
+        return self._iter_xml_chunks(_stream_document)
+
+    def _iter_xml_chunks(self, stream: Callable[[List[str]], Iterator[None]]) -> Iterator[bytes]:
+        """
+        Drives the given streaming serialization function, and yields the buffered output as encoded chunk whenever
+        it exceeds ``STREAMING_CHUNK_PARTS``.
+        """
+        out = []
+        for _ in stream(out):
+            if len(out) >= self.STREAMING_CHUNK_PARTS:
+                yield "".join(out).encode(self.DEFAULT_ENCODING)
+                out.clear()
+        if out:
+            yield "".join(out).encode(self.DEFAULT_ENCODING)
+
+    def _stream_root_shape(self, out: List[str], params: Any, shape: Shape) -> Iterator[None]:
+        """Streaming counterpart of ``_write_root_shape``."""
+        root_name = shape.serialization.get("name", shape.name)
+        yield from self._get_shape_stream_writer(shape)(out, params, root_name)
+
+    def _get_shape_stream_writer(self, shape: Shape) -> Optional[XmlStreamWriter]:
+        """
+        Returns the streaming serialization function for the given shape (compiled once and cached per shape), or None
+        if elements of the shape are always written at once (i.e. the shape is neither a structure nor a list).
+        """
+        try:
+            return self._shape_stream_writers[shape]
+        except KeyError:
+            pass
+        if shape.type_name == "structure":
+            stream = self._compile_xml_stream_structure(shape)
+        elif shape.type_name == "list":
+            stream = self._compile_xml_stream_list(shape)
+        else:
+            self._shape_stream_writers[shape] = None
+            return None
+
+        result_wrapper = shape.serialization.get("resultWrapper")
+        shape_name = shape.name
+        type_name = shape.type_name
+
+        def _stream(out: List[str], params: Any, name: str) -> Iterator[None]:
+            try:
+                yield from stream(out, params, result_wrapper or name)
+            except (TypeError, ValueError, AttributeError) as e:
+                raise ProtocolSerializerError(
+                    f"Invalid type when serializing {shape_name}: '{params}' cannot be parsed to {type_name}."
+                ) from e
+
+        self._shape_stream_writers[shape] = _stream
+        return _stream
+
+    def _compile_xml_stream_structure(self, shape: StructureShape) -> XmlStreamWriter:
+        namespace_attributes = self._get_namespace_attributes(shape)
+
+        def _stream_structure(out: List[str], params: dict, name: str) -> Iterator[None]:
+            # the attributes are collected first, since the start tag has to be complete before the first part is
+            # flushed
+            attributes = dict(namespace_attributes)
+            for key, value in params.items():
+                member_shape = shape.members.get(key)
+                if (
+                    value is not None
+                    and member_shape is not None
+                    and member_shape.serialization.get("xmlAttribute")
+                ):
+                    attributes[member_shape.serialization.get("name", key)] = value
+            attributes_string = self._xml_attributes(attributes)
+
+            start = len(out)
+            out.append(f"<{name}{attributes_string}>")
+            if (yield from self._stream_xml_members(out, params, shape)):
+                out.append(f"</{name}>")
+            else:
+                # nothing has been flushed since the start tag has been written
+                out[start] = f"<{name}{attributes_string} />"
+
+        return _stream_structure
+
+    def _stream_xml_members(
+        self, out: List[str], params: dict, shape: StructureShape
+    ) -> Generator[None, None, bool]:
+        """
+        Writes the child elements of the members of the given structure to the output. Members which are structures or
+        lists are streamed, all other members are written at once.
+
+        :return: True if any child element has been written
+        """
+        has_children = False
+        members = shape.members
+        for key, value in params.items():
+            if value is None:
+                # Don't serialize any param whose value is None.
+                continue
+            member_shape = members.get(key)
+            if member_shape is None:
+                LOG.warning(
+                    "Response object %s contains a member which is not specified: %s",
+                    shape.name,
+                    key,
+                )
+                continue
+            if member_shape.serialization.get("xmlAttribute"):
+                # attributes have already been written to the start tag
+                continue
+            member_name = member_shape.serialization.get("name", key)
+            stream_member = self._get_shape_stream_writer(member_shape)
+            mark = len(out)
+            if stream_member is None:
+                self._get_shape_serializer(member_shape)(out, value, member_name)
+            else:
+                for _ in stream_member(out, value, member_name):
+                    has_children = True
+                    yield
+            # if the output has been flushed while streaming the member, has_children is already set
+            if len(out) > mark:
+                has_children = True
+        return has_children
+
+    def _compile_xml_stream_list(self, shape: ListShape) -> XmlStreamWriter:
+        member_shape = shape.member
+        # the items are the smallest unit which is streamed, every item is written at once
+        write_member = self._get_shape_serializer(member_shape)
+
+        if shape.serialization.get("flattened"):
+            member_name = member_shape.serialization.get("name")
+
+            def _stream_flattened_list(out: List[str], params: list, name: str) -> Iterator[None]:
+                element_name = name if member_name is None else member_name
+                for item in params:
+                    # Don't serialize any item which is None
+                    if item is not None:
+                        write_member(out, item, element_name)
+                        yield
+
+            return _stream_flattened_list
+
+        element_name = member_shape.serialization.get("name", "member")
+
+        def _stream_list(out: List[str], params: list, name: str) -> Iterator[None]:
+            start = len(out)
+            out.append(f"<{name}>")
+            has_items = False
+            for item in params:
+                # Don't serialize any item which is None
+                if item is not None:
+                    write_member(out, item, element_name)
+                    has_items = True
+                    yield
+            if has_items:
+                out.append(f"</{name}>")
+            else:
+                # nothing has been flushed since the start tag has been written
+                out[start] = f"<{name} />"
+
+        return _stream_list
+
     def _prepare_additional_traits_in_xml(self, root: Optional[ETree.Element], request_id: str):
         """
         Prepares the XML root node before being serialized with additional traits (like the Response ID in the Query
@@ -1143,6 +1635,50 @@ class QueryResponseSerializer(BaseXMLResponseSerializer):
         request_id_element = ETree.SubElement(response_metadata, "RequestId")
         request_id_element.text = request_id
 
+    def _serialize_body_params_to_xml_string(
+        self, params: dict, shape: Shape, operation_model: OperationModel, request_id: str
+    ) -> str:
+        # The Query protocol responses have a root element which is not contained in the specification file.
+        root_name = f"{operation_model.name}Response"
+        out = [self._xml_declaration(), f"<{root_name}{self._root_attributes(operation_model)}>"]
+        if shape is not None:
+            self._write_root_shape(out, params, shape)
+        self._write_additional_traits_to_xml(out, request_id)
+        out.append(f"</{root_name}>")
+        return "".join(out)
+
+    def _serialize_body_params_to_xml_stream(
+        self, params: dict, shape: Shape, operation_model: OperationModel, request_id: str
+    ) -> Iterator[bytes]:
+        root_name = f"{operation_model.name}Response"
+
+        def _stream_document(out: List[str]) -> Iterator[None]:
+            out.append(self._xml_declaration())
+            out.append(f"<{root_name}{self._root_attributes(operation_model)}>")
+            if shape is not None:
+                yield from self._stream_root_shape(out, params, shape)
+            self._write_additional_traits_to_xml(out, request_id)
+            out.append(f"</{root_name}>")
+
+        return self._iter_xml_chunks(_stream_document)
+
+    def _write_additional_traits_to_xml(self, out: List[str], request_id: str) -> None:
+        """Writes the additional elements (which are not defined in the specs) to the root element of the output."""
+        # Add the response metadata here
+        out.append("<ResponseMetadata>")
+        self._write_request_id(out, "RequestId", request_id)
+        out.append("</ResponseMetadata>")
+
+    def _write_request_id(self, out: List[str], name: str, request_id: str) -> None:
+        text = self._escape_xml_text(request_id)
+        out.append(f"<{name}>{text}</{name}>" if text else f"<{name} />")
+
+    def _root_attributes(self, operation_model: OperationModel) -> str:
+        # Check if we need to add a namespace
+        if "xmlNamespace" in operation_model.metadata:
+            return self._xml_attributes({"xmlns": operation_model.metadata.get("xmlNamespace")})
+        return ""
+
 
 class EC2ResponseSerializer(QueryResponseSerializer):
     """
@@ -1199,6 +1735,21 @@ class EC2ResponseSerializer(QueryResponseSerializer):
         request_id_element = ETree.SubElement(root, "requestId")
         request_id_element.text = request_id
 
+    def _write_root_shape(self, out: List[str], params: Any, shape: Shape) -> None:
+        # The EC2 protocol does not use the root output shape, therefore only the content of the root shape's element
+        # is written (the compiled serializer writes the start and end tag as separate parts)
+        root_out = []
+        super()._write_root_shape(root_out, params, shape)
+        out.extend(root_out[1:-1])
+
+    def _stream_root_shape(self, out: List[str], params: Any, shape: Shape) -> Iterator[None]:
+        # Only the child elements of the root shape's element are written (see `_write_root_shape`)
+        yield from self._stream_xml_members(out, params, shape)
+
+    def _write_additional_traits_to_xml(self, out: List[str], request_id: str) -> None:
+        # Add the requestId here
+        self._write_request_id(out, "requestId", request_id)
+
 
 class JSONResponseSerializer(ResponseSerializer):
     """
@@ -1212,6 +1763,8 @@ class JSONResponseSerializer(ResponseSerializer):
     SUPPORTED_MIME_TYPES = JSON_TYPES + CBOR_TYPES
 
     TIMESTAMP_FORMAT = "unixtimestamp"
+    # codec used to encode the JSON payloads (uses orjson if it is installed)
+    JSON_CODEC: JsonCodec = json_codec
 
     def _serialize_error(
         self,
@@ -1280,7 +1833,7 @@ class JSONResponseSerializer(ResponseSerializer):
         operation_model: OperationModel,
         mime_type: str,
         request_id: str,
-    ) -> Optional[str]:
+    ) -> Optional[bytes]:
         body = {}
         if shape is not None:
             self._serialize(body, params, shape, None, mime_type)
@@ -1288,41 +1841,77 @@ class JSONResponseSerializer(ResponseSerializer):
         if mime_type in self.CBOR_TYPES:
             return cbor2.dumps(body)
         else:
-            return json.dumps(body)
+            return self.JSON_CODEC.dumps(body)
 
     def _serialize(self, body: dict, value: Any, shape, key: Optional[str], mime_type: str):
-        """This method dynamically invokes the correct `_serialize_type_*` method for each shape type."""
-        try:
-            method = getattr(self, "_serialize_type_%s" % shape.type_name, self._default_serialize)
-            method(body, value, shape, key, mime_type)
-        except (TypeError, ValueError, AttributeError) as e:
-            raise ProtocolSerializerError(
-                f"Invalid type when serializing {shape.name}: '{value}' cannot be parsed to {shape.type_name}."
-            ) from e
-
-    def _serialize_type_structure(
-        self, body: dict, value: dict, shape: StructureShape, key: Optional[str], mime_type: str
-    ):
-        if value is None:
+        """
+        Serializes the value using the compiled serialization function of the shape and sets it in the given body.
+        If no key is given, the members of the (structure) value are directly added to the body.
+        """
+        if value is None and shape.type_name in ("structure", "map", "list"):
             return
-        if shape.is_document_type:
-            body[key] = value
+        serializer = self._get_shape_serializer(shape)
+        if key is None and shape.type_name == "structure" and not shape.is_document_type:
+            body.update(serializer(value, mime_type))
         else:
-            if key is not None:
-                # If a key is provided, this is a result of a recursive
-                # call, so we need to add a new child dict as the value
-                # of the passed in serialized dict.  We'll then add
-                # all the structure members as key/vals in the new serialized
-                # dictionary we just created.
-                new_serialized = {}
-                body[key] = new_serialized
-                body = new_serialized
-            members = shape.members
+            body[key] = serializer(value, mime_type)
+
+    def _compile_shape_serializer(self, shape: Shape) -> Callable[[Any, str], Any]:
+        compile_fn = getattr(self, "_compile_json_%s" % shape.type_name, None)
+        convert = compile_fn(shape) if compile_fn is not None else None
+        if convert is None:
+            # the value of the shape is used as is
+            return self._serialize_unchanged
+        shape_name = shape.name
+        type_name = shape.type_name
+
+        def _serialize(value: Any, mime_type: str) -> Any:
+            try:
+                return convert(value, mime_type)
+            except (TypeError, ValueError, AttributeError) as e:
+                raise ProtocolSerializerError(
+                    f"Invalid type when serializing {shape_name}: '{value}' cannot be parsed to {type_name}."
+                ) from e
+
+        return _serialize
+
+    def _get_member_serializer(self, shape: Shape) -> Optional[Callable[[Any, str], Any]]:
+        """Returns the compiled serialization function for a member, or None if its value can be used as is."""
+        serializer = self._get_shape_serializer(shape)
+        return None if serializer is self._serialize_unchanged else serializer
+
+    @staticmethod
+    def _serialize_unchanged(value: Any, _) -> Any:
+        return value
+
+    def _compile_json_structure(
+        self, shape: StructureShape
+    ) -> Optional[Callable[[dict, str], Any]]:
+        if shape.is_document_type:
+            return None
+        # the members are compiled on the first invocation, since the shapes can be recursive
+        members = None
+
+        def _compile_members() -> dict:
+            return {
+                member_key: (
+                    member_shape.serialization.get("name", member_key),
+                    self._get_member_serializer(member_shape),
+                )
+                for member_key, member_shape in shape.members.items()
+            }
+
+        def _serialize_structure(value: dict, mime_type: str) -> dict:
+            nonlocal members
+            if members is None:
+                members = _compile_members()
+
+            serialized = {}
             for member_key, member_value in value.items():
                 if member_value is None:
                     continue
                 try:
-                    member_shape = members[member_key]
+                    serialized_key, serialize_member = members[member_key]
                 except KeyError:
                     LOG.warning(
                         "Response object %s contains a member which is not specified: %s",
@@ -1330,59 +1919,67 @@ class JSONResponseSerializer(ResponseSerializer):
                         member_key,
                     )
                     continue
-                if "name" in member_shape.serialization:
-                    member_key = member_shape.serialization["name"]
-                self._serialize(body, member_value, member_shape, member_key, mime_type)
+                serialized[serialized_key] = (
+                    member_value
+                    if serialize_member is None
+                    else serialize_member(member_value, mime_type)
+                )
+            return serialized
+
+        return _serialize_structure
+
+    def _compile_json_map(self, shape: MapShape) -> Callable[[dict, str], dict]:
+        serialize_value = self._get_member_serializer(shape.value)
+
+        def _serialize_map(value: dict, mime_type: str) -> dict:
+            if serialize_value is None:
+                return {
+                    sub_key: sub_value
+                    for sub_key, sub_value in value.items()
+                    if sub_value is not None
+                }
+            return {
+                sub_key: serialize_value(sub_value, mime_type)
+                for sub_key, sub_value in value.items()
+                if sub_value is not None
+            }
+
+        return _serialize_map
+
+    def _compile_json_list(self, shape: ListShape) -> Callable[[list, str], list]:
+        serialize_member = self._get_member_serializer(shape.member)
+
+        def _serialize_list(value: list, mime_type: str) -> list:
+            if serialize_member is None:
+                return [list_item for list_item in value if list_item is not None]
+            return [
+                serialize_member(list_item, mime_type)
+                for list_item in value
+                if list_item is not None
+            ]
 
-    def _serialize_type_map(
-        self, body: dict, value: dict, shape: MapShape, key: str, mime_type: str
-    ):
-        if value is None:
-            return
-        map_obj = {}
-        body[key] = map_obj
-        for sub_key, sub_value in value.items():
-            if sub_value is not None:
-                self._serialize(map_obj, sub_value, shape.value, sub_key, mime_type)
+        return _serialize_list
 
-    def _serialize_type_list(
-        self, body: dict, value: list, shape: ListShape, key: str, mime_type: str
-    ):
-        if value is None:
-            return
-        list_obj = []
-        body[key] = list_obj
-        for list_item in value:
-            if list_item is not None:
-                wrapper = {}
-                # The JSON list serialization is the only case where we aren't
-                # setting a key on a dict.  We handle this by using
-                # a __current__ key on a wrapper dict to serialize each
-                # list item before appending it to the serialized list.
-                self._serialize(wrapper, list_item, shape.member, "__current__", mime_type)
-                list_obj.append(wrapper["__current__"])
-
-    def _default_serialize(self, body: dict, value: Any, _, key: str, __):
-        body[key] = value
+    def _compile_json_timestamp(self, shape: Shape) -> Callable[[Any, str], Any]:
+        timestamp_format = shape.serialization.get("timestampFormat")
 
-    def _serialize_type_timestamp(
-        self, body: dict, value: Any, shape: Shape, key: str, mime_type: str
-    ):
-        timestamp_format = (
-            shape.serialization.get("timestampFormat")
-            # CBOR always uses unix timestamp milliseconds
-            if mime_type not in self.CBOR_TYPES
-            else "unixtimestampmillis"
-        )
-        body[key] = self._convert_timestamp_to_str(value, timestamp_format)
+        def _serialize_timestamp(value: Any, mime_type: str) -> Any:
+            return self._convert_timestamp_to_str(
+                value,
+                timestamp_format
+                # CBOR always uses unix timestamp milliseconds
+                if mime_type not in self.CBOR_TYPES else "unixtimestampmillis",
+            )
 
-    def _serialize_type_blob(
-        self, body: dict, value: Union[str, bytes], _, key: str, mime_type: str
-    ):
-        if mime_type in self.CBOR_TYPES:
-            body[key] = value
-        else:
-            body[key] = self._get_base64(value)
+        return _serialize_timestamp
+
+    def _compile_json_blob(self, shape: Shape) -> Callable[[Union[str, bytes], str], Any]:
+        def _serialize_blob(value: Union[str, bytes], mime_type: str) -> Any:
+            if mime_type in self.CBOR_TYPES:
+                return value
+            return self._get_base64(value)
+
+        return _serialize_blob
 
     def _prepare_additional_traits_in_response(
         self, response: HttpResponse, operation_model: OperationModel, request_id: str
@@ -1516,19 +2113,29 @@ class S3ResponseSerializer(RestXMLResponseSerializer):
 
         response.set_response(self._encode_payload(self._node_to_string(root, mime_type)))
 
-    def _serialize_body_params(
-        self,
-        params: dict,
-        shape: Shape,
-        operation_model: OperationModel,
-        mime_type: str,
-        request_id: str,
-    ) -> Optional[str]:
-        root = self._serialize_body_params_to_xml(params, shape, operation_model, mime_type)
+    def _write_root_shape(self, out: List[str], params: Any, shape: Shape) -> None:
+        root_name = shape.serialization.get("name", shape.name)
         # S3 does not follow the specs on the root tag name for 41 of 44 operations
-        root.tag = self._RESPONSE_ROOT_TAGS.get(root.tag, root.tag)
-        self._prepare_additional_traits_in_xml(root, request_id)
-        return self._node_to_string(root, mime_type)
+        root_name = self._RESPONSE_ROOT_TAGS.get(root_name, root_name)
+        start = len(out)
+        self._get_shape_serializer(shape)(out, params, root_name)
+        # some tools (Serverless) require a newline after the "<?xml ...>\n" preamble line, e.g., for
+        # LocationConstraint (only added if the root element is not empty)
+        if len(out) > start + 1:
+            out.append("\n")
+
+    def _stream_root_shape(self, out: List[str], params: Any, shape: Shape) -> Iterator[None]:
+        root_name = shape.serialization.get("name", shape.name)
+        root_name = self._RESPONSE_ROOT_TAGS.get(root_name, root_name)
+        start = len(out)
+        # the streaming function of a structure only yields after a child element has been written
+        has_children = False
+        for _ in self._get_shape_stream_writer(shape)(out, params, root_name):
+            has_children = True
+            yield
+        # see `_write_root_shape`
+        if has_children or len(out) > start + 1:
+            out.append("\n")
 
     def _prepare_additional_traits_in_response(
         self, response: HttpResponse, operation_model: OperationModel, request_id: str
@@ -1563,11 +2170,6 @@ class S3ResponseSerializer(RestXMLResponseSerializer):
     def _create_empty_node(xmlnode: ETree.Element, name: str) -> None:
         ETree.SubElement(xmlnode, name)
 
-    def _prepare_additional_traits_in_xml(self, root: Optional[ETree.Element], request_id: str):
-        # some tools (Serverless) require a newline after the "<?xml ...>\n" preamble line, e.g., for LocationConstraint
-        if root and not root.tail:
-            root.tail = "\n"
-
 
 class SqsResponseSerializer(QueryResponseSerializer):
     """
@@ -1596,6 +2198,10 @@ class SqsResponseSerializer(QueryResponseSerializer):
             .replace("\r", "__marker__\r__marker__")
         )
 
+    def _escape_xml_text(self, text: str) -> str:
+        """Directly encodes the characters which need to be specifically encoded when writing the XML text."""
+        return super()._escape_xml_text(text).replace('"', "&quot;").replace("\r", "&#xD;")
+
     def _node_to_string(self, root: Optional[ETree.ElementTree], mime_type: str) -> Optional[str]:
         """Replaces the previously "marked" characters with their encoded value."""
         generated_string = super()._node_to_string(root, mime_type)
@@ -1,12 +1,14 @@
 import logging
 import os
-from typing import NamedTuple, Optional, Set
+import threading
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional, Set, Tuple
 
 import botocore
-from werkzeug.http import parse_dict_header
 
 import localstack
 from localstack import config
+from localstack.aws.auth import Authorization, parse_authorization_header
 from localstack.aws.spec import ServiceCatalog, build_service_index_cache, load_service_index_cache
 from localstack.constants import LOCALHOST_HOSTNAME, PATH_USER_REQUEST
 from localstack.http import Request
@@ -40,22 +42,21 @@ class _ServiceIndicators(NamedTuple):
     path: Optional[str] = None
 
 
-def _extract_service_indicators(request: Request) -> _ServiceIndicators:
-    """Extracts all different fields that might indicate which service a request is targeting."""
+def _extract_service_indicators(
+    request: Request, authorization: Optional[Authorization] = None
+) -> _ServiceIndicators:
+    """
+    Extracts all different fields that might indicate which service a request is targeting.
+
+    :param request: to extract the indicators from
+    :param authorization: the already parsed Authorization header of the request (parsed from the request if not set)
+    """
     x_amz_target = request.headers.get("x-amz-target")
-    authorization = request.headers.get("authorization")
-
-    signing_name = None
-    if authorization:
-        try:
-            auth_type, auth_info = authorization.split(None, 1)
-            auth_type = auth_type.lower().strip()
-            if auth_type == "aws4-hmac-sha256":
-                values = parse_dict_header(auth_info)
-                _, _, _, signing_name, _ = values["Credential"].split("/")
-        except (ValueError, KeyError):
-            LOG.debug("auth header could not be parsed for service routing: %s", authorization)
-            pass
+    authorization = authorization or parse_authorization_header(
+        request.headers.get("authorization")
+    )
+
+    signing_name = authorization.service if authorization and authorization.is_sigv4 else None
     if x_amz_target:
         if "." in x_amz_target:
             target_prefix, operation = x_amz_target.split(".", 1)
@@ -282,28 +283,139 @@ def resolve_conflicts(candidates: Set[str], request: Request):
         return "rds"
 
 
-def determine_aws_service_name(request: Request, services: ServiceCatalog = None) -> Optional[str]:
+class RoutingDecisionCache:
+    """
+    Bounded LRU cache for service routing decisions. The decisions are keyed by the service indicators of a request
+    which can be extracted without looking at the body or the query string of the request (see
+    ``_routing_cache_key``). Only decisions which are fully determined by these indicators are cached.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._cache: OrderedDict[Hashable, str] = OrderedDict()
+        self._mutex = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Returns the cached service name for the given key (and counts the hit or miss).
+
+        :param key: routing cache key of a request
+        :return: the cached service name or None if there is no cached decision for the key
+        """
+        with self._mutex:
+            service_name = self._cache.get(key)
+            if service_name is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._cache.move_to_end(key)
+            return service_name
+
+    def put(self, key: Hashable, service_name: str) -> None:
+        with self._mutex:
+            self._cache[key] = service_name
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached decisions and resets the counters."""
+        with self._mutex:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+
+routing_decision_cache = RoutingDecisionCache()
+"""Routing decision cache used by ``determine_aws_service_name`` for the default service catalog."""
+
+
+def _routing_cache_key(indicators: _ServiceIndicators) -> Hashable:
+    """
+    Creates the routing cache key for the given service indicators. Instead of the whole path, only its first segment
+    (including the enclosing slashes, f.e. ``/2015-03-31/`` for ``/2015-03-31/functions/my-function``) is part of
+    the key. Therefore, decisions which depend on more than the first segment of the path must not be cached.
+    """
+    signing_name, target_prefix, operation, host, path = indicators
+    path_key = path
+    if path:
+        second_slash = path.find("/", 1)
+        if second_slash != -1:
+            path_key = path[: second_slash + 1]
+    return signing_name, target_prefix, operation, host, path_key
+
+
+def _signing_name_rules_use_path_key(signing_name: str) -> bool:
+    """
+    Checks if the result of the custom signing name rules for the given signing name is fully determined by the
+    routing cache key (i.e. if none of the rules looks at more than the first segment of the path).
+    """
+    rules = signing_name_path_prefix_rules.get(signing_name) or {}
+    return all(prefix == "*" or "/" not in prefix[1:] for prefix in rules)
+
+
+def determine_aws_service_name(
+    request: Request, services: ServiceCatalog = None, authorization: Optional[Authorization] = None
+) -> Optional[str]:
     """
     Tries to determine the name of the AWS service an incoming request is targeting.
+    Decisions which do not depend on the body or the query string of the request are cached in the
+    ``routing_decision_cache`` (if the default service catalog is used).
     :param request: to determine the target service name of
     :param services: service catalog (can be handed in for caching purposes)
+    :param authorization: the already parsed Authorization header of the request (parsed from the request if not set)
     :return: service name string (or None if the targeting service could not be determined exactly)
     """
-    services = services or get_service_catalog()
-    signing_name, target_prefix, operation, host, path = _extract_service_indicators(request)
+    default_services = get_service_catalog()
+    services = services or default_services
+    indicators = _extract_service_indicators(request, authorization)
+
+    if services is not default_services:
+        service_name, _ = _determine_aws_service_name(request, services, indicators)
+        return service_name
+
+    cache_key = _routing_cache_key(indicators)
+    service_name = routing_decision_cache.get(cache_key)
+    if service_name is not None:
+        return service_name
+
+    service_name, cacheable = _determine_aws_service_name(request, services, indicators)
+    if cacheable and service_name is not None:
+        routing_decision_cache.put(cache_key, service_name)
+    return service_name
+
+
+def _determine_aws_service_name(
+    request: Request, services: ServiceCatalog, indicators: _ServiceIndicators
+) -> Tuple[Optional[str], bool]:
+    """
+    Implements the actual service routing logic of ``determine_aws_service_name``.
+
+    :return: tuple of the service name (or None) and a bool indicating if the decision is fully determined by the
+             routing cache key of the request (i.e. if it can be cached)
+    """
+    signing_name, target_prefix, operation, host, path = indicators
     candidates = set()
+    # set to false as soon as the routing looks at more than the indicators in the routing cache key
+    cacheable = True
 
     # 1. check the signing names
     if signing_name:
         signing_name_candidates = services.by_signing_name(signing_name)
         if len(signing_name_candidates) == 1:
             # a unique signing-name -> service name mapping is the case for ~75% of service operations
-            return signing_name_candidates[0]
+            return signing_name_candidates[0], cacheable
 
         # try to find a match with the custom signing name rules
+        cacheable = _signing_name_rules_use_path_key(signing_name)
         custom_match = custom_signing_name_rules(signing_name, path)
         if custom_match:
-            return custom_match
+            return custom_match, cacheable
 
         # still ambiguous - add the services to the list of candidates
         candidates.update(signing_name_candidates)
@@ -313,7 +425,7 @@ def determine_aws_service_name(request: Request, services: ServiceCatalog = None
         target_candidates = services.by_target_prefix(target_prefix)
         if len(target_candidates) == 1:
             # a unique target prefix
-            return target_candidates[0]
+            return target_candidates[0], cacheable
 
         # still ambiguous - add the services to the list of candidates
         candidates.update(target_candidates)
@@ -331,14 +443,16 @@ def determine_aws_service_name(request: Request, services: ServiceCatalog = None
                 candidates.remove(service_name)
 
     if len(candidates) == 1:
-        return candidates.pop()
+        return candidates.pop(), cacheable
 
     # 3. check the path if it is set and not a trivial root path
     if path and path != "/":
+        # the path rules look at the whole path
+        cacheable = False
         # try to find a match with the custom path rules
         custom_path_match = custom_path_addressing_rules(path)
         if custom_path_match:
-            return custom_path_match
+            return custom_path_match, cacheable
 
     # 4. check the host (custom host addressing rules)
     if host:
@@ -347,12 +461,15 @@ def determine_aws_service_name(request: Request, services: ServiceCatalog = None
             # this prevents a virtual host addressed bucket to be wrongly recognized
             if host.startswith(f"{prefix}.") and ".s3." not in host:
                 if len(services_per_prefix) == 1:
-                    return services_per_prefix[0]
+                    return services_per_prefix[0], cacheable
                 candidates.update(services_per_prefix)
 
         custom_host_match = custom_host_addressing_rules(host)
         if custom_host_match:
-            return custom_host_match
+            return custom_host_match, cacheable
+
+    # the remaining rules look at the query string, the body, or other headers of the request
+    cacheable = False
 
     # 5. check the query / form-data
     values = request.values
@@ -365,7 +482,7 @@ def determine_aws_service_name(request: Request, services: ServiceCatalog = None
         ]
 
         if len(query_candidates) == 1:
-            return query_candidates[0]
+            return query_candidates[0], cacheable
 
         if "Version" in values:
             for service in list(query_candidates):
@@ -375,22 +492,22 @@ def determine_aws_service_name(request: Request, services: ServiceCatalog = None
                     query_candidates.remove(service)
 
         if len(query_candidates) == 1:
-            return query_candidates[0]
+            return query_candidates[0], cacheable
 
         candidates.update(query_candidates)
 
     # 6. resolve service spec conflicts
     resolved_conflict = resolve_conflicts(candidates, request)
     if resolved_conflict:
-        return resolved_conflict
+        return resolved_conflict, cacheable
 
     # 7. check the legacy rules in the end
     legacy_match = legacy_rules(request)
     if legacy_match:
-        return legacy_match
+        return legacy_match, cacheable
 
     if signing_name:
-        return signing_name
+        return signing_name, cacheable
     if candidates:
-        return candidates.pop()
-    return None
+        return candidates.pop(), cacheable
+    return None, cacheable
@@ -2,7 +2,7 @@
 Adapters and other utilities to use ASF together with the edge proxy.
 """
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from botocore.model import ServiceModel
 
@@ -12,25 +12,28 @@ from localstack.aws.accounts import (
     set_aws_account_id,
 )
 from localstack.aws.api import RequestContext
+from localstack.aws.auth import Authorization, parse_authorization_header
 from localstack.aws.skeleton import Skeleton
 from localstack.aws.spec import load_service
 from localstack.constants import TEST_AWS_ACCESS_KEY_ID
 from localstack.http import Request, Response
 from localstack.http.adapters import ProxyListenerAdapter
-from localstack.utils.aws.aws_stack import extract_access_key_id_from_auth_header
 from localstack.utils.aws.request_context import extract_region_from_headers
 
 LOG = logging.getLogger(__name__)
 
 
-def get_region(request: Request) -> str:
-    return extract_region_from_headers(request.headers)
+def get_region(request: Request, authorization: Optional[Authorization] = None) -> str:
+    return extract_region_from_headers(request.headers, authorization)
 
 
-def get_account_id_from_request(request: Request) -> str:
-    access_key_id = (
-        extract_access_key_id_from_auth_header(request.headers) or TEST_AWS_ACCESS_KEY_ID
+def get_account_id_from_request(
+    request: Request, authorization: Optional[Authorization] = None
+) -> str:
+    authorization = authorization or parse_authorization_header(
+        request.headers.get("Authorization")
     )
+    access_key_id = (authorization and authorization.access_key_id) or TEST_AWS_ACCESS_KEY_ID
     set_aws_access_key_id(access_key_id)
 
     account_id = get_account_id_from_access_key_id(access_key_id)
@@ -54,6 +57,6 @@ class AwsApiListener(ProxyListenerAdapter):
         context = RequestContext()
         context.service = self.service
         context.request = request
-        context.region = get_region(request)
-        context.account_id = get_account_id_from_request(request)
+        context.region = get_region(request, context.authorization)
+        context.account_id = get_account_id_from_request(request, context.authorization)
         return context
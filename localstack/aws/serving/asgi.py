@@ -1,12 +1,16 @@
 import asyncio
 import concurrent.futures.thread
+import logging
 from asyncio import AbstractEventLoop
 from typing import Optional
 
 from localstack.aws.gateway import Gateway
-from localstack.aws.serving.wsgi import WsgiGateway
+from localstack.aws.serving.wsgi import WsgiGateway, create_request
+from localstack.http import Response
 from localstack.http.asgi import ASGIAdapter, ASGILifespanListener
 
+LOG = logging.getLogger(__name__)
+
 
 class _ThreadPool(concurrent.futures.thread.ThreadPoolExecutor):
     """
@@ -29,7 +33,10 @@ class _ThreadPool(concurrent.futures.thread.ThreadPoolExecutor):
 
 class AsgiGateway:
     """
-    Exposes a Gateway as an ASGI3 application. Under the hood, it uses a WsgiGateway with a threading async/sync bridge.
+    Exposes a Gateway as an ASGI3 application. HTTP requests are processed with ``Gateway.process_async``, which runs
+    the handlers in a thread pool, but lets request handlers (like service operations that wait for a resource to
+    become ready) await on the event loop without occupying a thread. The response is written through the
+    threading async/sync bridge of the ``ASGIAdapter``.
     """
 
     gateway: Gateway
@@ -64,8 +71,27 @@ class AsgiGateway:
         if self._closed:
             raise RuntimeError("Cannot except new request on closed ASGIGateway")
 
+        if scope["type"] == "http":
+            return await self.handle_http(scope, receive, send)
+
         return await self.wsgi(scope, receive, send)
 
+    async def handle_http(self, scope, receive, send) -> None:
+        environ = self.wsgi.to_wsgi_environment(scope, receive)
+        LOG.debug(
+            "%s %s%s",
+            environ["REQUEST_METHOD"],
+            environ.get("HTTP_HOST"),
+            environ["RAW_URI"],
+        )
+
+        request = create_request(environ)
+        response = Response()
+        await self.gateway.process_async(request, response, self.executor)
+
+        # the response is itself a WSGI application
+        await self.wsgi.run_wsgi_app(response, environ, send)
+
     def close(self):
         """
         Close the ASGIGateway by shutting down the underlying executor.
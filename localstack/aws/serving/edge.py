@@ -1,13 +1,28 @@
+from typing import Optional
+
+from localstack.aws.gateway import Gateway
 from localstack.http.hypercorn import GatewayServer
 from localstack.runtime.shutdown import SHUTDOWN_HANDLERS
 from localstack.services.plugins import SERVICE_PLUGINS
 
+_current_gateway: Optional[Gateway] = None
+
+
+def get_current_gateway() -> Optional[Gateway]:
+    """
+    Returns the gateway that is currently being served by ``serve_gateway``, or None if the gateway has not been
+    started (yet).
+    """
+    return _current_gateway
+
 
 def serve_gateway(bind_address, port, use_ssl, asynchronous=False):
     """
     Implementation of the edge.do_start_edge_proxy interface to start a Hypercorn server instance serving the
     LocalstackAwsGateway.
     """
+    global _current_gateway
+
     from localstack.aws.app import LocalstackAwsGateway
 
     gateway = LocalstackAwsGateway(SERVICE_PLUGINS)
@@ -15,6 +30,7 @@ def serve_gateway(bind_address, port, use_ssl, asynchronous=False):
     # start serving gateway
     server = GatewayServer(gateway, port, bind_address, use_ssl)
     server.start()
+    _current_gateway = gateway
 
     # with the current way the infrastructure is started, this is the easiest way to shut down the server correctly
     # FIXME: but the infrastructure shutdown should be much cleaner, core components like the gateway should be handled
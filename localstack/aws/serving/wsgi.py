@@ -14,6 +14,24 @@ from ..gateway import Gateway
 LOG = logging.getLogger(__name__)
 
 
+def create_request(environ: "WSGIEnvironment") -> Request:
+    """
+    Creates a Request with mutable headers from the given WSGI environment.
+
+    :param environ: the WSGI environment
+    :return: a new Request object
+    """
+    request = Request(environ)
+    if "asgi.headers" in environ:
+        # restores raw headers from ASGI scope, which allows dashes in header keys
+        # see https://github.com/pallets/werkzeug/issues/940
+        request.headers = Headers(environ["asgi.headers"])
+    else:
+        # by default, werkzeug requests from environ are immutable
+        request.headers = Headers(request.headers)
+    return request
+
+
 class WsgiGateway:
     """
     Exposes a Gateway as a WSGI application.
@@ -35,14 +53,7 @@ class WsgiGateway:
             environ.get("HTTP_HOST"),
             environ["RAW_URI"],
         )
-        request = Request(environ)
-        if "asgi.headers" in environ:
-            # restores raw headers from ASGI scope, which allows dashes in header keys
-            # see https://github.com/pallets/werkzeug/issues/940
-            request.headers = Headers(environ["asgi.headers"])
-        else:
-            # by default, werkzeug requests from environ are immutable
-            request.headers = Headers(request.headers)
+        request = create_request(environ)
 
         # prepare response
         response = Response()
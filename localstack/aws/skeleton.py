@@ -1,6 +1,6 @@
 import inspect
 import logging
-from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Union
 
 from botocore import xform_name
 from botocore.model import ServiceModel
@@ -16,6 +16,7 @@ from localstack.aws.protocol.parser import create_parser
 from localstack.aws.protocol.serializer import create_serializer
 from localstack.aws.spec import load_service
 from localstack.utils import analytics
+from localstack.utils.asyncio import run_awaitable
 from localstack.utils.coverage_docs import get_coverage_link_for_service
 
 LOG = logging.getLogger(__name__)
@@ -133,6 +134,28 @@ class Skeleton:
             self.dispatch_table = create_dispatch_table(implementation)
 
     def invoke(self, context: RequestContext) -> HttpResponse:
+        """
+        Invokes the handler of the operation of the request in the given context, and serializes its result. If the
+        handler is asynchronous, this blocks until it is done.
+
+        :param context: the request context
+        :return: an HttpResponse object
+        """
+        response = self.invoke_deferred(context)
+        if inspect.isawaitable(response):
+            return run_awaitable(response)
+        return response
+
+    def invoke_deferred(
+        self, context: RequestContext
+    ) -> Union[HttpResponse, Awaitable[HttpResponse]]:
+        """
+        Like ``invoke``, but if the handler of the operation returns an awaitable (e.g., because it is a coroutine
+        function), an awaitable of the response is returned instead of waiting for the handler to finish.
+
+        :param context: the request context
+        :return: an HttpResponse object, or an awaitable of it
+        """
         if context.operation and context.service_request:
             # if the parsed request is already set in the context, re-use them
             operation, instance = context.operation, context.service_request
@@ -151,19 +174,58 @@ class Skeleton:
                 )
                 raise NotImplementedError
 
-            return self.dispatch_request(context, instance)
+            response = self.dispatch_request(context, instance)
+        except ServiceException as e:
+            return self.on_service_exception(context, e)
+        except NotImplementedError as e:
+            return self.on_not_implemented_error(context, e)
+
+        if inspect.isawaitable(response):
+            return self._await_response(context, response)
+        return response
+
+    async def _await_response(
+        self, context: RequestContext, response: Awaitable[HttpResponse]
+    ) -> HttpResponse:
+        try:
+            return await response
         except ServiceException as e:
             return self.on_service_exception(context, e)
         except NotImplementedError as e:
             return self.on_not_implemented_error(context, e)
 
-    def dispatch_request(self, context: RequestContext, instance: ServiceRequest) -> HttpResponse:
+    def dispatch_request(
+        self, context: RequestContext, instance: ServiceRequest
+    ) -> Union[HttpResponse, Awaitable[HttpResponse]]:
         operation = context.operation
 
         handler = self.dispatch_table[operation.name]
 
         # Call the appropriate handler
-        result = handler(context, instance) or {}
+        result = handler(context, instance)
+
+        if inspect.isawaitable(result):
+            # the handler has deferred its result, serialize it once it's available
+            return self._serialize_deferred_result(context, result)
+
+        return self._serialize_result(context, result or {})
+
+    async def _serialize_deferred_result(
+        self, context: RequestContext, result: Awaitable[ServiceResponse]
+    ) -> HttpResponse:
+        return self._serialize_result(context, await result or {})
+
+    def _serialize_result(
+        self, context: RequestContext, result: Union[ServiceResponse, HttpResponse]
+    ) -> HttpResponse:
+        """
+        Serializes the result returned by the handler of the operation to an HttpResponse.
+
+        :param context: the request context
+        :param result: the result of the handler
+        :return: an HttpResponse object
+        """
+        operation = context.operation
 
         # if the service handler returned an HTTP request, forego serialization and return immediately
         if isinstance(result, HttpResponse):
@@ -171,6 +233,10 @@ class Skeleton:
 
         context.service_response = result
 
+        if context.direct_dispatch:
+            # the caller reads the service response directly from the context
+            return HttpResponse(status=operation.http.get("responseCode", 200))
+
         # Serialize result dict to an HTTPResponse and return it
         return self.serializer.serialize_to_response(
             result, operation, context.request.headers, context.request_id
@@ -188,6 +254,9 @@ class Skeleton:
         """
         context.service_exception = exception
 
+        if context.direct_dispatch:
+            return HttpResponse(status=getattr(exception, "status_code", None) or 400)
+
         return self.serializer.serialize_error_to_response(
             exception, context.operation, context.request.headers, context.request_id
         )
@@ -217,6 +286,9 @@ class Skeleton:
         )
         context.service_exception = error
 
+        if context.direct_dispatch:
+            return HttpResponse(status=error.status_code)
+
         return serializer.serialize_error_to_response(
             error, operation, context.request.headers, context.request_id
         )
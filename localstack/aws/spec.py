@@ -1,14 +1,25 @@
 import dataclasses
+import hashlib
 import json
+import logging
+import marshal
 import os
+import sys
+import threading
 from collections import defaultdict
-from functools import cached_property, lru_cache
-from typing import Dict, Generator, List, Optional, Tuple
+from functools import cached_property, lru_cache, partial
+from typing import Any, Callable, Dict, Generator, Iterator, List, Mapping, Optional, Tuple
 
+import botocore
 import jsonpatch
 from botocore.loaders import Loader, instance_cache
 from botocore.model import OperationModel, ServiceModel
 
+import localstack
+from localstack import config
+
+LOG = logging.getLogger(__name__)
+
 ServiceName = str
 
 spec_patches_json = os.path.join(os.path.dirname(__file__), "spec-patches.json")
@@ -37,7 +48,8 @@ class PatchingLoader(Loader):
         result = super(PatchingLoader, self).load_data(name)
 
         if patches := self.patches.get(name):
-            return jsonpatch.apply_patch(result, patches)
+            # the loaded data is not shared with anyone else yet, avoid copying the whole spec
+            return jsonpatch.apply_patch(result, patches, in_place=True)
 
         return result
 
@@ -46,17 +58,220 @@ loader = PatchingLoader(load_spec_patches())
 
 
 def list_services(model_type="service-2") -> List[ServiceModel]:
-    return [load_service(service) for service in loader.list_available_services(model_type)]
+    # the specs are loaded directly with the loader, since compiling all of them would not pay off
+    return [
+        ServiceModel(loader.load_service_model(service, model_type), service)
+        for service in loader.list_available_services(model_type)
+    ]
 
 
 def load_service(service: ServiceName, version: str = None, model_type="service-2") -> ServiceModel:
     """
     For example: load_service("sqs", "2012-11-05")
     """
-    service_description = loader.load_service_model(service, model_type, version)
+    if spec_cache := get_compiled_spec_cache():
+        service_description = spec_cache.load(service, version, model_type)
+    else:
+        service_description = loader.load_service_model(service, model_type, version)
     return ServiceModel(service_description, service)
 
 
+class CompiledMapping(Mapping[str, Any]):
+    """
+    A read-only mapping of marshalled values, which are only deserialized once they are accessed. If a value cannot be
+    deserialized, the values are taken from the mapping returned by ``fallback`` instead.
+    """
+
+    def __init__(
+        self, compiled: Dict[str, bytes], fallback: Callable[[], Mapping[str, Any]] = None
+    ):
+        self._compiled = compiled
+        self._values = {}
+        self._fallback = fallback
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        compiled = self._compiled[key]
+        try:
+            value = marshal.loads(compiled)
+        except Exception:
+            if self._fallback is None:
+                raise
+            value = self._fallback()[key]
+        self._values[key] = value
+        return value
+
+    def __contains__(self, key) -> bool:
+        return key in self._compiled
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._compiled)
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+
+class CompiledSpecCache:
+    """
+    A cache of patched service specs in a compact binary form. Each spec is stored in its own file in the cache
+    directory, in which every operation and shape is marshalled individually. When a spec is loaded from the cache, its
+    operations and shapes are therefore only deserialized once they are touched (by the ``ServiceModel``).
+
+    Specs which are not in the cache yet are loaded with the ``PatchingLoader`` and compiled into the cache.
+    """
+
+    _lazy_keys = ("operations", "shapes")
+
+    def __init__(self, directory: str, spec_loader: Loader = None):
+        self.directory = directory
+        self.loader = spec_loader or loader
+        self._specs: Dict[Tuple[str, Optional[str], str], dict] = {}
+        self._mutex = threading.RLock()
+
+    def load(self, service: ServiceName, version: str = None, model_type="service-2") -> dict:
+        """
+        Loads the service description from the cache, or from the loader if it has not been compiled yet.
+
+        :param service: the service name
+        :param version: the API version of the service, the latest version if not set
+        :param model_type: the type of the model
+        :return: the service description
+        """
+        key = (service, version, model_type)
+        try:
+            return self._specs[key]
+        except KeyError:
+            pass
+
+        with self._mutex:
+            if key in self._specs:
+                return self._specs[key]
+
+            file_path = self._file_path(service, version, model_type)
+            description = None
+            try:
+                description = self._read(
+                    file_path, self._get_fallback(service, version, model_type)
+                )
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                LOG.debug("error while reading the compiled spec %s, recompiling: %s", file_path, e)
+
+            if description is None:
+                description = self._load_and_write(service, version, model_type)
+
+            self._specs[key] = description
+            return description
+
+    def _load_and_write(
+        self, service: ServiceName, version: Optional[str], model_type: str
+    ) -> dict:
+        # loads the spec with the loader, and (re-)compiles it into the cache
+        file_path = self._file_path(service, version, model_type)
+        description = self.loader.load_service_model(service, model_type, version)
+        try:
+            self._write(file_path, description)
+        except Exception as e:
+            LOG.debug("error while compiling the spec of %s into %s: %s", service, file_path, e)
+        return description
+
+    def _get_fallback(
+        self, service: ServiceName, version: Optional[str], model_type: str
+    ) -> Callable[[str], Mapping[str, Any]]:
+        # returns a function which loads the (uncompiled) operations or shapes of the spec, for values of the compiled
+        # spec which cannot be deserialized. the spec is loaded (and recompiled) at most once.
+        uncompiled = []
+
+        def _fallback(lazy_key: str) -> Mapping[str, Any]:
+            with self._mutex:
+                if not uncompiled:
+                    LOG.debug(
+                        "error while deserializing the compiled spec of %s, recompiling", service
+                    )
+                    uncompiled.append(self._load_and_write(service, version, model_type))
+            return uncompiled[0][lazy_key]
+
+        return _fallback
+
+    def compile(self, service: ServiceName, version: str = None, model_type="service-2") -> str:
+        """
+        Compiles the spec of the given service into the cache (f.e. at build time).
+
+        :return: the path of the compiled spec
+        """
+        file_path = self._file_path(service, version, model_type)
+        self._write(file_path, self.loader.load_service_model(service, model_type, version))
+        return file_path
+
+    def _file_path(self, service: ServiceName, version: Optional[str], model_type: str) -> str:
+        return os.path.join(self.directory, f"{service}-{version or 'latest'}-{model_type}.bin")
+
+    def _read(self, file_path: str, fallback: Callable[[str], Mapping[str, Any]]) -> dict:
+        with open(file_path, "rb") as fd:
+            compiled = marshal.load(fd)
+
+        description = compiled["description"]
+        for key in self._lazy_keys:
+            if key in compiled:
+                description[key] = CompiledMapping(compiled[key], partial(fallback, key))
+        return description
+
+    def _write(self, file_path: str, description: dict):
+        description = _to_builtin_types(description)
+        compiled = {
+            "description": {k: v for k, v in description.items() if k not in self._lazy_keys}
+        }
+        for key in self._lazy_keys:
+            if key in description:
+                compiled[key] = {
+                    name: marshal.dumps(value) for name, value in description[key].items()
+                }
+
+        os.makedirs(self.directory, exist_ok=True)
+        # write to a temporary file first, such that concurrent readers never see a partially written file
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as fd:
+            marshal.dump(compiled, fd)
+        os.replace(tmp_path, file_path)
+
+
+def _to_builtin_types(value: Any) -> Any:
+    # botocore loads the specs into OrderedDicts, which cannot be marshalled
+    if isinstance(value, dict):
+        return {k: _to_builtin_types(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_builtin_types(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def get_compiled_spec_cache() -> Optional[CompiledSpecCache]:
+    """
+    Returns the CompiledSpecCache in the cache directory of LocalStack, or None if there is no cache directory. The
+    cache is specific to the versions of LocalStack and botocore, to the spec patches, and to the versions of the
+    interpreter and its marshal format (since the cache directory may be shared between the host and the container).
+    """
+    if not config.dirs.cache or not os.path.isdir(config.dirs.cache):
+        return None
+
+    ls_ver = localstack.__version__.replace(".", "_")
+    botocore_ver = botocore.__version__.replace(".", "_")
+    patches_hash = hashlib.sha1(
+        json.dumps(loader.patches, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:8]
+    python_ver = f"py{sys.version_info[0]}{sys.version_info[1]}"
+    directory = os.path.join(
+        config.dirs.cache,
+        f"service-specs-{ls_ver}-{botocore_ver}-{patches_hash}-{python_ver}-m{marshal.version}",
+    )
+    return CompiledSpecCache(directory)
+
+
 def iterate_service_operations() -> Generator[Tuple[ServiceModel, OperationModel], None, None]:
     """
     Returns one record per operation in the AWS service spec, where the first item is the service model the operation
@@ -262,6 +262,7 @@ class TracingHandlerChain(HandlerChain):
 
     Methods:
     - handle(context: RequestContext, response: Response):
+    - handle_async(context: RequestContext, response: Response, executor):
     - _call_response_handlers(response): .
     - _call_exception_handlers(e, response): Overrides HandlerChain's _call_exception_handlers method and adds tracing handler to exception handlers.
     - _log_report(): Logs the trace report in the format specified.
@@ -290,6 +291,18 @@ class TracingHandlerChain(HandlerChain):
             self.request_handler_traces = [handler.trace for handler in self.request_handlers]
             self._log_report()
 
+    async def handle_async(self, context: RequestContext, response: Response, executor=None):
+        """Overrides HandlerChain's handle_async method and adds tracing handler to request handlers. Logs the trace
+        report with request and response details."""
+        then = time.perf_counter()
+        try:
+            self.request_handlers = [TracingHandler(handler) for handler in self.request_handlers]
+            return await super().handle_async(context, response, executor)
+        finally:
+            self.duration = (time.perf_counter() - then) * 1000
+            self.request_handler_traces = [handler.trace for handler in self.request_handlers]
+            self._log_report()
+
     def _call_response_handlers(self, response):
         self.response_handlers = [TracingHandler(handler) for handler in self.response_handlers]
         try:
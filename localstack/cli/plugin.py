@@ -3,7 +3,9 @@ import logging
 import os
 
 import click
-from plugin import Plugin, PluginManager
+from plugin import Plugin
+
+from localstack.utils.plugin_index import IndexedPluginManager
 
 LOG = logging.getLogger(__name__)
 
@@ -35,5 +37,5 @@ def load_cli_plugins(cli):
         # importing localstack.config is still quite expensive...
         logging.basicConfig(level=logging.DEBUG)
 
-    loader = PluginManager("localstack.plugins.cli", load_args=(cli,))
+    loader = IndexedPluginManager("localstack.plugins.cli", load_args=(cli,))
     loader.load_all()
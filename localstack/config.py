@@ -16,6 +16,7 @@ from localstack.constants import (
     DEFAULT_LAMBDA_CONTAINER_REGISTRY,
     DEFAULT_VOLUME_DIR,
     ENV_INTERNAL_TEST_COLLECT_METRIC,
+    ENV_INTERNAL_TEST_COLLECT_METRIC_MAX_SIZE,
     ENV_INTERNAL_TEST_RUN,
     FALSE_STRINGS,
     LOCALHOST,
@@ -640,6 +641,15 @@ EXTRA_CORS_EXPOSE_HEADERS = os.environ.get("EXTRA_CORS_EXPOSE_HEADERS", "").stri
 EXTRA_CORS_ALLOWED_ORIGINS = os.environ.get("EXTRA_CORS_ALLOWED_ORIGINS", "").strip()
 DISABLE_PREFLIGHT_PROCESSING = is_env_true("DISABLE_PREFLIGHT_PROCESSING")
 
+# whether to disable the compression of responses for clients which send an Accept-Encoding header
+DISABLE_RESPONSE_COMPRESSION = is_env_true("DISABLE_RESPONSE_COMPRESSION")
+# the minimum size (in bytes) of a response body to be compressed
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.environ.get("RESPONSE_COMPRESSION_MIN_SIZE") or 1024)
+# the maximum size (in bytes) of a compressed request body after decoding, larger requests are rejected
+REQUEST_DECOMPRESSION_MAX_SIZE = int(
+    os.environ.get("REQUEST_DECOMPRESSION_MAX_SIZE") or 100 * 1024 * 1024
+)
+
 # whether to disable publishing events to the API
 DISABLE_EVENTS = is_env_true("DISABLE_EVENTS")
 DEBUG_ANALYTICS = is_env_true("DEBUG_ANALYTICS")
@@ -647,8 +657,52 @@ DEBUG_ANALYTICS = is_env_true("DEBUG_ANALYTICS")
 # whether to log fine-grained debugging information for the handler chain
 DEBUG_HANDLER_CHAIN = is_env_true("DEBUG_HANDLER_CHAIN")
 
+# whether to record latency histograms of the handlers in the handler chain, exposed at /_localstack/metrics
+ENABLE_HANDLER_CHAIN_METRICS = is_env_true("ENABLE_HANDLER_CHAIN_METRICS")
+
+# whether request/response log records are formatted and written on a background thread instead of the request thread
+ASYNC_REQUEST_LOGGING = is_env_true("ASYNC_REQUEST_LOGGING")
+# the maximum number of request/response log records waiting to be written, further records are dropped
+ASYNC_REQUEST_LOGGING_QUEUE_SIZE = int(os.environ.get("ASYNC_REQUEST_LOGGING_QUEUE_SIZE") or 10000)
+
+# whether to discover plugins without the plugin index cache in the cache directory, i.e., by reading the entry points
+# of all installed distributions on every start
+DISABLE_PLUGIN_INDEX_CACHE = is_env_true("DISABLE_PLUGIN_INDEX_CACHE")
+
+# whether to dispatch all calls to moto via moto's response classes, even if the operation has an adapter which calls
+# the moto backend directly
+DISABLE_MOTO_ADAPTERS = is_env_true("DISABLE_MOTO_ADAPTERS")
+
+# the number of worker processes which run CPU-bound jobs of providers (f.e., RSA key generation), defaults to the
+# number of CPUs (at most 4). 0 runs the jobs in the request threads.
+PROCESS_POOL_MAX_WORKERS = (
+    int(os.environ["PROCESS_POOL_MAX_WORKERS"])
+    if os.environ.get("PROCESS_POOL_MAX_WORKERS")
+    else None
+)
+# the time (in seconds) a request waits for the result of a job in the process pool
+PROCESS_POOL_JOB_TIMEOUT = float(os.environ.get("PROCESS_POOL_JOB_TIMEOUT") or 60)
+
+# the number of threads of the worker pool, which runs short-lived background tasks (f.e., the dispatching of event
+# notifications) of all services
+WORKER_POOL_MAX_WORKERS = int(os.environ.get("WORKER_POOL_MAX_WORKERS") or 32)
+
 # whether to eagerly start services
 EAGER_SERVICE_LOADING = is_env_true("EAGER_SERVICE_LOADING")
+# the number of services which are started concurrently with EAGER_SERVICE_LOADING (1 starts them one after another)
+EAGER_SERVICE_LOADING_WORKERS = int(os.environ.get("EAGER_SERVICE_LOADING_WORKERS") or 8)
+
+# whether internal clients (created via `connect_to`) dispatch their requests directly into the gateway, instead of
+# sending them over the network to the edge port
+IN_MEMORY_CLIENT = is_env_true("IN_MEMORY_CLIENT")
+
+# whether internal clients pass their call parameters directly to the provider, and receive the provider response
+# without it being serialized and parsed again
+IN_MEMORY_CLIENT_DIRECT_DISPATCH = is_env_true("IN_MEMORY_CLIENT_DIRECT_DISPATCH")
+
+# whether XML responses (query, ec2, and rest-xml protocols) are streamed to the client in chunks while they are
+# serialized, instead of being serialized completely before being sent
+STREAM_XML_RESPONSES = is_env_true("STREAM_XML_RESPONSES")
 
 # Whether to skip downloading additional infrastructure components (e.g., custom Elasticsearch versions)
 SKIP_INFRA_DOWNLOADS = os.environ.get("SKIP_INFRA_DOWNLOADS", "").strip()
@@ -1037,6 +1091,8 @@ CFN_VERBOSE_ERRORS = is_env_true("CFN_VERBOSE_ERRORS")
 # Note: do *not* include DATA_DIR in this list, as it is treated separately
 CONFIG_ENV_VARS = [
     "ALLOW_NONSTANDARD_REGIONS",
+    "ASYNC_REQUEST_LOGGING",
+    "ASYNC_REQUEST_LOGGING_QUEUE_SIZE",
     "BUCKET_MARKER_LOCAL",
     "CFN_VERBOSE_ERRORS",
     "CUSTOM_SSL_CERT_PATH",
@@ -1050,6 +1106,9 @@ CONFIG_ENV_VARS = [
     "DISABLE_CUSTOM_CORS_APIGATEWAY",
     "DISABLE_CUSTOM_CORS_S3",
     "DISABLE_EVENTS",
+    "DISABLE_MOTO_ADAPTERS",
+    "DISABLE_PLUGIN_INDEX_CACHE",
+    "DISABLE_RESPONSE_COMPRESSION",
     "DOCKER_BRIDGE_IP",
     "DOCKER_SDK_DEFAULT_TIMEOUT_SECONDS",
     "DYNAMODB_ERROR_PROBABILITY",
@@ -1059,11 +1118,13 @@ CONFIG_ENV_VARS = [
     "DYNAMODB_READ_ERROR_PROBABILITY",
     "DYNAMODB_WRITE_ERROR_PROBABILITY",
     "EAGER_SERVICE_LOADING",
+    "EAGER_SERVICE_LOADING_WORKERS",
     "EDGE_BIND_HOST",
     "EDGE_FORWARD_URL",
     "EDGE_PORT",
     "EDGE_PORT_HTTP",
     "ENABLE_CONFIG_UPDATES",
+    "ENABLE_HANDLER_CHAIN_METRICS",
     "ES_CUSTOM_BACKEND",
     "ES_ENDPOINT_STRATEGY",
     "ES_MULTI_CLUSTER",
@@ -1074,6 +1135,8 @@ CONFIG_ENV_VARS = [
     "HOSTNAME",
     "HOSTNAME_EXTERNAL",
     "HOSTNAME_FROM_LAMBDA",
+    "IN_MEMORY_CLIENT",
+    "IN_MEMORY_CLIENT_DIRECT_DISPATCH",
     "KINESIS_ERROR_PROBABILITY",
     "KINESIS_INITIALIZE_STREAMS",
     "KINESIS_MOCK_PERSIST_INTERVAL",
@@ -1129,7 +1192,11 @@ CONFIG_ENV_VARS = [
     "PARITY_AWS_ACCESS_KEY_ID",
     "PERSISTENCE",
     "PORTS_CHECK_DOCKER_IMAGE",
+    "PROCESS_POOL_JOB_TIMEOUT",
+    "PROCESS_POOL_MAX_WORKERS",
+    "REQUEST_DECOMPRESSION_MAX_SIZE",
     "REQUESTS_CA_BUNDLE",
+    "RESPONSE_COMPRESSION_MIN_SIZE",
     "S3_SKIP_SIGNATURE_VALIDATION",
     "S3_SKIP_KMS_KEY_VALIDATION",
     "SERVICES",
@@ -1144,6 +1211,7 @@ CONFIG_ENV_VARS = [
     "SQS_DISABLE_CLOUDWATCH_METRICS",
     "SQS_CLOUDWATCH_METRICS_REPORT_INTERVAL",
     "STEPFUNCTIONS_LAMBDA_ENDPOINT",
+    "STREAM_XML_RESPONSES",
     "SYNCHRONOUS_KINESIS_EVENTS",
     "SYNCHRONOUS_SNS_EVENTS",
     "TEST_AWS_ACCOUNT_ID",
@@ -1154,6 +1222,7 @@ CONFIG_ENV_VARS = [
     "USE_SSL",
     "WAIT_FOR_DEBUGGER",
     "WINDOWS_DOCKER_MOUNT_PREFIX",
+    "WORKER_POOL_MAX_WORKERS",
 ]
 
 
@@ -1167,6 +1236,11 @@ def is_collect_metrics_mode() -> bool:
     return is_env_true(ENV_INTERNAL_TEST_COLLECT_METRIC)
 
 
+def get_collect_metrics_max_size() -> int:
+    """Returns the maximum number of distinct metrics that are held in memory in metric collection mode."""
+    return int(os.environ.get(ENV_INTERNAL_TEST_COLLECT_METRIC_MAX_SIZE) or 10000)
+
+
 def collect_config_items() -> List[Tuple[str, Any]]:
     """Returns a list of key-value tuples of LocalStack configuration values."""
     none = object()  # sentinel object
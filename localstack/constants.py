@@ -91,6 +91,9 @@ ENV_INTERNAL_TEST_RUN = "LOCALSTACK_INTERNAL_TEST_RUN"
 # environment variable name to tag collect metrics during a test run
 ENV_INTERNAL_TEST_COLLECT_METRIC = "LOCALSTACK_INTERNAL_TEST_COLLECT_METRIC"
 
+# environment variable name to limit the number of distinct metrics collected during a test run
+ENV_INTERNAL_TEST_COLLECT_METRIC_MAX_SIZE = "LOCALSTACK_INTERNAL_TEST_COLLECT_METRIC_MAX_SIZE"
+
 # environment variable that flags whether pro was activated. do not use for security purposes!
 ENV_PRO_ACTIVATED = "PRO_ACTIVATED"
 
@@ -3,7 +3,6 @@
 migration from the edge proxy to the new HTTP framework, and will be removed in the future. """
 from urllib.parse import urlsplit
 
-from quart import request as quart_request
 from requests.models import Response as _RequestsResponse
 from werkzeug.exceptions import NotFound
 
@@ -25,6 +24,9 @@ def create_request_from_parts(method: str, path: str, data: MessagePayload, head
     :param headers: of the HTTP request
     :return: created Request object
     """
+    # quart is imported lazily, since it is only needed by the legacy proxy server
+    from quart import request as quart_request
+
     split_url = urlsplit(path)
     raw_path = get_raw_path(quart_request)
 
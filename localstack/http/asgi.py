@@ -347,12 +347,23 @@ class ASGIAdapter:
     ):
         env = self.to_wsgi_environment(scope, receive)
 
+        await self.run_wsgi_app(self.wsgi_app, env, send)
+
+    async def run_wsgi_app(
+        self, wsgi_app: "WSGIApplication", env: "WSGIEnvironment", send: "ASGISendCallable"
+    ):
+        """
+        Runs the given WSGI application with the given environment in the executor, and sends the response it
+        produces through the given ASGI send callable.
+
+        :param wsgi_app: the WSGI application to run
+        :param env: the WSGI environment
+        :param send: the send callable
+        """
         try:
             response = WsgiStartResponse(send, self.event_loop)
 
-            iterable = await self.event_loop.run_in_executor(
-                self.executor, self.wsgi_app, env, response
-            )
+            iterable = await self.event_loop.run_in_executor(self.executor, wsgi_app, env, response)
         except Exception as e:
             LOG.error(
                 "Error while trying to schedule execution: %s with environment %s",
@@ -3,7 +3,7 @@ from typing import Any, Dict, Iterable, Union
 
 from werkzeug.wrappers import Response as WerkzeugResponse
 
-from localstack.utils.common import CustomEncoder
+from localstack.utils.json import CustomEncoder
 
 
 class Response(WerkzeugResponse):
@@ -1,5 +1,6 @@
 import functools
 import inspect
+import re
 import threading
 from typing import (
     Any,
@@ -485,3 +486,77 @@ class Router(Generic[E]):
     def remove_rule(self, rule: Rule):
         """DEPRECATED: use ``remove`` instead."""
         self._remove_rules([rule])
+
+
+# matches the variable parts of werkzeug rule templates, f.e. ``<path:path>`` or ``<regex('.*'):host>``
+_RULE_VARIABLE = re.compile(r"<(?:[a-zA-Z_][a-zA-Z0-9_]*(?:\(.*?\))?:)?[a-zA-Z_][a-zA-Z0-9_]*>")
+
+
+def _template_to_pattern(template: str) -> Optional[str]:
+    """
+    Converts a werkzeug rule template into a regular expression which matches a superset of the rule: every variable can
+    match anything, and slashes may be merged, missing, or trailing. Returns None if the template matches anything.
+    """
+    parts = _RULE_VARIABLE.split(template)
+    if any("<" in part for part in parts):
+        # the template could not be parsed, so it is approximated with a pattern that matches everything
+        return None
+    if not any(parts):
+        return None
+    pattern = ".*".join(re.escape(part).replace("/", "/*") for part in parts)
+    return re.sub(r"(\.\*)+", ".*", pattern)
+
+
+def _compile_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE | re.DOTALL)
+
+
+class RoutePrefilter:
+    """
+    A precompiled, conservative approximation of the rules of a Router. If ``may_match`` returns False for a request,
+    then no rule of the router matches the request, and dispatching it would only raise a ``NotFound``. Matching the
+    request against a single regular expression is much cheaper than binding and matching the werkzeug ``Map``, which
+    makes this useful for routers that are consulted for every request, but only serve a small fraction of them.
+
+    The prefilter is recompiled whenever rules are added to or removed from the router.
+    """
+
+    router: Router
+
+    def __init__(self, router: Router):
+        self.router = router
+        self._url_map = None
+        self._num_rules = -1
+        self._host_pattern: Optional[re.Pattern] = None
+        self._path_pattern: Optional[re.Pattern] = None
+
+    def may_match(self, request: Request) -> bool:
+        url_map = self.router.url_map
+        if url_map is not self._url_map or len(url_map._rules) != self._num_rules:
+            self._compile(url_map)
+
+        if self._host_pattern and self._host_pattern.fullmatch(request.host):
+            return True
+        if self._path_pattern and self._path_pattern.fullmatch(get_raw_path(request)):
+            return True
+        return False
+
+    def _compile(self, url_map: Map):
+        rules = list(url_map._rules)
+
+        # rules with a host pattern are approximated by their host, all other rules by their path
+        host_patterns = []
+        path_patterns = []
+        for rule in rules:
+            host_pattern = _template_to_pattern(rule.host or "")
+            if host_pattern:
+                host_patterns.append(host_pattern)
+                continue
+            path_patterns.append((_template_to_pattern(rule.rule) or ".*") + "/*")
+
+        self._host_pattern = _compile_patterns(host_patterns)
+        self._path_pattern = _compile_patterns(path_patterns)
+        self._url_map = url_map
+        self._num_rules = len(rules)
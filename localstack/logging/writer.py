@@ -0,0 +1,125 @@
+"""Writing of log records on a background thread."""
+import logging
+import threading
+from queue import Full, Queue
+from typing import Optional
+
+from localstack.utils.threads import start_worker_thread
+
+LOG = logging.getLogger(__name__)
+
+
+class QueueLogWriter:
+    """
+    Emits log records on a background thread. The logging thread only creates the record and puts it into a bounded
+    queue, which is drained by a single writer thread that handles the record with the handlers of its logger (i.e.,
+    filtering, formatting, and writing of the record happen on the writer thread). If the queue is full, the record is
+    dropped and counted in ``dropped``.
+
+    Unlike a ``logging.handlers.QueueHandler``, the writer does not format the record before putting it into the queue,
+    so the arguments and ``extra`` attributes of a record must not be modified after it has been logged.
+    """
+
+    _stop = object()
+
+    queue: Queue
+    dropped: int
+    """The number of records that have been dropped because the queue was full."""
+
+    def __init__(self, max_size: int = 10000, name: str = "log-writer"):
+        self.queue = Queue(maxsize=max_size)
+        self.dropped = 0
+        self.name = name
+        self._thread = None
+        self._closed = False
+        self._mutex = threading.Lock()
+
+    def log(self, logger: logging.Logger, level: int, msg: str, *args, extra: dict = None) -> bool:
+        """
+        Creates a log record and enqueues it to be handled by the given logger on the writer thread. The caller
+        information of the record is not collected.
+
+        :param logger: the logger that handles the record
+        :param level: the log level
+        :param msg: the log message
+        :param args: the arguments of the log message
+        :param extra: additional attributes of the log record
+        :return: False if the logger is not enabled for the level, or the record was dropped
+        """
+        if not logger.isEnabledFor(level):
+            return False
+        record = logger.makeRecord(
+            logger.name, level, "(unknown file)", 0, msg, args, None, extra=extra
+        )
+        return self.put(logger, record)
+
+    def put(self, logger: logging.Logger, record: logging.LogRecord) -> bool:
+        """
+        Enqueues the given record to be handled by the given logger on the writer thread. Once the writer has been
+        closed, records are handled directly on the calling thread.
+
+        :param logger: the logger that handles the record
+        :param record: the record
+        :return: False if the record was dropped
+        """
+        if self._thread is None:
+            self.start()
+            if self._closed:
+                logger.handle(record)
+                return True
+
+        try:
+            self.queue.put_nowait((logger, record))
+        except Full:
+            with self._mutex:
+                self.dropped += 1
+                dropped = self.dropped
+            if dropped == 1:
+                LOG.warning(
+                    "%s queue is full (max size %d), dropping log records",
+                    self.name,
+                    self.queue.maxsize,
+                )
+            return False
+        return True
+
+    def start(self):
+        with self._mutex:
+            if self._thread is not None or self._closed:
+                return
+            self._thread = start_worker_thread(self._run, name=self.name)
+
+    def close(self, timeout: Optional[float] = 5):
+        """
+        Stops the writer thread after all records that have been enqueued so far are handled.
+
+        :param timeout: the maximum time in seconds to wait for the remaining records to be handled
+        """
+        with self._mutex:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._thread = None
+
+        if thread is None:
+            return
+
+        try:
+            self.queue.put(self._stop, timeout=timeout)
+        except Full:
+            LOG.debug("%s did not stop in time, remaining log records are discarded", self.name)
+            return
+        thread.join(timeout)
+
+    def _run(self, *_):
+        while True:
+            item = self.queue.get()
+            if item is self._stop:
+                return
+            logger, record = item
+            try:
+                logger.handle(record)
+            except Exception:
+                # handlers deal with their own errors, this only guards the writer thread
+                pass
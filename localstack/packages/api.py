@@ -8,9 +8,10 @@ from inspect import getmodule
 from threading import RLock
 from typing import Callable, List, Optional, Tuple
 
-from plugin import Plugin, PluginManager, PluginSpec
+from plugin import Plugin, PluginSpec
 
 from localstack import config
+from localstack.utils.plugin_index import IndexedPluginManager
 
 LOG = logging.getLogger(__name__)
 
@@ -319,7 +320,7 @@ class NoSuchPackageException(PackageException):
     pass
 
 
-class PackagesPluginManager(PluginManager[PackagesPlugin]):
+class PackagesPluginManager(IndexedPluginManager[PackagesPlugin]):
     """PluginManager which simplifies the loading / access of PackagesPlugins and their exposed package instances."""
 
     def __init__(self):
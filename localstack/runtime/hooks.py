@@ -1,6 +1,8 @@
 import functools
 
-from plugin import PluginManager, plugin
+from plugin import plugin
+
+from localstack.utils.plugin_index import IndexedPluginManager
 
 # plugin namespace constants
 HOOKS_CONFIGURE_LOCALSTACK_CONTAINER = "localstack.hooks.configure_localstack_container"
@@ -44,7 +46,7 @@ def hook_spec(namespace: str):
     return fn
 
 
-class HookManager(PluginManager):
+class HookManager(IndexedPluginManager):
     def load_all_sorted(self, propagate_exceptions=False):
         """
         Loads all hook plugins and sorts them by their hook_priority attribute.
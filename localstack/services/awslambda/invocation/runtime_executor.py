@@ -7,6 +7,7 @@ from plugin import PluginManager
 from localstack import config
 from localstack.services.awslambda.invocation.lambda_models import FunctionVersion, ServiceEndpoint
 from localstack.services.awslambda.invocation.plugins import RuntimeExecutorPlugin
+from localstack.utils.plugin_index import IndexedPluginManager
 
 LOG = logging.getLogger(__name__)
 
@@ -113,7 +114,7 @@ class LambdaRuntimeException(Exception):
         super().__init__(message)
 
 
-EXECUTOR_PLUGIN_MANAGER: PluginManager[Type[RuntimeExecutor]] = PluginManager(
+EXECUTOR_PLUGIN_MANAGER: PluginManager[Type[RuntimeExecutor]] = IndexedPluginManager(
     RuntimeExecutorPlugin.namespace
 )
 
@@ -38,6 +38,7 @@ from localstack.services.awslambda.invocation.runtime_environment import (
 )
 from localstack.services.awslambda.invocation.runtime_executor import get_runtime_executor
 from localstack.services.awslambda.lambda_executors import InvocationException
+from localstack.utils import worker_pool
 from localstack.utils.aws import dead_letter_queue
 from localstack.utils.aws.client_types import ServicePrincipal
 from localstack.utils.aws.message_forwarding import send_event_to_target
@@ -721,12 +722,12 @@ class LambdaVersionManager(ServiceEndpoint):
     # Service Endpoint implementation
     def invocation_result(self, invoke_id: str, invocation_result: InvocationResult) -> None:
         LOG.debug("Got invocation result for invocation '%s'", invoke_id)
-        start_thread(self.record_cw_metric_invocation)
+        worker_pool.submit("lambda-metrics", self.record_cw_metric_invocation)
         self.invocation_response(invoke_id=invoke_id, invocation_result=invocation_result)
 
     def invocation_error(self, invoke_id: str, invocation_error: InvocationError) -> None:
         LOG.debug("Got invocation error for invocation '%s'", invoke_id)
-        start_thread(self.record_cw_metric_error)
+        worker_pool.submit("lambda-metrics", self.record_cw_metric_error)
         self.invocation_response(invoke_id=invoke_id, invocation_result=invocation_error)
 
     def invocation_logs(self, invoke_id: str, invocation_logs: InvocationLogs) -> None:
@@ -7,7 +7,8 @@ from typing import TYPE_CHECKING, List, Optional
 
 from localstack.aws.api.cloudwatch import MetricAlarm, MetricDataQuery, StateValue
 from localstack.utils.aws import arns, aws_stack
-from localstack.utils.scheduler import Scheduler
+from localstack.utils.scheduler import TimerWheelScheduler
+from localstack.utils.worker_pool import get_worker_pool
 
 if TYPE_CHECKING:
     from mypy_boto3_cloudwatch import CloudWatchClient
@@ -33,10 +34,13 @@ INSUFFICIENT_DATA = "Insufficient Data"
 class AlarmScheduler:
     def __init__(self) -> None:
         """
-        Creates a new AlarmScheduler, with a Scheduler, that will be started in a new thread
+        Creates a new AlarmScheduler, with a Scheduler, that will be started in a new thread. The alarms are evaluated in
+        the worker pool, so a slow evaluation does not delay the evaluation of other alarms.
         """
         super().__init__()
-        self.scheduler = Scheduler()
+        self.scheduler = TimerWheelScheduler(
+            executor=get_worker_pool().get_pool("cloudwatch-alarms")
+        )
         self.thread = threading.Thread(target=self.scheduler.run, name="cloudwatch-scheduler")
         self.thread.start()
         self.scheduled_alarms = {}
@@ -70,10 +74,9 @@ class AlarmScheduler:
         def on_error(e):
             LOG.exception("Error executing scheduled alarm", exc_info=e)
 
-        task = self.scheduler.schedule(
+        task = self.scheduler.schedule_at_fixed_rate(
             func=calculate_alarm_state,
             period=schedule_period,
-            fixed_rate=True,
             args=[alarm_arn],
             on_error=on_error,
         )
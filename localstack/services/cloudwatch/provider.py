@@ -1,5 +1,6 @@
 import json
 import logging
+import math
 from xml.sax.saxutils import escape
 
 from moto.cloudwatch import cloudwatch_backends
@@ -11,6 +12,7 @@ from localstack.aws.api.cloudwatch import (
     AlarmNames,
     AmazonResourceName,
     CloudwatchApi,
+    DeleteAlarmsInput,
     DescribeAlarmsInput,
     DescribeAlarmsOutput,
     GetMetricDataInput,
@@ -20,12 +22,14 @@ from localstack.aws.api.cloudwatch import (
     ListTagsForResourceOutput,
     PutCompositeAlarmInput,
     PutMetricAlarmInput,
+    PutMetricDataInput,
     StateValue,
     TagKeyList,
     TagList,
     TagResourceOutput,
     UntagResourceOutput,
 )
+from localstack.aws.auth import parse_authorization_header
 from localstack.constants import DEFAULT_AWS_ACCOUNT_ID
 from localstack.deprecations import deprecated_endpoint
 from localstack.http import Request
@@ -34,7 +38,6 @@ from localstack.services.cloudwatch.alarm_scheduler import AlarmScheduler
 from localstack.services.edge import ROUTER
 from localstack.services.plugins import SERVICE_PLUGINS, ServiceLifecycleHook
 from localstack.utils.aws import arns, aws_stack
-from localstack.utils.aws.aws_stack import extract_access_key_id_from_auth_header
 from localstack.utils.patch import patch
 from localstack.utils.sync import poll_condition
 from localstack.utils.tagging import TaggingService
@@ -217,6 +220,44 @@ def _cleanup_describe_output(alarm):
         alarm["StateValue"] = StateValue.INSUFFICIENT_DATA
 
 
+def _to_moto_metric_datum(datum: dict) -> dict:
+    # moto's backend expects the metric data in the form of the (string) query parameters of the request
+    result = {"MetricName": datum["MetricName"]}
+    if "Dimensions" in datum:
+        result["Dimensions.member"] = datum["Dimensions"]
+    if "Unit" in datum:
+        result["Unit"] = datum["Unit"]
+    if "Timestamp" in datum:
+        result["Timestamp"] = datum["Timestamp"]
+    if "Value" in datum:
+        value = datum["Value"]
+        result["Value"] = "NaN" if math.isnan(value) else str(value)
+    if "Values" in datum:
+        result["Values.member"] = [str(value) for value in datum["Values"]]
+    if "Counts" in datum:
+        result["Counts.member"] = [str(count) for count in datum["Counts"]]
+    if "StatisticValues" in datum:
+        result["StatisticValues"] = {k: str(v) for k, v in datum["StatisticValues"].items()}
+    return result
+
+
+@moto.moto_adapter("cloudwatch", "PutMetricData")
+def _put_metric_data(context: RequestContext, request: PutMetricDataInput) -> dict:
+    backend: CloudWatchBackend = cloudwatch_backends[context.account_id][context.region]
+    backend.put_metric_data(
+        request.get("Namespace"),
+        [_to_moto_metric_datum(datum) for datum in request.get("MetricData", [])],
+    )
+    return {}
+
+
+@moto.moto_adapter("cloudwatch", "DeleteAlarms")
+def _delete_alarms(context: RequestContext, request: DeleteAlarmsInput) -> dict:
+    backend: CloudWatchBackend = cloudwatch_backends[context.account_id][context.region]
+    backend.delete_alarms(request.get("AlarmNames", []))
+    return {}
+
+
 class CloudwatchProvider(CloudwatchApi, ServiceLifecycleHook):
     """
     Cloudwatch provider.
@@ -281,10 +322,9 @@ class CloudwatchProvider(CloudwatchApi, ServiceLifecycleHook):
             self.alarm_scheduler.delete_scheduler_for_alarm(arn)
 
     def get_raw_metrics(self, request: Request):
-        region = aws_stack.extract_region_from_auth_header(request.headers)
-        account_id = (
-            extract_access_key_id_from_auth_header(request.headers) or DEFAULT_AWS_ACCOUNT_ID
-        )
+        authorization = parse_authorization_header(request.headers.get("Authorization"))
+        region = (authorization and authorization.region) or aws_stack.get_region()
+        account_id = (authorization and authorization.access_key_id) or DEFAULT_AWS_ACCOUNT_ID
         backend = cloudwatch_backends[account_id][region]
         if backend:
             result = [m for m in backend.metric_data if isinstance(m, MetricDatum)]
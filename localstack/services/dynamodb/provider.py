@@ -116,6 +116,7 @@ from localstack.services.dynamodbstreams.models import dynamodbstreams_stores
 from localstack.services.edge import ROUTER
 from localstack.services.plugins import ServiceLifecycleHook
 from localstack.state import AssetDirectory, StateVisitor
+from localstack.utils import worker_pool
 from localstack.utils.aws import arns, aws_stack
 from localstack.utils.aws.arns import extract_account_id_from_arn, extract_region_from_arn
 from localstack.utils.aws.aws_stack import get_valid_regions_for_service
@@ -123,7 +124,6 @@ from localstack.utils.collections import select_attributes, select_from_typed_di
 from localstack.utils.common import short_uid, to_bytes
 from localstack.utils.json import BytesEncoder, canonical_json
 from localstack.utils.strings import long_uid, to_str
-from localstack.utils.threads import start_worker_thread
 
 # set up logger
 LOG = logging.getLogger(__name__)
@@ -176,7 +176,7 @@ class EventForwarder:
             cls.forward_to_ddb_stream(records_to_ddb)
 
         if background:
-            return start_worker_thread(_forward)
+            return worker_pool.submit("dynamodb-event-forwarder", _forward)
         _forward()
 
     @staticmethod
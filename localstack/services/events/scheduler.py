@@ -3,6 +3,7 @@ import threading
 
 from crontab import CronTab
 
+from localstack.utils import worker_pool
 from localstack.utils.common import short_uid
 from localstack.utils.run import FuncThread
 
@@ -29,7 +30,7 @@ class Job:
         return delay_secs is not None and delay_secs < 60
 
     def do_run(self):
-        FuncThread(self.job_func, name="events-job-run").start()
+        worker_pool.submit("events-job-run", self.job_func)
 
 
 class JobScheduler:
@@ -14,13 +14,6 @@ from typing import Dict, List, Optional, Union
 from urllib.parse import urlparse
 
 import requests
-from flask_cors.core import (
-    ACL_ALLOW_HEADERS,
-    ACL_EXPOSE_HEADERS,
-    ACL_METHODS,
-    ACL_ORIGIN,
-    ACL_REQUEST_HEADERS,
-)
 from requests.models import Request, Response
 from werkzeug.exceptions import HTTPException
 
@@ -37,12 +30,18 @@ from localstack.utils.aws.request_context import RequestContextManager, get_prox
 from localstack.utils.functions import empty_context_manager
 from localstack.utils.json import json_safe
 from localstack.utils.net import wait_for_port_open
-from localstack.utils.server import http2_server
 from localstack.utils.ssl import create_ssl_cert, install_predefined_cert_if_available
 
 # set up logger
 LOG = logging.getLogger(__name__)
 
+# CORS header names (the same as in flask_cors.core)
+ACL_ORIGIN = "Access-Control-Allow-Origin"
+ACL_METHODS = "Access-Control-Allow-Methods"
+ACL_ALLOW_HEADERS = "Access-Control-Allow-Headers"
+ACL_EXPOSE_HEADERS = "Access-Control-Expose-Headers"
+ACL_REQUEST_HEADERS = "Access-Control-Request-Headers"
+
 # CORS constants below
 CORS_ALLOWED_HEADERS = [
     "authorization",
@@ -325,6 +324,7 @@ def modify_and_forward(
     """This is the central function that coordinates the incoming/outgoing messages
     with the proxy listeners (message interceptors)."""
     from localstack.services.edge import ProxyListenerEdge
+    from localstack.utils.server.http2_server import get_async_generator_result
 
     # Check origin / referer header before anything else happens.
     if (
@@ -422,7 +422,7 @@ def modify_and_forward(
             #  handler_chain_request (ls.routing.Request)
             modified_request_to_backend = listener_result
             break
-        elif http2_server.get_async_generator_result(listener_result):
+        elif get_async_generator_result(listener_result):
             return listener_result
         elif listener_result is not True:
             # get status code from response, or use Bad Gateway status code
@@ -627,6 +627,9 @@ def start_proxy_server(
         _, cert_file_name, key_file_name = create_ssl_cert(serial_number=port)
         ssl_creds = (cert_file_name, key_file_name)
 
+    # the legacy HTTP server (quart and hypercorn) is imported lazily, since it is only used by legacy proxies
+    from localstack.utils.server import http2_server
+
     result = http2_server.run_server(
         port,
         bind_addresses=bind_addresses,
@@ -58,7 +58,6 @@ from localstack.aws.api.iam import (
 from localstack.constants import INTERNAL_AWS_SECRET_ACCESS_KEY
 from localstack.services.moto import call_moto
 from localstack.utils.aws import aws_stack
-from localstack.utils.aws.aws_stack import extract_access_key_id_from_auth_header
 from localstack.utils.common import short_uid
 from localstack.utils.patch import patch
 
@@ -386,7 +385,7 @@ class IamProvider(IamApi):
         moto_user = get_iam_backend(context).users.get(moto_user_name)
         # if the user does not exist or is no user
         if not moto_user and not user_name:
-            access_key_id = extract_access_key_id_from_auth_header(context.request.headers)
+            access_key_id = context.authorization and context.authorization.access_key_id
             sts_client = aws_stack.connect_to_service(
                 "sts",
                 aws_access_key_id=access_key_id,
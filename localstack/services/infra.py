@@ -19,7 +19,7 @@ from localstack.runtime import events, hooks
 from localstack.runtime.exceptions import LocalstackExit
 from localstack.services import generic_proxy, motoserver
 from localstack.services.generic_proxy import ProxyListener, start_proxy_server
-from localstack.services.plugins import SERVICE_PLUGINS, ServiceDisabled, wait_for_infra_shutdown
+from localstack.services.plugins import SERVICE_PLUGINS, wait_for_infra_shutdown
 from localstack.utils import config_listener, files, objects
 from localstack.utils.analytics import usage
 from localstack.utils.aws.request_context import patch_moto_request_handling
@@ -453,15 +453,8 @@ def do_start_infra(asynchronous, apis, is_in_docker):
         if not config.EAGER_SERVICE_LOADING:
             return
 
-        for api in available_services:
-            # this should be the only call to is_api_enabled left
-            if is_api_enabled(api):
-                try:
-                    SERVICE_PLUGINS.require(api)
-                except ServiceDisabled as e:
-                    LOG.debug("%s", e)
-                except Exception:
-                    LOG.exception("could not load service plugin %s", api)
+        # this should be the only call to is_api_enabled left
+        SERVICE_PLUGINS.start_services([api for api in available_services if is_api_enabled(api)])
 
     @log_duration()
     def start_runtime_components():
@@ -14,6 +14,7 @@ from localstack.deprecations import deprecated_endpoint
 from localstack.http import Request, Resource, Response, Router
 from localstack.http.adapters import RouterListener
 from localstack.http.dispatcher import handler_dispatcher
+from localstack.http.router import HTTP_METHODS
 from localstack.services.infra import exit_infra, signal_supervisor_restart
 from localstack.utils.collections import merge_recursive
 from localstack.utils.config_listener import update_config_variable
@@ -21,7 +22,6 @@ from localstack.utils.files import load_file
 from localstack.utils.functions import call_safe
 from localstack.utils.json import parse_json_or_yaml
 from localstack.utils.objects import singleton_factory
-from localstack.utils.server.http2_server import HTTP_METHODS
 
 LOG = logging.getLogger(__name__)
 
@@ -167,6 +167,9 @@ class DiagnoseResource:
                 },
             },
             "services": call_safe(diagnose.get_service_stats),
+            "startup-timeline": call_safe(diagnose.get_startup_timeline),
+            "moto-adapters": call_safe(diagnose.get_moto_adapter_coverage),
+            "worker-pools": call_safe(diagnose.get_worker_pool_metrics),
             "config": call_safe(diagnose.get_localstack_config),
             "docker-inspect": call_safe(diagnose.inspect_main_container),
             "docker-dependent-image-hashes": call_safe(diagnose.get_important_image_hashes),
@@ -274,6 +277,17 @@ class ConfigResource:
         }
 
 
+class MetricsResource:
+    """
+    Exposes the latency histograms of the handler chain in the Prometheus text format.
+    """
+
+    def on_get(self, request):
+        from localstack.aws.metrics import HANDLER_CHAIN_METRICS
+
+        return Response(HANDLER_CHAIN_METRICS.to_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
 class LocalstackResources(Router):
     """
     Router for localstack-internal HTTP resources.
@@ -310,6 +324,9 @@ class LocalstackResources(Router):
         if config.ENABLE_CONFIG_UPDATES:
             self.add(Resource("/_localstack/config", ConfigResource()))
 
+        if config.ENABLE_HANDLER_CHAIN_METRICS:
+            self.add(Resource("/_localstack/metrics", MetricsResource()))
+
         if config.DEBUG:
             LOG.warning(
                 "Enabling diagnose endpoint, "
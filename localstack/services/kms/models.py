@@ -16,7 +16,7 @@ from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, hmac
 from cryptography.hazmat.primitives import serialization as crypto_serialization
-from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa, utils
+from cryptography.hazmat.primitives.asymmetric import ec, padding, utils
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 
 from localstack.aws.accounts import get_aws_account_id
@@ -39,7 +39,8 @@ from localstack.services.kms.exceptions import ValidationException
 from localstack.services.kms.utils import is_valid_key_arn
 from localstack.services.stores import AccountRegionBundle, BaseStore, LocalAttribute
 from localstack.utils.aws.arns import kms_alias_arn, kms_key_arn
-from localstack.utils.crypto import decrypt, encrypt
+from localstack.utils.crypto import decrypt, encrypt, generate_rsa_key_pair
+from localstack.utils.process_pool import get_process_pool
 from localstack.utils.strings import long_uid, to_bytes, to_str
 
 LOG = logging.getLogger(__name__)
@@ -172,7 +173,11 @@ class KmsCryptoKey:
 
         if key_spec.startswith("RSA"):
             key_size = RSA_CRYPTO_KEY_LENGTHS.get(key_spec)
-            key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+            # generating RSA keys takes up to seconds of CPU time, which would block other requests
+            self.private_key, self.public_key = get_process_pool().run(
+                generate_rsa_key_pair, key_size
+            )
+            return
         elif key_spec.startswith("ECC"):
             curve = ECC_CURVES.get(key_spec)
             key = ec.generate_private_key(curve)
@@ -1,13 +1,18 @@
 """
 This module provides tools to call moto using moto and botocore internals without going through the moto HTTP server.
 """
+import math
 import sys
+import threading
+from collections import Counter
 from functools import lru_cache
-from typing import Callable, Optional, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 import moto.backends as moto_backends
+from moto import settings as moto_settings
 from moto.core import BackendDict
 from moto.core.exceptions import RESTError
+from moto.core.responses import BaseResponse
 from moto.moto_server.utilities import RegexConverter
 from werkzeug.exceptions import NotFound
 from werkzeug.routing import Map, Rule
@@ -31,10 +36,38 @@ from localstack.constants import DEFAULT_AWS_ACCOUNT_ID
 from localstack.http import Response
 
 MotoDispatcher = Callable[[HttpRequest, str, dict], Response]
+MotoAdapter = Callable[[RequestContext, ServiceRequest], ServiceResponse]
+"""Calls the moto backend of an operation directly, and returns the ServiceResponse moto would have serialized."""
 
 user_agent = f"Localstack/{localstack_version} Python/{sys.version.split(' ')[0]}"
 
 
+# adapters which call moto backends directly, indexed by (service name, operation name)
+_moto_adapters: Dict[Tuple[str, str], MotoAdapter] = {}
+# number of calls to moto, indexed by (service name, operation name, whether an adapter was used)
+_moto_calls: Counter = Counter()
+_moto_calls_mutex = threading.Lock()
+
+
+def moto_adapter(service: str, operation: str) -> Callable[[MotoAdapter], MotoAdapter]:
+    """
+    Decorator to register a ``MotoAdapter`` for the given operation. ``call_moto`` then calls the adapter with the
+    parsed service request, instead of serializing the request, dispatching it to moto's response class (which parses
+    it again), and parsing moto's serialized response. The adapter has to return the same ServiceResponse as moto's
+    response would have been parsed into, and may raise moto's ``RESTError``.
+
+    :param service: the service name
+    :param operation: the operation name
+    :return: a decorator that registers the adapter
+    """
+
+    def wrapper(fn: MotoAdapter) -> MotoAdapter:
+        _moto_adapters[(service, operation)] = fn
+        return fn
+
+    return wrapper
+
+
 def call_moto(context: RequestContext, include_response_metadata=False) -> ServiceResponse:
     """
     Call moto with the given request context and receive a parsed ServiceResponse.
@@ -43,7 +76,78 @@ def call_moto(context: RequestContext, include_response_metadata=False) -> Servi
     :param include_response_metadata: whether to include botocore's "ResponseMetadata" attribute
     :return: a serialized AWS ServiceResponse (same as boto3 would return)
     """
-    return dispatch_to_backend(context, dispatch_to_moto, include_response_metadata)
+    adapter = None if include_response_metadata else _get_moto_adapter(context)
+
+    key = (context.service.service_name, context.operation.name, adapter is not None)
+    with _moto_calls_mutex:
+        _moto_calls[key] += 1
+
+    if not adapter:
+        return dispatch_to_backend(context, dispatch_to_moto, include_response_metadata)
+
+    _mark_account_as_visited(context)
+    try:
+        return adapter(context, context.service_request)
+    except RESTError as e:
+        raise CommonServiceException(e.error_type, e.message, status_code=e.code) from e
+
+
+def _get_moto_adapter(context: RequestContext) -> Optional[MotoAdapter]:
+    if config.DISABLE_MOTO_ADAPTERS or context.service_request is None:
+        return None
+    if not math.isinf(moto_settings.INITIAL_NO_AUTH_ACTION_COUNT):
+        # moto's IAM enforcement is only done when dispatching requests to moto's response classes
+        return None
+    return _moto_adapters.get((context.service.service_name, context.operation.name))
+
+
+def get_access_key(context: RequestContext) -> str:
+    """
+    Returns the access key id of the request, in the same way as moto's ``BaseResponse.get_access_key``.
+
+    :param context: the request context
+    :return: the access key id used to sign the request, or moto's default access key
+    """
+    authorization = context.request.headers.get("Authorization")
+    if authorization:
+        match = BaseResponse.access_key_regex.search(authorization)
+        if match:
+            return match.group(1)
+
+    return context.request.values.get("AWSAccessKeyId") or "AKIAEXAMPLE"
+
+
+def _mark_account_as_visited(context: RequestContext):
+    # this is done by moto's BaseResponse for every request, and tracks when IAM access keys were last used
+    from moto.iam.models import mark_account_as_visited
+
+    mark_account_as_visited(
+        account_id=context.account_id,
+        access_key=get_access_key(context),
+        service=context.service.service_name,
+        region=context.region,
+    )
+
+
+def get_moto_adapter_coverage() -> Dict[str, Dict]:
+    """
+    Returns which operations have a registered ``MotoAdapter``, and how often each operation was dispatched to moto with
+    an adapter (fast path) or via moto's response classes (slow path), f.e.::
+
+        {
+            "adapters": ["cloudwatch.PutMetricData", ...],
+            "fast_path": {"cloudwatch.PutMetricData": 1024, ...},
+            "slow_path": {"cloudwatch.ListMetrics": 12, ...},
+        }
+    """
+    with _moto_calls_mutex:
+        calls = dict(_moto_calls)
+
+    return {
+        "adapters": sorted(f"{service}.{operation}" for service, operation in _moto_adapters),
+        "fast_path": {f"{s}.{o}": count for (s, o, fast), count in calls.items() if fast},
+        "slow_path": {f"{s}.{o}": count for (s, o, fast), count in calls.items() if not fast},
+    }
 
 
 def call_moto_with_request(
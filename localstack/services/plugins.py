@@ -1,7 +1,10 @@
 import abc
+import contextlib
+import dataclasses
 import functools
 import logging
 import threading
+import time
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
@@ -13,9 +16,15 @@ from localstack import config
 from localstack.aws.skeleton import DispatchTable
 from localstack.config import ServiceProviderConfig
 from localstack.state import StateLifecycleHook, StateVisitable, StateVisitor
-from localstack.utils.bootstrap import get_enabled_apis, log_duration
+from localstack.utils.bootstrap import (
+    API_DEPENDENCIES,
+    API_EXTERNAL_PROCESSES,
+    get_enabled_apis,
+    log_duration,
+)
 from localstack.utils.functions import call_safe
 from localstack.utils.net import wait_for_port_status
+from localstack.utils.plugin_index import IndexedPluginManager
 from localstack.utils.sync import SynchronizedDefaultDict, poll_condition
 
 # set up logger
@@ -242,11 +251,87 @@ class ServiceContainer:
             self.errors.append(e)
 
 
+@dataclasses.dataclass
+class TimelineEvent:
+    service: str
+    phase: str
+    start: float
+    end: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "service": self.service,
+            "phase": self.phase,
+            "start": self.start,
+            "end": self.end,
+            "duration_ms": round((self.end - self.start) * 1000, 2) if self.end else None,
+        }
+
+
+class ServiceTimeline:
+    """
+    Records when services go through the phases of their lifecycle (loading the plugin, starting the service), to see
+    where the startup time goes. Exposed via ``/_localstack/diagnose``.
+    """
+
+    events: List[TimelineEvent]
+
+    def __init__(self):
+        self.events = []
+        self._mutex = threading.Lock()
+
+    @contextlib.contextmanager
+    def record(self, service: str, phase: str):
+        event = TimelineEvent(service, phase, time.time())
+        with self._mutex:
+            self.events.append(event)
+        try:
+            yield event
+        finally:
+            event.end = time.time()
+
+    def to_list(self) -> List[Dict]:
+        with self._mutex:
+            return [event.to_dict() for event in self.events]
+
+
+def group_dependent_services(services: List[str]) -> List[List[str]]:
+    """
+    Groups the given services by their dependencies (see ``API_DEPENDENCIES``), such that services which depend on each
+    other (directly or transitively) are in the same group. Within a group, services which launch external processes
+    come first, otherwise the order of the given services is kept.
+
+    :param services: the services to group
+    :return: the groups of services, groups with services that launch external processes first
+    """
+    parents = {}
+
+    def _find(service: str) -> str:
+        while parents.setdefault(service, service) != service:
+            service = parents[service]
+        return service
+
+    for service, dependencies in API_DEPENDENCIES.items():
+        for dependency in dependencies:
+            parents[_find(dependency)] = _find(service)
+
+    groups: Dict[str, List[str]] = {}
+    for service in services:
+        groups.setdefault(_find(service), []).append(service)
+
+    def _starts_process(service: str) -> bool:
+        return service in API_EXTERNAL_PROCESSES
+
+    result = [sorted(group, key=lambda s: not _starts_process(s)) for group in groups.values()]
+    return sorted(result, key=lambda group: not _starts_process(group[0]))
+
+
 class ServiceManager:
     def __init__(self) -> None:
         super().__init__()
         self._services: Dict[str, ServiceContainer] = {}
         self._mutex = threading.RLock()
+        self.timeline = ServiceTimeline()
 
     def get_service_container(self, name: str) -> Optional[ServiceContainer]:
         return self._services.get(name)
@@ -316,7 +401,9 @@ class ServiceManager:
                 raise container.errors[-1]
 
             if container.state == ServiceState.AVAILABLE or container.state == ServiceState.STOPPED:
-                if container.start():
+                with self.timeline.record(name, "start"):
+                    started = container.start()
+                if started:
                     return container.service
                 else:
                     raise container.errors[-1]
@@ -325,6 +412,36 @@ class ServiceManager:
             "service %s is not ready (%s) and could not be started" % (name, container.state)
         )
 
+    def start_services(self, services: List[str], max_workers: int = None):
+        """
+        Starts the given services concurrently on a thread pool. Services which depend on each other are started one
+        after another, and services which launch external processes are started first (see
+        ``group_dependent_services``). Errors are logged, but do not prevent other services from starting.
+
+        :param services: the services to start
+        :param max_workers: the maximum number of services which are started concurrently, defaults to
+            ``config.EAGER_SERVICE_LOADING_WORKERS``
+        """
+        groups = group_dependent_services(services)
+        if not groups:
+            return
+
+        max_workers = max_workers or config.EAGER_SERVICE_LOADING_WORKERS
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(groups)), thread_name_prefix="service-start"
+        ) as executor:
+            for group in groups:
+                executor.submit(self._start_service_group, group)
+
+    def _start_service_group(self, services: List[str]):
+        for service in services:
+            try:
+                self.require(service)
+            except ServiceDisabled as e:
+                LOG.debug("%s", e)
+            except Exception:
+                LOG.exception("could not load service plugin %s", service)
+
     # legacy map compatibility
 
     def items(self):
@@ -448,7 +565,7 @@ class ServicePluginManager(ServiceManager):
     ) -> None:
         super().__init__()
         self.plugin_errors = ServicePluginErrorCollector()
-        self.plugin_manager = plugin_manager or PluginManager(
+        self.plugin_manager = plugin_manager or IndexedPluginManager(
             PLUGIN_NAMESPACE, listener=self.plugin_errors
         )
         self._api_provider_specs = None
@@ -562,7 +679,8 @@ class ServicePluginManager(ServiceManager):
             # this is where we start lazy loading. we now know the PluginSpec for the API exists,
             # but the ServiceContainer has not been created.
             # this control path will be executed once per service
-            plugin = self._load_service_plugin(name)
+            with self.timeline.record(name, "load"):
+                plugin = self._load_service_plugin(name)
             if not plugin or not plugin.service:
                 return None
 
@@ -1,6 +1,5 @@
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, TypedDict, Union
 from urllib.parse import quote
@@ -42,6 +41,7 @@ from localstack.utils.aws.arns import parse_arn, s3_bucket_arn
 from localstack.utils.aws.client_types import ServicePrincipal
 from localstack.utils.strings import short_uid
 from localstack.utils.time import timestamp_millis
+from localstack.utils.worker_pool import get_worker_pool
 
 LOG = logging.getLogger(__name__)
 
@@ -656,7 +656,7 @@ class NotificationDispatcher:
     }
 
     def __init__(self, num_thread: int = 3):
-        self.executor = ThreadPoolExecutor(num_thread, thread_name_prefix="s3_ev")
+        self.executor = get_worker_pool().get_pool("s3-notifications", max_workers=num_thread)
 
     def shutdown(self):
         self.executor.shutdown(wait=False)
@@ -3,15 +3,13 @@ import logging
 import re
 import time
 from collections import namedtuple
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 from urllib import parse as urlparse
 from urllib.parse import parse_qs, urlencode
 
 from botocore.awsrequest import create_request_object
 from botocore.compat import urlsplit
 from botocore.credentials import Credentials
-from moto.s3 import s3_backends
-from moto.s3.models import S3Backend
 
 from localstack import config
 from localstack.aws.accounts import get_aws_account_id
@@ -24,6 +22,9 @@ from localstack.constants import (
 from localstack.utils.auth import HmacV1QueryAuth, S3SigV4QueryAuth
 from localstack.utils.aws.aws_responses import requests_error_response_xml_signature_calculation
 
+if TYPE_CHECKING:
+    from moto.s3.models import S3Backend
+
 LOGGER = logging.getLogger(__name__)
 
 REGION_REGEX = r"[a-z]{2}-[a-z]+-[0-9]{1,}"
@@ -81,7 +82,10 @@ ALLOWED_QUERY_PARAMS = [
 ]
 
 
-def get_s3_backend() -> S3Backend:
+def get_s3_backend() -> "S3Backend":
+    # moto is imported lazily, since this module is imported by the service router
+    from moto.s3 import s3_backends
+
     return s3_backends[get_aws_account_id()]["global"]
 
 
@@ -7,7 +7,6 @@ import json
 import logging
 import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Union
 
@@ -39,6 +38,7 @@ from localstack.utils.cloudwatch.cloudwatch_util import store_cloudwatch_logs
 from localstack.utils.objects import not_none_or
 from localstack.utils.strings import long_uid, md5, to_bytes
 from localstack.utils.time import timestamp_millis
+from localstack.utils.worker_pool import get_worker_pool
 
 LOG = logging.getLogger(__name__)
 
@@ -68,7 +68,7 @@ class TopicPublisher(abc.ABC):
     def publish(self, context: SnsPublishContext, subscriber: SnsSubscription):
         """
         This function wraps the underlying call to the actual publishing. This allows us to catch any uncaught
-        exception and log it properly. This method is passed to the ThreadPoolExecutor, which would swallow the
+        exception and log it properly. This method is passed to the executor, which would swallow the
         exception. This is a convenient way of doing it, but not something the abstract class should take care.
         Discussion here: https://github.com/localstack/localstack/pull/7267#discussion_r1056873437
         # TODO: move this out of the base class
@@ -120,7 +120,7 @@ class EndpointPublisher(abc.ABC):
     def publish(self, context: SnsPublishContext, endpoint: str):
         """
         This function wraps the underlying call to the actual publishing. This allows us to catch any uncaught
-        exception and log it properly. This method is passed to the ThreadPoolExecutor, which would swallow the
+        exception and log it properly. This method is passed to the executor, which would swallow the
         exception. This is a convenient way of doing it, but not something the abstract class should take care.
         Discussion here: https://github.com/localstack/localstack/pull/7267#discussion_r1056873437
         # TODO: move this out of the base class
@@ -1037,7 +1037,7 @@ class SubscriptionFilter:
 class PublishDispatcher:
     """
     The PublishDispatcher is responsible for dispatching the publishing of SNS messages asynchronously to worker
-    threads via a `ThreadPoolExecutor`, depending on the SNS subscriber protocol and filter policy.
+    threads via a sub-pool of the worker pool, depending on the SNS subscriber protocol and filter policy.
     """
 
     topic_notifiers = {
@@ -1058,7 +1058,7 @@ class PublishDispatcher:
     subscription_filter = SubscriptionFilter()
 
     def __init__(self, num_thread: int = 10):
-        self.executor = ThreadPoolExecutor(num_thread, thread_name_prefix="sns_pub")
+        self.executor = get_worker_pool().get_pool("sns-publisher", max_workers=num_thread)
 
     def shutdown(self):
         self.executor.shutdown(wait=False)
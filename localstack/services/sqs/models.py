@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import heapq
 import inspect
@@ -41,6 +42,77 @@ LOG = logging.getLogger(__name__)
 ReceiptHandle = str
 
 
+class _WaitableQueueMixin:
+    """
+    Mixin for ``queue.Queue`` classes that lets coroutines wait for items to be put into the queue, without blocking a
+    thread. Every item that is put into the queue wakes up one waiting coroutine.
+    """
+
+    _waiters: Dict[asyncio.Future, asyncio.AbstractEventLoop]
+
+    def _init(self, maxsize: int):
+        super()._init(maxsize)
+        self._waiters = {}
+
+    def _put(self, item):
+        # called by put/put_nowait while holding the mutex
+        super()._put(item)
+        self._notify_waiter()
+
+    def _notify_waiter(self):
+        while self._waiters:
+            future = next(iter(self._waiters))
+            loop = self._waiters.pop(future)
+            try:
+                loop.call_soon_threadsafe(self._wake_waiter, future)
+                return
+            except RuntimeError:
+                # the event loop of the waiter has been closed
+                continue
+
+    def _wake_waiter(self, future: asyncio.Future):
+        if not future.done():
+            future.set_result(None)
+            return
+
+        # the waiter has timed out in the meantime, so the notification is passed on to the next one
+        with self.mutex:
+            if self._qsize():
+                self._notify_waiter()
+
+    async def wait_for_item(self, timeout: float) -> bool:
+        """
+        Waits until the queue is not empty, or the timeout expires.
+
+        :param timeout: the maximum number of seconds to wait
+        :return: True if the queue is not empty, False if the timeout has expired
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        with self.mutex:
+            if self._qsize():
+                return True
+            self._waiters[future] = loop
+
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self.mutex:
+                self._waiters.pop(future, None)
+
+
+class WaitableQueue(_WaitableQueueMixin, Queue):
+    pass
+
+
+class WaitablePriorityQueue(_WaitableQueueMixin, PriorityQueue):
+    pass
+
+
 class SqsMessage:
     message: Message
     created: float
@@ -432,6 +504,37 @@ class SqsQueue:
         """
         raise NotImplementedError
 
+    async def receive_async(
+        self,
+        num_messages: int = 1,
+        wait_time_seconds: int = None,
+        visibility_timeout: int = None,
+    ) -> ReceiveMessageResult:
+        """
+        Like ``receive``, but waits for messages on the event loop instead of blocking the calling thread.
+
+        :param num_messages: the number of messages you want to get from the underlying queue
+        :param wait_time_seconds: the number of seconds you want to wait
+        :param visibility_timeout: an optional new visibility timeout
+        :return: a ReceiveMessageResult object that contains the result of the operation
+        """
+        deadline = time.time() + (wait_time_seconds or 0)
+
+        while True:
+            result = self.receive(num_messages, 0, visibility_timeout)
+            if result.successful or result.dead_letter_messages:
+                return result
+
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                return result
+
+            await self._wait_for_visible_messages(timeout)
+
+    async def _wait_for_visible_messages(self, timeout: float):
+        """Waits until messages may be visible in the queue, or the timeout expires."""
+        raise NotImplementedError
+
     def clear(self):
         """
         Calls clear on all internal datastructures that hold messages and data related to them.
@@ -498,12 +601,12 @@ class SqsQueue:
 
 
 class StandardQueue(SqsQueue):
-    visible: PriorityQueue
+    visible: WaitablePriorityQueue
     inflight: Set[SqsMessage]
 
     def __init__(self, name: str, region: str, account_id: str, attributes=None, tags=None) -> None:
         super().__init__(name, region, account_id, attributes, tags)
-        self.visible = PriorityQueue()
+        self.visible = WaitablePriorityQueue()
 
     def clear(self):
         with self.mutex:
@@ -632,6 +735,9 @@ class StandardQueue(SqsQueue):
 
         return result
 
+    async def _wait_for_visible_messages(self, timeout: float):
+        await self.visible.wait_for_item(timeout)
+
     def _on_remove_message(self, message: SqsMessage):
         try:
             self.inflight.remove(message)
@@ -685,7 +791,7 @@ class FifoQueue(SqsQueue):
     deduplication: Dict[str, SqsMessage]
     message_groups: dict[str, MessageGroup]
     inflight_groups: set[MessageGroup]
-    message_group_queue: Queue
+    message_group_queue: WaitableQueue
 
     def __init__(self, name: str, region: str, account_id: str, attributes=None, tags=None) -> None:
         super().__init__(name, region, account_id, attributes, tags)
@@ -693,7 +799,7 @@ class FifoQueue(SqsQueue):
 
         self.message_groups = {}
         self.inflight_groups = set()
-        self.message_group_queue = Queue()
+        self.message_group_queue = WaitableQueue()
 
     @property
     def approx_number_of_messages(self):
@@ -927,6 +1033,9 @@ class FifoQueue(SqsQueue):
 
         return result
 
+    async def _wait_for_visible_messages(self, timeout: float):
+        await self.message_group_queue.wait_for_item(timeout)
+
     def _on_remove_message(self, message: SqsMessage):
         # if a message is deleted from the queue, the message's group can become visible again
         message_group = self.get_message_group(message.message_group_id)
@@ -5,7 +5,6 @@ import logging
 import re
 import threading
 import time
-from concurrent.futures.thread import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 from moto.sqs.models import BINARY_TYPE_FIELD_INDEX, STRING_TYPE_FIELD_INDEX
@@ -88,6 +87,7 @@ from localstack.utils.scheduler import Scheduler
 from localstack.utils.strings import md5
 from localstack.utils.threads import start_thread
 from localstack.utils.time import now
+from localstack.utils.worker_pool import get_worker_pool
 
 LOG = logging.getLogger(__name__)
 
@@ -160,12 +160,12 @@ def check_message_content(message_body: str):
 
 class CloudwatchDispatcher:
     """
-    Dispatches SQS metrics for specific api-calls using a ThreadPool
+    Dispatches SQS metrics for specific api-calls using a sub-pool of the worker pool
     """
 
     def __init__(self, num_thread: int = 3):
-        self.executor = ThreadPoolExecutor(
-            num_thread, thread_name_prefix="sqs-metrics-cloudwatch-dispatcher"
+        self.executor = get_worker_pool().get_pool(
+            "sqs-metrics-cloudwatch-dispatcher", max_workers=num_thread
         )
 
     def shutdown(self):
@@ -175,7 +175,7 @@ class CloudwatchDispatcher:
         self, region: str, queue_name: str, metric: str, value: float = 1, unit: str = "Count"
     ):
         """
-        Publishes a metric to Cloudwatch using a Threadpool
+        Publishes a metric to Cloudwatch using the sub-pool
         :param region The region that should be used for Cloudwatch client
         :param queue_name The name of the queue that the metric belongs to
         :param metric The name of the metric
@@ -975,8 +975,47 @@ class SqsProvider(SqsApi, ServiceLifecycleHook):
         # fewer messages than requested on small queues. at some point we could maybe change this to randomly sample
         # between 1 and max_number_of_messages.
         # see https://docs.aws.amazon.com/AWSSimpleQueueService/latest/APIReference/API_ReceiveMessage.html
-        result = queue.receive(num, wait_time_seconds, visibility_timeout)
+        result = queue.receive(num, 0, visibility_timeout)
+
+        if wait_time_seconds and not (result.successful or result.dead_letter_messages):
+            # long polling: wait for messages on the event loop, instead of blocking a thread while waiting
+            return self._receive_message_async(
+                context,
+                queue,
+                num,
+                wait_time_seconds,
+                visibility_timeout,
+                attribute_names,
+                message_attribute_names,
+            )
+
+        return self._create_receive_message_result(
+            context, queue, result, attribute_names, message_attribute_names
+        )
 
+    async def _receive_message_async(
+        self,
+        context: RequestContext,
+        queue: SqsQueue,
+        num: int,
+        wait_time_seconds: int,
+        visibility_timeout: Optional[int],
+        attribute_names: Optional[AttributeNameList],
+        message_attribute_names: Optional[MessageAttributeNameList],
+    ) -> ReceiveMessageResult:
+        result = await queue.receive_async(num, wait_time_seconds, visibility_timeout)
+        return self._create_receive_message_result(
+            context, queue, result, attribute_names, message_attribute_names
+        )
+
+    def _create_receive_message_result(
+        self,
+        context: RequestContext,
+        queue: SqsQueue,
+        result,
+        attribute_names: Optional[AttributeNameList],
+        message_attribute_names: Optional[MessageAttributeNameList],
+    ) -> ReceiveMessageResult:
         # process dead letter messages
         if result.dead_letter_messages:
             dead_letter_target_arn = queue.redrive_policy["deadLetterTargetArn"]
@@ -1,13 +1,24 @@
 import logging
 
-from localstack.aws.api import RequestContext
+from moto.sts import sts_backends
+
+from localstack.aws.api import RequestContext, ServiceRequest
 from localstack.aws.api.sts import GetCallerIdentityResponse, StsApi
-from localstack.services.moto import call_moto
+from localstack.services.moto import call_moto, get_access_key, moto_adapter
 from localstack.services.plugins import ServiceLifecycleHook
 
 LOG = logging.getLogger(__name__)
 
 
+@moto_adapter("sts", "GetCallerIdentity")
+def _get_caller_identity(
+    context: RequestContext, request: ServiceRequest
+) -> GetCallerIdentityResponse:
+    backend = sts_backends[context.account_id]["global"]
+    user_id, arn, account_id = backend.get_caller_identity(get_access_key(context))
+    return GetCallerIdentityResponse(UserId=user_id, Account=account_id, Arn=arn)
+
+
 class StsProvider(StsApi, ServiceLifecycleHook):
     def get_caller_identity(self, context: RequestContext) -> GetCallerIdentityResponse:
         response = call_moto(context)
@@ -110,7 +110,7 @@ def create_request_context(
     parser = create_parser(context.service)
     _, instance = parser.parse(context.request)
     context.service_request = instance
-    context.account_id = get_account_id_from_request(context.request)
+    context.account_id = get_account_id_from_request(context.request, context.authorization)
     return context
 
 
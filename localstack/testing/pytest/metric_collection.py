@@ -63,6 +63,4 @@ def pytest_runtest_teardown(item: "Item", nextitem: Optional["Item"]) -> None:
         metric.snapshot_skipped_paths = skipped
 
     with open(FNAME_RAW_DATA_CSV, "a") as fd:
-        writer = csv.writer(fd)
-        writer.writerows(MetricHandler.metric_data)
-        MetricHandler.metric_data.clear()
+        MetricHandler.metric_data.export_csv(fd, clear=True)
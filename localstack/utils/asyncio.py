@@ -3,10 +3,13 @@ import concurrent.futures
 import functools
 import time
 from contextvars import copy_context
+from typing import Awaitable, TypeVar
 
 from .run import FuncThread
 from .threads import TMP_THREADS, start_worker_thread
 
+T = TypeVar("T")
+
 # reference to named event loop instances
 EVENT_LOOPS = {}
 
@@ -92,6 +95,30 @@ def run_coroutine(coroutine, loop=None):
     return future.result()
 
 
+def run_awaitable(awaitable: Awaitable[T]) -> T:
+    """
+    Run the given awaitable in the event loop of the calling thread (see ``ensure_event_loop``), and block the thread
+    until it is done. This allows synchronous code to consume the result of async code.
+
+    :raises RuntimeError: if the calling thread is already running an event loop, in which case the awaitable needs to
+        be awaited instead
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "run_awaitable cannot be called from a thread which is running an event loop, await the awaitable instead"
+        )
+
+    loop = ensure_event_loop()
+    if loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(awaitable)
+
+
 def ensure_event_loop():
     """Ensure that an event loop is defined for the currently running thread"""
     try:
@@ -8,7 +8,6 @@ from typing import Any, Dict, Optional, Union
 from urllib.parse import parse_qs
 
 import xmltodict
-from flask import Response as FlaskResponse
 from moto.core.exceptions import JsonRESTError
 from requests.models import CaseInsensitiveDict
 from requests.models import Response as RequestsResponse
@@ -47,6 +46,8 @@ def flask_error_response_json(
     headers = {"x-amzn-errortype": error_type}
     # Note: don't use flask's make_response(..) or jsonify(..) here as they
     # can lead to "RuntimeError: working outside of application context".
+    from flask import Response as FlaskResponse
+
     return FlaskResponse(json.dumps(result), status=code, headers=headers)
 
 
@@ -167,6 +168,8 @@ def is_invalid_html_response(headers, content) -> bool:
 
 
 def is_response_obj(result, include_lambda_response=False):
+    from flask import Response as FlaskResponse
+
     types = (RequestsResponse, FlaskResponse)
     if include_lambda_response:
         types += (LambdaResponse,)
@@ -174,6 +177,8 @@ def is_response_obj(result, include_lambda_response=False):
 
 
 def get_response_payload(response, as_json=False):
+    from flask import Response as FlaskResponse
+
     result = (
         response.content
         if isinstance(response, RequestsResponse)
@@ -220,6 +225,8 @@ def flask_to_requests_response(r):
 
 
 def requests_to_flask_response(r):
+    from flask import Response as FlaskResponse
+
     return FlaskResponse(r.content, status=r.status_code, headers=dict(r.headers))
 
 
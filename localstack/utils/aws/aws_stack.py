@@ -14,6 +14,7 @@ import botocore.config
 
 from localstack import config
 from localstack.aws.accounts import get_aws_access_key_id, get_aws_account_id
+from localstack.aws.auth import parse_authorization_header
 from localstack.constants import (
     APPLICATION_AMZ_JSON_1_0,
     APPLICATION_AMZ_JSON_1_1,
@@ -453,29 +454,18 @@ def inject_region_into_env(env, region):
 
 
 def extract_region_from_auth_header(headers: Dict[str, str], use_default=True) -> str:
-    auth = headers.get("Authorization") or ""
-    region = re.sub(r".*Credential=[^/]+/[^/]+/([^/]+)/.*", r"\1", auth)
-    if region == auth:
-        region = None
+    authorization = parse_authorization_header(headers.get("Authorization"))
+    region = authorization.region if authorization else None
     if use_default:
         region = region or get_region()
     return region
 
 
 def extract_access_key_id_from_auth_header(headers: Dict[str, str]) -> Optional[str]:
-    auth = headers.get("Authorization") or ""
-
-    if auth.startswith("AWS4-"):
-        # For Signature Version 4
-        access_id = re.findall(r".*Credential=([^/]+)/[^/]+/[^/]+/.*", auth)
-        if len(access_id):
-            return access_id[0]
-
-    elif auth.startswith("AWS "):
-        # For Signature Version 2
-        access_id = auth.removeprefix("AWS ").split(":")
-        if len(access_id):
-            return access_id[0]
+    # supports Signature Version 4 and 2
+    authorization = parse_authorization_header(headers.get("Authorization"))
+    if authorization:
+        return authorization.access_key_id
 
 
 def mock_aws_request_headers(
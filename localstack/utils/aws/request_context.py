@@ -9,6 +9,7 @@ from requests.models import Request
 from requests.structures import CaseInsensitiveDict
 
 from localstack import config
+from localstack.aws.auth import Authorization, parse_authorization_header
 from localstack.constants import APPLICATION_JSON, APPLICATION_XML, HEADER_CONTENT_TYPE
 from localstack.utils.aws import aws_stack
 from localstack.utils.aws.aws_responses import (
@@ -59,14 +60,16 @@ def get_flask_request_for_thread():
 
 
 def extract_region_from_auth_header(headers):
-    auth = headers.get("Authorization") or ""
-    region = re.sub(r".*Credential=[^/]+/[^/]+/([^/]+)/.*", r"\1", auth)
-    if region == auth:
-        return None
-    return region
+    authorization = parse_authorization_header(headers.get("Authorization"))
+    return authorization.region if authorization else None
 
 
-def extract_region_from_headers(headers):
+def extract_region_from_headers(headers, authorization: Optional[Authorization] = None):
+    """
+    :param headers: of the request
+    :param authorization: the already parsed Authorization header (parsed from the headers if not set)
+    :return: the region of the request, or the local region if the headers do not contain a region
+    """
     region = headers.get(MARKER_APIGW_REQUEST_REGION)
     # Fix region lookup for certain requests, e.g., API gateway invocations
     #  that do not contain region details in the Authorization header.
@@ -74,7 +77,10 @@ def extract_region_from_headers(headers):
     if region:
         return region
 
-    region = extract_region_from_auth_header(headers)
+    if authorization:
+        region = authorization.region
+    else:
+        region = extract_region_from_auth_header(headers)
 
     if not region:
         # fall back to local region
@@ -41,6 +41,9 @@ API_DEPENDENCIES = {
     "kinesis": ["dynamodb"],
     "firehose": ["kinesis"],
 }
+# APIs which launch external processes (like the DynamoDBLocal JVM or kinesis-mock), and therefore take long to start.
+# with EAGER_SERVICE_LOADING, these services are started first.
+API_EXTERNAL_PROCESSES = ["dynamodb", "kinesis"]
 # composites define an abstract name like "serverless" that maps to a set of services
 API_COMPOSITES = {
     "serverless": [
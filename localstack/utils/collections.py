@@ -3,6 +3,8 @@ This package provides custom collection types, as well as tools to analyze
 and manipulate python collection (dicts, list, sets).
 """
 
+import base64
+import json
 import logging
 import re
 import sys
@@ -113,7 +115,14 @@ _ListType = TypeVar("_ListType")
 
 
 class PaginatedList(List[_ListType]):
-    """List which can be paginated and filtered. For usage in AWS APIs with paginated responses"""
+    """
+    List which can be paginated and filtered. For usage in AWS APIs with paginated responses.
+
+    The next token of a page is an opaque cursor, which holds the position and the token of the first item of the next
+    page. The next page is therefore found without generating the tokens of all items before it, as long as the item
+    is still at the same position. Otherwise (f.e., if items were added or removed between the requests), the item is
+    searched by its token.
+    """
 
     DEFAULT_PAGE_SIZE = 50
 
@@ -124,6 +133,16 @@ class PaginatedList(List[_ListType]):
         page_size: int = None,
         filter_function: Callable[[_ListType], bool] = None,
     ) -> Tuple[List[_ListType], Optional[str]]:
+        """
+        Returns the page starting at the item with the given next token, and the next token of the following page.
+
+        :param token_generator: returns the token of an item
+        :param next_token: the next token returned with the previous page (or the token of an item), the page starts
+            at the first item if not set (or if the item cannot be found)
+        :param page_size: the maximum number of items of the page
+        :param filter_function: only items for which this function returns True are paginated
+        :return: a tuple of the page and the next token of the following page (None if this is the last page)
+        """
         if filter_function is not None:
             result_list = list(filter(filter_function, self))
         else:
@@ -136,19 +155,57 @@ class PaginatedList(List[_ListType]):
             return result_list, None
 
         start_idx = 0
+        if next_token is not None:
+            start_idx = self._find_start(result_list, token_generator, next_token)
 
-        try:
-            start_item = next(item for item in result_list if token_generator(item) == next_token)
-            start_idx = result_list.index(start_item)
-        except StopIteration:
-            pass
-
-        if start_idx + page_size < len(result_list):
-            next_token = token_generator(result_list[start_idx + page_size])
+        next_idx = start_idx + page_size
+        if next_idx < len(result_list):
+            next_token = self._encode_cursor(next_idx, token_generator(result_list[next_idx]))
         else:
             next_token = None
 
-        return result_list[start_idx : start_idx + page_size], next_token
+        return result_list[start_idx:next_idx], next_token
+
+    @staticmethod
+    def _find_start(
+        result_list: List[_ListType], token_generator: Callable[[_ListType], str], next_token: str
+    ) -> int:
+        cursor = PaginatedList._decode_cursor(next_token)
+        if cursor is None:
+            # a plain token of an item
+            return next(
+                (
+                    idx
+                    for idx, item in enumerate(result_list)
+                    if token_generator(item) == next_token
+                ),
+                0,
+            )
+
+        idx, token = cursor
+        if idx < len(result_list) and str(token_generator(result_list[idx])) == token:
+            return idx
+        return next(
+            (idx for idx, item in enumerate(result_list) if str(token_generator(item)) == token),
+            0,
+        )
+
+    @staticmethod
+    def _encode_cursor(idx: int, token: Any) -> str:
+        cursor = json.dumps([idx, str(token)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(next_token: Any) -> Optional[Tuple[int, str]]:
+        if not isinstance(next_token, str):
+            return None
+        try:
+            idx, token = json.loads(base64.urlsafe_b64decode(next_token.encode("ascii")))
+        except Exception:
+            return None
+        if not isinstance(idx, int) or idx < 0 or not isinstance(token, str):
+            return None
+        return idx, token
 
 
 class CustomExpiryTTLCache(cachetools.TTLCache):
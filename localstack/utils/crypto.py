@@ -6,6 +6,8 @@ import threading
 from typing import Tuple
 
 from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from .files import TMP_FILES, file_exists_not_empty, load_file, new_tmp_file, save_file
@@ -181,3 +183,24 @@ def decrypt(
     decrypted = decryptor.update(encrypted) + decryptor.finalize()
     decrypted = unpad(decrypted)
     return decrypted
+
+
+def generate_rsa_key_pair(key_size: int) -> Tuple[bytes, bytes]:
+    """
+    Generates an RSA key pair. This is CPU-bound (and takes seconds for large keys), so it is usually run in the
+    process pool (see ``localstack.utils.process_pool``).
+
+    :param key_size: the size of the key in bits
+    :return: a tuple of the DER-encoded private key (PKCS8) and public key (SubjectPublicKeyInfo)
+    """
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    private_key = key.private_bytes(
+        serialization.Encoding.DER,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_key = key.public_key().public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_key, public_key
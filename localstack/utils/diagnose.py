@@ -2,7 +2,7 @@
 import inspect
 import os
 import socket
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Union
 
 from localstack import config
 from localstack.constants import DEFAULT_VOLUME_DIR
@@ -138,6 +138,24 @@ def get_service_stats() -> Dict[str, str]:
     return {service: state.value for service, state in SERVICE_PLUGINS.get_states().items()}
 
 
+def get_startup_timeline() -> List[Dict]:
+    from localstack.services.plugins import SERVICE_PLUGINS
+
+    return SERVICE_PLUGINS.timeline.to_list()
+
+
+def get_moto_adapter_coverage() -> Dict[str, Dict]:
+    from localstack.services.moto import get_moto_adapter_coverage
+
+    return get_moto_adapter_coverage()
+
+
+def get_worker_pool_metrics() -> Dict[str, Any]:
+    from localstack.utils.worker_pool import get_worker_pool
+
+    return get_worker_pool().get_metrics()
+
+
 def get_file_tree() -> Dict[str, List[str]]:
     return {d: traverse_file_tree(d) for d in INSPECT_DIRECTORIES}
 
@@ -0,0 +1,162 @@
+"""
+Profiling of module import times, based on the output of ``python -X importtime``. Can be used as a command line tool
+to list the modules which contribute the most to the import time of a module, f.e.::
+
+    python -m localstack.utils.importtime localstack.aws.app --top 20
+"""
+import dataclasses
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+
+@dataclasses.dataclass
+class ImportTime:
+    """The import time of a single module, as reported by ``python -X importtime``."""
+
+    module: str
+    self_us: int
+    """The time (in microseconds) it took to execute the module itself, excluding its imports."""
+    cumulative_us: int
+    """The time (in microseconds) it took to import the module, including its imports."""
+    depth: int
+    """The nesting level of the import (0 for modules imported directly by the profiled code)."""
+
+
+@dataclasses.dataclass
+class ImportTimeReport:
+    imports: List[ImportTime]
+
+    @property
+    def total_us(self) -> int:
+        """The total import time, i.e., the sum of the cumulative times of all top-level imports."""
+        return sum(i.cumulative_us for i in self.imports if i.depth == 0)
+
+    def get(self, module: str) -> Optional[ImportTime]:
+        for i in self.imports:
+            if i.module == module:
+                return i
+        return None
+
+    def import_chain(self, module: str) -> List[str]:
+        """
+        Returns the chain of imports which caused the given module to be imported, starting with the top-level import.
+        """
+        # imports are reported after their nested imports, so the importer is the next entry with a lower depth
+        for index, i in enumerate(self.imports):
+            if i.module != module:
+                continue
+            chain = [i.module]
+            depth = i.depth
+            for parent in self.imports[index + 1 :]:
+                if parent.depth < depth:
+                    chain.append(parent.module)
+                    depth = parent.depth
+            return list(reversed(chain))
+        return []
+
+    def top_self(self, n: int = 20, prefix: str = None) -> List[ImportTime]:
+        """Returns the n modules with the highest self time (optionally only the ones with the given prefix)."""
+        imports = self._filter(prefix)
+        return sorted(imports, key=lambda i: i.self_us, reverse=True)[:n]
+
+    def top_cumulative(self, n: int = 20, prefix: str = None) -> List[ImportTime]:
+        """Returns the n modules with the highest cumulative time (optionally only the ones with the given prefix)."""
+        imports = self._filter(prefix)
+        return sorted(imports, key=lambda i: i.cumulative_us, reverse=True)[:n]
+
+    def _filter(self, prefix: Optional[str]) -> List[ImportTime]:
+        if not prefix:
+            return self.imports
+        return [i for i in self.imports if i.module.startswith(prefix)]
+
+
+def parse_importtime_output(output: str) -> ImportTimeReport:
+    """
+    Parses the output of ``python -X importtime``, which consists of lines like::
+
+        import time: self [us] | cumulative | imported package
+        import time:       104 |        104 |   _io
+        import time:      1204 |    1325752 | localstack.aws.app
+
+    :param output: the output (stderr) of the interpreter
+    :return: the parsed report
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+            self_us = int(self_us)
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            # the header line
+            continue
+        module = name.lstrip(" ")
+        depth = (len(name) - len(module) - 1) // 2
+        imports.append(ImportTime(module.rstrip(), self_us, cumulative_us, depth))
+    return ImportTimeReport(imports)
+
+
+def profile_import(module: str, python: str = None, env: Dict[str, str] = None) -> ImportTimeReport:
+    """
+    Imports the given module in a new interpreter with ``-X importtime`` and returns the report. Bytecode caches are
+    used if they exist, but not written.
+
+    :param module: the module to import
+    :param python: the python executable, defaults to the current one
+    :param env: additional environment variables of the interpreter
+    :return: the parsed report
+    """
+    process_env = dict(os.environ)
+    process_env["PYTHONDONTWRITEBYTECODE"] = "1"
+    process_env.update(env or {})
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=process_env,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"error while importing {module}: {result.stderr[-2000:]}")
+    return parse_importtime_output(result.stderr)
+
+
+def format_imports(imports: List[ImportTime]) -> str:
+    lines = ["%12s %12s  %s" % ("self [ms]", "cumul. [ms]", "module")]
+    for i in imports:
+        lines.append("%12.1f %12.1f  %s" % (i.self_us / 1000, i.cumulative_us / 1000, i.module))
+    return "\n".join(lines)
+
+
+def main():
+    import click
+
+    @click.command()
+    @click.argument("module")
+    @click.option("--top", default=20, help="Number of modules to list")
+    @click.option("--prefix", default=None, help="Only list modules with this prefix")
+    @click.option("--sort", type=click.Choice(["self", "cumulative"]), default="self")
+    @click.option("--why", default=None, help="Show the chain of imports which imports this module")
+    def _profile(module: str, top: int, prefix: str, sort: str, why: str):
+        """Lists the modules which contribute the most to the import time of MODULE."""
+        report = profile_import(module)
+        if why:
+            click.echo(" -> ".join(report.import_chain(why)) or f"{why} is not imported")
+            return
+        if sort == "self":
+            imports = report.top_self(top, prefix)
+        else:
+            imports = report.top_cumulative(top, prefix)
+        click.echo(format_imports(imports))
+        click.echo(f"\ntotal import time: {report.total_us / 1000:.1f} ms")
+
+    _profile()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+A persistent index of the entry points of all installed distributions, used to discover plugins without scanning the
+metadata of every distribution on each CLI invocation or container start. The index is stored in the cache directory,
+and is keyed by the installed distributions (their names, versions, and entry point files), so it is rebuilt
+automatically whenever a distribution is installed, upgraded, or removed, or its entry points change.
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from plugin import Plugin, PluginFinder, PluginManager, PluginSpec, PluginSpecResolver
+
+from localstack.utils.functions import call_safe
+
+if sys.version_info >= (3, 8):
+    from importlib.metadata import EntryPoint, entry_points
+else:
+    from importlib_metadata import EntryPoint, entry_points
+
+LOG = logging.getLogger(__name__)
+
+P = TypeVar("P", bound=Plugin)
+
+INDEX_FILE_NAME = "plugin-index.json"
+
+METADATA_SUFFIXES = (".dist-info", ".egg-info")
+
+
+def get_distributions_key(paths: List[str] = None) -> str:
+    """
+    Creates a key of the installed distributions, which changes whenever a distribution is installed, upgraded, or
+    removed, or the entry points of an (editable) distribution are changed. To be cheap, the key is built from the names
+    of the metadata directories (which contain the name and version of the distribution), and the modification times
+    of their entry point files, without reading any of the metadata.
+
+    :param paths: the paths to look for distributions, defaults to ``sys.path``
+    :return: a hex digest identifying the installed distributions
+    """
+    digest = hashlib.sha1()
+    for path in paths if paths is not None else sys.path:
+        try:
+            entries = sorted(os.scandir(path or "."), key=lambda e: e.name)
+        except OSError:
+            continue
+        digest.update(path.encode("utf-8"))
+        for entry in entries:
+            if not entry.name.endswith(METADATA_SUFFIXES):
+                continue
+            digest.update(entry.name.encode("utf-8"))
+            try:
+                mtime = os.stat(os.path.join(entry.path, "entry_points.txt")).st_mtime_ns
+            except OSError:
+                # the distribution does not define entry points
+                continue
+            digest.update(str(mtime).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_entry_points_by_group() -> Dict[str, List[EntryPoint]]:
+    """
+    Returns the entry points of all installed distributions by their group. Depending on the Python version (and the
+    version of the ``importlib_metadata`` backport), ``entry_points()`` returns a selectable object, or a plain dict of
+    the groups and their entry points.
+    """
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, "select"):
+        return {
+            group: list(all_entry_points.select(group=group)) for group in all_entry_points.groups
+        }
+    return {
+        group: list(group_entry_points) for group, group_entry_points in all_entry_points.items()
+    }
+
+
+class PluginIndex:
+    """
+    Maps entry point groups (plugin namespaces) to the entry points of all installed distributions. The index is read
+    from the index file if the installed distributions have not changed since it was written, otherwise it is built
+    from the distribution metadata and written to the index file.
+    """
+
+    path: Optional[str]
+
+    def __init__(self, path: str = None):
+        """
+        :param path: the path of the index file, if not set, the index is only kept in memory
+        """
+        self.path = path
+        self._entry_points: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        self._mutex = threading.Lock()
+
+    def get_entry_points(self, group: str) -> List[EntryPoint]:
+        return [
+            EntryPoint(name=name, value=value, group=group)
+            for name, value in self._get_index().get(group, [])
+        ]
+
+    def _get_index(self) -> Dict[str, List[Tuple[str, str]]]:
+        if self._entry_points is not None:
+            return self._entry_points
+
+        with self._mutex:
+            if self._entry_points is None:
+                self._entry_points = self._load()
+            return self._entry_points
+
+    def _load(self) -> Dict[str, List[Tuple[str, str]]]:
+        key = get_distributions_key()
+
+        if self.path:
+            index = call_safe(self._read)
+            if index and index.get("key") == key:
+                return index["entry_points"]
+
+        index = {
+            group: [[ep.name, ep.value] for ep in group_entry_points]
+            for group, group_entry_points in get_entry_points_by_group().items()
+        }
+
+        if self.path:
+            call_safe(
+                self._write,
+                args=({"key": key, "entry_points": index},),
+                exception_message="error writing plugin index",
+            )
+        return index
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        if not os.path.isfile(self.path):
+            return None
+        with open(self.path, "r") as fd:
+            return json.load(fd)
+
+    def _write(self, index: Dict[str, Any]):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # write to a temporary file first, to make sure concurrent readers never see a partial index
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as fd:
+            json.dump(index, fd)
+        os.replace(tmp_path, self.path)
+
+
+_plugin_index: Optional[PluginIndex] = None
+_plugin_index_mutex = threading.Lock()
+
+
+def get_plugin_index() -> PluginIndex:
+    """Returns the plugin index of this process, which is stored in ``config.dirs.cache``."""
+    global _plugin_index
+
+    with _plugin_index_mutex:
+        if _plugin_index is None:
+            from localstack import config
+
+            path = None
+            if not config.DISABLE_PLUGIN_INDEX_CACHE and config.dirs.cache:
+                path = os.path.join(config.dirs.cache, INDEX_FILE_NAME)
+            _plugin_index = PluginIndex(path)
+        return _plugin_index
+
+
+class PluginIndexFinder(PluginFinder):
+    """
+    A PluginFinder which resolves PluginSpecs from the entry points in a ``PluginIndex``. Like plux's default
+    ``StevedorePluginFinder``, it imports all the entry points of the namespace.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        on_resolve_exception_callback: Callable[[str, Any, Exception], None] = None,
+        index: PluginIndex = None,
+        spec_resolver: PluginSpecResolver = None,
+    ):
+        self.namespace = namespace
+        self.on_resolve_exception_callback = on_resolve_exception_callback
+        self.index = index
+        self.spec_resolver = spec_resolver or PluginSpecResolver()
+
+    def find_plugins(self) -> List[PluginSpec]:
+        index = self.index or get_plugin_index()
+
+        specs = []
+        for entry_point in index.get_entry_points(self.namespace):
+            try:
+                specs.append(self.spec_resolver.resolve(entry_point.load()))
+            except Exception as e:
+                if LOG.isEnabledFor(logging.DEBUG):
+                    LOG.exception("error resolving plugin %s.%s", self.namespace, entry_point.name)
+                if self.on_resolve_exception_callback:
+                    self.on_resolve_exception_callback(self.namespace, entry_point, e)
+        return specs
+
+
+class IndexedPluginManager(PluginManager[P]):
+    """A PluginManager which discovers its plugins through the plugin index (see ``PluginIndexFinder``)."""
+
+    def __init__(self, namespace: str, *args, finder: PluginFinder = None, **kwargs):
+        finder = finder or PluginIndexFinder(namespace, self._fire_on_resolve_exception)
+        super().__init__(namespace, *args, finder=finder, **kwargs)
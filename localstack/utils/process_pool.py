@@ -0,0 +1,156 @@
+"""
+A shared pool of worker processes for CPU-bound jobs of providers (f.e., the generation of RSA keys). Jobs running on
+the request threads of the gateway hold the GIL for most of their runtime, which stalls all other requests. Jobs
+submitted to the pool run in a separate interpreter instead, so the request thread only waits for the result.
+
+Jobs (and their arguments and results) are pickled, so they have to be module-level functions. The worker processes
+are spawned (not forked) and only import the modules of the jobs, so jobs should live in lightweight modules.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, TypeVar
+
+LOG = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class JobTimeoutError(TimeoutError):
+    """Raised if a job did not finish within its timeout."""
+
+
+class ProcessPool:
+    """
+    A bounded pool of worker processes. The worker processes are started with the first job, and restarted if one of
+    them dies. At most ``max_workers`` jobs run at the same time, and at most ``max_pending`` jobs are submitted to the
+    pool at the same time. Submitting further jobs blocks until a job has finished, which limits the memory used by the
+    pickled arguments of waiting jobs.
+
+    If ``max_workers`` is 0, jobs are run directly in the thread which submits them.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int = None, timeout: float = None):
+        """
+        :param max_workers: the number of worker processes, 0 runs jobs in the submitting thread
+        :param max_pending: the maximum number of submitted jobs which have not finished, defaults to 4 * max_workers
+        :param timeout: the default timeout (in seconds) of jobs run with ``run``
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending or 4 * max(max_workers, 1)
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = threading.BoundedSemaphore(self.max_pending)
+        self._mutex = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        """
+        Submits a job to the pool, and blocks if ``max_pending`` jobs are already submitted.
+
+        :param fn: the job, a picklable module-level function
+        :return: a future of the result of the job
+        """
+        if self.max_workers <= 0:
+            return self._run_inline(fn, *args, **kwargs)
+
+        self._pending.acquire()
+        try:
+            future = self._get_executor().submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            # a worker died since the last job, the executor does not accept any jobs after that
+            LOG.debug("restarting broken process pool")
+            self._reset_executor()
+            try:
+                future = self._get_executor().submit(fn, *args, **kwargs)
+            except BaseException:
+                self._pending.release()
+                raise
+        except BaseException:
+            self._pending.release()
+            raise
+
+        future.add_done_callback(lambda _: self._pending.release())
+        return future
+
+    def run(self, fn: Callable[..., T], *args, timeout: float = None, **kwargs) -> T:
+        """
+        Runs a job in the pool, and waits for its result.
+
+        :param fn: the job, a picklable module-level function
+        :param timeout: the timeout (in seconds), defaults to the timeout of the pool
+        :return: the result of the job
+        :raises JobTimeoutError: if the job did not finish within the timeout
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # jobs which are already running cannot be interrupted, but they occupy a worker only until they finish
+            future.cancel()
+            raise JobTimeoutError(f"job {fn.__name__} did not finish within {timeout} seconds")
+
+    @property
+    def is_shut_down(self) -> bool:
+        return self._shutdown
+
+    def shutdown(self, wait: bool = False):
+        self._shutdown = True
+        with self._mutex:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._shutdown:
+            raise RuntimeError("cannot submit jobs after the process pool was shut down")
+
+        with self._mutex:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _reset_executor(self):
+        with self._mutex:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _run_inline(fn: Callable[..., T], *args, **kwargs) -> "Future[T]":
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+_process_pool: Optional[ProcessPool] = None
+_process_pool_mutex = threading.Lock()
+
+
+def get_process_pool() -> ProcessPool:
+    """Returns the process pool shared by all providers, which is configured by ``PROCESS_POOL_*``."""
+    global _process_pool
+
+    with _process_pool_mutex:
+        if _process_pool is None or _process_pool.is_shut_down:
+            from localstack import config
+            from localstack.utils.threads import TMP_THREADS
+
+            max_workers = config.PROCESS_POOL_MAX_WORKERS
+            if max_workers is None:
+                max_workers = min(4, os.cpu_count() or 1)
+            _process_pool = ProcessPool(max_workers, timeout=config.PROCESS_POOL_JOB_TIMEOUT)
+            # shut down with the other threads and processes of the infra
+            TMP_THREADS.append(_process_pool)
+        return _process_pool
@@ -1,8 +1,13 @@
+import logging
+import math
 import queue
 import threading
 import time
+from collections import deque
 from concurrent.futures import Executor
-from typing import Any, Callable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+LOG = logging.getLogger(__name__)
 
 
 class ScheduledTask:
@@ -124,6 +129,59 @@ class Scheduler:
         self.schedule_task(st)
         return st
 
+    def schedule_once(
+        self,
+        func: Callable,
+        delay: float = 0,
+        on_error: Callable[[Exception], None] = None,
+        args: Optional[Union[Tuple, List[Any]]] = None,
+        kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> ScheduledTask:
+        """
+        Schedules a task to run once after the given delay.
+
+        :param func: the task to schedule
+        :param delay: the delay (in seconds) after which the task runs
+        :param on_error: error callback
+        :param args: additional positional arguments to pass to the function
+        :param kwargs: additional keyword arguments to pass to the function
+        :return: a ScheduledTask instance
+        """
+        return self.schedule(
+            func, start=time.time() + delay, on_error=on_error, args=args, kwargs=kwargs
+        )
+
+    def schedule_at_fixed_rate(
+        self,
+        func: Callable,
+        period: float,
+        initial_delay: float = 0,
+        on_error: Callable[[Exception], None] = None,
+        args: Optional[Union[Tuple, List[Any]]] = None,
+        kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> ScheduledTask:
+        """
+        Schedules a task to run periodically at a fixed rate (regardless of how long the task runs), starting after the
+        given initial delay.
+
+        :param func: the task to schedule
+        :param period: the period (in seconds) in which to run the task
+        :param initial_delay: the delay (in seconds) after which the task runs the first time
+        :param on_error: error callback
+        :param args: additional positional arguments to pass to the function
+        :param kwargs: additional keyword arguments to pass to the function
+        :return: a ScheduledTask instance
+        """
+        return self.schedule(
+            func,
+            period=period,
+            fixed_rate=True,
+            start=time.time() + initial_delay,
+            on_error=on_error,
+            args=args,
+            kwargs=kwargs,
+        )
+
     def schedule_task(self, task: ScheduledTask) -> None:
         """
         Schedules the given task and sets the deadline of the task to either ``task.start`` or the current time.
@@ -198,3 +256,188 @@ class Scheduler:
                     # task deadline couldn't be set because it was cancelled
                     continue
                 q.put((task.deadline, task))
+
+
+class TimerWheelScheduler(Scheduler):
+    """
+    A Scheduler based on a hierarchical timer wheel, for a large number of scheduled tasks (f.e., CloudWatch alarms).
+    Adding, re-scheduling, and cancelling a task is O(1), independent of the number of scheduled tasks.
+
+    Time is divided into ticks of ``tick`` seconds, and each task is put into the bucket of the tick in which its
+    deadline lies. The buckets are grouped into the slots of ``levels`` wheels, where each slot of the first wheel spans
+    ``wheel_size`` ticks, and each slot of the next wheel spans a full rotation of the previous wheel. The wheels only
+    count the tasks in each of their slots, which is used to find the next tick with tasks (and skip all ticks without
+    tasks) by descending from the first non-empty slot of the highest wheel. Unlike in a classic hierarchical timer
+    wheel, tasks are never moved between wheels, which would delay the tasks that are due while large slots are moved.
+
+    Tasks never run before their deadline, and at most one tick after it. Cancelled tasks are removed when they would
+    have run.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        tick: float = 0.01,
+        wheel_size: int = 64,
+        levels: int = 3,
+    ) -> None:
+        """
+        Creates a new TimerWheelScheduler.
+
+        :param executor: an optional executor that tasks will be submitted to (see ``Scheduler``)
+        :param tick: the resolution (in seconds) of the scheduler
+        :param wheel_size: the number of slots of each wheel
+        :param levels: the number of wheels
+        """
+        super().__init__(executor)
+        self.tick = tick
+        self.wheel_size = wheel_size
+
+        # the tasks (in insertion order) by the tick in which they expire, and the expiration tick of each task
+        self._buckets: Dict[int, Dict[ScheduledTask, None]] = {}
+        self._expirations: Dict[ScheduledTask, int] = {}
+        # the number of ticks spanned by a slot of each wheel, and the number of tasks in the slots of each wheel
+        self._spans = [wheel_size ** (level + 1) for level in range(levels)]
+        self._counts: List[Dict[int, int]] = [{} for _ in range(levels)]
+        # the last tick which has been processed, all scheduled tasks expire after it
+        self._current = math.floor(time.time() / tick)
+        self._due: Deque[ScheduledTask] = deque()
+        self._closed = False
+
+    def add(self, task: ScheduledTask) -> None:
+        if task.deadline is None:
+            raise ValueError
+
+        task._cancelled = False
+
+        with self._condition:
+            self._insert(task)
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def run(self):
+        cond = self._condition
+
+        while True:
+            with cond:
+                if self._closed:
+                    break
+
+                self._expire(math.floor(time.time() / self.tick))
+                if not self._due:
+                    next_tick = self._find_next_tick()
+                    if next_tick is None:
+                        cond.wait()
+                    else:
+                        cond.wait(timeout=max(0.0, next_tick * self.tick - time.time()))
+                    continue
+
+                due = self._due
+                self._due = deque()
+
+            for task in due:
+                self._dispatch(task)
+
+    def _dispatch(self, task: ScheduledTask):
+        if task.is_cancelled:
+            return
+
+        executor = self.executor
+        if executor:
+            try:
+                executor.submit(task.run)
+            except RuntimeError as e:
+                # the executor has been shut down (f.e., a sub-pool of the worker pool), the scheduler thread must not
+                # die because of that, since no other task would be run anymore
+                LOG.warning(
+                    "Cannot submit scheduled tasks to the executor anymore, running them in the "
+                    "scheduler thread: %s",
+                    e,
+                )
+                self.executor = None
+                task.run()
+        else:
+            task.run()
+
+        if task.is_periodic and not task.is_cancelled:
+            task.set_next_deadline()
+            with self._condition:
+                self._insert(task)
+
+    def _insert(self, task: ScheduledTask):
+        # needs to be called with the condition held
+        self._remove(task)
+
+        expiration = math.ceil(task.deadline / self.tick)
+        if expiration <= self._current:
+            self._due.append(task)
+            return
+
+        bucket = self._buckets.get(expiration)
+        if bucket is None:
+            bucket = self._buckets[expiration] = {}
+        bucket[task] = None
+        self._expirations[task] = expiration
+
+        for span, counts in zip(self._spans, self._counts):
+            slot = expiration // span
+            counts[slot] = counts.get(slot, 0) + 1
+
+    def _remove(self, task: ScheduledTask):
+        # needs to be called with the condition held
+        expiration = self._expirations.pop(task, None)
+        if expiration is None:
+            return
+
+        bucket = self._buckets[expiration]
+        del bucket[task]
+        if not bucket:
+            del self._buckets[expiration]
+        self._decrement_counts(expiration, 1)
+
+    def _decrement_counts(self, expiration: int, n: int):
+        for span, counts in zip(self._spans, self._counts):
+            slot = expiration // span
+            if counts[slot] == n:
+                del counts[slot]
+            else:
+                counts[slot] -= n
+
+    def _expire(self, target: int):
+        # needs to be called with the condition held. moves the tasks which expire up to the target tick to the due tasks
+        while True:
+            next_tick = self._find_next_tick()
+            if next_tick is None or next_tick > target:
+                break
+
+            bucket = self._buckets.pop(next_tick)
+            self._decrement_counts(next_tick, len(bucket))
+            for task in bucket:
+                del self._expirations[task]
+                if not task.is_cancelled:
+                    self._due.append(task)
+            self._current = next_tick
+
+        self._current = max(self._current, target)
+
+    def _find_next_tick(self) -> Optional[int]:
+        # returns the first tick with scheduled tasks, or None if there are no scheduled tasks
+        if not self._buckets:
+            return None
+
+        start = self._current + 1
+        # the highest wheel is not limited to one rotation, so its first non-empty slot is the one with the lowest index
+        slot = min(self._counts[-1])
+        for level in range(len(self._spans) - 2, -2, -1):
+            span = self._spans[level] if level >= 0 else 1
+            slots = self._counts[level] if level >= 0 else self._buckets
+            # the first non-empty slot (or bucket) of the lower wheel within the slot of the higher wheel. there are no
+            # tasks before the start tick, so there is always one
+            first = max(slot * self.wheel_size, start // span)
+            slot = next(i for i in range(first, (slot + 1) * self.wheel_size) if i in slots)
+
+        return slot
@@ -0,0 +1,249 @@
+"""
+A global, bounded pool of worker threads for short-lived background tasks (f.e., dispatching event notifications),
+which would otherwise each start a new thread with ``start_worker_thread``. The tasks are submitted to named sub-pools
+(f.e., "sns-publisher"), which share the threads of the global pool, but each limit how many of their tasks run at the
+same time and how many of their tasks may wait to be run. This keeps the number of threads constant under bursts of
+events, and keeps a single busy sub-pool from taking all threads of the pool.
+
+Long-running tasks (like polling loops) should not be run in the pool, since they keep a thread of the pool occupied.
+"""
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+_local = threading.local()
+
+
+class SubPool(Executor):
+    """
+    A named sub-pool of a ``WorkerPool``. At most ``max_workers`` tasks of the sub-pool run at the same time, the other
+    tasks are queued in the order in which they were submitted. If ``max_queue_size`` tasks are queued, submitting a
+    task blocks until a queued task was started (back-pressure), unless the task is submitted by a task of the worker
+    pool itself, which would otherwise dead-lock the pool.
+    """
+
+    name: str
+    max_workers: int
+    max_queue_size: int
+
+    def __init__(self, name: str, executor: Executor, max_workers: int, max_queue_size: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor = executor
+        self._queue: Deque[Tuple[Future, Callable, tuple, dict]] = deque()
+        self._running = 0
+        self._shutdown = False
+        self._condition = threading.Condition()
+
+        # metrics
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._throttled = 0
+        self._max_queue_depth = 0
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        future = Future()
+
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError(f"cannot submit tasks to the shut down worker pool {self.name}")
+
+            if len(self._queue) >= self.max_queue_size and not getattr(_local, "worker", False):
+                self._throttled += 1
+                self._condition.wait_for(
+                    lambda: len(self._queue) < self.max_queue_size or self._shutdown
+                )
+                if self._shutdown:
+                    raise RuntimeError(
+                        f"cannot submit tasks to the shut down worker pool {self.name}"
+                    )
+
+            self._queue.append((future, fn, args, kwargs))
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            self._schedule()
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Shuts down the sub-pool (but not the worker pool). Queued tasks are still run, unless ``cancel_futures`` is set.
+
+        :param wait: whether to wait until all tasks of the sub-pool are done
+        :param cancel_futures: whether to cancel the queued tasks
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                while self._queue:
+                    self._queue.popleft()[0].cancel()
+            self._condition.notify_all()
+            if wait:
+                self._condition.wait_for(lambda: not self._queue and not self._running)
+
+    @property
+    def is_shut_down(self) -> bool:
+        return self._shutdown
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of tasks which are queued, but were not started yet."""
+        return len(self._queue)
+
+    def get_metrics(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "running": self._running,
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self._max_queue_depth,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "throttled": self._throttled,
+            }
+
+    def _schedule(self):
+        # needs to be called with the condition held
+        while self._queue and self._running < self.max_workers:
+            task = self._queue.popleft()
+            self._running += 1
+            self._condition.notify_all()
+            try:
+                self._executor.submit(self._run, *task)
+            except RuntimeError as e:
+                # the worker pool was shut down
+                self._running -= 1
+                task[0].set_exception(e)
+
+    def _run(self, future: Future, fn: Callable, args: tuple, kwargs: dict):
+        if not future.set_running_or_notify_cancel():
+            self._task_done(failed=False)
+            return
+
+        _local.worker = True
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            LOG.info("Task %s of worker pool %s failed: %s", fn, self.name, e)
+            # update the metrics before the result is visible to the submitter
+            self._task_done(failed=True)
+            future.set_exception(e)
+        else:
+            self._task_done(failed=False)
+            future.set_result(result)
+        finally:
+            _local.worker = False
+
+    def _task_done(self, failed: bool):
+        with self._condition:
+            self._running -= 1
+            self._completed += 1
+            self._failed += int(failed)
+            # start the next task with a new submission to the pool, so the tasks of all sub-pools take turns
+            self._schedule()
+            self._condition.notify_all()
+
+
+class WorkerPool:
+    """
+    A bounded pool of worker threads, which runs the tasks of its named sub-pools. Threads are started on demand, and
+    reused for subsequent tasks.
+    """
+
+    max_workers: int
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "worker-pool"):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=thread_name_prefix)
+        self._pools: Dict[str, SubPool] = {}
+        self._mutex = threading.Lock()
+        self._shutdown = False
+
+    def get_pool(self, name: str, max_workers: int = None, max_queue_size: int = None) -> SubPool:
+        """
+        Returns the sub-pool with the given name, which is created if it does not exist (or was shut down).
+
+        :param name: the name of the sub-pool
+        :param max_workers: the maximum number of tasks of the sub-pool which run at the same time, defaults to (and is
+            limited by) the number of workers of the pool
+        :param max_queue_size: the maximum number of tasks of the sub-pool which wait to be run
+        :return: the sub-pool
+        """
+        with self._mutex:
+            pool = self._pools.get(name)
+            if pool is None or pool.is_shut_down:
+                pool = SubPool(
+                    name,
+                    self._executor,
+                    min(max_workers or self.max_workers, self.max_workers),
+                    max_queue_size or DEFAULT_MAX_QUEUE_SIZE,
+                )
+                self._pools[name] = pool
+            return pool
+
+    def submit(self, name: str, fn: Callable, *args, **kwargs) -> Future:
+        """Submits a task to the sub-pool with the given name, see ``SubPool.submit``."""
+        return self.get_pool(name).submit(fn, *args, **kwargs)
+
+    def get_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Returns the metrics of all sub-pools, and the number of threads of the pool."""
+        with self._mutex:
+            pools = list(self._pools.values())
+        return {
+            "threads": len(self._executor._threads),
+            "max_workers": self.max_workers,
+            "pools": {pool.name: pool.get_metrics() for pool in pools},
+        }
+
+    @property
+    def is_shut_down(self) -> bool:
+        return self._shutdown
+
+    def shutdown(self, wait: bool = False):
+        with self._mutex:
+            self._shutdown = True
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_worker_pool: Optional[WorkerPool] = None
+_worker_pool_mutex = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    """Returns the global worker pool, which is configured by ``WORKER_POOL_MAX_WORKERS``."""
+    global _worker_pool
+
+    with _worker_pool_mutex:
+        if _worker_pool is None or _worker_pool.is_shut_down:
+            from localstack import config
+            from localstack.utils.threads import TMP_THREADS
+
+            _worker_pool = WorkerPool(config.WORKER_POOL_MAX_WORKERS)
+            # shut down with the other threads and processes of the infra
+            TMP_THREADS.append(_worker_pool)
+        return _worker_pool
+
+
+def submit(name: str, fn: Callable, *args, **kwargs) -> Future:
+    """
+    Runs the given function in the sub-pool with the given name of the global worker pool. This replaces starting a
+    new thread for short-lived background tasks, f.e., ``start_worker_thread(fn)`` becomes ``submit("my-pool", fn)``.
+
+    :param name: the name of the sub-pool
+    :param fn: the function to run
+    :return: a future of the result of the function
+    """
+    return get_worker_pool().submit(name, fn, *args, **kwargs)
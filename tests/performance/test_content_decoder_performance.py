@@ -0,0 +1,78 @@
+"""
+Microbenchmark for the decoding of compressed request bodies. Measures the average time it takes to decode large,
+compressed CloudWatch PutMetricData batches with the ``ContentDecoder`` for each supported content coding, compared to
+reading the uncompressed batch.
+
+The script does not need a running LocalStack instance.
+"""
+import gzip
+import timeit
+import zlib
+from typing import Callable, Dict, Optional
+from urllib.parse import urlencode
+
+from localstack.aws.api import RequestContext
+from localstack.aws.handlers.codec import ContentDecoder
+from localstack.aws.spec import load_service
+from localstack.http import Request
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+NUM_ROUNDS = 200
+NUM_METRICS = 1000
+"""The number of metric data items per batch (the maximum of PutMetricData)."""
+
+
+def create_put_metric_data_body() -> bytes:
+    params = {"Action": "PutMetricData", "Version": "2010-08-01", "Namespace": "Benchmark"}
+    for i in range(1, NUM_METRICS + 1):
+        prefix = f"MetricData.member.{i}"
+        params[f"{prefix}.MetricName"] = f"metric-{i % 20}"
+        params[f"{prefix}.Dimensions.member.1.Name"] = "InstanceId"
+        params[f"{prefix}.Dimensions.member.1.Value"] = f"i-{i:017x}"
+        params[f"{prefix}.Unit"] = "Milliseconds"
+        params[f"{prefix}.Values.member.1"] = str(i * 1.5)
+        params[f"{prefix}.Counts.member.1"] = "1"
+    return urlencode(params).encode("utf-8")
+
+
+def run_benchmark(name: str, body: bytes, content_encoding: Optional[str], expected_size: int):
+    service = load_service("cloudwatch")
+    decoder = ContentDecoder()
+    headers = {"Content-Type": "application/x-www-form-urlencoded; charset=utf-8"}
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+
+    def _decode():
+        context = RequestContext()
+        context.request = Request("POST", "/", body=body, headers=headers)
+        context.service = service
+        decoder(None, context, None)
+        assert len(context.request.get_data()) == expected_size
+
+    duration = timeit.timeit(_decode, number=NUM_ROUNDS)
+    print("%s: %.2f ms per batch (%s bytes)" % (name, duration / NUM_ROUNDS * 1e3, len(body)))
+
+
+def main():
+    body = create_put_metric_data_body()
+
+    codecs: Dict[str, Callable[[bytes], bytes]] = {
+        "gzip": gzip.compress,
+        "deflate": zlib.compress,
+    }
+    if zstandard:
+        codecs["zstd"] = zstandard.ZstdCompressor().compress
+
+    size = len(body)
+    run_benchmark("identity", body, None, size)
+    for encoding, compress in codecs.items():
+        run_benchmark(encoding, compress(body), encoding, size)
+    run_benchmark("gzip, deflate", zlib.compress(gzip.compress(body)), "gzip, deflate", size)
+
+
+if __name__ == "__main__":
+    main()
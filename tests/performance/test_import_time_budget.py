@@ -0,0 +1,41 @@
+"""
+Regression benchmark for the cold import time of the AWS gateway application (``localstack.aws.app``). Imports the
+module several times in a fresh interpreter with ``python -X importtime``, prints the modules which contribute the most
+to the import time, and exits with a non-zero exit code if the median import time exceeds the budget.
+
+The budget (in milliseconds) can be set with the ``IMPORT_TIME_BUDGET_MS`` environment variable.
+
+The script does not need a running LocalStack instance.
+"""
+import os
+import statistics
+import sys
+
+from localstack.utils.importtime import format_imports, profile_import
+
+MODULE = "localstack.aws.app"
+NUM_ROUNDS = 5
+IMPORT_TIME_BUDGET_MS = int(os.environ.get("IMPORT_TIME_BUDGET_MS") or 1500)
+
+
+def main():
+    reports = [profile_import(MODULE) for _ in range(NUM_ROUNDS)]
+    durations = [report.total_us / 1000 for report in reports]
+    median = statistics.median(durations)
+
+    print("top offenders (self time):")
+    print(format_imports(reports[-1].top_self(15)))
+    print("\nslowest localstack modules (cumulative time):")
+    print(format_imports(reports[-1].top_cumulative(15, prefix="localstack")))
+    print(
+        "\nimport time of %s: %.1f ms (median of %s rounds, budget %s ms)"
+        % (MODULE, median, NUM_ROUNDS, IMPORT_TIME_BUDGET_MS)
+    )
+
+    if median > IMPORT_TIME_BUDGET_MS:
+        print("import time budget exceeded")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Microbenchmark for the JSON codecs used by the ``json`` and ``rest-json`` protocols. Measures the time it takes to
+parse a DynamoDB BatchWriteItem request and to serialize a DynamoDB Scan response, once with each of the available
+JSON codecs (the ``json`` module of the standard library, and ``orjson`` if it is installed).
+
+The script does not need a running LocalStack instance.
+"""
+import timeit
+from typing import List
+
+from localstack.aws.protocol import codec
+from localstack.aws.protocol.parser import create_parser
+from localstack.aws.protocol.serializer import create_serializer
+from localstack.aws.spec import load_service
+from localstack.http import Request
+
+NUM_ITERATIONS = 1000
+NUM_ITEMS = 25
+
+
+def create_item(i: int) -> dict:
+    return {
+        "id": {"S": f"item-{i}"},
+        "number": {"N": str(i)},
+        "data": {"B": "ZGF0YQ=="},
+        "nested": {
+            "M": {
+                "string": {"S": "value " * 10},
+                "list": {"L": [{"S": "value"}, {"N": "1.5"}, {"BOOL": True}]},
+            }
+        },
+    }
+
+
+def create_batch_write_item_request(json_codec: codec.JsonCodec) -> Request:
+    body = {
+        "RequestItems": {
+            "table": [{"PutRequest": {"Item": create_item(i)}} for i in range(NUM_ITEMS)]
+        }
+    }
+    return Request(
+        "POST",
+        "/",
+        body=json_codec.dumps(body),
+        headers={
+            "Content-Type": "application/x-amz-json-1.0",
+            "X-Amz-Target": "DynamoDB_20120810.BatchWriteItem",
+        },
+    )
+
+
+def create_scan_response() -> dict:
+    items = []
+    for i in range(NUM_ITEMS * 4):
+        item = create_item(i)
+        item["data"] = {"B": b"data"}
+        items.append(item)
+    return {"Count": len(items), "ScannedCount": len(items), "Items": items}
+
+
+def run_benchmark(json_codec: codec.JsonCodec):
+    service = load_service("dynamodb")
+    parser = create_parser(service)
+    parser.JSON_CODEC = json_codec
+    serializer = create_serializer(service)
+    serializer.JSON_CODEC = json_codec
+    scan = service.operation_model("Scan")
+    scan_response = create_scan_response()
+
+    # werkzeug caches the body on the request, therefore every parse call gets a new request
+    requests: List[Request] = [
+        create_batch_write_item_request(json_codec) for _ in range(NUM_ITERATIONS + 1)
+    ]
+    parser.parse(requests.pop())
+    requests = iter(requests)
+    parse_duration = timeit.timeit(lambda: parser.parse(next(requests)), number=NUM_ITERATIONS)
+
+    serializer.serialize_to_response(scan_response, scan, None, "request-id")
+    serialize_duration = timeit.timeit(
+        lambda: serializer.serialize_to_response(scan_response, scan, None, "request-id"),
+        number=NUM_ITERATIONS,
+    )
+
+    print(
+        "%s: parse BatchWriteItem %.1f us, serialize Scan %.1f us (average of %s iterations)"
+        % (
+            json_codec.name,
+            parse_duration / NUM_ITERATIONS * 1e6,
+            serialize_duration / NUM_ITERATIONS * 1e6,
+            NUM_ITERATIONS,
+        )
+    )
+
+
+def main():
+    run_benchmark(codec.StdlibJsonCodec())
+    try:
+        run_benchmark(codec.OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed")
+
+
+if __name__ == "__main__":
+    main()
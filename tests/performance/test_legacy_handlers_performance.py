@@ -0,0 +1,77 @@
+"""
+Microbenchmark for the legacy compatibility handlers (``serve_default_listeners`` and ``serve_edge_router_rules``), which
+are passed by every request before it reaches the AWS handler chain. Measures the average time an SQS GetQueueUrl
+request spends in these handlers, with the edge routes a LocalStack instance typically registers, when the edge router
+is always dispatched, and when requests are filtered with the ``RoutePrefilter`` first.
+
+The script does not need a running LocalStack instance.
+"""
+import timeit
+
+from localstack.aws.api import RequestContext
+from localstack.aws.chain import HandlerChain
+from localstack.aws.handlers.legacy import DefaultListenerHandler, EdgeRouterHandler
+from localstack.aws.handlers.routes import RouterHandler
+from localstack.http import Request, Response
+from localstack.services.edge import ROUTER
+
+NUM_ROUNDS = 50000
+
+
+def noop(request, **kwargs):
+    return Response()
+
+
+def register_edge_routes():
+    # a selection of the routes registered by the service providers
+    region = "<regex('(us|eu|ap)-[a-z]+-\\\\d'):region>"
+    ROUTER.add("/_aws/sqs/messages", endpoint=noop)
+    ROUTER.add("/_aws/sns/platform-endpoint-messages", endpoint=noop)
+    ROUTER.add("/_aws/cloudwatch/metrics/raw", endpoint=noop)
+    ROUTER.add("/shell", endpoint=noop, methods=["GET"])
+    ROUTER.add("/shell/<regex('.*'):req_path>", endpoint=noop)
+    ROUTER.add("/_aws/ses", endpoint=noop)
+    ROUTER.add("/", host=f"<api_id>.lambda-url.{region}.<regex('.*'):server>", endpoint=noop)
+    ROUTER.add(
+        "/<path:path>", host=f"<api_id>.lambda-url.{region}.<regex('.*'):server>", endpoint=noop
+    )
+    execute_api_host = "<regex('[^-]+'):api_id><regex('(-vpce-[^.]+)?'):vpce_suffix>.execute-api.<regex('.*'):server>"
+    ROUTER.add("/", host=execute_api_host, endpoint=noop)
+    ROUTER.add("/<stage>/", host=execute_api_host, endpoint=noop)
+    ROUTER.add("/<stage>/<path:path>", host=execute_api_host, endpoint=noop)
+    ROUTER.add("/restapis/<api_id>/<stage>/_user_request_", endpoint=noop)
+    ROUTER.add("/restapis/<api_id>/<stage>/_user_request_/<path:path>", endpoint=noop)
+
+
+def run_benchmark(name: str, edge_router_handler: RouterHandler):
+    default_listener_handler = DefaultListenerHandler()
+    request = Request(
+        "POST",
+        "/",
+        body=b"Action=GetQueueUrl&QueueName=my-queue&Version=2012-11-05",
+        headers={
+            "Host": "sqs.us-east-1.localhost.localstack.cloud:4566",
+            "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
+        },
+    )
+    chain = HandlerChain()
+    response = Response()
+
+    def _handle():
+        context = RequestContext()
+        context.request = request
+        default_listener_handler(chain, context, response)
+        edge_router_handler(chain, context, response)
+
+    duration = timeit.timeit(_handle, number=NUM_ROUNDS)
+    print("%s: %.2f us per request" % (name, duration / NUM_ROUNDS * 1e6))
+
+
+def main():
+    register_edge_routes()
+    run_benchmark("always dispatched", RouterHandler(ROUTER))
+    run_benchmark("prefiltered", EdgeRouterHandler())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Microbenchmark for calls to moto with and without a ``MotoAdapter``. Measures the average time of ``call_moto`` for
+operations which have an adapter, once via the adapter (which calls the moto backend directly), and once via moto's
+response classes (which serialize the request, parse it again in moto, and parse moto's serialized response).
+
+The script does not need a running LocalStack instance.
+"""
+import os
+import timeit
+from typing import List, Tuple
+
+from localstack import config
+from localstack.aws.forwarder import create_aws_request_context
+from localstack.services import moto
+
+# registers the adapters
+from localstack.services.cloudwatch import provider as cloudwatch_provider  # noqa
+from localstack.services.sts import provider as sts_provider  # noqa
+
+NUM_ROUNDS = 2000
+
+ACCOUNT_ID = "000000000000"
+
+OPERATIONS: List[Tuple[str, str, dict]] = [
+    (
+        "cloudwatch",
+        "PutMetricData",
+        {
+            "Namespace": "Benchmark",
+            "MetricData": [
+                {
+                    "MetricName": f"metric-{i}",
+                    "Dimensions": [{"Name": "InstanceId", "Value": f"i-{i:017x}"}],
+                    "Unit": "Milliseconds",
+                    "Value": i * 1.5,
+                }
+                for i in range(20)
+            ],
+        },
+    ),
+    ("cloudwatch", "DeleteAlarms", {"AlarmNames": ["alarm-1", "alarm-2"]}),
+    ("sts", "GetCallerIdentity", {}),
+]
+
+
+def run_benchmark(service: str, operation: str, parameters: dict) -> float:
+    context = create_aws_request_context(service, operation, parameters)
+    context.account_id = ACCOUNT_ID
+    context.request.headers.add("x-moto-account-id", ACCOUNT_ID)
+
+    duration = timeit.timeit(lambda: moto.call_moto(context), number=NUM_ROUNDS)
+    return duration / NUM_ROUNDS
+
+
+def main():
+    # the requests are signed like the requests of a client
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+
+    print("%-30s %12s %12s" % ("operation", "adapter", "moto"))
+    for service, operation, parameters in OPERATIONS:
+        config.DISABLE_MOTO_ADAPTERS = False
+        fast = run_benchmark(service, operation, parameters)
+        config.DISABLE_MOTO_ADAPTERS = True
+        slow = run_benchmark(service, operation, parameters)
+        print("%-30s %9.1f us %9.1f us" % (f"{service}.{operation}", fast * 1e6, slow * 1e6))
+
+    print("\ncoverage: %s" % moto.get_moto_adapter_coverage())
+
+
+if __name__ == "__main__":
+    main()
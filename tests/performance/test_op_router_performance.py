@@ -0,0 +1,63 @@
+"""
+Microbenchmark for the REST operation routers. Measures the average time it takes to match typical S3, API Gateway,
+and Lambda requests to their operations with the trie-based ``RestServiceOperationRouter`` and the Werkzeug-based
+``WerkzeugRestServiceOperationRouter``.
+
+The script does not need a running LocalStack instance.
+"""
+import timeit
+from typing import List, Tuple
+
+from localstack.aws.protocol.op_router import (
+    RestServiceOperationRouter,
+    WerkzeugRestServiceOperationRouter,
+)
+from localstack.aws.spec import load_service
+from localstack.http import Request
+
+NUM_ROUNDS = 2000
+
+REQUESTS: List[Tuple[str, str, str, str]] = [
+    # service, method, path, query string
+    ("s3", "GET", "/my-bucket/some/nested/key.txt", ""),
+    ("s3", "PUT", "/my-bucket/some/nested/key.txt", ""),
+    ("s3", "HEAD", "/my-bucket/key", ""),
+    ("s3", "GET", "/my-bucket", "list-type=2&prefix=some"),
+    ("s3", "PUT", "/my-bucket", "versioning"),
+    ("s3", "POST", "/my-bucket/key", "uploads"),
+    ("s3", "DELETE", "/my-bucket", "delete"),
+    ("apigateway", "GET", "/restapis/api-id/resources/resource-id/methods/GET", ""),
+    ("apigateway", "POST", "/restapis/api-id/deployments", ""),
+    ("apigateway", "GET", "/restapis", ""),
+    ("lambda", "POST", "/2015-03-31/functions/my-function/invocations", ""),
+    ("lambda", "GET", "/2015-03-31/functions/", ""),
+]
+
+
+def run_benchmark(name: str, router_type):
+    routers = {}
+    for service, _, _, _ in REQUESTS:
+        if service not in routers:
+            routers[service] = router_type(load_service(service))
+
+    requests = [
+        (routers[service], Request(method, path, query_string=query))
+        for service, method, path, query in REQUESTS
+    ]
+
+    def _route_all():
+        for router, request in requests:
+            router.match(request)
+
+    number = NUM_ROUNDS * len(requests)
+    duration = timeit.timeit(_route_all, number=NUM_ROUNDS)
+    print("%s: %.2f us per request (%s requests)" % (name, duration / number * 1e6, number))
+
+
+def main():
+    run_benchmark("werkzeug", WerkzeugRestServiceOperationRouter)
+    run_benchmark("trie", RestServiceOperationRouter)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark for the pagination of a ``PaginatedList``. Creates many keys with the KMS provider and pages through them with
+``ListKeys``, once with the ``NextMarker`` cursors returned by the provider (which hold the position of the next item),
+and once with the plain ``KeyId`` of the next item as marker, which has to be searched in the list of keys before each
+page.
+
+The script does not need a running LocalStack instance.
+"""
+import time
+
+from localstack.aws.api import RequestContext
+from localstack.aws.api.kms import ListKeysRequest
+from localstack.services.kms.provider import KmsProvider
+from localstack.utils.collections import PaginatedList
+
+NUM_KEYS = 20_000
+"""The number of keys in the store."""
+PAGE_SIZE = 100
+"""The number of keys of each page (the default ``Limit`` of ``ListKeys``)."""
+
+
+def run_scenario(name: str, provider: KmsProvider, context: RequestContext, plain_marker: bool):
+    pages = 0
+    keys = 0
+    marker = None
+    page_times = []
+
+    then = time.perf_counter()
+    while True:
+        request = ListKeysRequest(Limit=PAGE_SIZE)
+        if marker:
+            request["Marker"] = marker
+        page_start = time.perf_counter()
+        response = provider.list_keys(context, request)
+        page_times.append(time.perf_counter() - page_start)
+        pages += 1
+        keys += len(response["Keys"])
+        marker = response.get("NextMarker")
+        if not marker:
+            break
+        if plain_marker:
+            # the token of the next key, like the markers before they held the position of the key
+            marker = PaginatedList._decode_cursor(marker)[1]
+    total = time.perf_counter() - then
+
+    assert keys == NUM_KEYS
+    print(
+        "%-14s total %7.2f s   first page %7.3f ms   last page %7.3f ms   (%d pages)"
+        % (name, total, page_times[0] * 1e3, page_times[-1] * 1e3, pages)
+    )
+
+
+def main():
+    provider = KmsProvider()
+    context = RequestContext()
+    context.account_id = "000000000000"
+    context.region = "us-east-1"
+
+    for _ in range(NUM_KEYS):
+        provider.create_key(context)
+    # warm up the provider before measuring the first page
+    provider.list_keys(context, ListKeysRequest(Limit=PAGE_SIZE))
+
+    print(f"{NUM_KEYS} keys, {PAGE_SIZE} keys per page")
+    run_scenario("key id marker", provider, context, plain_marker=True)
+    run_scenario("cursor marker", provider, context, plain_marker=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Microbenchmark for the request parsers. Measures the time it takes to parse an SQS (query protocol) and a DynamoDB
+(json protocol) request, once for the first request of an operation (which compiles the parse functions of the
+operation's shapes), and on average for the subsequent requests (which re-use the compiled parse functions).
+
+The script does not need a running LocalStack instance.
+"""
+import json
+import timeit
+
+from localstack.aws.protocol.parser import create_parser
+from localstack.aws.spec import load_service
+from localstack.http import Request
+
+NUM_REQUESTS = 5000
+
+
+def create_sqs_request() -> Request:
+    body = "Action=SendMessage&Version=2012-11-05&QueueUrl=http%3A%2F%2Flocalhost%3A4566%2F000000000000%2Fq"
+    body += "&MessageBody=test123&DelaySeconds=2"
+    for i in range(1, 6):
+        body += f"&MessageAttribute.{i}.Name=attr{i}"
+        body += f"&MessageAttribute.{i}.Value.DataType=String"
+        body += f"&MessageAttribute.{i}.Value.StringValue=value{i}"
+    return Request(
+        "POST", "/", body=body, headers={"Content-Type": "application/x-www-form-urlencoded"}
+    )
+
+
+def create_dynamodb_request() -> Request:
+    item = {
+        f"attr{i}": {
+            "M": {
+                "string": {"S": "value"},
+                "number": {"N": "1"},
+                "list": {"L": [{"S": "value"}, {"BOOL": True}]},
+            }
+        }
+        for i in range(5)
+    }
+    return Request(
+        "POST",
+        "/",
+        body=json.dumps({"TableName": "table", "Item": item}),
+        headers={
+            "Content-Type": "application/x-amz-json-1.0",
+            "X-Amz-Target": "DynamoDB_20120810.PutItem",
+        },
+    )
+
+
+def run_benchmark(service: str, create_request):
+    parser = create_parser(load_service(service))
+    # werkzeug caches the parsed body on the request, therefore every parse call gets a new request
+    requests = [create_request() for _ in range(NUM_REQUESTS + 1)]
+
+    first = timeit.timeit(lambda: parser.parse(requests[0]), number=1)
+    requests = iter(requests[1:])
+    duration = timeit.timeit(lambda: parser.parse(next(requests)), number=NUM_REQUESTS)
+    print(
+        "%s: first request %.1f us, subsequent requests %.1f us on average (%s requests)"
+        % (service, first * 1e6, duration / NUM_REQUESTS * 1e6, NUM_REQUESTS)
+    )
+
+
+def main():
+    run_benchmark("sqs", create_sqs_request)
+    run_benchmark("dynamodb", create_dynamodb_request)
+
+
+if __name__ == "__main__":
+    main()
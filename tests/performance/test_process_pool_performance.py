@@ -0,0 +1,115 @@
+"""
+Benchmark for the offloading of CPU-bound jobs to the process pool. Measures the latency of SQS SendMessage calls while
+other threads concurrently create KMS keys with the key spec RSA_4096 (like parallel KMS CreateKey requests), once with
+the RSA keys generated in the request threads, and once with the RSA keys generated in the process pool.
+
+The script does not need a running LocalStack instance.
+"""
+import os
+import threading
+import time
+from typing import List
+
+from localstack import config
+from localstack.aws.forwarder import create_aws_request_context
+from localstack.services.kms.models import KmsCryptoKey
+from localstack.services.sqs.provider import SqsProvider
+from localstack.utils.process_pool import get_process_pool
+
+DURATION = 10
+"""The number of seconds the SQS latency is measured for each scenario."""
+NUM_KMS_THREADS = 4
+"""The number of threads which concurrently create RSA_4096 KMS keys."""
+
+ACCOUNT_ID = "000000000000"
+
+
+def create_keys(stop: threading.Event, created: List[int]):
+    while not stop.is_set():
+        KmsCryptoKey("RSA_4096")
+        created.append(1)
+
+
+def measure_sqs_latency(provider: SqsProvider, queue_url: str) -> List[float]:
+    context = create_aws_request_context(
+        "sqs", "SendMessage", {"QueueUrl": queue_url, "MessageBody": "hello"}
+    )
+    context.account_id = ACCOUNT_ID
+
+    latencies = []
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        then = time.perf_counter()
+        provider.send_message(context, queue_url, "hello")
+        latencies.append(time.perf_counter() - then)
+        # leave the CPU to the other threads between the requests, like a client waiting for its next request
+        time.sleep(0.001)
+    return sorted(latencies)
+
+
+def run_scenario(name: str, provider: SqsProvider, queue_url: str, num_kms_threads: int):
+    stop = threading.Event()
+    created = []
+    threads = [
+        threading.Thread(target=create_keys, args=(stop, created), daemon=True)
+        for _ in range(num_kms_threads)
+    ]
+    for thread in threads:
+        thread.start()
+
+    latencies = measure_sqs_latency(provider, queue_url)
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    def _percentile(p: float) -> float:
+        return latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1e3
+
+    print(
+        "%-16s p50 %7.2f ms   p99 %7.2f ms   max %8.2f ms   (%d SendMessage, %d CreateKey)"
+        % (
+            name,
+            _percentile(0.5),
+            _percentile(0.99),
+            latencies[-1] * 1e3,
+            len(latencies),
+            len(created),
+        )
+    )
+
+
+def set_process_pool_workers(max_workers: int):
+    config.PROCESS_POOL_MAX_WORKERS = max_workers
+    # the pool is created again with the new configuration when it is used the next time
+    get_process_pool().shutdown(wait=True)
+    # start the worker processes before measuring
+    KmsCryptoKey("RSA_2048")
+
+
+def main():
+    # the requests are signed like the requests of a client
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+    # do not send metrics to a CloudWatch instance which is not running
+    config.SQS_DISABLE_CLOUDWATCH_METRICS = True
+
+    provider = SqsProvider()
+    context = create_aws_request_context("sqs", "CreateQueue", {"QueueName": "benchmark"})
+    context.account_id = ACCOUNT_ID
+    queue_url = provider.create_queue(context, "benchmark")["QueueUrl"]
+
+    print(f"{os.cpu_count()} CPUs, {NUM_KMS_THREADS} threads creating RSA_4096 keys")
+    run_scenario("no KMS load", provider, queue_url, 0)
+
+    set_process_pool_workers(0)
+    run_scenario("request threads", provider, queue_url, NUM_KMS_THREADS)
+
+    set_process_pool_workers(min(NUM_KMS_THREADS, os.cpu_count() or 1))
+    run_scenario("process pool", provider, queue_url, NUM_KMS_THREADS)
+
+    get_process_pool().shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Microbenchmark for the response serializers. Measures the time it takes to serialize an S3 (rest-xml protocol), an
+EC2 (ec2 protocol), and a DynamoDB (json protocol) response, once for the first response of an operation (which
+compiles the serialization functions of the operation's shapes), and on average for the subsequent responses (which
+re-use the compiled serialization functions).
+
+The script does not need a running LocalStack instance.
+"""
+import timeit
+from datetime import datetime
+
+from localstack.aws.protocol.serializer import create_serializer
+from localstack.aws.spec import load_service
+
+NUM_RESPONSES = 2000
+NUM_ITEMS = 50
+
+
+def create_s3_list_objects_v2_response() -> dict:
+    return {
+        "IsTruncated": False,
+        "Name": "bucket",
+        "Prefix": "",
+        "MaxKeys": 1000,
+        "KeyCount": NUM_ITEMS,
+        "Contents": [
+            {
+                "Key": f"some/key-{i}",
+                "LastModified": datetime(2022, 1, 1, 12, 0, 0),
+                "ETag": '"d41d8cd98f00b204e9800998ecf8427e"',
+                "Size": 1024 * i,
+                "StorageClass": "STANDARD",
+            }
+            for i in range(NUM_ITEMS)
+        ],
+    }
+
+
+def create_ec2_describe_instances_response() -> dict:
+    return {
+        "Reservations": [
+            {
+                "ReservationId": f"r-{i}",
+                "OwnerId": "000000000000",
+                "Instances": [
+                    {
+                        "InstanceId": f"i-{i}",
+                        "ImageId": "ami-12345678",
+                        "InstanceType": "t2.micro",
+                        "LaunchTime": datetime(2022, 1, 1, 12, 0, 0),
+                        "State": {"Code": 16, "Name": "running"},
+                        "PrivateIpAddress": "10.0.0.1",
+                        "Tags": [{"Key": "Name", "Value": f"instance-{i}"}],
+                    }
+                ],
+            }
+            for i in range(NUM_ITEMS)
+        ]
+    }
+
+
+def create_dynamodb_scan_response() -> dict:
+    return {
+        "Count": NUM_ITEMS,
+        "ScannedCount": NUM_ITEMS,
+        "Items": [
+            {
+                "id": {"S": f"item-{i}"},
+                "number": {"N": str(i)},
+                "nested": {"M": {"list": {"L": [{"S": "value"}, {"BOOL": True}]}}},
+            }
+            for i in range(NUM_ITEMS)
+        ],
+    }
+
+
+def run_benchmark(service: str, operation: str, create_response):
+    service_model = load_service(service)
+    operation_model = service_model.operation_model(operation)
+    serializer = create_serializer(service_model)
+    response = create_response()
+
+    def _serialize():
+        serializer.serialize_to_response(response, operation_model, None, "request-id")
+
+    first = timeit.timeit(_serialize, number=1)
+    duration = timeit.timeit(_serialize, number=NUM_RESPONSES)
+    print(
+        "%s %s: first response %.1f us, subsequent responses %.1f us on average (%s responses)"
+        % (
+            service,
+            operation,
+            first * 1e6,
+            duration / NUM_RESPONSES * 1e6,
+            NUM_RESPONSES,
+        )
+    )
+
+
+def main():
+    run_benchmark("s3", "ListObjectsV2", create_s3_list_objects_v2_response)
+    run_benchmark("ec2", "DescribeInstances", create_ec2_describe_instances_response)
+    run_benchmark("dynamodb", "Scan", create_dynamodb_scan_response)
+
+
+if __name__ == "__main__":
+    main()
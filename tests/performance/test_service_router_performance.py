@@ -0,0 +1,136 @@
+"""
+Microbenchmark for the service routing (``determine_aws_service_name``). Records the requests of a mix of typical
+client calls (created and signed by botocore clients, but not sent), as well as some unsigned requests (like S3
+pre-signed URLs), and measures the average time it takes to determine the target service of a request, with and
+without the routing decision cache.
+
+The script does not need a running LocalStack instance.
+"""
+import timeit
+from typing import Callable, List
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+
+from localstack.aws.client import create_http_request
+from localstack.aws.protocol.service_router import (
+    _determine_aws_service_name,
+    _extract_service_indicators,
+    determine_aws_service_name,
+    get_service_catalog,
+    routing_decision_cache,
+)
+from localstack.http import Request
+
+NUM_ROUNDS = 500
+
+
+def _record(service: str, call: Callable) -> Request:
+    """Performs the given client call, and returns the request the client would have sent."""
+    client = boto3.client(
+        service,
+        endpoint_url="http://localhost:4566",
+        region_name="us-east-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        config=Config(parameter_validation=False, retries={"max_attempts": 0}),
+    )
+    recorded = []
+
+    def _capture(request, **kwargs):
+        recorded.append(request)
+        return AWSResponse(request.url, 500, {}, None)
+
+    client.meta.events.register("before-send", _capture)
+    try:
+        call(client)
+    except Exception:
+        pass
+    return create_http_request(recorded[0])
+
+
+def record_requests() -> List[Callable[[], Request]]:
+    """Returns factories for the recorded requests (werkzeug caches parsed data on the request objects)."""
+    recorded = [
+        _record(
+            "sqs",
+            lambda c: c.send_message(
+                QueueUrl="http://localhost:4566/000000000000/q", MessageBody="test"
+            ),
+        ),
+        _record(
+            "sqs", lambda c: c.receive_message(QueueUrl="http://localhost:4566/000000000000/q")
+        ),
+        _record(
+            "sns",
+            lambda c: c.publish(TopicArn="arn:aws:sns:us-east-1:000000000000:t", Message="test"),
+        ),
+        _record("dynamodb", lambda c: c.get_item(TableName="t", Key={"id": {"S": "1"}})),
+        _record("dynamodb", lambda c: c.put_item(TableName="t", Item={"id": {"S": "1"}})),
+        _record("kinesis", lambda c: c.put_record(StreamName="s", Data=b"test", PartitionKey="p")),
+        _record("lambda", lambda c: c.invoke(FunctionName="f", Payload=b"{}")),
+        _record("s3", lambda c: c.get_object(Bucket="bucket", Key="some/key")),
+        _record("s3", lambda c: c.put_object(Bucket="bucket", Key="some/other/key", Body=b"test")),
+        _record("stepfunctions", lambda c: c.start_execution(stateMachineArn="arn", input="{}")),
+    ]
+    factories = []
+    for request in recorded:
+        data = request.get_data()
+        factories.append(
+            lambda r=request, d=data: Request(
+                method=r.method,
+                path=r.path,
+                query_string=r.query_string,
+                headers=r.headers,
+                body=d,
+                raw_path=r.path,
+            )
+        )
+
+    # unsigned requests: S3 pre-signed URL and a plain SQS queue URL
+    factories.append(
+        lambda: Request(
+            method="GET",
+            path="/bucket/some/key",
+            query_string="X-Amz-Algorithm=AWS4-HMAC-SHA256&X-Amz-Signature=1234",
+            headers={"Host": "localhost:4566"},
+        )
+    )
+    factories.append(
+        lambda: Request(
+            method="GET",
+            path="/000000000000/q",
+            query_string="Action=GetQueueAttributes",
+            headers={"Host": "localhost:4566"},
+        )
+    )
+    return factories
+
+
+def run_benchmark(name: str, factories: List[Callable[[], Request]], route: Callable):
+    requests = iter([factory() for _ in range(NUM_ROUNDS) for factory in factories])
+    number = NUM_ROUNDS * len(factories)
+    duration = timeit.timeit(lambda: route(next(requests)), number=number)
+    print("%s: %.2f us per request (%s requests)" % (name, duration / number * 1e6, number))
+
+
+def main():
+    factories = record_requests()
+    services = get_service_catalog()
+
+    run_benchmark(
+        "uncached",
+        factories,
+        lambda r: _determine_aws_service_name(r, services, _extract_service_indicators(r)),
+    )
+    routing_decision_cache.clear()
+    run_benchmark("cached", factories, determine_aws_service_name)
+    print(
+        "routing decision cache: %s hits, %s misses, %s entries"
+        % (routing_decision_cache.hits, routing_decision_cache.misses, len(routing_decision_cache))
+    )
+
+
+if __name__ == "__main__":
+    main()
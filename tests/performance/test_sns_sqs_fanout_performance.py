@@ -0,0 +1,84 @@
+"""
+Measures the SNS -> SQS fan-out throughput of a running LocalStack instance. Every published message is delivered by
+the SNS provider to each subscribed queue through an internal client, so the result is dominated by the cost of
+internal service-to-service calls.
+
+To compare the in-memory client transport with the default HTTP transport, run the script once against an instance
+started with ``IN_MEMORY_CLIENT=1`` and once against an instance started without it.
+"""
+import time
+
+from localstack.utils.aws.aws_stack import create_external_boto_client
+from localstack.utils.strings import short_uid
+
+NUM_QUEUES = 10
+NUM_MESSAGES = 200
+
+
+def create_fanout():
+    sns = create_external_boto_client("sns")
+    sqs = create_external_boto_client("sqs")
+
+    topic_arn = sns.create_topic(Name=f"perf-topic-{short_uid()}")["TopicArn"]
+    queue_urls = []
+    for i in range(NUM_QUEUES):
+        queue_url = sqs.create_queue(QueueName=f"perf-queue-{i}-{short_uid()}")["QueueUrl"]
+        queue_arn = sqs.get_queue_attributes(QueueUrl=queue_url, AttributeNames=["QueueArn"])[
+            "Attributes"
+        ]["QueueArn"]
+        sns.subscribe(
+            TopicArn=topic_arn,
+            Protocol="sqs",
+            Endpoint=queue_arn,
+            Attributes={"RawMessageDelivery": "true"},
+        )
+        queue_urls.append(queue_url)
+
+    return topic_arn, queue_urls
+
+
+def count_messages(queue_urls):
+    sqs = create_external_boto_client("sqs")
+    total = 0
+    for queue_url in queue_urls:
+        attributes = sqs.get_queue_attributes(
+            QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessages"]
+        )["Attributes"]
+        total += int(attributes["ApproximateNumberOfMessages"])
+    return total
+
+
+def publish_messages(topic_arn, queue_urls):
+    sns = create_external_boto_client("sns")
+    expected = NUM_MESSAGES * NUM_QUEUES
+
+    print(
+        "Publishing %s messages to %s subscribed queues (%s deliveries)"
+        % (NUM_MESSAGES, NUM_QUEUES, expected)
+    )
+    start = time.time()
+    for i in range(NUM_MESSAGES):
+        sns.publish(TopicArn=topic_arn, Message=f"message {i}")
+    published = time.time() - start
+    print("Published %s messages in %.2f seconds" % (NUM_MESSAGES, published))
+
+    # SNS delivers messages asynchronously, so wait until all queues have received all messages
+    delivered = 0
+    while delivered < expected:
+        time.sleep(0.1)
+        delivered = count_messages(queue_urls)
+
+    duration = time.time() - start
+    print(
+        "Delivered %s messages in %.2f seconds (%.2f deliveries/sec)"
+        % (delivered, duration, delivered / duration)
+    )
+
+
+def main():
+    topic_arn, queue_urls = create_fanout()
+    publish_messages(topic_arn, queue_urls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Startup benchmark for the loading of service specs. Measures the time it takes until the first request to a service can
+be handled, i.e., until the spec of the service is loaded and the shapes of a typical operation are resolved. The
+specs are either loaded from the botocore JSON files (with a fresh ``PatchingLoader``), or from a ``CompiledSpecCache``
+in a temporary directory.
+
+The script does not need a running LocalStack instance.
+"""
+import tempfile
+import timeit
+from typing import Callable, List, Tuple
+
+from botocore.model import ServiceModel, Shape
+
+from localstack.aws.spec import CompiledSpecCache, PatchingLoader, load_spec_patches
+
+NUM_ROUNDS = 10
+
+OPERATIONS: List[Tuple[str, str]] = [
+    ("ec2", "DescribeInstances"),
+    ("ssm", "GetParameter"),
+    ("s3", "ListObjectsV2"),
+    ("sqs", "SendMessage"),
+    ("dynamodb", "PutItem"),
+    ("lambda", "Invoke"),
+    ("kinesis", "PutRecords"),
+    ("cloudwatch", "PutMetricData"),
+]
+
+
+def _resolve(shape: Shape):
+    # touch the members of all nested shapes, like the parser and serializer do
+    visited = set()
+    stack = [shape]
+    while stack:
+        shape = stack.pop()
+        if shape is None or shape.name in visited:
+            continue
+        visited.add(shape.name)
+        if shape.type_name == "structure":
+            stack.extend(shape.members.values())
+        elif shape.type_name == "list":
+            stack.append(shape.member)
+        elif shape.type_name == "map":
+            stack.extend((shape.key, shape.value))
+
+
+def first_request(load_description: Callable[[str], dict], service: str, operation: str):
+    service_model = ServiceModel(load_description(service), service)
+    operation_model = service_model.operation_model(operation)
+    _resolve(operation_model.input_shape)
+    _resolve(operation_model.output_shape)
+
+
+def main():
+    patches = load_spec_patches()
+    directory = tempfile.mkdtemp(prefix="localstack-specs-")
+    for service, _ in OPERATIONS:
+        CompiledSpecCache(directory).compile(service)
+
+    print("%-12s %12s %12s" % ("service", "botocore", "compiled"))
+    for service, operation in OPERATIONS:
+
+        def _from_botocore():
+            loader = PatchingLoader(patches)
+            first_request(lambda s: loader.load_service_model(s, "service-2"), service, operation)
+
+        def _from_compiled():
+            cache = CompiledSpecCache(directory)
+            first_request(cache.load, service, operation)
+
+        botocore_duration = timeit.timeit(_from_botocore, number=NUM_ROUNDS) / NUM_ROUNDS
+        compiled_duration = timeit.timeit(_from_compiled, number=NUM_ROUNDS) / NUM_ROUNDS
+        print(
+            "%-12s %9.2f ms %9.2f ms" % (service, botocore_duration * 1e3, compiled_duration * 1e3)
+        )
+
+
+if __name__ == "__main__":
+    main()
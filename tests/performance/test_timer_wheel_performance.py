@@ -0,0 +1,82 @@
+"""
+Benchmark for the timer wheel scheduler. Schedules a large number of one-shot tasks (like the evaluations of many
+CloudWatch alarms) with deadlines spread over a few seconds, cancels every other task, and measures the time it takes to
+schedule and cancel the tasks, and how late the remaining tasks run, once with the heap based ``Scheduler`` and once with
+the ``TimerWheelScheduler``.
+
+The script does not need a running LocalStack instance.
+"""
+import random
+import threading
+import time
+from typing import List, Type
+
+from localstack.utils.scheduler import Scheduler, TimerWheelScheduler
+
+NUM_TASKS = 100_000
+"""The number of scheduled tasks."""
+SPREAD = 5
+"""The number of seconds over which the deadlines of the tasks are spread."""
+START_DELAY = 2
+"""The number of seconds before the first deadline, to schedule all tasks before the first one runs."""
+
+
+def run_scenario(name: str, scheduler_class: Type[Scheduler]):
+    scheduler = scheduler_class()
+    thread = threading.Thread(target=scheduler.run, daemon=True)
+    thread.start()
+
+    lateness: List[float] = []
+    done = threading.Event()
+
+    def _task(deadline: float):
+        lateness.append(time.time() - deadline)
+        if len(lateness) == NUM_TASKS // 2:
+            done.set()
+
+    # the heap of the Scheduler cannot order tasks with the same deadline, so the deadlines are evenly spaced
+    start = time.time() + START_DELAY
+    deadlines = [start + i * SPREAD / NUM_TASKS for i in range(NUM_TASKS)]
+    random.shuffle(deadlines)
+
+    then = time.perf_counter()
+    tasks = [scheduler.schedule(_task, start=deadline, args=(deadline,)) for deadline in deadlines]
+    schedule_time = time.perf_counter() - then
+
+    then = time.perf_counter()
+    for task in tasks[::2]:
+        task.cancel()
+    cancel_time = time.perf_counter() - then
+
+    done.wait(START_DELAY + SPREAD + 30)
+    scheduler.close()
+    thread.join(5)
+
+    lateness.sort()
+
+    def _percentile(p: float) -> float:
+        return lateness[min(int(len(lateness) * p), len(lateness) - 1)] * 1e3
+
+    print(
+        "%-22s schedule %6.2f us/task   cancel %5.2f us/task   "
+        "lateness p50 %6.2f ms   p99 %7.2f ms   max %7.2f ms   (%d runs)"
+        % (
+            name,
+            schedule_time / NUM_TASKS * 1e6,
+            cancel_time / (NUM_TASKS // 2) * 1e6,
+            _percentile(0.5),
+            _percentile(0.99),
+            lateness[-1] * 1e3,
+            len(lateness),
+        )
+    )
+
+
+def main():
+    print(f"{NUM_TASKS} tasks over {SPREAD} seconds, every other task cancelled")
+    run_scenario("Scheduler", Scheduler)
+    run_scenario("TimerWheelScheduler", TimerWheelScheduler)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Burst benchmark for background tasks. Dispatches a burst of events (like DynamoDB stream records or S3 notifications)
+whose handlers each run for a few milliseconds, once by starting a thread per event with ``start_worker_thread``, and
+once by submitting the handlers to a sub-pool of the worker pool. Reports the duration of the burst, the peak number of
+threads, and the number of context switches of the process.
+
+The script does not need a running LocalStack instance.
+"""
+import resource
+import threading
+import time
+from typing import Callable
+
+from localstack.utils.threads import start_worker_thread
+from localstack.utils.worker_pool import WorkerPool
+
+NUM_EVENTS = 2000
+HANDLER_DURATION = 0.05
+"""The time (in seconds) it takes to handle a single event, f.e., to forward it to another service."""
+
+
+def handle_event(done: threading.Semaphore):
+    time.sleep(HANDLER_DURATION)
+    done.release()
+
+
+def run_burst(name: str, dispatch: Callable[[Callable, threading.Semaphore], None]):
+    done = threading.Semaphore(0)
+    peak_threads = threading.active_count()
+    stop = threading.Event()
+
+    def _monitor():
+        nonlocal peak_threads
+        while not stop.is_set():
+            peak_threads = max(peak_threads, threading.active_count())
+            time.sleep(0.001)
+
+    monitor = threading.Thread(target=_monitor, daemon=True)
+    monitor.start()
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    then = time.perf_counter()
+    for _ in range(NUM_EVENTS):
+        dispatch(handle_event, done)
+    for _ in range(NUM_EVENTS):
+        done.acquire()
+    duration = time.perf_counter() - then
+    after = resource.getrusage(resource.RUSAGE_SELF)
+
+    stop.set()
+    monitor.join()
+
+    context_switches = (after.ru_nvcsw - usage.ru_nvcsw) + (after.ru_nivcsw - usage.ru_nivcsw)
+    print(
+        "%-20s %8.2f s %8d threads (peak) %10d context switches"
+        % (name, duration, peak_threads, context_switches)
+    )
+
+
+def main():
+    print(f"{NUM_EVENTS} events, {HANDLER_DURATION * 1000:.0f} ms per event")
+
+    run_burst("start_worker_thread", lambda fn, done: start_worker_thread(lambda *_: fn(done)))
+
+    worker_pool = WorkerPool(max_workers=32)
+    pool = worker_pool.get_pool("events")
+    run_burst("worker pool", lambda fn, done: pool.submit(fn, done))
+    print("worker pool metrics: %s" % worker_pool.get_metrics())
+    worker_pool.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compares the serialization of large XML responses (S3 ListObjectsV2 with 1000 keys, and EC2 DescribeInstances with 200
+reservations) with and without ``STREAM_XML_RESPONSES``. For each variant, it reports the time until the first chunk
+of the response body is available (time to first byte), the total time to produce the whole body, and the peak memory
+allocated while the body is produced and consumed chunk by chunk.
+
+The script does not need a running LocalStack instance.
+"""
+import time
+import tracemalloc
+from datetime import datetime
+
+from localstack import config
+from localstack.aws.protocol.serializer import create_serializer
+from localstack.aws.spec import load_service
+
+
+def create_s3_list_objects_v2_response() -> dict:
+    return {
+        "IsTruncated": False,
+        "Name": "bucket",
+        "KeyCount": 1000,
+        "MaxKeys": 1000,
+        "Contents": [
+            {
+                "Key": f"some/prefix/key-{i}",
+                "LastModified": datetime(2022, 1, 1, 12, 0, 0),
+                "ETag": '"d41d8cd98f00b204e9800998ecf8427e"',
+                "Size": 1024 * i,
+                "StorageClass": "STANDARD",
+                "Owner": {"ID": "owner", "DisplayName": "owner"},
+            }
+            for i in range(1000)
+        ],
+    }
+
+
+def create_ec2_describe_instances_response() -> dict:
+    return {
+        "Reservations": [
+            {
+                "ReservationId": f"r-{i}",
+                "OwnerId": "000000000000",
+                "Instances": [
+                    {
+                        "InstanceId": f"i-{i}-{j}",
+                        "ImageId": "ami-12345678",
+                        "InstanceType": "t2.micro",
+                        "LaunchTime": datetime(2022, 1, 1, 12, 0, 0),
+                        "State": {"Code": 16, "Name": "running"},
+                        "PrivateIpAddress": "10.0.0.1",
+                        "Tags": [{"Key": "Name", "Value": f"instance-{i}-{j}"}],
+                    }
+                    for j in range(5)
+                ],
+            }
+            for i in range(200)
+        ]
+    }
+
+
+def run_benchmark(service: str, operation: str, create_response, streaming: bool):
+    config.STREAM_XML_RESPONSES = streaming
+    service_model = load_service(service)
+    operation_model = service_model.operation_model(operation)
+    serializer = create_serializer(service_model)
+    response = create_response()
+    # warm up the compiled serialization functions
+    serializer.serialize_to_response(response, operation_model, None, "request-id").get_data()
+
+    def _consume():
+        start = time.perf_counter()
+        serialized = serializer.serialize_to_response(response, operation_model, None, "request-id")
+        first_byte = None
+        size = 0
+        for chunk in serialized.iter_encoded():
+            if first_byte is None:
+                first_byte = time.perf_counter() - start
+            size += len(chunk)
+        return first_byte, size, time.perf_counter() - start
+
+    first_byte, size, total = _consume()
+    # the memory is measured in a separate run, since tracing the allocations distorts the timings
+    tracemalloc.start()
+    _consume()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        "%s %s (%s): first byte after %.2f ms, %s bytes after %.2f ms, peak memory %.1f KiB"
+        % (
+            service,
+            operation,
+            "streamed" if streaming else "buffered",
+            first_byte * 1e3,
+            size,
+            total * 1e3,
+            peak / 1024,
+        )
+    )
+
+
+def main():
+    for streaming in (False, True):
+        run_benchmark("s3", "ListObjectsV2", create_s3_list_objects_v2_response, streaming)
+        run_benchmark("ec2", "DescribeInstances", create_ec2_describe_instances_response, streaming)
+
+
+if __name__ == "__main__":
+    main()
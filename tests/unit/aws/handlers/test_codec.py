@@ -0,0 +1,252 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
+
+from localstack.aws.api import RequestContext
+from localstack.aws.gateway import Gateway
+from localstack.aws.handlers.codec import ContentDecoder, ResponseCompressor
+from localstack.aws.handlers.fallback import InternalFailureHandler
+from localstack.aws.handlers.service import (
+    ServiceExceptionSerializer,
+    ServiceNameParser,
+    ServiceRequestParser,
+)
+from localstack.aws.spec import load_service
+from localstack.http import Request, Response
+
+LARGE_DOCUMENT = json.dumps({"Items": [{"id": {"S": str(i)}} for i in range(200)]})
+LARGE_BODY = LARGE_DOCUMENT.encode("utf-8")
+
+
+def _encoded_request_context(body: bytes, content_encoding: str, service: str = "dynamodb"):
+    context = RequestContext()
+    context.request = Request(
+        "POST",
+        "/",
+        body=body,
+        headers={"Content-Encoding": content_encoding, "Content-Length": str(len(body))},
+    )
+    context.service = load_service(service)
+    return context
+
+
+class TestContentDecoder:
+    @pytest.mark.parametrize(
+        "content_encoding,body",
+        [
+            ("gzip", gzip.compress(LARGE_BODY)),
+            ("x-gzip", gzip.compress(LARGE_BODY)),
+            ("deflate", zlib.compress(LARGE_BODY)),
+            # some clients send raw DEFLATE data without the zlib header
+            ("deflate", zlib.compress(LARGE_BODY, wbits=-zlib.MAX_WBITS)),
+            ("GZIP, identity", gzip.compress(LARGE_BODY)),
+            # concatenated gzip members
+            ("gzip", gzip.compress(LARGE_BODY[:100]) + gzip.compress(LARGE_BODY[100:])),
+            # the codings are listed in the order in which they were applied
+            ("gzip, deflate", zlib.compress(gzip.compress(LARGE_BODY))),
+            ("deflate, gzip", gzip.compress(zlib.compress(LARGE_BODY))),
+        ],
+    )
+    def test_decode(self, content_encoding, body):
+        context = _encoded_request_context(body, content_encoding)
+
+        ContentDecoder()(None, context, None)
+
+        assert context.request.headers["Content-Encoding"] == "identity"
+        assert context.request.get_data() == LARGE_BODY
+
+    def test_decode_incrementally(self):
+        context = _encoded_request_context(gzip.compress(LARGE_BODY), "gzip")
+
+        ContentDecoder()(None, context, None)
+
+        stream = context.request.stream
+        assert stream.read(10) == LARGE_BODY[:10]
+        assert stream.read(20) == LARGE_BODY[10:30]
+        assert stream.read() == LARGE_BODY[30:]
+        assert stream.read() == b""
+
+    def test_decode_zstd(self):
+        zstandard = pytest.importorskip("zstandard")
+        body = gzip.compress(zstandard.ZstdCompressor().compress(LARGE_BODY))
+        context = _encoded_request_context(body, "zstd, gzip")
+
+        ContentDecoder()(None, context, None)
+
+        assert context.request.get_data() == LARGE_BODY
+
+    def test_decoded_size_is_limited(self):
+        body = gzip.compress(b"0" * 100_000)
+        context = _encoded_request_context(body, "gzip")
+
+        ContentDecoder(max_size=50_000)(None, context, None)
+
+        with pytest.raises(RequestEntityTooLarge):
+            context.request.get_data()
+
+    @pytest.mark.parametrize(
+        "body", [gzip.compress(LARGE_BODY)[:-100], b"not gzip at all"], ids=["truncated", "invalid"]
+    )
+    def test_invalid_body(self, body):
+        context = _encoded_request_context(body, "gzip")
+
+        ContentDecoder()(None, context, None)
+
+        with pytest.raises(BadRequest):
+            context.request.get_data()
+
+    @pytest.mark.parametrize(
+        "content_encoding,service",
+        [("br", "dynamodb"), ("gzip, br", "dynamodb"), ("gzip", "s3")],
+    )
+    def test_not_decoded(self, content_encoding, service):
+        body = gzip.compress(LARGE_BODY)
+        context = _encoded_request_context(body, content_encoding, service)
+
+        ContentDecoder()(None, context, None)
+
+        assert context.request.headers["Content-Encoding"] == content_encoding
+        assert context.request.get_data() == body
+
+    @pytest.mark.parametrize(
+        "body,status_code",
+        [
+            (gzip.compress(json.dumps({"TableName": "0" * 100_000}).encode("utf-8")), 413),
+            (gzip.compress(LARGE_BODY)[:-100], 400),
+        ],
+        ids=["too-large", "truncated"],
+    )
+    def test_gateway_responds_with_status_code_of_decoding_error(self, body, status_code):
+        gateway = Gateway()
+        gateway.request_handlers.extend(
+            [ServiceNameParser(), ContentDecoder(max_size=50_000), ServiceRequestParser()]
+        )
+        gateway.exception_handlers.extend([ServiceExceptionSerializer(), InternalFailureHandler()])
+
+        request = Request(
+            "POST",
+            "/",
+            body=body,
+            headers={
+                "Content-Encoding": "gzip",
+                "Content-Type": "application/x-amz-json-1.0",
+                "X-Amz-Target": "DynamoDB_20120810.DescribeTable",
+                "Authorization": "AWS4-HMAC-SHA256 Credential=test/20230101/us-east-1/dynamodb/aws4_request, SignedHeaders=host, Signature=0",
+            },
+        )
+        response = Response()
+        gateway.process(request, response)
+
+        assert response.status_code == status_code
+
+
+def _context(accept_encoding: str = "gzip", service: str = None, operation: str = None):
+    context = RequestContext()
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    context.request = Request("POST", "/", headers=headers)
+    if service:
+        context.service = load_service(service)
+        context.operation = context.service.operation_model(operation)
+    return context
+
+
+@pytest.fixture
+def compressor():
+    compressor = ResponseCompressor(min_size=1024)
+    # do not depend on the availability of zstandard
+    compressor.encodings.pop("zstd", None)
+    return compressor
+
+
+def test_compress_json_response(compressor):
+    response = Response(LARGE_DOCUMENT, mimetype="application/x-amz-json-1.0")
+
+    compressor(None, _context("deflate, gzip;q=0.8"), response)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert int(response.headers["Content-Length"]) == len(response.data)
+    assert gzip.decompress(response.data).decode("utf-8") == LARGE_DOCUMENT
+
+
+def test_compress_updates_crc32_checksum(compressor):
+    response = Response(LARGE_DOCUMENT, mimetype="application/x-amz-json-1.0")
+    response.headers["x-amz-crc32"] = zlib.crc32(response.data)
+
+    compressor(None, _context(), response)
+
+    assert response.headers["x-amz-crc32"] == str(zlib.crc32(response.data))
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,data,mimetype",
+    [
+        (None, LARGE_DOCUMENT, "application/json"),
+        ("identity", LARGE_DOCUMENT, "application/json"),
+        ("gzip;q=0", LARGE_DOCUMENT, "application/json"),
+        ("gzip", '{"small": true}', "application/json"),
+        ("gzip", LARGE_DOCUMENT, "application/octet-stream"),
+    ],
+)
+def test_response_not_compressed(compressor, accept_encoding, data, mimetype):
+    response = Response(data, mimetype=mimetype)
+
+    compressor(None, _context(accept_encoding), response)
+
+    assert "Content-Encoding" not in response.headers
+    assert response.get_data(as_text=True) == data
+
+
+def test_encoded_response_not_compressed(compressor):
+    response = Response(LARGE_DOCUMENT, mimetype="application/json")
+    response.headers["Content-Encoding"] = "br"
+
+    compressor(None, _context(), response)
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.get_data(as_text=True) == LARGE_DOCUMENT
+
+
+def test_s3_object_body_not_compressed(compressor):
+    response = Response(LARGE_DOCUMENT, mimetype="application/json")
+    compressor(None, _context(service="s3", operation="GetObject"), response)
+    assert "Content-Encoding" not in response.headers
+
+    response = Response(LARGE_DOCUMENT, mimetype="application/xml")
+    compressor(None, _context(service="s3", operation="ListObjectsV2"), response)
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+def test_compress_streamed_response_incrementally(compressor):
+    def _stream():
+        yield b'{"Items": ['
+        yield LARGE_DOCUMENT.encode("utf-8")
+        yield b"]}"
+
+    response = Response(_stream(), mimetype="application/json")
+
+    compressor(None, _context(), response)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+
+    # every compressed chunk can be decoded as soon as it is received
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    chunks = [decompressor.decompress(chunk) for chunk in response.response]
+    assert chunks[:3] == [b'{"Items": [', LARGE_DOCUMENT.encode("utf-8"), b"]}"]
+    assert decompressor.eof
+
+
+def test_zstd_preferred_if_available():
+    zstandard = pytest.importorskip("zstandard")
+    response = Response(LARGE_DOCUMENT, mimetype="application/json")
+
+    ResponseCompressor(min_size=1024)(None, _context("gzip, zstd"), response)
+
+    assert response.headers["Content-Encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(response.data) == (
+        LARGE_DOCUMENT.encode("utf-8")
+    )
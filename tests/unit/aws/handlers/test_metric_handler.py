@@ -0,0 +1,99 @@
+import gc
+import io
+import json
+
+import pytest
+
+from localstack.aws.chain import HandlerChain
+from localstack.aws.forwarder import create_aws_request_context
+from localstack.aws.handlers.metric_handler import Metric, MetricCollection, MetricHandler
+from localstack.constants import ENV_INTERNAL_TEST_COLLECT_METRIC
+from localstack.http import Response
+
+
+def _metric(operation: str, response_code: int = 200) -> Metric:
+    return Metric(
+        service="sqs",
+        operation=operation,
+        headers="",
+        parameters="QueueName",
+        response_code=response_code,
+        response_data="",
+        exception="",
+        origin="external",
+    )
+
+
+class TestMetricCollection:
+    def test_deduplicates_and_counts(self):
+        collection = MetricCollection()
+        assert collection.add(_metric("CreateQueue"))
+        assert collection.add(_metric("CreateQueue"))
+        assert collection.add(_metric("CreateQueue", response_code=400))
+
+        assert len(collection) == 2
+        assert collection.count(_metric("CreateQueue")) == 2
+        assert collection.count(_metric("CreateQueue", response_code=400)) == 1
+
+    def test_bounded(self):
+        collection = MetricCollection(max_size=1)
+        assert collection.add(_metric("CreateQueue"))
+        assert not collection.add(_metric("DeleteQueue"))
+        # metrics that are already in the collection are still counted
+        assert collection.add(_metric("CreateQueue"))
+
+        assert list(collection) == [_metric("CreateQueue")]
+        assert collection.dropped == 1
+
+    def test_export(self):
+        collection = MetricCollection()
+        collection.add(_metric("CreateQueue"))
+        collection.add(_metric("CreateQueue"))
+        collection.add(_metric("DeleteQueue"))
+
+        fd = io.StringIO()
+        collection.export_jsonl(fd)
+        lines = [json.loads(line) for line in fd.getvalue().splitlines()]
+        assert [(line["operation"], line["count"]) for line in lines] == [
+            ("CreateQueue", 2),
+            ("DeleteQueue", 1),
+        ]
+        assert len(collection) == 2
+
+        fd = io.StringIO()
+        collection.export_csv(fd, clear=True)
+        assert fd.getvalue().splitlines()[0].startswith("sqs,CreateQueue,")
+        assert len(fd.getvalue().splitlines()) == 2
+        assert len(collection) == 0
+
+
+class TestMetricHandler:
+    @pytest.fixture(autouse=True)
+    def collect_metrics_mode(self, monkeypatch):
+        monkeypatch.setenv(ENV_INTERNAL_TEST_COLLECT_METRIC, "1")
+        monkeypatch.setattr(MetricHandler, "metric_data", MetricCollection())
+
+    def test_update_metric_collection_evicts_items(self):
+        handler = MetricHandler()
+        chain = HandlerChain(
+            request_handlers=[handler.create_metric_handler_item, handler.record_parsed_request],
+            response_handlers=[handler.update_metric_collection],
+        )
+
+        for _ in range(3):
+            context = create_aws_request_context("sqs", "CreateQueue", {"QueueName": "foo"})
+            chain.handle(context, Response())
+
+        assert len(MetricHandler.metric_data) == 1
+        assert MetricHandler.metric_data.count(next(iter(MetricHandler.metric_data))) == 3
+        assert len(handler.metrics_handler_items) == 0
+
+    def test_items_of_unfinished_requests_are_evicted(self):
+        handler = MetricHandler()
+        context = create_aws_request_context("sqs", "CreateQueue", {"QueueName": "foo"})
+        handler.create_metric_handler_item(HandlerChain(), context, Response())
+        assert len(handler.metrics_handler_items) == 1
+
+        del context
+        gc.collect()
+        assert len(handler.metrics_handler_items) == 0
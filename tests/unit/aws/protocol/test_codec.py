@@ -0,0 +1,68 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from localstack.aws.protocol.codec import (
+    JsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    create_json_codec,
+)
+
+
+@pytest.fixture(params=[StdlibJsonCodec, OrjsonCodec], ids=["json", "orjson"])
+def codec(request) -> JsonCodec:
+    if request.param is OrjsonCodec:
+        pytest.importorskip("orjson")
+    return request.param()
+
+
+def test_create_json_codec():
+    codec = create_json_codec()
+    try:
+        import orjson  # noqa: F401
+
+        assert isinstance(codec, OrjsonCodec)
+    except ImportError:
+        assert isinstance(codec, StdlibJsonCodec)
+
+
+def test_roundtrip(codec):
+    document = {
+        "string": 'välüe " \\ \n',
+        "int": 9223372036854775807,
+        "float": 1.5,
+        "bool": True,
+        "null": None,
+        "list": [1, "two", {"three": 3.0}],
+    }
+    encoded = codec.dumps(document)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == document
+    assert codec.loads(encoded) == document
+    assert codec.loads(encoded.decode("utf-8")) == document
+
+
+def test_loads_invalid_document(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b'{"foo": ')
+
+
+def test_loads_lone_surrogate(codec):
+    assert codec.loads(b'{"foo": "\\ud800"}') == {"foo": "\ud800"}
+
+
+def test_dumps_big_integer(codec):
+    assert json.loads(codec.dumps({"foo": 2**70})) == {"foo": 2**70}
+
+
+def test_dumps_non_string_keys(codec):
+    assert json.loads(codec.dumps({1: "foo"})) == {"1": "foo"}
+
+
+@pytest.mark.parametrize("value", [b"foo", datetime(2022, 1, 1), object()])
+def test_dumps_non_json_types(codec, value):
+    # non-native JSON types (like blobs or timestamps) have to be converted by the serializer before
+    with pytest.raises(TypeError):
+        codec.dumps({"foo": value})
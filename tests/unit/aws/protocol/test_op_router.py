@@ -1,8 +1,15 @@
+import re
+
 import pytest
 from werkzeug.exceptions import NotFound
 from werkzeug.routing import Map, Rule
 
-from localstack.aws.protocol.op_router import GreedyPathConverter, RestServiceOperationRouter
+from localstack.aws.protocol.op_router import (
+    GreedyPathConverter,
+    RestServiceOperationRouter,
+    WerkzeugRestServiceOperationRouter,
+    _HttpOperation,
+)
 from localstack.aws.spec import list_services, load_service
 from localstack.http import Request
 
@@ -27,6 +34,47 @@ def test_create_op_router_works_for_every_service(service):
         pass
 
 
+def _match_or_none(router, request: Request):
+    try:
+        operation, params = router.match(request)
+        return operation.name, params
+    except NotFound:
+        return None
+
+
+@pytest.mark.parametrize(
+    "service",
+    _collect_services(),
+)
+@pytest.mark.param
+def test_op_router_matches_werkzeug_router(service):
+    # the werkzeug based router is the reference implementation for the trie based router
+    service_model = load_service(service)
+    router = RestServiceOperationRouter(service_model)
+    reference_router = WerkzeugRestServiceOperationRouter(service_model)
+
+    for operation_name in service_model.operation_names:
+        operation = _HttpOperation.from_operation(service_model.operation_model(operation_name))
+        query_string = "&".join(
+            f"{key}={values[0]}" if values else key for key, values in operation.query_args.items()
+        )
+        headers = {header: "value" for header in operation.header_args}
+        for param_value, greedy_param_value in [("value-1", "some/key"), ("a%2Fb", "")]:
+            path = re.sub(r"{[^}]+\+}", greedy_param_value, operation.path)
+            path = re.sub(r"{[^}]+}", param_value, path)
+            for request_path in [path, f"{path}/", f"/{path}", path.replace("/", "//", 2)]:
+                for method in {operation.method, "GET", "OPTIONS"}:
+                    for request in [
+                        Request(
+                            method, request_path or "/", query_string=query_string, headers=headers
+                        ),
+                        Request(method, request_path or "/"),
+                    ]:
+                        assert _match_or_none(router, request) == _match_or_none(
+                            reference_router, request
+                        ), f"{method} {request_path}"
+
+
 def test_greedy_path_converter():
     # this test is mostly to document behavior
 
@@ -141,3 +189,25 @@ def test_s3_bucket_operation_with_double_slashes():
     op, params = router.match(Request("GET", "/mybucket//mykey"))
     assert op.name == "GetObject"
     assert params == {"Bucket": "mybucket", "Key": "/mykey"}
+
+
+def test_s3_required_query_arg_values():
+    router = RestServiceOperationRouter(load_service("s3"))
+
+    # the required values of query args need to be matched for every request (not only for the first one)
+    for _ in range(2):
+        op, _ = router.match(Request("GET", "/mybucket", query_string="list-type=2"))
+        assert op.name == "ListObjectsV2"
+
+        op, _ = router.match(Request("GET", "/mybucket", query_string="list-type=3"))
+        assert op.name == "ListObjects"
+
+
+def test_greedy_path_param_in_the_middle_of_the_path():
+    router = RestServiceOperationRouter(load_service("s3control"))
+
+    op, params = router.match(
+        Request("GET", "/v20180820/mrap/instances/arn:aws:s3::000000000000:accesspoint/name/routes")
+    )
+    assert op.name == "GetMultiRegionAccessPointRoutes"
+    assert params == {"mrap": "arn:aws:s3::000000000000:accesspoint/name"}
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime, timezone
 from io import BytesIO
 from urllib.parse import unquote, urlencode, urlsplit
@@ -1224,7 +1225,7 @@ def test_parser_error_on_unknown_error():
     def raise_error(*args, **kwargs):
         raise NotImplementedError()
 
-    parser._process_member = raise_error
+    parser._filter_node = raise_error
     with pytest.raises(UnknownParserError):
         parser.parse(request)
 
@@ -1271,3 +1272,27 @@ def test_restxml_ignores_get_body():
     assert "Bucket" in parsed_request
     assert parsed_request["Bucket"] == "test-bucket"
     assert parsed_request["Key"] == "foo"
+
+
+def test_parser_caches_compiled_shape_parsers():
+    parser = create_parser(load_service("dynamodb"))
+    item = {"id": {"S": "foo"}, "nested": {"M": {"list": {"L": [{"N": "1"}, {"BOOL": True}]}}}}
+    request = HttpRequest(
+        "POST",
+        "/",
+        body=json.dumps({"TableName": "table", "Item": item}),
+        headers={
+            "Content-Type": "application/x-amz-json-1.0",
+            "X-Amz-Target": "DynamoDB_20120810.PutItem",
+        },
+    )
+
+    operation, params = parser.parse(request)
+    assert params == {"TableName": "table", "Item": item}
+    compiled = dict(parser._shape_parsers)
+    assert operation.input_shape in compiled
+
+    # parsing another request of the same operation re-uses the compiled parse functions
+    _, params = parser.parse(request)
+    assert params == {"TableName": "table", "Item": item}
+    assert parser._shape_parsers == compiled
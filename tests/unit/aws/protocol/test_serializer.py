@@ -18,6 +18,7 @@ from urllib3 import HTTPResponse as UrlLibHttpResponse
 from werkzeug.datastructures import Headers
 from werkzeug.wrappers import ResponseStream
 
+from localstack import config
 from localstack.aws.api import CommonServiceException, ServiceException
 from localstack.aws.api.dynamodb import (
     AttributeValue,
@@ -1559,6 +1560,82 @@ def test_no_mutation_of_parameters():
     assert parameters == expected
 
 
+@pytest.mark.parametrize(
+    "service_name,operation_name,parameters",
+    [
+        ("sqs", "ListQueues", {"QueueUrls": ["http://localhost:4566/000000000000/foo"]}),
+        ("s3", "ListBuckets", {"Buckets": [{"Name": "foo"}], "Owner": {"ID": "bar"}}),
+        ("dynamodb", "ListTables", {"TableNames": ["foo", "bar"]}),
+    ],
+)
+def test_serializer_caches_compiled_shape_serializers(service_name, operation_name, parameters):
+    service = load_service(service_name)
+    operation_model = service.operation_model(operation_name)
+    response_serializer = create_serializer(service)
+
+    first = response_serializer.serialize_to_response(
+        parameters, operation_model, None, "request-id"
+    ).get_data()
+    compiled = dict(response_serializer._shape_serializers)
+    assert operation_model.output_shape in compiled
+
+    # serializing another response of the same operation re-uses the compiled serialization functions
+    second = response_serializer.serialize_to_response(
+        parameters, operation_model, None, "request-id"
+    ).get_data()
+    assert first == second
+    assert response_serializer._shape_serializers == compiled
+
+
+@pytest.mark.parametrize(
+    "service_name,operation_name,parameters",
+    [
+        (
+            "s3",
+            "ListObjectsV2",
+            {
+                "Name": "bucket",
+                "KeyCount": 100,
+                "Contents": [
+                    {"Key": f"key-{i}", "Size": i, "LastModified": datetime(2022, 1, 1)}
+                    for i in range(100)
+                ],
+            },
+        ),
+        (
+            "ec2",
+            "DescribeInstances",
+            {
+                "Reservations": [
+                    {"ReservationId": f"r-{i}", "Instances": [{"InstanceId": f"i-{i}"}]}
+                    for i in range(100)
+                ]
+            },
+        ),
+        ("sqs", "ListQueues", {"QueueUrls": []}),
+        ("cloudfront", "ListDistributions", {"DistributionList": {"Items": []}}),
+    ],
+)
+def test_xml_response_streaming(monkeypatch, service_name, operation_name, parameters):
+    service = load_service(service_name)
+    operation_model = service.operation_model(operation_name)
+    response_serializer = create_serializer(service)
+    expected = response_serializer.serialize_to_response(
+        parameters, operation_model, None, "request-id"
+    )
+
+    monkeypatch.setattr(config, "STREAM_XML_RESPONSES", True)
+    monkeypatch.setattr(response_serializer, "STREAMING_CHUNK_PARTS", 10)
+    response = response_serializer.serialize_to_response(
+        parameters, operation_model, None, "request-id"
+    )
+    assert response.is_streamed
+    chunks = list(response.response)
+    assert b"".join(chunks) == expected.get_data()
+    if len(expected.get_data()) > 1000:
+        assert len(chunks) > 1
+
+
 def test_serializer_error_on_protocol_error_invalid_exception():
     """Test that the serializer raises a ProtocolSerializerError in case of invalid exception to serialize."""
     service = load_service("sqs")
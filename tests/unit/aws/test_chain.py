@@ -1,8 +1,15 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
+from localstack.aws.accounts import get_aws_account_id, set_aws_account_id
 from localstack.aws.api import RequestContext
 from localstack.aws.chain import CompositeHandler, HandlerChain
+from localstack.constants import DEFAULT_AWS_ACCOUNT_ID
 from localstack.http import Response
+from localstack.utils.aws.request_context import THREAD_LOCAL, get_request_context
 
 
 class TestCompositeHandler:
@@ -137,3 +144,157 @@ class TestCompositeHandler:
         inner2.assert_not_called()
         exception_handler.assert_called_once()
         response1.assert_called_once()
+
+
+class TestAwaitableHandlers:
+    def test_handle_awaits_awaitable_of_request_handler(self):
+        async def _respond(response: Response):
+            await asyncio.sleep(0)
+            response.status_code = 202
+
+        def deferring_handler(_chain: HandlerChain, request: RequestContext, response: Response):
+            return _respond(response)
+
+        def next_handler(_chain: HandlerChain, request: RequestContext, response: Response):
+            # the awaitable is done before the chain continues
+            assert response.status_code == 202
+            response.headers["X-Next"] = "true"
+
+        response_handler = mock.MagicMock()
+
+        chain = HandlerChain(
+            request_handlers=[deferring_handler, next_handler],
+            response_handlers=[response_handler],
+        )
+        response = Response()
+        chain.handle(RequestContext(), response)
+
+        assert response.status_code == 202
+        assert response.headers["X-Next"] == "true"
+        response_handler.assert_called_once()
+
+    def test_handle_async_awaits_on_event_loop(self):
+        loop_thread = None
+        handler_threads = set()
+
+        async def _respond(response: Response):
+            nonlocal loop_thread
+            loop_thread = threading.current_thread()
+            await asyncio.sleep(0)
+            response.status_code = 202
+
+        def deferring_handler(_chain: HandlerChain, request: RequestContext, response: Response):
+            handler_threads.add(threading.current_thread())
+            return _respond(response)
+
+        def response_handler(_chain: HandlerChain, request: RequestContext, response: Response):
+            handler_threads.add(threading.current_thread())
+            response.headers["X-Status"] = str(response.status_code)
+
+        chain = HandlerChain(
+            request_handlers=[deferring_handler],
+            response_handlers=[response_handler],
+        )
+        response = Response()
+
+        with ThreadPoolExecutor(1) as executor:
+            asyncio.run(chain.handle_async(RequestContext(), response, executor))
+
+        assert response.headers["X-Status"] == "202"
+        assert loop_thread is threading.main_thread()
+        assert threading.main_thread() not in handler_threads
+
+    def test_handle_async_calls_exception_handlers_for_errors_of_awaitable(self):
+        async def _fail():
+            raise ValueError("oh noes")
+
+        def deferring_handler(_chain: HandlerChain, request: RequestContext, response: Response):
+            return _fail()
+
+        next_handler = mock.MagicMock()
+        exception_handler = mock.MagicMock()
+        response_handler = mock.MagicMock()
+
+        chain = HandlerChain(
+            request_handlers=[deferring_handler, next_handler],
+            response_handlers=[response_handler],
+            exception_handlers=[exception_handler],
+        )
+
+        asyncio.run(chain.handle_async(RequestContext(), Response()))
+
+        next_handler.assert_not_called()
+        exception_handler.assert_called_once()
+        assert isinstance(exception_handler.call_args[0][1], ValueError)
+        response_handler.assert_called_once()
+
+    def test_handle_async_retains_context_variables_across_handlers(self):
+        var = contextvars.ContextVar("var")
+
+        async def _wait():
+            await asyncio.sleep(0)
+
+        def set_var(_chain: HandlerChain, request: RequestContext, response: Response):
+            var.set("value")
+            return _wait()
+
+        def read_var(_chain: HandlerChain, request: RequestContext, response: Response):
+            response.data = var.get()
+
+        chain = HandlerChain(request_handlers=[set_var, read_var])
+        response = Response()
+
+        with ThreadPoolExecutor(4) as executor:
+            asyncio.run(chain.handle_async(RequestContext(), response, executor))
+
+        assert response.data == b"value"
+
+    def test_handle_async_carries_thread_local_request_state_to_other_threads(self):
+        class _AlternatingExecutor(ThreadPoolExecutor):
+            # runs consecutive steps in different threads
+            def __init__(self):
+                super().__init__(1)
+                self.other = ThreadPoolExecutor(1)
+                self.calls = 0
+
+            def submit(self, fn, /, *args, **kwargs):
+                self.calls += 1
+                if self.calls % 2:
+                    return super().submit(fn, *args, **kwargs)
+                return self.other.submit(fn, *args, **kwargs)
+
+        async def _wait():
+            await asyncio.sleep(0)
+
+        context = RequestContext()
+        context.request = object()
+        threads = []
+        state = {}
+
+        def set_state(_chain: HandlerChain, _context: RequestContext, _response: Response):
+            threads.append(threading.current_thread())
+            set_aws_account_id("111111111111")
+            THREAD_LOCAL.request_context = _context.request
+            return _wait()
+
+        def read_state(_chain: HandlerChain, _context: RequestContext, _response: Response):
+            threads.append(threading.current_thread())
+            state["account_id"] = get_aws_account_id()
+            state["request"] = get_request_context()
+
+        chain = HandlerChain(request_handlers=[set_state, read_state])
+
+        executor = _AlternatingExecutor()
+        try:
+            asyncio.run(chain.handle_async(context, Response(), executor))
+            # the thread which suspended the request does not keep its state
+            first_thread_state = executor.submit(
+                lambda: (get_aws_account_id(), get_request_context())
+            ).result()
+        finally:
+            executor.other.shutdown()
+            executor.shutdown()
+
+        assert threads[0] is not threads[1]
+        assert state == {"account_id": "111111111111", "request": context.request}
+        assert first_thread_state == (DEFAULT_AWS_ACCOUNT_ID, None)
@@ -1,7 +1,27 @@
+from unittest.mock import MagicMock, patch
+
+import boto3
 import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError, EndpointConnectionError
 
-from localstack.aws.api import ServiceException
-from localstack.aws.client import _ResponseStream, parse_service_exception
+from localstack import config
+from localstack.aws import handlers
+from localstack.aws.api import RequestContext, ServiceException, handler
+from localstack.aws.api.sqs import QueueDoesNotExist
+from localstack.aws.chain import HandlerChain
+from localstack.aws.client import (
+    DirectDispatchShortCircuit,
+    GatewayShortCircuit,
+    _ResponseStream,
+    parse_service_exception,
+)
+from localstack.aws.connect import InternalClientFactory
+from localstack.aws.gateway import Gateway
+from localstack.aws.handlers.service import SkeletonHandler
+from localstack.aws.protocol.parser import RequestParser
+from localstack.aws.protocol.serializer import ResponseSerializer
+from localstack.aws.skeleton import create_skeleton
 from localstack.http import Response
 
 
@@ -58,3 +78,207 @@ class TestResponseStream:
             assert next(stream) == b"bar"
             with pytest.raises(StopIteration):
                 next(stream)
+
+
+class TestGatewayShortCircuit:
+    @pytest.fixture
+    def create_client(self):
+        def _create(service: str, endpoint_url: str = None):
+            return boto3.client(
+                service,
+                endpoint_url=endpoint_url or config.get_edge_url(),
+                region_name="us-east-1",
+                aws_access_key_id="test",
+                aws_secret_access_key="test",
+                config=Config(retries={"max_attempts": 0}),
+            )
+
+        return _create
+
+    def test_dispatches_to_gateway(self, create_client):
+        requests = []
+
+        def echo_handler(_chain: HandlerChain, context: RequestContext, response: Response):
+            requests.append(context.request)
+            response.status_code = 200
+            response.set_json({"TableNames": ["foo"]})
+
+        gateway = Gateway()
+        gateway.request_handlers.append(echo_handler)
+
+        client = create_client("dynamodb")
+        GatewayShortCircuit.modify_client(client, gateway)
+
+        result = client.list_tables()
+        assert result["TableNames"] == ["foo"]
+
+        assert len(requests) == 1
+        assert requests[0].method == "POST"
+        assert requests[0].headers["X-Amz-Target"] == "DynamoDB_20120810.ListTables"
+        assert requests[0].headers["Authorization"].startswith("AWS4-HMAC-SHA256")
+
+    def test_raises_service_exception(self, create_client):
+        def error_handler(_chain: HandlerChain, context: RequestContext, response: Response):
+            response.status_code = 400
+            response.set_json(
+                {
+                    "__type": "com.amazonaws.dynamodb.v20120810#ResourceNotFoundException",
+                    "message": "no such table",
+                }
+            )
+
+        gateway = Gateway()
+        gateway.request_handlers.append(error_handler)
+
+        client = create_client("dynamodb")
+        GatewayShortCircuit.modify_client(client, gateway)
+
+        with pytest.raises(ClientError) as e:
+            client.describe_table(TableName="foo")
+        assert e.value.response["Error"]["Code"] == "ResourceNotFoundException"
+        assert e.value.response["Error"]["Message"] == "no such table"
+
+    def test_streaming_response(self, create_client):
+        def _gen():
+            yield b"foo"
+            yield b"bar"
+
+        def stream_handler(_chain: HandlerChain, context: RequestContext, response: Response):
+            response.status_code = 200
+            response.set_response(_gen())
+
+        gateway = Gateway()
+        gateway.request_handlers.append(stream_handler)
+
+        client = create_client("s3")
+        GatewayShortCircuit.modify_client(client, gateway)
+
+        result = client.get_object(Bucket="bucket", Key="key")
+        assert result["Body"].read() == b"foobar"
+
+    def test_skips_requests_to_other_endpoints(self, create_client):
+        gateway = Gateway()
+        gateway.request_handlers.append(MagicMock())
+
+        client = create_client("dynamodb", endpoint_url="http://localhost:1")
+        GatewayShortCircuit.modify_client(client, gateway)
+
+        with pytest.raises(EndpointConnectionError):
+            client.list_tables()
+
+        gateway.request_handlers[0].assert_not_called()
+
+
+class TestDirectDispatchShortCircuit:
+    @pytest.fixture
+    def create_gateway(self):
+        def _create(provider) -> Gateway:
+            skeleton = create_skeleton("sqs", provider)
+
+            gateway = Gateway()
+            gateway.request_handlers.extend(
+                [
+                    handlers.parse_service_name,
+                    handlers.add_region_from_header,
+                    handlers.add_account_id,
+                    handlers.add_internal_request_params,
+                    handlers.parse_service_request,
+                    SkeletonHandler(skeleton),
+                ]
+            )
+            gateway.response_handlers.append(handlers.parse_service_response)
+            return gateway
+
+        return _create
+
+    @pytest.fixture
+    def create_client(self):
+        factory = InternalClientFactory()
+
+        def _create(service: str, gateway: Gateway, endpoint_url: str = None):
+            client = factory.get_client(
+                service, region_name="eu-west-1", endpoint_url=endpoint_url or config.get_edge_url()
+            )
+            DirectDispatchShortCircuit.modify_client(client, gateway)
+            return client
+
+        return _create
+
+    def test_dispatches_service_request(self, create_gateway, create_client):
+        class Provider:
+            @handler("ListQueues")
+            def list_queues(
+                self, context: RequestContext, queue_name_prefix=None, max_results=None
+            ):
+                assert context.direct_dispatch
+                assert context.is_internal_call
+                assert context.region == "eu-west-1"
+                assert max_results == 10
+                return {
+                    "QueueUrls": [f"http://localhost:4566/000000000000/{queue_name_prefix}-1"],
+                    "Internal": "not part of the output shape",
+                }
+
+        gateway = create_gateway(Provider())
+        client = create_client("sqs", gateway)
+
+        with patch.object(ResponseSerializer, "serialize_to_response") as serialize, patch.object(
+            RequestParser, "parse"
+        ) as parse:
+            result = client.list_queues(QueueNamePrefix="foo", MaxResults=10)
+            serialize.assert_not_called()
+            parse.assert_not_called()
+
+        assert result["QueueUrls"] == ["http://localhost:4566/000000000000/foo-1"]
+        assert "Internal" not in result
+        assert result["ResponseMetadata"]["HTTPStatusCode"] == 200
+
+    def test_converts_types(self, create_gateway, create_client):
+        class Provider:
+            @handler("SendMessage", expand=False)
+            def send_message(self, context: RequestContext, request):
+                attribute = request["MessageAttributes"]["attr"]
+                assert attribute["BinaryValue"] == b"foobar"
+                return {"MessageId": 123, "MD5OfMessageBody": "abc"}
+
+        gateway = create_gateway(Provider())
+        client = create_client("sqs", gateway)
+
+        result = client.send_message(
+            QueueUrl="http://localhost:4566/000000000000/foo",
+            MessageBody="foo",
+            MessageAttributes={"attr": {"DataType": "Binary", "BinaryValue": "foobar"}},
+        )
+        assert result["MessageId"] == "123"
+
+    def test_raises_service_exception(self, create_gateway, create_client):
+        class Provider:
+            @handler("GetQueueUrl")
+            def get_queue_url(
+                self, context: RequestContext, queue_name, queue_owner_aws_account_id=None
+            ):
+                raise QueueDoesNotExist("no such queue")
+
+        gateway = create_gateway(Provider())
+        client = create_client("sqs", gateway)
+
+        with pytest.raises(client.exceptions.QueueDoesNotExist) as e:
+            client.get_queue_url(QueueName="foo")
+        assert e.value.response["Error"]["Message"] == "no such queue"
+        assert e.value.response["Error"]["Type"] == "Sender"
+        assert e.value.response["ResponseMetadata"]["HTTPStatusCode"] == 400
+
+    def test_skips_external_clients(self, create_gateway):
+        gateway = create_gateway(MagicMock())
+        client = boto3.client(
+            "sqs",
+            endpoint_url="http://localhost:1",
+            region_name="us-east-1",
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+            config=Config(retries={"max_attempts": 0}),
+        )
+        DirectDispatchShortCircuit.modify_client(client, gateway)
+
+        with pytest.raises(EndpointConnectionError):
+            client.list_queues()
@@ -1,4 +1,5 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import requests
@@ -18,11 +19,11 @@ from localstack.utils.sync import poll_condition
 def serve_gateway_hypercorn():
     _servers = []
 
-    def _create(gateway: Gateway) -> HypercornServer:
+    def _create(gateway: Gateway, **kwargs) -> HypercornServer:
         config = Config()
         config.bind = f"localhost:{net.get_free_tcp_port()}"
         loop = asyncio.new_event_loop()
-        srv = HypercornServer(AsgiGateway(gateway, event_loop=loop), config, loop=loop)
+        srv = HypercornServer(AsgiGateway(gateway, event_loop=loop, **kwargs), config, loop=loop)
         _servers.append(srv)
         srv.start()
         assert srv.wait_is_up(timeout=10), "gave up waiting for server to start up"
@@ -62,3 +63,24 @@ def test_gateway_served_through_hypercorn_preserves_client_headers(serve_gateway
     assert ["Some-Title-Case-Header", "value2"] in headers
     assert ["X-UPPER", "value3"] in headers
     assert ["KEEPS__underscores_-", "value4"] in headers
+
+
+def test_gateway_served_through_hypercorn_awaits_deferred_handlers(serve_gateway_hypercorn):
+    async def _respond(response: Response):
+        await asyncio.sleep(0.5)
+        response.set_json({"status": "done"})
+
+    def deferring_handler(chain: HandlerChain, context: RequestContext, response: Response):
+        chain.stop()
+        return _respond(response)
+
+    gateway = Gateway()
+    gateway.request_handlers.append(deferring_handler)
+
+    # waiting requests do not occupy a thread, so a single thread can serve all of them concurrently
+    server = serve_gateway_hypercorn(gateway=gateway, threads=1)
+
+    with ThreadPoolExecutor(5) as executor:
+        responses = list(executor.map(lambda _: requests.get(server.url, timeout=5), range(5)))
+
+    assert [response.json() for response in responses] == [{"status": "done"}] * 5
@@ -0,0 +1,76 @@
+from localstack.aws.api import RequestContext
+from localstack.aws.chain import HandlerChain
+from localstack.aws.metrics import HandlerChainMetrics, Histogram, HistogramFamily
+from localstack.aws.spec import load_service
+from localstack.http import Response
+
+
+class TestHistogram:
+    def test_observe(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.cumulative_counts() == [2, 3, 4]
+        assert histogram.count == 4
+        assert histogram.sum == 5.65
+
+    def test_family_to_prometheus(self):
+        family = HistogramFamily("test_seconds", "Some test.", ("name",), buckets=(0.1, 1.0))
+        family.labels('my "value"').observe(0.5)
+
+        assert list(family.to_prometheus()) == [
+            "# HELP test_seconds Some test.",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{name="my \\"value\\"",le="0.1"} 0',
+            'test_seconds_bucket{name="my \\"value\\"",le="1.0"} 1',
+            'test_seconds_bucket{name="my \\"value\\"",le="+Inf"} 1',
+            'test_seconds_sum{name="my \\"value\\""} 0.5',
+            'test_seconds_count{name="my \\"value\\""} 1',
+        ]
+
+
+class TestHandlerChainMetrics:
+    def test_chain_records_handler_and_operation_latency(self):
+        def set_operation(_chain: HandlerChain, context: RequestContext, response: Response):
+            context.service = load_service("sqs")
+            context.operation = context.service.operation_model("SendMessage")
+
+        def fail(_chain: HandlerChain, context: RequestContext, response: Response):
+            raise ValueError()
+
+        class ResponseHandler:
+            def __call__(self, _chain: HandlerChain, context: RequestContext, response: Response):
+                pass
+
+        def handle_exception(_chain, exception, context, response):
+            pass
+
+        metrics = HandlerChainMetrics()
+        chain = HandlerChain(
+            request_handlers=[set_operation, fail],
+            response_handlers=[ResponseHandler()],
+            exception_handlers=[handle_exception],
+        )
+        chain.metrics = metrics
+        chain.handle(RequestContext(), Response())
+
+        histograms = metrics.handler_duration.histograms
+        assert set(histograms.keys()) == {
+            ("request", set_operation.__qualname__),
+            ("request", fail.__qualname__),
+            ("response", "ResponseHandler"),
+            ("exception", handle_exception.__qualname__),
+        }
+        assert all(histogram.count == 1 for histogram in histograms.values())
+        assert metrics.operation_duration.histograms[("sqs", "SendMessage")].count == 1
+
+        output = metrics.to_prometheus()
+        assert "# TYPE localstack_handler_duration_seconds histogram" in output
+        assert (
+            'localstack_service_operation_duration_seconds_count{service="sqs",operation="SendMessage"} 1'
+            in output
+        )
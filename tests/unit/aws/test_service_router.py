@@ -8,7 +8,11 @@ from botocore.awsrequest import AWSRequest, create_request_object
 from botocore.config import Config
 from botocore.model import OperationModel, ServiceModel, Shape, StructureShape
 
-from localstack.aws.protocol.service_router import determine_aws_service_name, get_service_catalog
+from localstack.aws.protocol.service_router import (
+    determine_aws_service_name,
+    get_service_catalog,
+    routing_decision_cache,
+)
 from localstack.http import Request
 from localstack.utils.aws import aws_stack
 from localstack.utils.run import to_str
@@ -220,3 +224,90 @@ def test_endpoint_prefix_based_routing_s3_virtual_host():
         )
     )
     assert detected_service_name == "s3"
+
+
+def _signed_headers(signing_name: str, **headers) -> Dict[str, str]:
+    headers["Authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential=test/20230101/us-east-1/{signing_name}/aws4_request, "
+        "SignedHeaders=host;x-amz-date, Signature=1234"
+    )
+    return headers
+
+
+@pytest.fixture
+def routing_cache():
+    routing_decision_cache.clear()
+    yield routing_decision_cache
+    routing_decision_cache.clear()
+
+
+def test_routing_decision_cache_hit(routing_cache):
+    for queue_name in ["foo", "bar"]:
+        request = Request(
+            method="POST",
+            path="/",
+            body=f'{{"QueueName": "{queue_name}"}}',
+            headers=_signed_headers(
+                "sqs", **{"X-Amz-Target": "AmazonSQS.CreateQueue", "Host": "localhost:4566"}
+            ),
+        )
+        assert determine_aws_service_name(request) == "sqs"
+
+    assert routing_cache.misses == 1
+    assert routing_cache.hits == 1
+    assert len(routing_cache) == 1
+
+
+def test_routing_decision_cache_uses_first_path_segment(routing_cache):
+    assert (
+        determine_aws_service_name(
+            Request(method="GET", path="/v2/apis", headers=_signed_headers("apigateway"))
+        )
+        == "apigatewayv2"
+    )
+    assert (
+        determine_aws_service_name(
+            Request(method="GET", path="/v2/domainnames", headers=_signed_headers("apigateway"))
+        )
+        == "apigatewayv2"
+    )
+    assert (
+        determine_aws_service_name(
+            Request(method="GET", path="/restapis", headers=_signed_headers("apigateway"))
+        )
+        == "apigateway"
+    )
+    assert routing_cache.hits == 1
+    assert len(routing_cache) == 2
+
+
+def test_routing_decision_cache_skips_body_dependent_decisions(routing_cache):
+    for action in ["SendMessage", "Publish"]:
+        request = Request(
+            method="POST",
+            path="/",
+            body=f"Action={action}",
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Host": "localhost:4566",
+            },
+        )
+        assert determine_aws_service_name(request) == ("sqs" if action == "SendMessage" else "sns")
+
+    assert routing_cache.hits == 0
+    assert len(routing_cache) == 0
+
+
+def test_routing_decision_cache_skips_path_dependent_decisions(routing_cache):
+    # the custom path rules look at the whole path
+    request = Request(
+        method="GET", path="/000000000000/my-queue", headers={"Host": "localhost:4566"}
+    )
+    assert determine_aws_service_name(request) == "sqs"
+    request = Request(
+        method="GET", path="/000000000000/my-bucket/key", headers={"Host": "localhost:4566"}
+    )
+    assert determine_aws_service_name(request) == "s3"
+
+    assert routing_cache.hits == 0
+    assert len(routing_cache) == 0
@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 import sys
 from typing import Dict, List
 
@@ -112,6 +114,34 @@ class TestSqsApi:
         }
 
 
+class TestSqsApiAsync:
+    service = "sqs"
+    version = "2012-11-05"
+
+    @handler("SendMessage")
+    async def send_message(
+        self,
+        context: RequestContext,
+        queue_url: String,
+        message_body: String,
+        delay_seconds: Integer = None,
+        message_attributes: MessageBodyAttributeMap = None,
+        message_system_attributes: MessageBodySystemAttributeMap = None,
+        message_deduplication_id: String = None,
+        message_group_id: String = None,
+    ) -> SendMessageResult:
+        await asyncio.sleep(0)
+        if message_body == "invalid":
+            raise CommonServiceException("InvalidMessageContents", "Invalid message contents")
+        return {
+            "MD5OfMessageBody": "String",
+            "MD5OfMessageAttributes": "String",
+            "MD5OfMessageSystemAttributes": "String",
+            "MessageId": "String",
+            "SequenceNumber": "String",
+        }
+
+
 class TestSqsApiNotImplemented:
     service = "sqs"
     version = "2012-11-05"
@@ -203,6 +233,52 @@ def test_skeleton_e2e_sqs_send_message():
     }
 
 
+def _create_send_message_context(sqs_service, message_body: str) -> RequestContext:
+    context = RequestContext()
+    context.account = "test"
+    context.region = "us-west-1"
+    context.service = sqs_service
+    context.request = HttpRequest(
+        **{
+            "method": "POST",
+            "path": "/",
+            "body": "Action=SendMessage&Version=2012-11-05&QueueUrl=http%3A%2F%2Flocalhost%3A4566%2F000000000000%2Ftf-acc-test-queue&MessageBody="
+            + message_body,
+            "headers": _get_sqs_request_headers(),
+        }
+    )
+    return context
+
+
+def test_skeleton_e2e_sqs_send_message_async():
+    sqs_service = load_service("sqs")
+    skeleton = Skeleton(sqs_service, TestSqsApiAsync())
+    response_parser = create_parser(sqs_service.protocol)
+    output_shape = sqs_service.operation_model("SendMessage").output_shape
+
+    # invoke waits for the coroutine to finish
+    result = skeleton.invoke(_create_send_message_context(sqs_service, "foo"))
+    parsed_response = response_parser.parse(result.to_readonly_response_dict(), output_shape)
+    assert parsed_response["MessageId"] == "String"
+
+    # invoke_deferred returns an awaitable of the response instead
+    deferred = skeleton.invoke_deferred(_create_send_message_context(sqs_service, "foo"))
+    assert inspect.isawaitable(deferred)
+    result = asyncio.run(deferred)
+    parsed_response = response_parser.parse(result.to_readonly_response_dict(), output_shape)
+    assert parsed_response["MessageId"] == "String"
+
+    # service exceptions raised by the coroutine are serialized as well
+    context = _create_send_message_context(sqs_service, "invalid")
+    result = asyncio.run(skeleton.invoke_deferred(context))
+    parsed_response = response_parser.parse(result.to_readonly_response_dict(), output_shape)
+    assert parsed_response["Error"] == {
+        "Code": "InvalidMessageContents",
+        "Message": "Invalid message contents",
+    }
+    assert context.service_exception.code == "InvalidMessageContents"
+
+
 @pytest.mark.parametrize(
     "api_class, oracle_message",
     [
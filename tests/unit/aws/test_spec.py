@@ -1,8 +1,16 @@
+import marshal
+import os
+import sys
+
 from botocore.model import ServiceModel, StringShape
 
+from localstack import config
 from localstack.aws.spec import (
+    CompiledMapping,
+    CompiledSpecCache,
     LazyServiceCatalogIndex,
     PatchingLoader,
+    get_compiled_spec_cache,
     load_service_index_cache,
     save_service_index_cache,
 )
@@ -60,3 +68,75 @@ def test_patching_loaders():
     assert isinstance(shape.members["BucketName"], StringShape)
     assert shape.metadata["error"]["httpStatusCode"] == 404
     assert shape.metadata.get("exception")
+
+
+def test_compiled_spec_cache(tmp_path):
+    loader = PatchingLoader(
+        {
+            "sqs/2012-11-05/service-2": [
+                {"op": "add", "path": "/shapes/QueueUrl", "value": {"type": "string"}},
+            ],
+        }
+    )
+    original = ServiceModel(loader.load_service_model("sqs", "service-2"), "sqs")
+
+    # the first load compiles the spec into the cache
+    description = CompiledSpecCache(str(tmp_path), loader).load("sqs")
+    assert (tmp_path / "sqs-latest-service-2.bin").exists()
+    assert CompiledSpecCache(str(tmp_path), loader).load("sqs") is not description
+
+    # the operations and shapes of the compiled spec are only deserialized when they are accessed
+    description = CompiledSpecCache(str(tmp_path), loader).load("sqs")
+    assert isinstance(description["shapes"], CompiledMapping)
+    assert not description["shapes"]._values
+
+    compiled = ServiceModel(description, "sqs")
+    assert compiled.metadata == original.metadata
+    assert compiled.operation_names == original.operation_names
+    assert compiled.shape_names == original.shape_names
+    assert isinstance(compiled.shape_for("QueueUrl"), StringShape)
+
+    operation = compiled.operation_model("SendMessage")
+    assert operation.input_shape.members.keys() == (
+        original.operation_model("SendMessage").input_shape.members.keys()
+    )
+    assert "SendMessageRequest" in description["shapes"]._values
+    assert "CreateQueueRequest" not in description["shapes"]._values
+
+
+def test_compiled_spec_cache_recompiles_invalid_files(tmp_path):
+    (tmp_path / "sqs-latest-service-2.bin").write_bytes(b"invalid")
+
+    description = CompiledSpecCache(str(tmp_path)).load("sqs")
+
+    assert "SendMessage" in description["operations"]
+    description = CompiledSpecCache(str(tmp_path)).load("sqs")
+    assert isinstance(description["operations"], CompiledMapping)
+
+
+def test_compiled_spec_cache_recompiles_invalid_values(tmp_path):
+    CompiledSpecCache(str(tmp_path)).compile("sqs")
+    # corrupt a single marshalled operation, which is only deserialized once it is accessed
+    file_path = tmp_path / "sqs-latest-service-2.bin"
+    compiled = marshal.loads(file_path.read_bytes())
+    compiled["operations"]["SendMessage"] = b"\x00invalid"
+    file_path.write_bytes(marshal.dumps(compiled))
+
+    description = CompiledSpecCache(str(tmp_path)).load("sqs")
+    assert description["operations"]["SendMessage"]["name"] == "SendMessage"
+    assert description["operations"]["CreateQueue"]["name"] == "CreateQueue"
+
+    # the spec has been recompiled
+    description = CompiledSpecCache(str(tmp_path)).load("sqs")
+    assert description["operations"]["SendMessage"]["name"] == "SendMessage"
+
+
+def test_compiled_spec_cache_is_specific_to_interpreter(tmp_path, monkeypatch):
+    monkeypatch.setattr(config.dirs, "cache", str(tmp_path))
+    get_compiled_spec_cache.cache_clear()
+    try:
+        directory = os.path.basename(get_compiled_spec_cache().directory)
+    finally:
+        get_compiled_spec_cache.cache_clear()
+
+    assert directory.endswith(f"-py{sys.version_info[0]}{sys.version_info[1]}-m{marshal.version}")
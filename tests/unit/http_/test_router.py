@@ -8,7 +8,7 @@ from werkzeug.exceptions import MethodNotAllowed, NotFound
 from werkzeug.routing import RequestRedirect
 
 from localstack.http import Request, Response, Router
-from localstack.http.router import E, RequestArguments, route
+from localstack.http.router import E, RequestArguments, RoutePrefilter, route
 from localstack.utils.common import get_free_tcp_port
 
 
@@ -444,6 +444,75 @@ class TestRouter:
         assert router.dispatch(Request("HEAD", "/my_api")).data == b"/my_api/do-get"
 
 
+class TestRoutePrefilter:
+    @staticmethod
+    def _router() -> Router:
+        router = Router(dispatcher=noop)
+        router.add("/_aws/sqs/messages", endpoint=noop)
+        router.add("/shell/<regex('.*'):req_path>", endpoint=noop)
+        router.add(
+            "/<path:path>",
+            host="<api_id>.lambda-url.<regex('(us|eu)-[a-z]+-\\d'):region>.<regex('.*'):server>",
+            endpoint=noop,
+        )
+        router.add(
+            "/<stage>/<path:path>",
+            host="<regex('[^-]+'):api_id><regex('(-vpce-[^.]+)?'):vpce_suffix>.execute-api.<regex('.*'):server>",
+            endpoint=noop,
+        )
+        router.add("/restapis/<api_id>/<stage>/_user_request_/<path:path>", endpoint=noop)
+        return router
+
+    @pytest.mark.parametrize(
+        "host,path",
+        [
+            ("localhost:4566", "/_aws/sqs/messages"),
+            ("localhost:4566", "/_aws/sqs/messages/"),
+            ("localhost:4566", "//_aws/sqs/messages"),
+            ("localhost:4566", "/shell/index.html"),
+            ("abc123.lambda-url.us-east-1.localhost.localstack.cloud:4566", "/foo/bar"),
+            ("ABC123.LAMBDA-URL.us-east-1.localhost:4566", "/foo"),
+            ("myapi-vpce-1234.execute-api.localhost:4566", "/dev/pets"),
+            ("localhost:4566", "/restapis/myapi/dev/_user_request_/pets%20and%20cats"),
+        ],
+    )
+    def test_may_match_all_matching_requests(self, host, path):
+        router = self._router()
+        request = Request("GET", path, headers={"Host": host})
+        router.dispatch(request)
+
+        assert RoutePrefilter(router).may_match(request)
+
+    @pytest.mark.parametrize(
+        "host,path",
+        [
+            ("localhost:4566", "/"),
+            ("sqs.us-east-1.localhost.localstack.cloud:4566", "/000000000000/my-queue"),
+            ("localhost:4566", "/_aws/sns/platform-endpoint-messages"),
+            ("my-bucket.s3.localhost.localstack.cloud:4566", "/my-key"),
+        ],
+    )
+    def test_does_not_match_other_requests(self, host, path):
+        router = self._router()
+        request = Request("POST", path, headers={"Host": host})
+        with pytest.raises(NotFound):
+            router.dispatch(request)
+
+        assert not RoutePrefilter(router).may_match(request)
+
+    def test_prefilter_is_updated_with_rules(self):
+        router = Router(dispatcher=noop)
+        prefilter = RoutePrefilter(router)
+        request = Request("GET", "/foo/bar")
+        assert not prefilter.may_match(request)
+
+        rule = router.add("/foo/<bar>", endpoint=noop)
+        assert prefilter.may_match(request)
+
+        router.remove(rule)
+        assert not prefilter.may_match(request)
+
+
 class TestWsgiIntegration:
     def test_with_werkzeug(self):
         # setup up router
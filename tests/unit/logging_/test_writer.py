@@ -0,0 +1,117 @@
+import logging
+import threading
+
+import pytest
+
+from localstack.aws.api import RequestContext
+from localstack.aws.api.sqs import ListQueuesRequest
+from localstack.aws.handlers.logging import ResponseLogger
+from localstack.aws.spec import load_service
+from localstack.http import Request, Response
+from localstack.logging.writer import QueueLogWriter
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.messages = []
+        self.threads = []
+
+    def emit(self, record):
+        self.records.append(record)
+        self.messages.append(self.format(record))
+        self.threads.append(threading.current_thread())
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("localstack.test.writer")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    yield logger
+    logger.removeHandler(handler)
+
+
+def _handler(logger) -> RecordingHandler:
+    return logger.handlers[0]
+
+
+def test_log_is_handled_on_writer_thread(logger):
+    writer = QueueLogWriter(name="test-log-writer")
+    try:
+        assert writer.log(logger, logging.INFO, "hello %s", "world", extra={"foo": "bar"})
+        assert not writer.log(logger, logging.DEBUG, "not enabled")
+    finally:
+        writer.close()
+
+    handler = _handler(logger)
+    assert handler.messages == ["hello world"]
+    assert handler.records[0].foo == "bar"
+    # the record is created on the logging thread, but handled on the writer thread
+    assert handler.records[0].threadName == threading.current_thread().name
+    assert handler.threads[0] is not threading.current_thread()
+
+
+def test_records_are_dropped_if_queue_is_full(logger):
+    handled = threading.Event()
+    release = threading.Event()
+
+    def _block(record):
+        handled.set()
+        release.wait(5)
+        return True
+
+    logger.addFilter(_block)
+    writer = QueueLogWriter(max_size=2)
+    try:
+        # the first record blocks the writer thread, the next two fill up the queue
+        assert writer.log(logger, logging.INFO, "one")
+        assert handled.wait(5)
+        assert writer.log(logger, logging.INFO, "two")
+        assert writer.log(logger, logging.INFO, "three")
+        assert not writer.log(logger, logging.INFO, "four")
+        assert writer.dropped == 1
+    finally:
+        release.set()
+        writer.close()
+        logger.removeFilter(_block)
+
+    assert _handler(logger).messages == ["one", "two", "three"]
+
+
+def test_log_after_close_is_handled_directly(logger):
+    writer = QueueLogWriter()
+    writer.close()
+
+    assert writer.log(logger, logging.INFO, "after close")
+
+    handler = _handler(logger)
+    assert handler.messages == ["after close"]
+    assert handler.threads[0] is threading.current_thread()
+
+
+def test_response_logger_with_writer():
+    context = RequestContext()
+    context.request = Request("POST", "/")
+    context.service = load_service("sqs")
+    context.operation = context.service.operation_model("ListQueues")
+    context.service_request = ListQueuesRequest()
+    logger = logging.getLogger("localstack.request.aws")
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    writer = QueueLogWriter()
+    try:
+        ResponseLogger(writer=writer)(None, context, Response(status=200))
+        writer.close()
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+
+    assert handler.messages == ["AWS sqs.ListQueues => 200"]
+    assert handler.records[0].input_type == "ListQueuesRequest"
+    assert handler.threads[0] is not threading.current_thread()
@@ -5,7 +5,12 @@ import requests
 from localstack.constants import VERSION
 from localstack.http import Request
 from localstack.services.generic_proxy import ProxyListener
-from localstack.services.internal import CloudFormationUi, HealthResource, LocalstackResourceHandler
+from localstack.services.internal import (
+    CloudFormationUi,
+    HealthResource,
+    LocalstackResourceHandler,
+    MetricsResource,
+)
 from localstack.services.plugins import ServiceManager, ServiceState
 from localstack.utils.testutil import proxy_server
 
@@ -77,6 +82,13 @@ class TestCloudFormationUiResource:
         assert "text/html" in response.headers.get("content-type", "")
 
 
+class TestMetricsResource:
+    def test_get(self):
+        response = MetricsResource().on_get(Request("GET", "/_localstack/metrics"))
+        assert response.mimetype == "text/plain"
+        assert "# TYPE localstack_handler_duration_seconds histogram" in response.get_data(True)
+
+
 class TestLocalstackResourceHandlerIntegration:
     def test_health(self, monkeypatch):
         with proxy_server(LocalstackResourceHandler()) as url:
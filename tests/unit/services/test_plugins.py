@@ -1,7 +1,14 @@
 import threading
+import time
 from queue import Queue
 
-from localstack.services.plugins import ServicePluginManager
+from localstack.services.plugins import (
+    Service,
+    ServiceManager,
+    ServicePluginManager,
+    ServiceState,
+    group_dependent_services,
+)
 from localstack.services.sqs.provider import SqsProvider
 
 
@@ -69,3 +76,64 @@ class TestServicePluginManager:
 
         assert s1 is s2, "instantiated two different services"
         assert len(calls_to_on_after_init) == 1, "on_after_init should be called once"
+
+
+def test_group_dependent_services():
+    groups = group_dependent_services(["sqs", "kinesis", "logs", "lambda", "s3", "dynamodb"])
+
+    # services which launch external processes come first, dependent services are in the same group
+    assert groups == [["kinesis", "dynamodb"], ["sqs"], ["logs", "lambda"], ["s3"]]
+
+
+class TestServiceManager:
+    @staticmethod
+    def _service(
+        name: str,
+        started: list,
+        duration: float = 0,
+        fail: bool = False,
+        barrier: threading.Barrier = None,
+    ) -> Service:
+        def _start(asynchronous):
+            thread = threading.current_thread()
+            if barrier and thread not in dict(started).values():
+                # the first start on each thread waits until the starts on all other threads are running
+                barrier.wait()
+            started.append((name, thread))
+            time.sleep(duration)
+            if fail:
+                raise ValueError("start failed")
+
+        return Service(name, start=_start, check=None)
+
+    def test_start_services_concurrently(self):
+        manager = ServiceManager()
+        started = []
+        # the starts only pass the barrier if they run concurrently on 4 threads
+        barrier = threading.Barrier(4, timeout=10)
+        for name in ["sqs", "sns", "s3", "dynamodb", "kinesis"]:
+            manager.add_service(self._service(name, started, duration=0.2, barrier=barrier))
+
+        manager.start_services(["sqs", "sns", "s3", "dynamodb", "kinesis"], max_workers=4)
+
+        # dynamodb and kinesis depend on each other and are started on the same thread
+        threads = dict(started)
+        assert threads["dynamodb"] is threads["kinesis"]
+        assert len(set(threads.values())) == 4
+        assert all(manager.is_running(name) for name in threads)
+
+        timeline = manager.timeline.to_list()
+        assert sorted(event["service"] for event in timeline) == sorted(threads)
+        assert all(event["phase"] == "start" for event in timeline)
+        assert all(event["duration_ms"] >= 200 for event in timeline)
+
+    def test_start_services_with_error(self):
+        manager = ServiceManager()
+        started = []
+        manager.add_service(self._service("sqs", started, fail=True))
+        manager.add_service(self._service("sns", started))
+
+        manager.start_services(["sqs", "sns"])
+
+        assert manager.get_state("sqs") == ServiceState.ERROR
+        assert manager.get_state("sns") == ServiceState.RUNNING
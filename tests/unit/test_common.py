@@ -655,12 +655,21 @@ class TestPaginatedList:
     def test_next_token(self, paginated_list):
         page, next_token = paginated_list.get_page(lambda i: i["Id"], page_size=2)
         assert len(page) == 2
-        assert next_token == "c"
+        # the next token holds the position and the token of the first item of the next page
+        assert PaginatedList._decode_cursor(next_token) == (2, "c")
 
     def test_continuation(self, paginated_list):
+        page, next_token = paginated_list.get_page(lambda i: i["Id"], page_size=2)
+        page, next_token = paginated_list.get_page(
+            lambda i: i["Id"], page_size=2, next_token=next_token
+        )
+        assert [i["Id"] for i in page] == ["c", "d"]
+        assert PaginatedList._decode_cursor(next_token) == (4, "e")
+
+    def test_continuation_with_token_of_item(self, paginated_list):
         page, next_token = paginated_list.get_page(lambda i: i["Id"], page_size=2, next_token="c")
-        assert len(page) == 2
-        assert next_token == "e"
+        assert [i["Id"] for i in page] == ["c", "d"]
+        assert PaginatedList._decode_cursor(next_token) == (4, "e")
 
     def test_end(self, paginated_list):
         page, next_token = paginated_list.get_page(lambda i: i["Id"], page_size=2, next_token="e")
@@ -676,3 +685,36 @@ class TestPaginatedList:
         assert "b" in ids and "e" in ids
         assert "a" not in ids
         assert next_token is None
+
+    def test_pagination_through_all_items(self):
+        items = PaginatedList([{"Id": f"item-{i:03d}"} for i in range(100)])
+
+        pages = []
+        next_token = None
+        while True:
+            page, next_token = items.get_page(
+                lambda i: i["Id"], next_token=next_token, page_size=30
+            )
+            pages.append(page)
+            if not next_token:
+                break
+
+        assert [len(page) for page in pages] == [30, 30, 30, 10]
+        assert [item for page in pages for item in page] == items
+
+    def test_continuation_after_list_changed(self, paginated_list):
+        page, next_token = paginated_list.get_page(lambda i: i["Id"], page_size=2)
+
+        # the next item moved to another position, so it is searched by its token
+        paginated_list.insert(0, {"Id": "0", "Filter": "0"})
+        page, next_token = paginated_list.get_page(
+            lambda i: i["Id"], page_size=2, next_token=next_token
+        )
+        assert [i["Id"] for i in page] == ["c", "d"]
+
+        # the next item was removed, so the pagination starts from the beginning
+        paginated_list.pop(5)
+        page, next_token = paginated_list.get_page(
+            lambda i: i["Id"], page_size=2, next_token=next_token
+        )
+        assert [i["Id"] for i in page] == ["0", "a"]
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 import pytest
 
 import localstack.services.sqs.exceptions
@@ -140,3 +143,31 @@ def test_parse_queue_url_invalid():
         assert parse_queue_url(
             "http://foo.bar.queue.localhost.localstack.cloud:4566/000000000001/my-queue"
         )
+
+
+@pytest.mark.parametrize("queue_name", ["test-queue", "test-queue.fifo"])
+def test_receive_async_waits_for_messages(queue_name):
+    if queue_name.endswith(".fifo"):
+        queue = localstack.services.sqs.models.FifoQueue(queue_name, "us-east-1", "123456789")
+        put_kwargs = {"message_group_id": "group", "message_deduplication_id": "dedup"}
+    else:
+        queue = localstack.services.sqs.models.StandardQueue(queue_name, "us-east-1", "123456789")
+        put_kwargs = {}
+
+    async def _receive():
+        # put the message from another thread once the receiver is waiting on the event loop
+        threading.Timer(
+            0.2, queue.put, args=({"MessageId": "message-id", "Body": "foo"},), kwargs=put_kwargs
+        ).start()
+        return await queue.receive_async(num_messages=1, wait_time_seconds=5)
+
+    result = asyncio.run(_receive())
+    assert [message.message["Body"] for message in result.successful] == ["foo"]
+
+
+def test_receive_async_times_out():
+    queue = localstack.services.sqs.models.StandardQueue("test-queue", "us-east-1", "123456789")
+
+    result = asyncio.run(queue.receive_async(num_messages=1, wait_time_seconds=0.1))
+    assert not result.successful
+    assert not queue.visible._waiters
@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from localstack.utils.asyncio import run_awaitable
+
+
+async def _get_loop():
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop()
+
+
+def test_run_awaitable_reuses_event_loop_of_thread():
+    loop = run_awaitable(_get_loop())
+
+    assert run_awaitable(_get_loop()) is loop
+    assert not loop.is_closed()
+
+
+def test_run_awaitable_in_running_event_loop_fails():
+    async def _run():
+        coroutine = _get_loop()
+        try:
+            with pytest.raises(RuntimeError, match="await the awaitable instead"):
+                run_awaitable(coroutine)
+        finally:
+            coroutine.close()
+
+    asyncio.run(_run())
@@ -0,0 +1,35 @@
+from localstack.utils.importtime import parse_importtime_output
+
+IMPORTTIME_OUTPUT = """
+import time: self [us] | cumulative | imported package
+import time:       104 |        104 |   _io
+import time:        50 |        154 | io
+import time:       300 |        300 |     json.decoder
+import time:       200 |        500 |   json
+import time:      1000 |       1500 | localstack.aws.app
+"""
+
+
+def test_parse_importtime_output():
+    report = parse_importtime_output(IMPORTTIME_OUTPUT)
+
+    assert [i.module for i in report.imports] == [
+        "_io",
+        "io",
+        "json.decoder",
+        "json",
+        "localstack.aws.app",
+    ]
+    assert report.get("json.decoder").depth == 2
+    assert report.get("json").cumulative_us == 500
+    assert report.total_us == 1654
+    assert [i.module for i in report.top_self(2)] == ["localstack.aws.app", "json.decoder"]
+    assert [i.module for i in report.top_cumulative(2, prefix="json")] == ["json", "json.decoder"]
+
+
+def test_import_chain():
+    report = parse_importtime_output(IMPORTTIME_OUTPUT)
+
+    assert report.import_chain("json.decoder") == ["localstack.aws.app", "json", "json.decoder"]
+    assert report.import_chain("io") == ["io"]
+    assert report.import_chain("flask") == []
@@ -0,0 +1,117 @@
+import json
+import os
+import textwrap
+
+import pytest
+from plugin import PluginManager
+
+from localstack.utils import plugin_index
+from localstack.utils.plugin_index import PluginIndex, PluginIndexFinder
+
+NAMESPACE = "localstack.test.plugin_index"
+
+
+def _install_distribution(path, version: str):
+    dist_info = path / f"fake_plugins-{version}.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: fake-plugins\nVersion: {version}\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        f"[{NAMESPACE}]\nfoo = fake_plugins:FooPlugin\nbar = fake_plugins:BarPlugin\n"
+    )
+    return dist_info
+
+
+@pytest.fixture
+def site_dir(tmp_path, monkeypatch):
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+    (site_dir / "fake_plugins.py").write_text(
+        textwrap.dedent(
+            f"""
+            from plugin import Plugin
+
+            class FooPlugin(Plugin):
+                namespace = "{NAMESPACE}"
+                name = "foo"
+
+            class BarPlugin(Plugin):
+                namespace = "{NAMESPACE}"
+                name = "bar"
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(site_dir))
+    return site_dir
+
+
+def _names(index: PluginIndex):
+    return sorted(entry_point.name for entry_point in index.get_entry_points(NAMESPACE))
+
+
+def test_index_is_written_and_read(site_dir, tmp_path, monkeypatch):
+    _install_distribution(site_dir, "1.0")
+    path = str(tmp_path / "cache" / "plugin-index.json")
+
+    assert _names(PluginIndex(path)) == ["bar", "foo"]
+    with open(path) as fd:
+        assert json.load(fd)["entry_points"][NAMESPACE] == [
+            ["foo", "fake_plugins:FooPlugin"],
+            ["bar", "fake_plugins:BarPlugin"],
+        ]
+
+    # a new index is read from the file, without scanning the distributions
+    def _entry_points():
+        raise AssertionError("entry points should not be scanned")
+
+    monkeypatch.setattr(plugin_index, "entry_points", _entry_points)
+    assert _names(PluginIndex(path)) == ["bar", "foo"]
+
+
+def test_index_is_invalidated_if_distributions_change(site_dir, tmp_path):
+    dist_info = _install_distribution(site_dir, "1.0")
+    path = str(tmp_path / "plugin-index.json")
+    assert _names(PluginIndex(path)) == ["bar", "foo"]
+
+    # upgrade the distribution, which removes a plugin
+    dist_info.rename(site_dir / "fake_plugins-1.1.dist-info")
+    entry_points = site_dir / "fake_plugins-1.1.dist-info" / "entry_points.txt"
+    entry_points.write_text(f"[{NAMESPACE}]\nfoo = fake_plugins:FooPlugin\n")
+
+    assert _names(PluginIndex(path)) == ["foo"]
+
+
+def test_plugin_index_finder(site_dir):
+    _install_distribution(site_dir, "1.0")
+    index = PluginIndex()
+    manager = PluginManager(NAMESPACE, finder=PluginIndexFinder(NAMESPACE, index=index))
+
+    assert sorted(manager.list_names()) == ["bar", "foo"]
+    assert type(manager.load("foo")).__name__ == "FooPlugin"
+    assert not os.path.exists(site_dir / "plugin-index.json")
+
+
+def test_index_with_entry_points_dict(tmp_path, monkeypatch):
+    # before Python 3.10, entry_points() returns a plain dict of the groups and their entry points
+    def _entry_points():
+        return {
+            NAMESPACE: (
+                plugin_index.EntryPoint(
+                    name="foo", value="fake_plugins:FooPlugin", group=NAMESPACE
+                ),
+            ),
+            "console_scripts": (
+                plugin_index.EntryPoint(
+                    name="localstack", value="localstack.cli.main:main", group="console_scripts"
+                ),
+            ),
+        }
+
+    monkeypatch.setattr(plugin_index, "entry_points", _entry_points)
+    path = str(tmp_path / "plugin-index.json")
+
+    assert _names(PluginIndex(path)) == ["foo"]
+    assert [ep.value for ep in PluginIndex(path).get_entry_points("console_scripts")] == [
+        "localstack.cli.main:main"
+    ]
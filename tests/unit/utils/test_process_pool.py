@@ -0,0 +1,85 @@
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from localstack.utils.process_pool import JobTimeoutError, ProcessPool
+
+
+def _get_pid() -> int:
+    return os.getpid()
+
+
+def _add(a: int, b: int = 0) -> int:
+    return a + b
+
+
+def _sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def _fail(message: str):
+    raise ValueError(message)
+
+
+def _exit():
+    os._exit(1)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ProcessPool(max_workers=2, timeout=30)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_run_in_worker_process(pool):
+    assert pool.run(_add, 1, b=2) == 3
+    assert pool.run(_get_pid) != os.getpid()
+
+
+def test_exception_is_raised(pool):
+    with pytest.raises(ValueError, match="foobar"):
+        pool.run(_fail, "foobar")
+
+
+def test_timeout(pool):
+    with pytest.raises(JobTimeoutError):
+        pool.run(_sleep, 2, timeout=0.1)
+
+    # the pool is still usable after a timeout
+    assert pool.run(_add, 1) == 1
+
+
+def test_restart_after_worker_died():
+    pool = ProcessPool(max_workers=1, timeout=30)
+    try:
+        with pytest.raises(BrokenProcessPool):
+            pool.run(_exit)
+
+        assert pool.run(_add, 2) == 2
+    finally:
+        pool.shutdown(wait=True)
+
+
+def test_pending_jobs_are_bounded():
+    pool = ProcessPool(max_workers=1, max_pending=1, timeout=30)
+    try:
+        future = pool.submit(_sleep, 0.5)
+        then = time.time()
+        # blocks until the first job is done
+        assert pool.run(_add, 3) == 3
+        assert future.done()
+        assert time.time() - then >= 0.3
+    finally:
+        pool.shutdown(wait=True)
+
+
+def test_without_workers_jobs_run_inline():
+    pool = ProcessPool(max_workers=0)
+
+    assert pool.run(_get_pid) == os.getpid()
+    with pytest.raises(ValueError):
+        pool.run(_fail, "foobar")
@@ -5,8 +5,9 @@ from typing import Tuple
 
 import pytest
 
-from localstack.utils.scheduler import ScheduledTask, Scheduler
+from localstack.utils.scheduler import ScheduledTask, Scheduler, TimerWheelScheduler
 from localstack.utils.sync import poll_condition
+from localstack.utils.worker_pool import WorkerPool
 
 
 class DummyTask:
@@ -39,9 +40,10 @@ def dispatcher():
 
 
 class TestScheduler:
-    @staticmethod
-    def create_and_start(dispatcher) -> Tuple[Scheduler, threading.Thread]:
-        scheduler = Scheduler(executor=dispatcher)
+    scheduler_class = Scheduler
+
+    def create_and_start(self, dispatcher) -> Tuple[Scheduler, threading.Thread]:
+        scheduler = self.scheduler_class(executor=dispatcher)
         thread = threading.Thread(target=scheduler.run)
         thread.start()
 
@@ -135,7 +137,7 @@ class TestScheduler:
         assert len(task2.invocations) == 4
 
     def test_error_handler(self):
-        scheduler = Scheduler()
+        scheduler = self.scheduler_class()
 
         event = threading.Event()
 
@@ -182,3 +184,96 @@ class TestScheduler:
         thread.join(5)
 
         assert len(task.invocations) == 0
+
+    def test_schedule_once_and_at_fixed_rate(self, dispatcher):
+        task1 = DummyTask()
+        task2 = DummyTask()
+        scheduler, thread = self.create_and_start(dispatcher)
+
+        then = time.time()
+        scheduler.schedule_once(task1, delay=0.2)
+        scheduler.schedule_at_fixed_rate(task2, period=0.2, initial_delay=0.1)
+        scheduler.schedule_once(scheduler.close, delay=0.75)
+
+        thread.join(5)
+
+        assert len(task1.invocations) == 1
+        assert task1.invocations[0][1] == pytest.approx(then + 0.2, abs=0.05)
+        assert len(task2.invocations) == 4
+        assert task2.invocations[0][1] == pytest.approx(then + 0.1, abs=0.05)
+
+
+class TestTimerWheelScheduler(TestScheduler):
+    scheduler_class = TimerWheelScheduler
+
+    def test_tasks_in_higher_wheels(self):
+        # with a wheel of 4 ticks of 10ms, the tasks are put into the second and third wheel
+        scheduler = TimerWheelScheduler(tick=0.01, wheel_size=4)
+        thread = threading.Thread(target=scheduler.run)
+        thread.start()
+
+        task = DummyTask()
+        then = time.time()
+        for delay in [0.55, 0.05, 0.3, 0.15]:
+            scheduler.schedule(task, args=(delay,), start=then + delay)
+
+        assert poll_condition(lambda: len(task.invocations) >= 4, timeout=5)
+        scheduler.close()
+        thread.join(5)
+
+        assert [invocation[2][0] for invocation in task.invocations] == [0.05, 0.15, 0.3, 0.55]
+        for _, invoked, args, _ in task.invocations:
+            assert invoked == pytest.approx(then + args[0], abs=0.05)
+
+    def test_cancel_many_tasks(self, dispatcher):
+        tasks = [DummyTask() for _ in range(1000)]
+        scheduler, thread = self.create_and_start(dispatcher)
+
+        then = time.time()
+        scheduled = [scheduler.schedule(task, start=then + 0.2) for task in tasks]
+        for stask in scheduled[::2]:
+            stask.cancel()
+        scheduler.schedule(scheduler.close, start=then + 0.5)
+
+        thread.join(5)
+
+        assert sum(len(task.invocations) for task in tasks[::2]) == 0
+        assert all(len(task.invocations) == 1 for task in tasks[1::2])
+
+    def test_executor_shut_down_while_task_is_scheduled(self):
+        pool = WorkerPool(2)
+        scheduler = TimerWheelScheduler(executor=pool.get_pool("test-scheduler"))
+        thread = threading.Thread(target=scheduler.run)
+        thread.start()
+
+        task = DummyTask()
+        try:
+            scheduler.schedule(task, period=0.1)
+            assert poll_condition(lambda: len(task.invocations) >= 1, timeout=5)
+
+            pool.get_pool("test-scheduler").shutdown()
+            invocations = len(task.invocations)
+
+            # the scheduler keeps running the task in its own thread
+            assert poll_condition(lambda: len(task.invocations) >= invocations + 2, timeout=5)
+            assert thread.is_alive()
+        finally:
+            scheduler.close()
+            thread.join(5)
+            pool.shutdown()
+
+    def test_reschedule_task_runs_once(self):
+        task = DummyTask()
+        scheduler = TimerWheelScheduler()
+        thread = threading.Thread(target=scheduler.run)
+        thread.start()
+
+        stask = scheduler.schedule(task, start=time.time() + 0.2)
+        # scheduling the same task again moves it to the new deadline
+        stask.deadline = time.time() + 0.1
+        scheduler.add(stask)
+        scheduler.schedule(scheduler.close, start=time.time() + 0.4)
+
+        thread.join(5)
+
+        assert len(task.invocations) == 1
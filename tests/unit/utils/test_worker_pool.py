@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from localstack.utils.worker_pool import WorkerPool
+
+
+@pytest.fixture
+def worker_pool():
+    pool = WorkerPool(max_workers=4)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_submit(worker_pool):
+    future = worker_pool.submit("test", lambda a, b=0: (a + b, threading.current_thread()), 1, b=2)
+
+    result, thread = future.result(timeout=5)
+    assert result == 3
+    assert thread.name.startswith("worker-pool")
+    assert worker_pool.get_metrics()["pools"]["test"]["completed"] == 1
+
+
+def test_exception_is_set_on_future(worker_pool):
+    def _fail():
+        raise ValueError("foobar")
+
+    future = worker_pool.submit("test", _fail)
+
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+    assert worker_pool.get_metrics()["pools"]["test"]["failed"] == 1
+
+
+def test_number_of_threads_is_bounded(worker_pool):
+    futures = [worker_pool.submit("test", time.sleep, 0.001) for _ in range(500)]
+    for future in futures:
+        future.result(timeout=10)
+
+    metrics = worker_pool.get_metrics()
+    assert metrics["threads"] <= 4
+    assert metrics["pools"]["test"]["completed"] == 500
+
+
+def test_sub_pool_concurrency_is_limited(worker_pool):
+    pool = worker_pool.get_pool("limited", max_workers=2)
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def _task():
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.pop()
+
+    futures = [pool.submit(_task) for _ in range(20)]
+    for future in futures:
+        future.result(timeout=10)
+
+    assert max(max_running) == 2
+    assert pool.get_metrics()["max_queue_depth"] > 0
+
+
+def test_back_pressure(worker_pool):
+    pool = worker_pool.get_pool("bounded", max_workers=1, max_queue_size=1)
+    event = threading.Event()
+
+    pool.submit(event.wait)
+    # the first task is running, the second one is queued
+    pool.submit(lambda: None)
+    assert pool.queue_depth == 1
+
+    submitted = threading.Event()
+
+    def _submit():
+        pool.submit(lambda: None)
+        submitted.set()
+
+    threading.Thread(target=_submit, daemon=True).start()
+    assert not submitted.wait(0.2)
+
+    event.set()
+    assert submitted.wait(5)
+    assert pool.get_metrics()["throttled"] == 1
+
+
+def test_tasks_of_the_pool_are_not_throttled(worker_pool):
+    pool = worker_pool.get_pool("bounded", max_workers=1, max_queue_size=1)
+
+    def _fan_out():
+        # would block forever if the task waited for the queued tasks, which can only run after it
+        return [pool.submit(lambda i=i: i) for i in range(5)]
+
+    futures = pool.submit(_fan_out).result(timeout=5)
+
+    assert [future.result(timeout=5) for future in futures] == [0, 1, 2, 3, 4]
+
+
+def test_shutdown_sub_pool(worker_pool):
+    pool = worker_pool.get_pool("test")
+    pool.submit(lambda: None).result(timeout=5)
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
+
+    # the other sub-pools are not affected, and the sub-pool is created again when requested
+    assert worker_pool.submit("other", lambda: 1).result(timeout=5) == 1
+    assert worker_pool.submit("test", lambda: 2).result(timeout=5) == 2